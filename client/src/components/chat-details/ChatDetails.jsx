@@ -35,7 +35,7 @@ import {
     removeTypingUser,
     TYPING_START_THROTTLE_MS,
     TYPING_STATUS_TIMEOUT_MS,
-    upsertTypingUser,
+    typingUsersFromSnapshot,
 } from "./typingState";
 
 
@@ -420,6 +420,16 @@ function ChatDetails() {
         }
     }, []);
 
+    const markChatReadUpTo = useCallback((chatId, chatSeq) => {
+        if (!socket.current || chatSeq == null) {
+            return;
+        }
+
+        socket.current.emit("chats:read", {
+            reads: [{ chat_id: chatId, seq: chatSeq }],
+        });
+    }, []);
+
     const applyHistoryItems = useCallback((items, { prepend = false, scrollToBottom = false } = {}) => {
         const normalizedItems = items
             .map((item) => normalizeTimelineItem(item, store.user.user_id))
@@ -638,33 +648,17 @@ function ChatDetails() {
         typingTimeoutsRef.current.set(userId, timeoutId);
     }, []);
 
-    const handleTypingStartEvent = useCallback((data) => {
-        const typingData = parseSocketPayload(data);
-        if (typingData.chat_id !== chat.chat_id || typingData.user_id === store.user.user_id) {
+    const handleTypingSnapshotEvent = useCallback((data) => {
+        const snapshot = parseSocketPayload(data);
+        if (snapshot.chat_id !== chat.chat_id) {
             return;
         }
 
-        setTypingUsers((users) => upsertTypingUser(users, {
-            userId: typingData.user_id,
-            username: typingData.username,
-        }));
-        scheduleTypingTimeout(typingData.user_id, typingData.expires_in_seconds);
-    }, [chat.chat_id, scheduleTypingTimeout, store.user.user_id]);
-
-    const handleTypingStopEvent = useCallback((data) => {
-        const typingData = parseSocketPayload(data);
-        if (typingData.chat_id !== chat.chat_id || typingData.user_id === store.user.user_id) {
-            return;
-        }
-
-        const existingTimeout = typingTimeoutsRef.current.get(typingData.user_id);
-        if (existingTimeout) {
-            window.clearTimeout(existingTimeout);
-            typingTimeoutsRef.current.delete(typingData.user_id);
-        }
-
-        setTypingUsers((users) => removeTypingUser(users, typingData.user_id));
-    }, [chat.chat_id, store.user.user_id]);
+        const users = typingUsersFromSnapshot(snapshot.users, store.user.user_id);
+        clearTypingTimers();
+        setTypingUsers(users);
+        users.forEach((user) => scheduleTypingTimeout(user.userId, snapshot.expires_in_seconds));
+    }, [chat.chat_id, clearTypingTimers, scheduleTypingTimeout, store.user.user_id]);
 
     useEffect(() => {
         setSearchInput(activeSearchQuery);
@@ -970,6 +964,7 @@ function ChatDetails() {
             upgrade: false,
             auth: {
                 token: localStorage.getItem("token"),
+                protocol: 2,
             },
         });
 
@@ -1009,7 +1004,7 @@ function ChatDetails() {
         socket.current.on("message:created", (data) => {
             const msgData = parseSocketPayload(data);
             addMessageToChat(normalizeMessagePayload(msgData, store.user.user_id));
-            markCurrentChatRead(msgData.chat_id);
+            markChatReadUpTo(msgData.chat_id, msgData.chat_seq);
         })
 
         socket.current.on("message:updated", (data) => {
@@ -1032,8 +1027,7 @@ function ChatDetails() {
             applyReactionEvent(reactionEvent);
         })
 
-        socket.current.on("typing:start", handleTypingStartEvent);
-        socket.current.on("typing:stop", handleTypingStopEvent);
+        socket.current.on("typing:snapshot", handleTypingSnapshotEvent);
 
         return () => {
             stopTyping();
@@ -1047,8 +1041,7 @@ function ChatDetails() {
             socket.current.off("message:deleted");
             socket.current.off("message:reaction:added");
             socket.current.off("message:reaction:removed");
-            socket.current.off("typing:start");
-            socket.current.off("typing:stop");
+            socket.current.off("typing:snapshot");
             socket.current.off("connect_error");
             socket.current.disconnect();
         }
@@ -1056,9 +1049,8 @@ function ChatDetails() {
         applyHistoryItems,
         applyReactionEvent,
         chat.chat_id,
-        handleTypingStartEvent,
-        handleTypingStopEvent,
-        markCurrentChatRead,
+        handleTypingSnapshotEvent,
+        markChatReadUpTo,
         resetTypingState,
         stopTyping,
         store.user.user_id,
@@ -1130,7 +1122,7 @@ function ChatDetails() {
 
             const msgData = response.data;
             addMessageToChat(normalizeMessagePayload(msgData, store.user.user_id));
-            markCurrentChatRead(msgData.chat_id);
+            markChatReadUpTo(msgData.chat_id, msgData.chat_seq);
         });
     }
 
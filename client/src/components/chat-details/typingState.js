@@ -6,6 +6,12 @@ export function upsertTypingUser(typingUsers = [], nextUser) {
     return [...remainingUsers, nextUser];
 }
 
+export function typingUsersFromSnapshot(snapshotUsers = [], currentUserId) {
+    return snapshotUsers
+        .filter((user) => user.user_id !== currentUserId)
+        .map((user) => ({ userId: user.user_id, username: user.username }));
+}
+
 export function removeTypingUser(typingUsers = [], userId) {
     return typingUsers.filter((typingUser) => typingUser.userId !== userId);
 }
@@ -1,6 +1,7 @@
 import {
     getTypingIndicatorText,
     removeTypingUser,
+    typingUsersFromSnapshot,
     upsertTypingUser,
 } from "./typingState";
 
@@ -49,3 +50,15 @@ test("removeTypingUser removes the matching user only", () => {
         { userId: "user-2", username: "Bob" },
     ]);
 });
+
+
+test("typingUsersFromSnapshot drops the current user and keeps snapshot order", () => {
+    expect(typingUsersFromSnapshot([
+        { user_id: "user-1", username: "Alice" },
+        { user_id: "me", username: "Me" },
+        { user_id: "user-2", username: "Bob" },
+    ], "me")).toEqual([
+        { userId: "user-1", username: "Alice" },
+        { userId: "user-2", username: "Bob" },
+    ]);
+});
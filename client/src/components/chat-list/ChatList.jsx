@@ -110,6 +110,7 @@ function ChatList({ fetchChats, filters, refresh, enableRealtime = true }) {
             upgrade: false,
             auth: {
                 token: localStorage.getItem("token"),
+                protocol: 2,
             },
         });
 
@@ -0,0 +1,103 @@
+"""add users search vector
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-05-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            nullable=False,
+            server_default=sa.text("''::tsvector"),
+        ),
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION build_user_search_vector(username text, display_name text, bio text)
+        RETURNS tsvector
+        LANGUAGE sql
+        IMMUTABLE
+        AS $$
+        SELECT to_tsvector(
+            'simple',
+            concat_ws(' ', coalesce(username, ''), coalesce(display_name, ''), coalesce(bio, ''))
+        )
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION refresh_user_search_vector()
+        RETURNS trigger
+        LANGUAGE plpgsql
+        AS $$
+        BEGIN
+            NEW.search_vector := build_user_search_vector(NEW.username, NEW.display_name, NEW.bio);
+            RETURN NEW;
+        END;
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER trg_users_search_vector_refresh
+        BEFORE INSERT OR UPDATE OF username, display_name, bio ON users
+        FOR EACH ROW
+        EXECUTE FUNCTION refresh_user_search_vector()
+        """
+    )
+
+    op.execute("UPDATE users SET search_vector = build_user_search_vector(username, display_name, bio)")
+
+    op.drop_index("ix_users_search_vector", table_name="users")
+    op.create_index("ix_users_search_vector", "users", ["search_vector"], postgresql_using="gin")
+
+    # Author search matches on the bare column, which the expression index did not serve.
+    op.execute("DROP INDEX IF EXISTS ix_users_display_name_trgm")
+    op.create_index(
+        "users_display_name_trgm_idx",
+        "users",
+        ["display_name"],
+        postgresql_using="gin",
+        postgresql_ops={"display_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("users_display_name_trgm_idx", table_name="users")
+    op.execute("CREATE INDEX ix_users_display_name_trgm ON users USING gin (coalesce(display_name, '') gin_trgm_ops)")
+
+    op.drop_index("ix_users_search_vector", table_name="users")
+    op.create_index(
+        "ix_users_search_vector",
+        "users",
+        [sa.text("to_tsvector('simple', coalesce(username, '') || ' ' || coalesce(display_name, '') || ' ' || coalesce(bio, ''))")],
+        postgresql_using="gin",
+    )
+
+    op.execute("DROP TRIGGER IF EXISTS trg_users_search_vector_refresh ON users")
+    op.execute("DROP FUNCTION IF EXISTS refresh_user_search_vector()")
+    op.execute("DROP FUNCTION IF EXISTS build_user_search_vector(text, text, text)")
+
+    op.drop_column("users", "search_vector")
@@ -0,0 +1,46 @@
+"""add messages search vector
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-05-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # btree_gin lets chat_id share the GIN index with the tsvector.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    op.add_column(
+        "messages",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('simple', coalesce(content, ''))", persisted=True),
+            nullable=False,
+        ),
+    )
+    op.execute(
+        """
+        CREATE INDEX ix_messages_chat_search_vector
+        ON messages USING gin (chat_id, search_vector)
+        WHERE deleted_at IS NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_messages_chat_search_vector")
+    op.drop_column("messages", "search_vector")
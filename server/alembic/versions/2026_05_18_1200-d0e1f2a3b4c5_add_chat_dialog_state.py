@@ -0,0 +1,99 @@
+"""add chat dialog state
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-05-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d0e1f2a3b4c5"
+down_revision: Union[str, None] = "c9d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("chats", sa.Column("last_message_id", sa.Uuid(), nullable=True))
+    op.add_column("chats", sa.Column("last_message_at", sa.DateTime(timezone=True), nullable=True))
+    op.create_foreign_key(
+        "fk_chats_last_message_id_messages",
+        "chats",
+        "messages",
+        ["last_message_id"],
+        ["message_id"],
+        ondelete="SET NULL",
+    )
+    op.add_column("chat_user", sa.Column("last_message_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column(
+        "chat_user",
+        sa.Column("unread_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+
+    op.execute(
+        """
+        UPDATE chats
+        SET last_message_id = latest.message_id,
+            last_message_at = latest.created_at
+        FROM (
+            SELECT DISTINCT ON (chat_id) chat_id, message_id, created_at
+            FROM messages
+            ORDER BY chat_id, created_at DESC, message_id DESC
+        ) AS latest
+        WHERE chats.chat_id = latest.chat_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE chat_user
+        SET last_message_at = chats.last_message_at
+        FROM chats
+        WHERE chats.chat_id = chat_user.chat_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE chat_user
+        SET unread_count = unread.count
+        FROM (
+            SELECT membership.chat_id, membership.user_id, count(message.message_id) AS count
+            FROM chat_user AS membership
+            JOIN messages AS message
+                ON message.chat_id = membership.chat_id
+                AND message.user_id != membership.user_id
+                AND message.deleted_at IS NULL
+            LEFT JOIN messages AS read_message
+                ON read_message.message_id = membership.last_read_message_id
+            WHERE read_message.message_id IS NULL
+                OR (message.created_at, message.message_id)
+                    > (read_message.created_at, read_message.message_id)
+            GROUP BY membership.chat_id, membership.user_id
+        ) AS unread
+        WHERE chat_user.chat_id = unread.chat_id
+            AND chat_user.user_id = unread.user_id
+        """
+    )
+
+    # The new index leads with user_id, so it also serves plain membership lookups.
+    op.drop_index("ix_chat_user_user_id", table_name="chat_user")
+    op.execute(
+        """
+        CREATE INDEX ix_chat_user_user_last_message_at
+        ON chat_user (user_id, last_message_at DESC NULLS LAST, chat_id)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_chat_user_user_last_message_at")
+    op.create_index("ix_chat_user_user_id", "chat_user", ["user_id"], unique=False)
+    op.drop_column("chat_user", "unread_count")
+    op.drop_column("chat_user", "last_message_at")
+    op.drop_constraint("fk_chats_last_message_id_messages", "chats", type_="foreignkey")
+    op.drop_column("chats", "last_message_at")
+    op.drop_column("chats", "last_message_id")
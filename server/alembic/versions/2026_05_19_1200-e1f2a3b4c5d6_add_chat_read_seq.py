@@ -0,0 +1,72 @@
+"""add chat read seq
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-05-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, None] = "d0e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "chat_user",
+        sa.Column("last_read_seq", sa.BigInteger(), server_default=sa.text("0"), nullable=False),
+    )
+    op.add_column(
+        "chat_user",
+        sa.Column("unread_exempt_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+
+    op.execute(
+        """
+        UPDATE chat_user
+        SET last_read_seq = timeline.chat_seq
+        FROM chat_timeline_items AS timeline
+        WHERE timeline.message_id = chat_user.last_read_message_id
+        """
+    )
+    # Everything after the marker that the old counter did not count as unread
+    # (own messages, events, deleted messages) is exempt.
+    op.execute(
+        """
+        UPDATE chat_user
+        SET unread_exempt_count = greatest(
+            chats.last_timeline_seq - chat_user.last_read_seq - chat_user.unread_count,
+            0
+        )
+        FROM chats
+        WHERE chats.chat_id = chat_user.chat_id
+        """
+    )
+    op.drop_column("chat_user", "unread_count")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "chat_user",
+        sa.Column("unread_count", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE chat_user
+        SET unread_count = greatest(
+            chats.last_timeline_seq - chat_user.last_read_seq - chat_user.unread_exempt_count,
+            0
+        )
+        FROM chats
+        WHERE chats.chat_id = chat_user.chat_id
+        """
+    )
+    op.drop_column("chat_user", "unread_exempt_count")
+    op.drop_column("chat_user", "last_read_seq")
@@ -14,6 +14,7 @@ from src.comments.models import CommentModel
 from src.content.enums import ContentTypeEnum, ReactionTypeEnum
 from src.content.models import ContentModel, ContentReactionModel
 from src.users.models import UserModel
+from src.users.repository import populate_viewer_subscriptions
 
 
 class ActivityRepository:
@@ -69,7 +70,6 @@ class ActivityRepository:
                 .selectinload(UserModel.avatar_asset)
                 .selectinload(AssetModel.variants),
                 selectinload(ActivityEventModel.comment),
-                selectinload(ActivityEventModel.content).selectinload(ContentModel.author).selectinload(UserModel.subscribers),
                 selectinload(ActivityEventModel.content)
                 .selectinload(ContentModel.author)
                 .selectinload(UserModel.avatar_asset)
@@ -103,6 +103,14 @@ class ActivityRepository:
         has_more = len(events) > limit
         events = events[:limit]
         await self.populate_content_reactions(events=events, viewer_id=user_id)
+        await populate_viewer_subscriptions(
+            self._session,
+            users=[
+                *(event.target_user for event in events),
+                *(event.content.author for event in events if event.content is not None),
+            ],
+            viewer_id=user_id,
+        )
         return events, has_more
 
     async def populate_content_reactions(
@@ -6,7 +6,7 @@ from src.activity.schemas import ActivityEventListGet
 from src.activity.service import ActivityService
 from src.auth.dependencies import get_current_user
 from src.content.enums import ContentTypeEnum
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 
 
 router = APIRouter(
@@ -22,7 +22,7 @@ async def get_my_activity(
     period: ActivityPeriodEnum = ActivityPeriodEnum.ALL_TIME,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     activity_service: ActivityService = Depends(get_activity_service),
 ) -> ActivityEventListGet:
     return await activity_service.get_my_activity(
@@ -16,6 +16,7 @@ from src.content.enums import ContentStatusEnum, ContentTypeEnum, ContentVisibil
 from src.content.models import ContentModel, ContentReactionModel
 from src.content.repository import ContentReactionRemoveResult, ContentReactionSetResult
 from src.users.models import SubscriptionModel, UserModel
+from src.users.repository import populate_viewer_subscriptions
 
 
 ARTICLE_ATTACHMENT_TYPES = (
@@ -89,7 +90,7 @@ class ArticleRepository:
     ) -> ContentModel | None:
         stmt = self._build_article_query(viewer_id=viewer_id).where(ContentModel.content_id == content_id)
         result = await self._session.execute(stmt)
-        return self._one_or_none(result, viewer_id=viewer_id)
+        return await self._one_or_none(result, viewer_id=viewer_id)
 
     async def get_feed(
         self,
@@ -110,7 +111,7 @@ class ArticleRepository:
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
 
     async def get_author_articles(
         self,
@@ -160,7 +161,7 @@ class ArticleRepository:
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
 
     async def update_article(
         self,
@@ -380,7 +381,7 @@ class ArticleRepository:
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=user_id)
+        return await self._many(result, viewer_id=user_id)
 
     async def _get_reaction(
         self,
@@ -415,7 +416,6 @@ class ArticleRepository:
         reaction_subquery = self._reaction_subquery(viewer_id=viewer_id)
 
         base_options = (
-            selectinload(ContentModel.author).selectinload(UserModel.subscribers),
             selectinload(ContentModel.author)
             .selectinload(UserModel.avatar_asset)
             .selectinload(AssetModel.variants),
@@ -458,7 +458,7 @@ class ArticleRepository:
             .subquery()
         )
 
-    def _many(self, result, viewer_id: uuid.UUID | None) -> list[ContentModel]:  # type: ignore[no-untyped-def]
+    async def _many(self, result, viewer_id: uuid.UUID | None) -> list[ContentModel]:  # type: ignore[no-untyped-def]
         if viewer_id is None:
             articles = list(result.scalars().unique().all())
             for article in articles:
@@ -471,9 +471,14 @@ class ArticleRepository:
             article.my_reaction = my_reaction
             article.is_owner = article.author_id == viewer_id
             articles.append(article)
+        await populate_viewer_subscriptions(
+            self._session,
+            users=[article.author for article in articles],
+            viewer_id=viewer_id,
+        )
         return articles
 
-    def _one_or_none(self, result, viewer_id: uuid.UUID | None) -> ContentModel | None:  # type: ignore[no-untyped-def]
+    async def _one_or_none(self, result, viewer_id: uuid.UUID | None) -> ContentModel | None:  # type: ignore[no-untyped-def]
         if viewer_id is None:
             article = result.scalar_one_or_none()
             if article is not None:
@@ -488,6 +493,7 @@ class ArticleRepository:
         article, my_reaction = row
         article.my_reaction = my_reaction
         article.is_owner = article.author_id == viewer_id
+        await populate_viewer_subscriptions(self._session, users=[article.author], viewer_id=viewer_id)
         return article
 
     def _order_by_clause(self, order: ArticleOrder, order_desc: bool):
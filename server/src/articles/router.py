@@ -8,7 +8,7 @@ from src.articles.schemas import ArticleCardGet, ArticleCreate, ArticleEditorGet
 from src.articles.service import ArticleService
 from src.auth.dependencies import get_current_optional_user, get_current_user
 from src.common.schemas import Status
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 
 router = APIRouter(
     prefix="/articles",
@@ -19,7 +19,7 @@ router = APIRouter(
 @router.post("/")
 async def create_article(
     data: ArticleCreate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     article_service: ArticleService = Depends(get_article_service),
 ) -> ArticleGet:
     return await article_service.create_article(user=user, data=data)
@@ -33,7 +33,7 @@ async def get_articles(
     limit: int = Query(default=100, ge=0, lt=1000),
     user_id: uuid.UUID | None = None,
     profile_filter: ArticleProfileFilter = ArticleProfileFilter.PUBLIC,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     article_service: ArticleService = Depends(get_article_service),
 ) -> list[ArticleCardGet]:
     return await article_service.get_articles(
@@ -50,7 +50,7 @@ async def get_articles(
 @router.get("/{article_id}")
 async def get_article_by_id(
     article_id: uuid.UUID,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     article_service: ArticleService = Depends(get_article_service),
 ) -> ArticleGet:
     return await article_service.get_article(article_id=article_id, user=user)
@@ -59,7 +59,7 @@ async def get_article_by_id(
 @router.get("/{article_id}/editor")
 async def get_article_editor(
     article_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     article_service: ArticleService = Depends(get_article_service),
 ) -> ArticleEditorGet:
     return await article_service.get_article_editor(article_id=article_id, user=user)
@@ -69,7 +69,7 @@ async def get_article_editor(
 async def update_article(
     article_id: uuid.UUID,
     data: ArticleUpdate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     article_service: ArticleService = Depends(get_article_service),
 ) -> ArticleGet:
     return await article_service.update_article(
@@ -82,7 +82,7 @@ async def update_article(
 @router.delete("/{article_id}")
 async def delete_article(
     article_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     article_service: ArticleService = Depends(get_article_service),
 ) -> Status:
     await article_service.delete_article(user=user, article_id=article_id)
@@ -92,7 +92,7 @@ async def delete_article(
 @router.post("/{article_id}/like")
 async def like_article(
     article_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     article_service: ArticleService = Depends(get_article_service),
 ) -> ArticleRating:
     return await article_service.add_like_to_article(
@@ -104,7 +104,7 @@ async def like_article(
 @router.delete("/{article_id}/like")
 async def unlike_article(
     article_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     article_service: ArticleService = Depends(get_article_service),
 ) -> ArticleRating:
     return await article_service.remove_like_from_article(
@@ -116,7 +116,7 @@ async def unlike_article(
 @router.post("/{article_id}/dislike")
 async def dislike_article(
     article_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     article_service: ArticleService = Depends(get_article_service),
 ) -> ArticleRating:
     return await article_service.add_dislike_to_article(
@@ -128,7 +128,7 @@ async def dislike_article(
 @router.delete("/{article_id}/dislike")
 async def undislike_article(
     article_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     article_service: ArticleService = Depends(get_article_service),
 ) -> ArticleRating:
     return await article_service.remove_dislike_from_article(
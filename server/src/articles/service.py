@@ -25,7 +25,7 @@ from src.common.exceptions import PermissionDenied
 from src.content.access import can_view_content
 from src.content.enums import ContentStatusEnum, ContentVisibilityEnum, ReactionTypeEnum
 from src.tags.service import TagService
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 
 if TYPE_CHECKING:
     from src.activity.service import ActivityService
@@ -61,7 +61,7 @@ class ArticleService:
 
     async def create_article(
         self,
-        user: UserGet,
+        user: UserPrincipal,
         data: ArticleCreate,
     ) -> ArticleGet:
         payload = data.model_dump()
@@ -130,7 +130,7 @@ class ArticleService:
     async def get_article(
         self,
         article_id: uuid.UUID,
-        user: UserGet | None = None,
+        user: UserPrincipal | None = None,
     ) -> ArticleGet:
         viewer_id = user.user_id if user else None
         article = await self._repository.get_single(content_id=article_id, viewer_id=viewer_id)
@@ -141,7 +141,7 @@ class ArticleService:
     async def get_article_editor(
         self,
         article_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
     ) -> ArticleEditorGet:
         article = await self._repository.get_single(content_id=article_id, viewer_id=user.user_id)
         if article is None or article.author_id != user.user_id or article.deleted_at is not None:
@@ -155,7 +155,7 @@ class ArticleService:
         offset: int,
         limit: int,
         user_id: uuid.UUID | None = None,
-        user: UserGet | None = None,
+        user: UserPrincipal | None = None,
         profile_filter: ArticleProfileFilter = ArticleProfileFilter.PUBLIC,
     ) -> list[ArticleCardGet]:
         viewer_id = user.user_id if user else None
@@ -181,7 +181,7 @@ class ArticleService:
 
     async def update_article(
         self,
-        user: UserGet,
+        user: UserPrincipal,
         article_id: uuid.UUID,
         data: ArticleUpdate,
     ) -> ArticleGet:
@@ -273,7 +273,7 @@ class ArticleService:
 
     async def delete_article(
         self,
-        user: UserGet,
+        user: UserPrincipal,
         article_id: uuid.UUID,
     ) -> None:
         article = await self._repository.get_single(content_id=article_id, viewer_id=user.user_id)
@@ -0,0 +1,90 @@
+"""Microbenchmark: botocore presigned GET URLs vs the offline SigV4 signer.
+
+    python -m src.assets.bench_presign --iterations 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import typing as tp
+
+import botocore.session
+from botocore.config import Config
+
+from src.assets.storage import SigV4QuerySigner
+
+ENDPOINT_URL = "https://s3.storage.selcloud.ru"
+REGION = "ru-1"
+BUCKET = "nerdex-private"
+KEY = "v1/assets/ab/ab7c2a61-2d5c-4a4f-9a55-2c0e9b0c1f3e/avatar_medium.webp"
+QUERY = {
+    "response-content-disposition": "inline; filename*=UTF-8''avatar.webp",
+    "response-content-type": "image/webp",
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.assets.bench_presign",
+        description="Compare presigned GET URL signing paths",
+    )
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--addressing-style", choices=["virtual", "path"], default="virtual")
+    return parser
+
+
+def _measure(fn: tp.Callable[[], str], iterations: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    client = botocore.session.get_session().create_client(
+        "s3",
+        aws_access_key_id="access",
+        aws_secret_access_key="secret",
+        endpoint_url=ENDPOINT_URL,
+        region_name=REGION,
+        config=Config(signature_version="s3v4", s3={"addressing_style": args.addressing_style}),
+    )
+    signer = SigV4QuerySigner(
+        access_key="access",
+        secret_key="secret",
+        region=REGION,
+        endpoint_url=ENDPOINT_URL,
+        addressing_style=args.addressing_style,
+    )
+
+    botocore_seconds = _measure(
+        lambda: client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": BUCKET,
+                "Key": KEY,
+                "ResponseContentDisposition": QUERY["response-content-disposition"],
+                "ResponseContentType": QUERY["response-content-type"],
+            },
+            ExpiresIn=900,
+        ),
+        args.iterations,
+    )
+    signer_seconds = _measure(
+        lambda: signer.presign_get(bucket=BUCKET, key=KEY, expires_in=900, query=QUERY),
+        args.iterations,
+    )
+
+    print(f"iterations: {args.iterations}")
+    print(f"botocore generate_presigned_url: {botocore_seconds * 1e6:.1f} us/url")
+    print(f"SigV4QuerySigner.presign_get:    {signer_seconds * 1e6:.1f} us/url")
+    print(f"speedup: {botocore_seconds / signer_seconds:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
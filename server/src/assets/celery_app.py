@@ -31,5 +31,13 @@ celery_app.conf.update(
             "task": "recommendations.incremental_sync",
             "schedule": 60 * 5,
         },
+        "recommendations-refresh-candidates": {
+            "task": "recommendations.refresh_candidates",
+            "schedule": settings.recommendations.candidate_refresh_interval_seconds,
+        },
+        "recommendations-reconcile-affinities": {
+            "task": "recommendations.reconcile_affinities",
+            "schedule": settings.recommendations.affinity_reconcile_interval_seconds,
+        },
     },
 )
@@ -1,6 +1,7 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.assets.image_rendering import ImageRenderExecutor
 from src.assets.repository import AssetRepository
 from src.assets.service import AssetService, TaskDispatcher
 from src.assets.storage import AssetStorage
@@ -8,8 +9,23 @@ from src.common.database import get_async_session
 from src.config import settings
 
 
+_asset_storage: AssetStorage | None = None
+_image_renderer: ImageRenderExecutor | None = None
+
+
 def get_asset_storage() -> AssetStorage:
-    return AssetStorage(settings.storage)
+    # One process-wide instance so the pooled client and presigned URL cache are shared.
+    global _asset_storage
+    if _asset_storage is None:
+        _asset_storage = AssetStorage(settings.storage)
+    return _asset_storage
+
+
+def get_image_renderer() -> ImageRenderExecutor:
+    global _image_renderer
+    if _image_renderer is None:
+        _image_renderer = ImageRenderExecutor(max_workers=settings.assets.image_render_workers)
+    return _image_renderer
 
 
 def get_task_dispatcher() -> TaskDispatcher:
@@ -29,4 +45,5 @@ async def get_asset_service(
         storage=get_asset_storage(),
         settings=settings.assets,
         task_dispatcher=get_task_dispatcher(),
+        image_renderer=get_image_renderer(),
     )
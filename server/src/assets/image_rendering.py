@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import multiprocessing
+import typing as tp
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+
+from PIL import Image, ImageOps
+
+from src.assets.exceptions import InvalidAsset
+
+MIN_AVATAR_CROP_SIZE_PX = 96
+
+# EXIF orientations that make exif_transpose swap width and height.
+_TRANSPOSED_ORIENTATIONS = {5, 6, 7, 8}
+
+T = tp.TypeVar("T")
+
+
+@dataclass(slots=True)
+class RenderedImageVariant:
+    payload: bytes
+    width: int
+    height: int
+
+
+@dataclass(slots=True)
+class AvatarCropSpec:
+    x: float
+    y: float
+    size: float
+
+
+@dataclass(slots=True)
+class RenderedImageSet:
+    format: str | None
+    variants: dict[str, RenderedImageVariant]
+
+
+class ImageRenderExecutor:
+    """Runs Pillow work off the event loop.
+
+    With `max_workers > 0` renders go to a lazily started process pool so decode
+    and WEBP encode don't hold the API process's GIL; with 0 they run in the
+    default thread pool, which is enough for tests and single-purpose workers.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self._max_workers = max_workers
+        self._pool: Executor | None = None
+
+    async def run(self, fn: tp.Callable[..., T], /, *args: tp.Any) -> T:
+        if self._max_workers <= 0:
+            return await asyncio.to_thread(fn, *args)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+def render_image_variants(source: str | bytes, sizes: dict[str, tuple[int, int]]) -> RenderedImageSet:
+    """Decode `source` once and derive each variant from the next larger one."""
+    image = load_image(source, max_size=max((max(size) for size in sizes.values()), default=0))
+    variants: dict[str, RenderedImageVariant] = {}
+    current = image if image.mode in ("RGB", "RGBA") else image.convert("RGBA")
+    for name, size in sorted(sizes.items(), key=lambda item: item[1], reverse=True):
+        current = current.copy()
+        current.thumbnail(size)
+        variants[name] = _encode_webp(current, quality=90)
+    return RenderedImageSet(format=image.format, variants=variants)
+
+
+def render_avatar_variants(
+    source: str | bytes,
+    crop: AvatarCropSpec,
+    sizes: dict[str, tuple[int, int]],
+) -> dict[str, RenderedImageVariant]:
+    with Image.open(_as_file(source)) as probe:
+        width, height = probe.size
+        if probe.getexif().get(0x0112) in _TRANSPOSED_ORIENTATIONS:
+            width, height = height, width
+    # The crop is validated against the full-resolution frame, then applied to a
+    # draft decode that is still large enough for the biggest avatar.
+    crop_box = build_avatar_crop_box(image_width=width, image_height=height, crop=crop)
+    largest = max((max(size) for size in sizes.values()), default=0)
+    min_dimension = min(width, height)
+    crop_size_px = crop_box[2] - crop_box[0]
+    draft_size = min(min_dimension, -(-largest * min_dimension // crop_size_px))
+    image = load_image(source, max_size=draft_size)
+    scale = image.width / width
+    left, top, right, bottom = (round(value * scale) for value in crop_box)
+    side = min(right - left, bottom - top, image.width - left, image.height - top)
+    cropped = image.crop((left, top, left + side, top + side))
+    if cropped.mode not in ("RGB", "RGBA"):
+        cropped = cropped.convert("RGBA")
+
+    return {
+        name: _encode_webp(cropped.resize(size, Image.Resampling.LANCZOS), quality=92)
+        for name, size in sizes.items()
+    }
+
+
+def build_avatar_crop_box(
+    *,
+    image_width: int,
+    image_height: int,
+    crop: AvatarCropSpec,
+) -> tuple[int, int, int, int]:
+    min_dimension = min(image_width, image_height)
+    crop_size_px = int(round(crop.size * min_dimension))
+    if crop_size_px < MIN_AVATAR_CROP_SIZE_PX:
+        raise InvalidAsset(
+            f"Avatar crop is too small; minimum square size is {MIN_AVATAR_CROP_SIZE_PX}px"
+        )
+
+    left = int(round(crop.x * image_width))
+    top = int(round(crop.y * image_height))
+    right = left + crop_size_px
+    bottom = top + crop_size_px
+
+    if left < 0 or top < 0 or right > image_width or bottom > image_height:
+        raise InvalidAsset("Avatar crop must stay within the source image bounds")
+
+    return left, top, right, bottom
+
+
+def load_image(source: str | bytes, *, max_size: int = 0) -> Image.Image:
+    """Decode an image, letting JPEG decode at a reduced scale.
+
+    `draft` only picks a power-of-two DCT scale that keeps both sides at or
+    above `max_size`, so downscaled variants are unchanged while large photos
+    never get fully decoded.
+    """
+    with Image.open(_as_file(source)) as image:
+        if max_size > 0:
+            image.draft(None, (max_size, max_size))
+        image.load()
+        normalized = ImageOps.exif_transpose(image)
+        normalized.load()
+        normalized.format = image.format
+    return normalized
+
+
+def _as_file(source: str | bytes) -> str | io.BytesIO:
+    return io.BytesIO(source) if isinstance(source, bytes) else source
+
+
+def _encode_webp(image: Image.Image, *, quality: int) -> RenderedImageVariant:
+    buffer = io.BytesIO()
+    image.save(buffer, format="WEBP", quality=quality)
+    return RenderedImageVariant(
+        payload=buffer.getvalue(),
+        width=image.width,
+        height=image.height,
+    )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
-import io
+import logging
 import mimetypes
 import typing as tp
 import uuid
@@ -9,7 +10,7 @@ from dataclasses import dataclass
 import tempfile
 from pathlib import Path
 
-from PIL import Image, ImageOps, UnidentifiedImageError
+from PIL import UnidentifiedImageError
 
 from src.assets.enums import (
     AssetAccessTypeEnum,
@@ -19,14 +20,36 @@ from src.assets.enums import (
     AssetVariantTypeEnum,
 )
 from src.assets.exceptions import AssetNotFound, AssetUploadNotReady, InvalidAsset
+from src.assets.image_rendering import (
+    AvatarCropSpec,
+    ImageRenderExecutor,
+    RenderedImageVariant,
+    render_avatar_variants,
+    render_image_variants,
+)
 from src.assets.models import AssetModel
 from src.assets.repository import AssetRepository
 from src.assets.schemas import AssetFinalizeUploadResponse, AssetGet, AssetInitUploadRequest, AssetInitUploadResponse, AssetVariantGet
-from src.assets.storage import AssetStorage, build_asset_storage_key, detect_extension, guess_mime_type
-from src.assets.video_processing import VideoMetadata, VideoProcessingError, VideoProcessor
+from src.assets.storage import (
+    AssetStorage,
+    StoredObject,
+    build_asset_hls_storage_key,
+    build_asset_storage_key,
+    detect_extension,
+    guess_mime_type,
+)
+from src.assets.video_processing import (
+    HlsPlaylist,
+    RenderedVideoVariant,
+    VideoMetadata,
+    VideoProcessingError,
+    VideoProcessor,
+)
 from src.config import AssetsSettings
 from src.videos.enums import VideoOrientationEnum, VideoProcessingStatusEnum
 
+logger = logging.getLogger(__name__)
+
 
 GENERIC_IMAGE_VARIANTS: dict[AssetVariantTypeEnum, tuple[int, int]] = {
     AssetVariantTypeEnum.IMAGE_MEDIUM: (1280, 1280),
@@ -42,7 +65,6 @@ AVATAR_ALLOWED_ASSET_STATUSES = {
     AssetStatusEnum.PROCESSING,
     AssetStatusEnum.READY,
 }
-MIN_AVATAR_CROP_SIZE_PX = 96
 
 IMAGE_FORMAT_TO_MIME = {
     "JPEG": "image/jpeg",
@@ -76,17 +98,11 @@ class VideoProcessingNotifier(tp.Protocol):
 
 
 @dataclass(slots=True)
-class RenderedImageVariant:
-    payload: bytes
-    width: int
-    height: int
-
-
-@dataclass(slots=True)
-class AvatarCropSpec:
-    x: float
-    y: float
-    size: float
+class StoredVideoRendition:
+    rendered: RenderedVideoVariant
+    storage_key: str
+    stored: StoredObject
+    variant_metadata: dict[str, object]
 
 
 class AssetService:
@@ -97,12 +113,14 @@ class AssetService:
         settings: AssetsSettings,
         task_dispatcher: TaskDispatcher | None = None,
         video_processing_notifier: VideoProcessingNotifier | None = None,
+        image_renderer: ImageRenderExecutor | None = None,
     ) -> None:
         self._repository = repository
         self._storage = storage
         self._settings = settings
         self._task_dispatcher = task_dispatcher
         self._video_processing_notifier = video_processing_notifier
+        self._image_renderer = image_renderer or ImageRenderExecutor(max_workers=0)
 
     async def init_upload(
         self,
@@ -220,42 +238,23 @@ class AssetService:
             variant for variant in asset.variants if variant.asset_variant_type == AssetVariantTypeEnum.ORIGINAL
         )
         try:
-            payload = await self._storage.get_object_bytes(
-                bucket=original_variant.storage_bucket,
-                key=original_variant.storage_key,
-            )
-            image = self._load_image(payload)
-            detected_mime_type = IMAGE_FORMAT_TO_MIME.get(image.format or "", original_variant.mime_type)
-
-            for variant_type, size in GENERIC_IMAGE_VARIANTS.items():
-                rendered = self._render_variant(image=image, size=size)
-                extension = "webp"
-                storage_key = build_asset_storage_key(
-                    asset_id=asset.asset_id,
-                    variant_type=variant_type,
-                    extension=extension,
-                )
-                stored = await self._storage.upload_bytes(
-                    bucket=self._storage.private_bucket,
-                    key=storage_key,
-                    payload=rendered.payload,
-                    mime_type="image/webp",
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                source_path = Path(tmp_dir) / "source"
+                await self._storage.download_to_file(
+                    bucket=original_variant.storage_bucket,
+                    key=original_variant.storage_key,
+                    path=source_path,
                 )
-                await self._repository.upsert_variant(
-                    asset_id=asset.asset_id,
-                    asset_variant_type=variant_type,
-                    storage_bucket=self._storage.private_bucket,
-                    storage_key=storage_key,
-                    mime_type=stored.mime_type,
-                    size_bytes=stored.size_bytes,
-                    width=rendered.width,
-                    height=rendered.height,
-                    duration_ms=None,
-                    bitrate=None,
-                    checksum_sha256=stored.checksum_sha256,
-                    is_primary=False,
-                    status=AssetVariantStatusEnum.READY,
+                rendered_set = await self._image_renderer.run(
+                    render_image_variants,
+                    str(source_path),
+                    {variant_type.value: size for variant_type, size in GENERIC_IMAGE_VARIANTS.items()},
                 )
+            detected_mime_type = IMAGE_FORMAT_TO_MIME.get(rendered_set.format or "", original_variant.mime_type)
+            await self._store_image_variants(
+                asset_id=asset.asset_id,
+                rendered_variants=rendered_set.variants,
+            )
 
             await self._repository.set_asset_ready(
                 asset_id=asset.asset_id,
@@ -281,41 +280,26 @@ class AssetService:
         original_variant = self._require_avatar_source_asset(asset)
         crop_spec = AvatarCropSpec(**crop)
 
-        payload = await self._storage.get_object_bytes(
-            bucket=original_variant.storage_bucket,
-            key=original_variant.storage_key,
-        )
-        rendered_variants = self._render_avatar_variants(payload, crop_spec)
-
-        for variant_type, rendered in rendered_variants.items():
-            storage_key = build_asset_storage_key(
-                asset_id=asset.asset_id,
-                variant_type=variant_type,
-                extension="webp",
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_path = Path(tmp_dir) / "source"
+            await self._storage.download_to_file(
+                bucket=original_variant.storage_bucket,
+                key=original_variant.storage_key,
+                path=source_path,
             )
-            stored = await self._storage.upload_bytes(
-                bucket=self._storage.private_bucket,
-                key=storage_key,
-                payload=rendered.payload,
-                mime_type="image/webp",
-            )
-            await self._repository.upsert_variant(
-                asset_id=asset.asset_id,
-                asset_variant_type=variant_type,
-                storage_bucket=self._storage.private_bucket,
-                storage_key=storage_key,
-                mime_type=stored.mime_type,
-                size_bytes=stored.size_bytes,
-                width=rendered.width,
-                height=rendered.height,
-                duration_ms=None,
-                bitrate=None,
-                checksum_sha256=stored.checksum_sha256,
-                is_primary=False,
-                status=AssetVariantStatusEnum.READY,
-                variant_metadata={"crop": crop},
+            rendered_variants = await self._image_renderer.run(
+                render_avatar_variants,
+                str(source_path),
+                crop_spec,
+                {variant_type.value: size for variant_type, size in AVATAR_VARIANTS.items()},
             )
 
+        await self._store_image_variants(
+            asset_id=asset.asset_id,
+            rendered_variants=rendered_variants,
+            variant_metadata={"crop": crop},
+        )
+
     async def process_video_asset(
         self,
         *,
@@ -333,7 +317,10 @@ class AssetService:
             or original_variant.mime_type
             or mimetypes.guess_type(asset.original_filename or "")[0]
         )
-        processor = VideoProcessor()
+        processor = VideoProcessor(
+            single_pass=self._settings.video_single_pass_transcode,
+            threads=self._settings.video_transcode_threads,
+        )
         metadata: VideoMetadata | None = None
         quality_metadata: dict[str, object] = {}
 
@@ -387,28 +374,54 @@ class AssetService:
                     available_quality_metadata=quality_metadata,
                     detected_mime_type=detected_mime_type,
                 )
-                rendered_variants = await processor.transcode_variants(
-                    input_path=input_path,
-                    output_dir=tmp_path,
-                    metadata=metadata,
-                )
-                for rendered in rendered_variants:
-                    storage_key = build_asset_storage_key(
-                        asset_id=asset.asset_id,
-                        variant_type=rendered.variant_type,
-                        extension="mp4",
+                upload_tasks: list[asyncio.Task[StoredVideoRendition]] = []
+
+                async def schedule_upload(rendered: RenderedVideoVariant) -> None:
+                    upload_tasks.append(
+                        asyncio.create_task(
+                            self._store_video_rendition(
+                                asset_id=asset.asset_id,
+                                rendered=rendered,
+                                processor=processor,
+                                output_dir=tmp_path,
+                            )
+                        )
                     )
-                    stored = await self._storage.upload_file(
-                        bucket=self._storage.private_bucket,
-                        key=storage_key,
-                        path=rendered.path,
-                        mime_type="video/mp4",
+
+                try:
+                    rendered_variants = await processor.transcode_variants(
+                        input_path=input_path,
+                        output_dir=tmp_path,
+                        metadata=metadata,
+                        on_rendered=schedule_upload if self._settings.video_pipelined_upload else None,
                     )
+                    if self._settings.video_pipelined_upload:
+                        stored_renditions = list(await asyncio.gather(*upload_tasks))
+                    else:
+                        stored_renditions = [
+                            await self._store_video_rendition(
+                                asset_id=asset.asset_id,
+                                rendered=rendered,
+                                processor=processor,
+                                output_dir=tmp_path,
+                            )
+                            for rendered in rendered_variants
+                        ]
+                except BaseException:
+                    # Uploads read from the temp dir, so they must stop before it is removed.
+                    for task in upload_tasks:
+                        task.cancel()
+                    await asyncio.gather(*upload_tasks, return_exceptions=True)
+                    raise
+
+                for stored_rendition in stored_renditions:
+                    rendered = stored_rendition.rendered
+                    stored = stored_rendition.stored
                     await self._repository.upsert_variant(
                         asset_id=asset.asset_id,
                         asset_variant_type=rendered.variant_type,
                         storage_bucket=self._storage.private_bucket,
-                        storage_key=storage_key,
+                        storage_key=stored_rendition.storage_key,
                         mime_type=stored.mime_type,
                         size_bytes=stored.size_bytes,
                         width=rendered.width,
@@ -418,11 +431,7 @@ class AssetService:
                         checksum_sha256=stored.checksum_sha256,
                         is_primary=False,
                         status=AssetVariantStatusEnum.READY,
-                        variant_metadata={
-                            "quality": rendered.label,
-                            "codec": "h264",
-                            "container": "mp4",
-                        },
+                        variant_metadata=stored_rendition.variant_metadata,
                     )
                     quality_metadata[rendered.label] = {
                         "variant_type": rendered.variant_type.value,
@@ -586,6 +595,12 @@ class AssetService:
                 bucket=variant.storage_bucket,
                 key=variant.storage_key,
             )
+            hls_metadata = (getattr(variant, "variant_metadata", None) or {}).get("hls")
+            if hls_metadata:
+                await self._storage.delete_object(
+                    bucket=variant.storage_bucket,
+                    key=hls_metadata["key"],
+                )
         await self._repository.mark_asset_deleted(asset_id=asset.asset_id, now=self._now())
 
     def _dispatch_image_processing(self, asset_id: uuid.UUID) -> None:
@@ -663,6 +678,73 @@ class AssetService:
             }
         }
 
+    async def _store_video_rendition(
+        self,
+        *,
+        asset_id: uuid.UUID,
+        rendered: RenderedVideoVariant,
+        processor: VideoProcessor,
+        output_dir: Path,
+    ) -> StoredVideoRendition:
+        logger.info(
+            "Transcoded asset %s rendition %s in an ffmpeg run of %.2fs covering %d rendition(s)",
+            asset_id,
+            rendered.label,
+            rendered.encode_run_seconds,
+            rendered.encode_run_renditions,
+        )
+        part_size_bytes = self._settings.multipart_part_size_mb * 1024 * 1024
+        storage_key = build_asset_storage_key(
+            asset_id=asset_id,
+            variant_type=rendered.variant_type,
+            extension="mp4",
+        )
+        stored = await self._storage.upload_file_multipart(
+            bucket=self._storage.private_bucket,
+            key=storage_key,
+            path=rendered.path,
+            mime_type="video/mp4",
+            part_size_bytes=part_size_bytes,
+        )
+        variant_metadata: dict[str, object] = {
+            "quality": rendered.label,
+            "codec": "h264",
+            "container": "mp4",
+            "encode_run_seconds": round(rendered.encode_run_seconds, 3),
+            "encode_run_renditions": rendered.encode_run_renditions,
+        }
+        if self._settings.video_hls_enabled:
+            [hls_package] = await processor.package_hls(
+                rendered=[rendered],
+                output_dir=output_dir,
+                segment_seconds=self._settings.video_hls_segment_seconds,
+            )
+            hls_key = build_asset_hls_storage_key(asset_id=asset_id, variant_type=rendered.variant_type)
+            await self._storage.upload_file_multipart(
+                bucket=self._storage.private_bucket,
+                key=hls_key,
+                path=hls_package.directory / hls_package.playlist.map_uri,
+                mime_type="video/mp4",
+                part_size_bytes=part_size_bytes,
+            )
+            variant_metadata["hls"] = self._hls_metadata(key=hls_key, playlist=hls_package.playlist)
+        return StoredVideoRendition(
+            rendered=rendered,
+            storage_key=storage_key,
+            stored=stored,
+            variant_metadata=variant_metadata,
+        )
+
+    def _hls_metadata(self, *, key: str, playlist: HlsPlaylist) -> dict[str, object]:
+        return {
+            "key": key,
+            "target_duration": playlist.target_duration,
+            "map": [playlist.map_length, playlist.map_offset],
+            "segments": [
+                [round(segment.duration, 6), segment.length, segment.offset] for segment in playlist.segments
+            ],
+        }
+
     def _require_avatar_source_asset(self, asset: AssetModel):
         if asset.asset_type != AssetTypeEnum.IMAGE:
             raise InvalidAsset("Avatar asset must be an image")
@@ -682,92 +764,52 @@ class AssetService:
 
         return original_variant
 
-    def _render_variant(
-        self,
-        *,
-        image: Image.Image,
-        size: tuple[int, int],
-    ) -> RenderedImageVariant:
-        variant = image.copy()
-        if variant.mode not in ("RGB", "RGBA"):
-            variant = variant.convert("RGBA")
-        variant.thumbnail(size)
-        buffer = io.BytesIO()
-        variant.save(buffer, format="WEBP", quality=90)
-        return RenderedImageVariant(
-            payload=buffer.getvalue(),
-            width=variant.width,
-            height=variant.height,
-        )
-
-    def _render_avatar_variants(
-        self,
-        payload: bytes,
-        crop: AvatarCropSpec,
-    ) -> dict[AssetVariantTypeEnum, RenderedImageVariant]:
-        image = self._load_image(payload)
-        crop_box = self._build_avatar_crop_box(
-            image_width=image.width,
-            image_height=image.height,
-            crop=crop,
-        )
-        cropped = image.crop(crop_box)
-
-        return {
-            variant_type: self._render_avatar_variant(cropped=cropped, size=size)
-            for variant_type, size in AVATAR_VARIANTS.items()
-        }
-
-    def _render_avatar_variant(
+    async def _store_image_variants(
         self,
         *,
-        cropped: Image.Image,
-        size: tuple[int, int],
-    ) -> RenderedImageVariant:
-        variant = cropped.copy()
-        if variant.mode not in ("RGB", "RGBA"):
-            variant = variant.convert("RGBA")
-        variant = variant.resize(size, Image.Resampling.LANCZOS)
-        buffer = io.BytesIO()
-        variant.save(buffer, format="WEBP", quality=92)
-        return RenderedImageVariant(
-            payload=buffer.getvalue(),
-            width=variant.width,
-            height=variant.height,
+        asset_id: uuid.UUID,
+        rendered_variants: dict[str, RenderedImageVariant],
+        variant_metadata: dict[str, tp.Any] | None = None,
+    ) -> None:
+        variant_types = [AssetVariantTypeEnum(value) for value in rendered_variants]
+        storage_keys = [
+            build_asset_storage_key(asset_id=asset_id, variant_type=variant_type, extension="webp")
+            for variant_type in variant_types
+        ]
+        stored_objects = await asyncio.gather(
+            *(
+                self._storage.upload_bytes(
+                    bucket=self._storage.private_bucket,
+                    key=storage_key,
+                    payload=rendered.payload,
+                    mime_type="image/webp",
+                )
+                for storage_key, rendered in zip(storage_keys, rendered_variants.values())
+            )
         )
-
-    def _build_avatar_crop_box(
-        self,
-        *,
-        image_width: int,
-        image_height: int,
-        crop: AvatarCropSpec,
-    ) -> tuple[int, int, int, int]:
-        min_dimension = min(image_width, image_height)
-        crop_size_px = int(round(crop.size * min_dimension))
-        if crop_size_px < MIN_AVATAR_CROP_SIZE_PX:
-            raise InvalidAsset(
-                f"Avatar crop is too small; minimum square size is {MIN_AVATAR_CROP_SIZE_PX}px"
+        for variant_type, storage_key, rendered, stored in zip(
+            variant_types,
+            storage_keys,
+            rendered_variants.values(),
+            stored_objects,
+        ):
+            await self._repository.upsert_variant(
+                asset_id=asset_id,
+                asset_variant_type=variant_type,
+                storage_bucket=self._storage.private_bucket,
+                storage_key=storage_key,
+                mime_type=stored.mime_type,
+                size_bytes=stored.size_bytes,
+                width=rendered.width,
+                height=rendered.height,
+                duration_ms=None,
+                bitrate=None,
+                checksum_sha256=stored.checksum_sha256,
+                is_primary=False,
+                status=AssetVariantStatusEnum.READY,
+                variant_metadata=variant_metadata,
             )
 
-        left = int(round(crop.x * image_width))
-        top = int(round(crop.y * image_height))
-        right = left + crop_size_px
-        bottom = top + crop_size_px
-
-        if left < 0 or top < 0 or right > image_width or bottom > image_height:
-            raise InvalidAsset("Avatar crop must stay within the source image bounds")
-
-        return left, top, right, bottom
-
-    def _load_image(self, payload: bytes) -> Image.Image:
-        image = Image.open(io.BytesIO(payload))
-        image.load()
-        normalized = ImageOps.exif_transpose(image)
-        normalized.load()
-        normalized.format = image.format
-        return normalized
-
     def _default_extension(self, asset_type: AssetTypeEnum, mime_type: str | None) -> str:
         guessed_extension = mimetypes.guess_extension(mime_type or "")
         if guessed_extension:
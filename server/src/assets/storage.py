@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import datetime
 import hashlib
+import hmac
 import mimetypes
+import re
+import time
+import typing as tp
 import uuid
 from pathlib import Path
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass
-from urllib.parse import quote
+from urllib.parse import quote, urlsplit
 
 from botocore.config import Config
 from botocore.exceptions import ClientError
@@ -22,6 +27,9 @@ except ModuleNotFoundError:  # pragma: no cover - exercised in lightweight unit-
     get_session = None
 
 
+# S3 rejects non-final multipart parts smaller than 5 MiB.
+MIN_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+
 IMAGE_EXTENSION_TO_MIME = {
     "jpg": "image/jpeg",
     "jpeg": "image/jpeg",
@@ -60,6 +68,153 @@ class StoredObject:
     bitrate: int | None = None
 
 
+SIGV4_ALGORITHM = "AWS4-HMAC-SHA256"
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+_DNS_COMPATIBLE_BUCKET_RE = re.compile(r"^[a-z0-9][a-z0-9-]{1,61}[a-z0-9]$")
+
+
+class SigV4QuerySigner:
+    """Signs S3 GET URLs with SigV4 query parameters without going through botocore.
+
+    The daily signing key is derived once per UTC date, so each URL costs one
+    SHA-256 of the canonical request and one HMAC over the string to sign.
+    """
+
+    def __init__(
+        self,
+        *,
+        access_key: str,
+        secret_key: str,
+        region: str,
+        endpoint_url: str,
+        addressing_style: str,
+    ) -> None:
+        parsed = urlsplit(endpoint_url)
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._region = region
+        self._scheme = parsed.scheme or "https"
+        self._host = parsed.netloc
+        self._base_path = parsed.path.rstrip("/")
+        self._addressing_style = addressing_style
+        self._signing_key_date: str | None = None
+        self._signing_key = b""
+
+    def presign_get(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        expires_in: int,
+        query: dict[str, str] | None = None,
+        now: datetime.datetime | None = None,
+    ) -> str:
+        now = now or datetime.datetime.now(datetime.UTC)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp = amz_date[:8]
+        scope = f"{date_stamp}/{self._region}/s3/aws4_request"
+
+        host, path = self._host_and_path(bucket=bucket, key=key)
+        params = {
+            "X-Amz-Algorithm": SIGV4_ALGORITHM,
+            "X-Amz-Credential": f"{self._access_key}/{scope}",
+            "X-Amz-Date": amz_date,
+            "X-Amz-Expires": str(expires_in),
+            "X-Amz-SignedHeaders": "host",
+            **(query or {}),
+        }
+        canonical_query = "&".join(
+            f"{_uri_encode(name)}={_uri_encode(value)}"
+            for name, value in sorted(params.items())
+        )
+        canonical_request = (
+            f"GET\n{path}\n{canonical_query}\nhost:{host}\n\nhost\n{UNSIGNED_PAYLOAD}"
+        )
+        string_to_sign = (
+            f"{SIGV4_ALGORITHM}\n{amz_date}\n{scope}\n"
+            f"{hashlib.sha256(canonical_request.encode()).hexdigest()}"
+        )
+        signature = hmac.new(
+            self._get_signing_key(date_stamp),
+            string_to_sign.encode(),
+            hashlib.sha256,
+        ).hexdigest()
+        return f"{self._scheme}://{host}{path}?{canonical_query}&X-Amz-Signature={signature}"
+
+    def _host_and_path(self, *, bucket: str, key: str) -> tuple[str, str]:
+        encoded_key = quote(key, safe="/~")
+        if self._addressing_style == "virtual" and _DNS_COMPATIBLE_BUCKET_RE.match(bucket):
+            return f"{bucket}.{self._host}", f"{self._base_path}/{encoded_key}"
+        return self._host, f"{self._base_path}/{bucket}/{encoded_key}"
+
+    def _get_signing_key(self, date_stamp: str) -> bytes:
+        if self._signing_key_date != date_stamp:
+            key = _hmac_sha256(f"AWS4{self._secret_key}".encode(), date_stamp)
+            for part in (self._region, "s3", "aws4_request"):
+                key = _hmac_sha256(key, part)
+            self._signing_key = key
+            self._signing_key_date = date_stamp
+        return self._signing_key
+
+
+def _hmac_sha256(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode(), hashlib.sha256).digest()
+
+
+def _uri_encode(value: str) -> str:
+    return quote(value, safe="-_.~")
+
+
+PresignedGetKey = tuple[str, str, str | None, str | None]
+
+
+class PresignedUrlCache:
+    """Reuses presigned GET URLs until shortly before their signature expires."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: int,
+        margin_seconds: int,
+        max_size: int,
+        clock: tp.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._lifetime_seconds = ttl_seconds - margin_seconds
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: dict[PresignedGetKey, tuple[float, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._lifetime_seconds > 0 and self._max_size > 0
+
+    def get(self, key: PresignedGetKey) -> str | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > self._clock():
+            self.hits += 1
+            return entry[1]
+
+        if entry is not None:
+            self._entries.pop(key, None)
+        self.misses += 1
+        return None
+
+    def set(self, key: PresignedGetKey, url: str) -> None:
+        if not self.enabled:
+            return
+
+        self._entries.pop(key, None)
+        while len(self._entries) >= self._max_size:
+            # Dicts keep insertion order, so the first key is the oldest signature.
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (self._clock() + self._lifetime_seconds, url)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class AssetStorage:
     def __init__(self, settings: StorageSettings) -> None:
         self._settings = settings
@@ -74,15 +229,57 @@ class AssetStorage:
             "config": Config(
                 signature_version="s3v4",
                 s3={"addressing_style": settings.addressing_style},
+                max_pool_connections=settings.max_pool_connections,
             ),
         }
+        self._get_signer = SigV4QuerySigner(
+            access_key=settings.access_key,
+            secret_key=settings.secret_key,
+            region=settings.region,
+            endpoint_url=endpoint_url,
+            addressing_style=settings.addressing_style,
+        )
+        self._exit_stack: AsyncExitStack | None = None
+        self._shared_client = None
+        self.presigned_get_cache = PresignedUrlCache(
+            ttl_seconds=settings.presigned_download_ttl_seconds,
+            margin_seconds=settings.presigned_url_cache_margin_seconds,
+            max_size=settings.presigned_url_cache_max_size,
+        )
 
     @property
     def private_bucket(self) -> str:
         return self._settings.private_bucket
 
+    async def open(self) -> None:
+        """Open a long-lived client whose connection pool is shared by all calls."""
+        if self._shared_client is not None:
+            return
+        if self._session is None:
+            raise RuntimeError("aiobotocore is required to use AssetStorage")
+
+        exit_stack = AsyncExitStack()
+        self._shared_client = await exit_stack.enter_async_context(
+            self._session.create_client(
+                "s3",
+                **self._client_config,
+                verify=self._settings.verify_ssl,
+            )
+        )
+        self._exit_stack = exit_stack
+
+    async def close(self) -> None:
+        exit_stack, self._exit_stack = self._exit_stack, None
+        self._shared_client = None
+        if exit_stack is not None:
+            await exit_stack.aclose()
+
     @asynccontextmanager
     async def _client(self):  # type: ignore[no-untyped-def]
+        if self._shared_client is not None:
+            yield self._shared_client
+            return
+
         if self._session is None:
             raise RuntimeError("aiobotocore is required to use AssetStorage")
         async with self._session.create_client(
@@ -128,23 +325,45 @@ class AssetStorage:
         download_filename: str | None = None,
         inline: bool = True,
         response_content_type: str | None = None,
+        expires_in_seconds: int | None = None,
     ) -> str:
-        params: dict[str, str] = {"Bucket": bucket, "Key": key}
+        """Presign a GET URL; an explicit `expires_in_seconds` is signed fresh, bypassing the cache."""
+        query: dict[str, str] = {}
         if download_filename:
             disposition = "inline" if inline else "attachment"
-            params["ResponseContentDisposition"] = (
+            query["response-content-disposition"] = (
                 f"{disposition}; filename*=UTF-8''{quote(download_filename)}"
             )
         if response_content_type:
-            params["ResponseContentType"] = response_content_type
-
-        async with self._client() as client:
-            return await client.generate_presigned_url(
-                "get_object",
-                Params=params,
-                ExpiresIn=self._settings.presigned_download_ttl_seconds,
+            query["response-content-type"] = response_content_type
+
+        if expires_in_seconds is not None:
+            return self._get_signer.presign_get(
+                bucket=bucket,
+                key=key,
+                expires_in=expires_in_seconds,
+                query=query,
             )
 
+        cache_key = (
+            bucket,
+            key,
+            query.get("response-content-disposition"),
+            response_content_type,
+        )
+        cached_url = self.presigned_get_cache.get(cache_key)
+        if cached_url is not None:
+            return cached_url
+
+        url = self._get_signer.presign_get(
+            bucket=bucket,
+            key=key,
+            expires_in=self._settings.presigned_download_ttl_seconds,
+            query=query,
+        )
+        self.presigned_get_cache.set(cache_key, url)
+        return url
+
     async def head_object(
         self,
         *,
@@ -250,6 +469,51 @@ class AssetStorage:
             mime_type=mime_type,
         )
 
+    async def upload_file_multipart(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        path: Path,
+        mime_type: str,
+        part_size_bytes: int,
+    ) -> StoredObject:
+        """Upload a file part by part so at most one part is held in memory."""
+        part_size_bytes = max(part_size_bytes, MIN_MULTIPART_PART_SIZE)
+        size_bytes = path.stat().st_size
+        if size_bytes <= part_size_bytes:
+            return await self.upload_file(bucket=bucket, key=key, path=path, mime_type=mime_type)
+
+        upload_id = await self.initiate_multipart_upload(bucket=bucket, key=key, mime_type=mime_type)
+        checksum = hashlib.sha256()
+        parts: list[dict[str, str | int]] = []
+        try:
+            async with aiofiles.open(path, "rb") as file:
+                while True:
+                    chunk = await file.read(part_size_bytes)
+                    if not chunk:
+                        break
+                    checksum.update(chunk)
+                    part_number = len(parts) + 1
+                    etag = await self.upload_part(
+                        bucket=bucket,
+                        key=key,
+                        upload_id=upload_id,
+                        part_number=part_number,
+                        payload=chunk,
+                    )
+                    parts.append({"ETag": etag, "PartNumber": part_number})
+            await self.complete_multipart_upload(bucket=bucket, key=key, upload_id=upload_id, parts=parts)
+        except BaseException:
+            await self.abort_multipart_upload(bucket=bucket, key=key, upload_id=upload_id)
+            raise
+
+        return StoredObject(
+            size_bytes=size_bytes,
+            checksum_sha256=checksum.hexdigest(),
+            mime_type=mime_type,
+        )
+
     async def delete_object(
         self,
         *,
@@ -274,6 +538,25 @@ class AssetStorage:
             response = await client.create_multipart_upload(**params)
             return response["UploadId"]
 
+    async def upload_part(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        upload_id: str,
+        part_number: int,
+        payload: bytes,
+    ) -> str:
+        async with self._client() as client:
+            response = await client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=payload,
+            )
+            return response["ETag"]
+
     async def complete_multipart_upload(
         self,
         *,
@@ -331,3 +614,11 @@ def build_asset_storage_key(
     return (
         f"v1/assets/{asset_id.hex[:2]}/{asset_id}/{variant_type.value}.{normalized_extension}"
     )
+
+
+def build_asset_hls_storage_key(
+    *,
+    asset_id: uuid.UUID,
+    variant_type: AssetVariantTypeEnum,
+) -> str:
+    return f"v1/assets/{asset_id.hex[:2]}/{asset_id}/hls/{variant_type.value}.m4s"
@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-import asyncio
 import uuid
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 
 from src.assets.celery_app import celery_app
 from src.assets.repository import AssetRepository
 from src.assets.service import AssetService
-from src.assets.storage import AssetStorage
+from src.assets.worker_runtime import worker_runtime
 from src.common.model_registry import import_all_models
 from src.config import settings
 from src.moments.repository import MomentRepository
@@ -20,19 +18,15 @@ from src.videos.service import VideoAssetProcessingNotifier
 import_all_models()
 
 
-def _build_task_session_maker() -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
-    engine = create_async_engine(
-        url=settings.db.db_url,
-        echo=settings.db.echo,
-        poolclass=NullPool,
-    )
-    return engine, async_sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        autoflush=False,
-        autocommit=False,
-        expire_on_commit=False,
-    )
+@worker_process_init.connect
+def _start_worker_runtime(**kwargs) -> None:  # type: ignore[no-untyped-def]
+    worker_runtime.start()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _shutdown_worker_runtime(**kwargs) -> None:  # type: ignore[no-untyped-def]
+    worker_runtime.shutdown()
 
 
 def enqueue_image_processing(asset_id: uuid.UUID) -> None:
@@ -43,54 +37,55 @@ def enqueue_video_processing(asset_id: uuid.UUID) -> None:
     process_video_asset_task.delay(str(asset_id))
 
 
-async def _run_with_service(
+async def _with_service(
     handler,  # type: ignore[no-untyped-def]
 ):
-    engine, session_maker = _build_task_session_maker()
-    try:
-        async with session_maker() as session:
-            service = AssetService(
-                repository=AssetRepository(session),
-                storage=AssetStorage(settings.storage),
-                settings=settings.assets,
-                video_processing_notifier=VideoAssetProcessingNotifier(
-                    VideoRepository(session),
-                    moment_repository=MomentRepository(session),
-                ),
-            )
-            return await handler(service)
-    finally:
-        await engine.dispose()
+    async with worker_runtime.session_maker() as session:
+        service = AssetService(
+            repository=AssetRepository(session),
+            storage=worker_runtime.storage,
+            settings=settings.assets,
+            video_processing_notifier=VideoAssetProcessingNotifier(
+                VideoRepository(session),
+                moment_repository=MomentRepository(session),
+            ),
+        )
+        return await handler(service)
+
+
+def _run_with_service(
+    name: str,
+    handler,  # type: ignore[no-untyped-def]
+):
+    return worker_runtime.run(name, lambda: _with_service(handler))
 
 
 @celery_app.task(name="assets.process_image_asset")
 def process_image_asset_task(asset_id: str) -> None:
-    asyncio.run(
-        _run_with_service(
-            lambda service: service.process_image_asset(asset_id=uuid.UUID(asset_id))
-        )
+    _run_with_service(
+        "assets.process_image_asset",
+        lambda service: service.process_image_asset(asset_id=uuid.UUID(asset_id)),
     )
 
 
 @celery_app.task(name="assets.process_video_asset")
 def process_video_asset_task(asset_id: str) -> None:
-    asyncio.run(
-        _run_with_service(
-            lambda service: service.process_video_asset(asset_id=uuid.UUID(asset_id))
-        )
+    _run_with_service(
+        "assets.process_video_asset",
+        lambda service: service.process_video_asset(asset_id=uuid.UUID(asset_id)),
     )
 
 
 @celery_app.task(name="assets.cleanup_stale_uploads")
 def cleanup_stale_uploads_task() -> None:
-    asyncio.run(_run_with_service(lambda service: service.cleanup_stale_uploads()))
+    _run_with_service("assets.cleanup_stale_uploads", lambda service: service.cleanup_stale_uploads())
 
 
 @celery_app.task(name="assets.cleanup_orphaned_assets")
 def cleanup_orphaned_assets_task() -> None:
-    asyncio.run(_run_with_service(lambda service: service.cleanup_orphaned_assets()))
+    _run_with_service("assets.cleanup_orphaned_assets", lambda service: service.cleanup_orphaned_assets())
 
 
 @celery_app.task(name="assets.reconcile_failed_assets")
 def reconcile_failed_assets_task() -> None:
-    asyncio.run(_run_with_service(lambda service: service.reconcile_failed_assets()))
+    _run_with_service("assets.reconcile_failed_assets", lambda service: service.reconcile_failed_assets())
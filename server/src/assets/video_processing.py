@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
+import time
+import typing as tp
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -10,6 +13,7 @@ from src.videos.enums import VideoOrientationEnum
 
 
 MAX_VIDEO_DURATION_SECONDS = 30 * 60
+_HLS_ATTRIBUTE_RE = re.compile(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)')
 
 
 @dataclass(slots=True)
@@ -38,6 +42,37 @@ class RenderedVideoVariant:
     width: int
     height: int
     bitrate: int | None
+    # Wall time of the ffmpeg run that produced the file and how many renditions
+    # that run encoded; a single-pass run is timed once for all of its outputs.
+    encode_run_seconds: float = 0.0
+    encode_run_renditions: int = 1
+
+
+@dataclass(slots=True)
+class HlsSegment:
+    duration: float
+    uri: str
+    length: int
+    offset: int
+
+
+@dataclass(slots=True)
+class HlsPlaylist:
+    target_duration: int
+    map_uri: str
+    map_length: int
+    map_offset: int
+    segments: list[HlsSegment]
+
+
+@dataclass(slots=True)
+class PackagedHlsRendition:
+    variant_type: AssetVariantTypeEnum
+    directory: Path
+    playlist: HlsPlaylist
+
+
+RenderedVariantCallback = tp.Callable[[RenderedVideoVariant], tp.Awaitable[None]]
 
 
 class VideoProcessingError(Exception):
@@ -45,6 +80,15 @@ class VideoProcessingError(Exception):
 
 
 class VideoProcessor:
+    def __init__(
+        self,
+        *,
+        single_pass: bool = True,
+        threads: int = 0,
+    ) -> None:
+        self._single_pass = single_pass
+        self._threads = threads
+
     async def probe(self, input_path: Path) -> VideoMetadata:
         stdout = await self._run(
             "ffprobe",
@@ -109,44 +153,161 @@ class VideoProcessor:
         input_path: Path,
         output_dir: Path,
         metadata: VideoMetadata,
+        on_rendered: RenderedVariantCallback | None = None,
     ) -> list[RenderedVideoVariant]:
-        rendered: list[RenderedVideoVariant] = []
-        for plan in build_quality_plans(width=metadata.width, height=metadata.height):
+        """Encode every planned rendition.
+
+        In single-pass mode one ffmpeg run writes every rendition, so `on_rendered`
+        is only awaited for each of them once that run has finished. Otherwise each
+        rendition is its own run and `on_rendered` is awaited as soon as its file is
+        complete, letting callers upload it while the remaining ones encode.
+        """
+        plans = build_quality_plans(width=metadata.width, height=metadata.height)
+        if self._single_pass and len(plans) > 1:
+            rendered = await self._transcode_single_pass(
+                input_path=input_path,
+                output_dir=output_dir,
+                plans=plans,
+            )
+            if on_rendered is not None:
+                for variant in rendered:
+                    await on_rendered(variant)
+            return rendered
+
+        encoded: list[RenderedVideoVariant] = []
+        for plan in plans:
             output_path = output_dir / f"{plan.variant_type.value}.mp4"
+            started = time.perf_counter()
             await self._run(
                 "ffmpeg",
                 "-y",
+                *self._thread_args(),
                 "-i",
                 str(input_path),
                 "-vf",
                 f"scale={plan.width}:{plan.height}",
-                "-c:v",
-                "libx264",
-                "-preset",
-                "veryfast",
-                "-crf",
-                "23",
-                "-pix_fmt",
-                "yuv420p",
-                "-c:a",
-                "aac",
-                "-b:a",
-                "128k",
-                "-movflags",
-                "+faststart",
+                *self._encode_args(),
                 str(output_path),
             )
-            rendered.append(
-                RenderedVideoVariant(
-                    variant_type=plan.variant_type,
-                    label=plan.label,
-                    path=output_path,
-                    width=plan.width,
-                    height=plan.height,
-                    bitrate=None,
+            variant = _rendered_variant(
+                plan,
+                output_path,
+                encode_run_seconds=time.perf_counter() - started,
+                encode_run_renditions=1,
+            )
+            encoded.append(variant)
+            if on_rendered is not None:
+                await on_rendered(variant)
+        return encoded
+
+    async def _transcode_single_pass(
+        self,
+        *,
+        input_path: Path,
+        output_dir: Path,
+        plans: list[VideoQualityPlan],
+    ) -> list[RenderedVideoVariant]:
+        """Decode the source once and fan it out to every rendition with split/scale."""
+        split_labels = "".join(f"[v{index}]" for index in range(len(plans)))
+        filter_graph = ";".join(
+            [f"[0:v]split={len(plans)}{split_labels}"]
+            + [
+                f"[v{index}]scale={plan.width}:{plan.height}[out{index}]"
+                for index, plan in enumerate(plans)
+            ]
+        )
+
+        output_paths = [output_dir / f"{plan.variant_type.value}.mp4" for plan in plans]
+        output_args: list[str] = []
+        for index, output_path in enumerate(output_paths):
+            output_args.extend(
+                [
+                    "-map",
+                    f"[out{index}]",
+                    "-map",
+                    "0:a?",
+                    *self._encode_args(),
+                    str(output_path),
+                ]
+            )
+
+        started = time.perf_counter()
+        await self._run(
+            "ffmpeg",
+            "-y",
+            *self._thread_args(),
+            "-i",
+            str(input_path),
+            "-filter_complex",
+            filter_graph,
+            *output_args,
+        )
+        elapsed = time.perf_counter() - started
+        return [
+            _rendered_variant(
+                plan,
+                output_path,
+                encode_run_seconds=elapsed,
+                encode_run_renditions=len(plans),
+            )
+            for plan, output_path in zip(plans, output_paths)
+        ]
+
+    async def package_hls(
+        self,
+        *,
+        rendered: list[RenderedVideoVariant],
+        output_dir: Path,
+        segment_seconds: int,
+    ) -> list[PackagedHlsRendition]:
+        """Remux renditions into single-file fMP4 HLS addressed by byte ranges."""
+        packaged: list[PackagedHlsRendition] = []
+        for variant in rendered:
+            directory = output_dir / f"hls_{variant.variant_type.value}"
+            directory.mkdir(parents=True, exist_ok=True)
+            playlist_path = directory / "index.m3u8"
+            await self._run(
+                "ffmpeg",
+                "-y",
+                "-i",
+                str(variant.path),
+                "-map",
+                "0",
+                "-c",
+                "copy",
+                "-f",
+                "hls",
+                "-hls_time",
+                str(segment_seconds),
+                "-hls_playlist_type",
+                "vod",
+                "-hls_segment_type",
+                "fmp4",
+                "-hls_flags",
+                "single_file",
+                "-hls_segment_filename",
+                str(directory / "stream.m4s"),
+                str(playlist_path),
+            )
+            packaged.append(
+                PackagedHlsRendition(
+                    variant_type=variant.variant_type,
+                    directory=directory,
+                    playlist=parse_hls_playlist(playlist_path.read_text()),
                 )
             )
-        return rendered
+        return packaged
+
+    def _thread_args(self) -> list[str]:
+        if self._threads <= 0:
+            return []
+        return ["-filter_complex_threads", str(self._threads), "-threads", str(self._threads)]
+
+    def _encode_args(self) -> list[str]:
+        encode_args = _rendition_encode_args()
+        if self._threads > 0:
+            encode_args.extend(["-threads", str(self._threads)])
+        return encode_args
 
     async def _run(self, *args: str) -> str:
         process = await asyncio.create_subprocess_exec(
@@ -166,6 +327,101 @@ class VideoProcessor:
         return VideoOrientationEnum.LANDSCAPE if width > height else VideoOrientationEnum.PORTRAIT
 
 
+def _rendition_encode_args() -> list[str]:
+    return [
+        "-c:v",
+        "libx264",
+        "-preset",
+        "veryfast",
+        "-crf",
+        "23",
+        "-pix_fmt",
+        "yuv420p",
+        "-c:a",
+        "aac",
+        "-b:a",
+        "128k",
+        "-movflags",
+        "+faststart",
+    ]
+
+
+def _rendered_variant(
+    plan: VideoQualityPlan,
+    path: Path,
+    *,
+    encode_run_seconds: float,
+    encode_run_renditions: int,
+) -> RenderedVideoVariant:
+    return RenderedVideoVariant(
+        variant_type=plan.variant_type,
+        label=plan.label,
+        path=path,
+        width=plan.width,
+        height=plan.height,
+        bitrate=None,
+        encode_run_seconds=encode_run_seconds,
+        encode_run_renditions=encode_run_renditions,
+    )
+
+
+def parse_hls_playlist(text: str) -> HlsPlaylist:
+    target_duration: int | None = None
+    map_uri: str | None = None
+    map_range: tuple[int, int] | None = None
+    segments: list[HlsSegment] = []
+    pending_duration: float | None = None
+    pending_range: tuple[int, int] | None = None
+    next_offset = 0
+
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        if line.startswith("#EXT-X-TARGETDURATION:"):
+            target_duration = int(line.split(":", 1)[1])
+        elif line.startswith("#EXT-X-MAP:"):
+            attributes = _parse_hls_attributes(line.split(":", 1)[1])
+            map_uri = attributes.get("URI")
+            if "BYTERANGE" not in attributes:
+                raise VideoProcessingError("HLS init section must be byte-range addressed")
+            map_range = _parse_byte_range(attributes["BYTERANGE"], default_offset=0)
+        elif line.startswith("#EXTINF:"):
+            pending_duration = float(line.split(":", 1)[1].split(",", 1)[0])
+        elif line.startswith("#EXT-X-BYTERANGE:"):
+            pending_range = _parse_byte_range(line.split(":", 1)[1], default_offset=next_offset)
+        elif not line.startswith("#"):
+            if pending_duration is None or pending_range is None:
+                raise VideoProcessingError("HLS playlist segment is missing duration or byte range")
+            length, offset = pending_range
+            segments.append(HlsSegment(duration=pending_duration, uri=line, length=length, offset=offset))
+            next_offset = offset + length
+            pending_duration = None
+            pending_range = None
+
+    if target_duration is None or map_uri is None or map_range is None or not segments:
+        raise VideoProcessingError("ffmpeg produced an incomplete HLS playlist")
+    return HlsPlaylist(
+        target_duration=target_duration,
+        map_uri=map_uri,
+        map_length=map_range[0],
+        map_offset=map_range[1],
+        segments=segments,
+    )
+
+
+def _parse_hls_attributes(value: str) -> dict[str, str]:
+    attributes: dict[str, str] = {}
+    for match in _HLS_ATTRIBUTE_RE.finditer(value):
+        attributes[match.group(1)] = match.group(2).strip('"')
+    return attributes
+
+
+def _parse_byte_range(value: str, *, default_offset: int) -> tuple[int, int]:
+    length, _, offset = value.partition("@")
+    return int(length), int(offset) if offset else default_offset
+
+
 def build_quality_plans(*, width: int, height: int) -> list[VideoQualityPlan]:
     orientation = VideoOrientationEnum.SQUARE
     if width > height:
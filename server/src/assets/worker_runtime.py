@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+import typing as tp
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from src.assets.storage import AssetStorage
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = tp.TypeVar("T")
+
+
+@dataclass(slots=True)
+class TaskTiming:
+    count: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float, *, failed: bool) -> None:
+        self.count += 1
+        self.failures += int(failed)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+def build_worker_session_maker() -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine(
+        url=settings.db.db_url,
+        echo=settings.db.echo,
+        pool_size=settings.celery.worker_db_pool_size,
+        max_overflow=settings.celery.worker_db_max_overflow,
+        pool_pre_ping=True,
+    )
+    return engine, async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+    )
+
+
+class WorkerRuntime:
+    """Event loop, DB engine and storage client kept for a worker process's lifetime.
+
+    Celery tasks are synchronous, so each one drives a coroutine to completion on
+    this loop. Reusing the loop is what lets the pooled asyncpg connections and the
+    shared S3 client survive between tasks. The runtime starts lazily and is
+    rebuilt if the process was forked after it started.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_maker_factory: tp.Callable[
+            [], tuple[AsyncEngine, async_sessionmaker[AsyncSession]]
+        ] = build_worker_session_maker,
+        storage_factory: tp.Callable[[], AssetStorage] = lambda: AssetStorage(settings.storage),
+        clock: tp.Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._session_maker_factory = session_maker_factory
+        self._storage_factory = storage_factory
+        self._clock = clock
+        self._pid: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._engine: AsyncEngine | None = None
+        self._session_maker: async_sessionmaker[AsyncSession] | None = None
+        self._storage: AssetStorage | None = None
+        self.timings: dict[str, TaskTiming] = {}
+
+    @property
+    def started(self) -> bool:
+        return self._loop is not None and self._pid == os.getpid()
+
+    @property
+    def session_maker(self) -> async_sessionmaker[AsyncSession]:
+        self.start()
+        assert self._session_maker is not None
+        return self._session_maker
+
+    @property
+    def storage(self) -> AssetStorage:
+        self.start()
+        assert self._storage is not None
+        return self._storage
+
+    def start(self) -> None:
+        if self.started:
+            return
+        # Resources inherited across fork belong to the parent; drop them without closing.
+        self._loop = asyncio.new_event_loop()
+        self._pid = os.getpid()
+        self._engine, self._session_maker = self._session_maker_factory()
+        self._storage = self._storage_factory()
+        self._loop.run_until_complete(self._storage.open())
+
+    def run(self, name: str, coroutine_factory: tp.Callable[[], tp.Awaitable[T]]) -> T:
+        self.start()
+        assert self._loop is not None
+        started = self._clock()
+        failed = True
+        try:
+            result = self._loop.run_until_complete(coroutine_factory())
+            failed = False
+            return result
+        finally:
+            elapsed = self._clock() - started
+            timing = self.timings.setdefault(name, TaskTiming())
+            timing.record(elapsed, failed=failed)
+            logger.info(
+                "Task %s %s in %.3fs (runs=%d, avg=%.3fs, max=%.3fs)",
+                name,
+                "failed" if failed else "succeeded",
+                elapsed,
+                timing.count,
+                timing.total_seconds / timing.count,
+                timing.max_seconds,
+            )
+
+    def shutdown(self) -> None:
+        if not self.started:
+            return
+        assert self._loop is not None
+        try:
+            if self._storage is not None:
+                self._loop.run_until_complete(self._storage.close())
+            if self._engine is not None:
+                self._loop.run_until_complete(self._engine.dispose())
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        finally:
+            self._loop.close()
+            self._loop = None
+            self._pid = None
+            self._engine = None
+            self._session_maker = None
+            self._storage = None
+
+
+worker_runtime = WorkerRuntime()
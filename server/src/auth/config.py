@@ -12,6 +12,8 @@ class AuthSettings(BaseSettings):
     access_token_expire_minutes: int = 15
     refresh_token_expire_minutes: int = 60 * 24 * 30
     refresh_token_cookie_key: str = "refresh_token"
+    principal_cache_ttl_seconds: float = 30
+    principal_cache_max_size: int = 10_000
 
 
 auth_settings = AuthSettings()
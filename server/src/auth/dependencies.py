@@ -1,6 +1,8 @@
+import uuid
 from typing import Any, Callable, Coroutine
 from fastapi import (
     HTTPException,
+    Query,
     Request,
     Depends,
     status,
@@ -11,8 +13,16 @@ from jwt import InvalidTokenError
 from src.users.dependencies import get_user_service
 from src.users.service import UserService
 from src.users.exceptions import UserNotFound
-from src.auth.utils import validate_password, decode_jwt, ACCESS_TOKEN_TYPE, REFRESH_TOKEN_TYPE
-from src.users.schemas import UserGet, UserGetWithPassword
+from src.auth.utils import (
+    validate_password,
+    decode_jwt,
+    ACCESS_TOKEN_TYPE,
+    PLAYBACK_TOKEN_TYPE,
+    REFRESH_TOKEN_TYPE,
+)
+from src.auth.schemas import PlaybackGrant
+from src.auth.principal import principal_cache
+from src.users.schemas import UserGet, UserGetWithPassword, UserPrincipal
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
@@ -105,23 +115,43 @@ def _check_token_type(
         )
 
 
-def get_current_user_closure() -> Callable[..., Coroutine[Any, Any, UserGet]]:
+async def _get_user_principal(
+    token_payload: dict[str, Any],
+    user_service: UserService,
+) -> UserPrincipal:
+    _check_token_type(token_payload, ACCESS_TOKEN_TYPE)
+
+    try:
+        user_id = uuid.UUID(str(token_payload.get("sub")))
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authorization token",
+        ) from exc
+
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    try:
+        principal = await user_service.get_user_principal(user_id=user_id)
+
+    except UserNotFound as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authorization token",
+        ) from exc
+
+    principal_cache.set(principal)
+    return principal
+
+
+def get_current_user_closure() -> Callable[..., Coroutine[Any, Any, UserPrincipal]]:
     async def get_current_user_wrapper(
         token_payload: dict[str, Any] = Depends(_get_token_payload_from_header),
         user_service: UserService = Depends(get_user_service),
-    ) -> UserGet:
-        _check_token_type(token_payload, ACCESS_TOKEN_TYPE)
-
-        try:
-            return await user_service.get_user(
-                user_id=token_payload.get("sub"),
-            )
-
-        except UserNotFound as exc:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authorization token",
-            ) from exc
+    ) -> UserPrincipal:
+        return await _get_user_principal(token_payload, user_service)
 
     return get_current_user_wrapper
 
@@ -132,16 +162,19 @@ get_current_user = get_current_user_closure()
 async def get_current_optional_user(
     token_payload: dict[str, Any] | None = Depends(_get_token_payload_from_header_optional),
     user_service: UserService = Depends(get_user_service),
-) -> UserGet | None:
+) -> UserPrincipal | None:
     if not token_payload:
         return None
 
-    _check_token_type(token_payload, ACCESS_TOKEN_TYPE)
+    return await _get_user_principal(token_payload, user_service)
+
 
+async def get_current_user_profile(
+    principal: UserPrincipal = Depends(get_current_user),
+    user_service: UserService = Depends(get_user_service),
+) -> UserGet:
     try:
-        return await user_service.get_user(
-            user_id=token_payload.get("sub"),
-        )
+        return await user_service.get_user(user_id=principal.user_id)  # type: ignore[return-value]
 
     except UserNotFound as exc:
         raise HTTPException(
@@ -166,3 +199,23 @@ async def get_current_user_for_refresh(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authorization token",
         ) from exc
+
+
+def get_playback_grant(
+    token: str = Query(),
+) -> PlaybackGrant:
+    token_payload = _get_token_payload(token)
+    _check_token_type(token_payload, PLAYBACK_TOKEN_TYPE)
+
+    viewer = token_payload.get("viewer")
+    try:
+        return PlaybackGrant(
+            token=token,
+            content_id=uuid.UUID(str(token_payload.get("sub"))),
+            viewer_id=uuid.UUID(str(viewer)) if viewer else None,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authorization token",
+        ) from exc
@@ -0,0 +1,63 @@
+import time
+import typing as tp
+import uuid
+
+from src.auth.config import auth_settings
+from src.users.schemas import UserPrincipal
+
+
+class PrincipalCache:
+    """Short-lived in-process cache of minimal user records keyed by user id.
+
+    Entries expire after `ttl_seconds`, so admin flag or username changes made
+    outside the users service become visible within one TTL window.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float,
+        max_size: int,
+        clock: tp.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._clock = clock
+        self._entries: dict[uuid.UUID, tuple[float, UserPrincipal]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0 and self._max_size > 0
+
+    def get(self, user_id: uuid.UUID) -> UserPrincipal | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+
+        expires_at, principal = entry
+        if expires_at <= self._clock():
+            self._entries.pop(user_id, None)
+            return None
+        return principal
+
+    def set(self, principal: UserPrincipal) -> None:
+        if not self.enabled:
+            return
+
+        self._entries.pop(principal.user_id, None)
+        while len(self._entries) >= self._max_size:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[principal.user_id] = (self._clock() + self._ttl_seconds, principal)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=auth_settings.principal_cache_ttl_seconds,
+    max_size=auth_settings.principal_cache_max_size,
+)
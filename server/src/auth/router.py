@@ -4,7 +4,7 @@ from fastapi import (
     Depends,
 )
 
-from src.users.schemas import UserGet, UserGetWithPassword
+from src.users.schemas import UserGet, UserGetWithPassword, UserPrincipal
 from src.auth.schemas import Token
 from src.auth.dependencies import authenticate_user, get_current_user_for_refresh, get_current_user
 from src.auth.utils import create_access_token, create_refresh_token
@@ -59,6 +59,6 @@ async def remove_refresh_token(
 
 @router.post("/check")
 async def check_token(
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
 ) -> str:
     return str(user.user_id)
@@ -1,6 +1,14 @@
+import uuid
+
 from pydantic import BaseModel
 
 
 class Token(BaseModel):
     access_token: str
     token_type: str = "Bearer"
+
+
+class PlaybackGrant(BaseModel):
+    token: str
+    content_id: uuid.UUID
+    viewer_id: uuid.UUID | None = None
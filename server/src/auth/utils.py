@@ -1,5 +1,7 @@
 from typing import Any
 import datetime
+import math
+import uuid
 import jwt
 import bcrypt
 
@@ -10,6 +12,7 @@ from src.auth.config import auth_settings
 TOKEN_TYPE_FIELD: str = "type"
 ACCESS_TOKEN_TYPE: str = "access"
 REFRESH_TOKEN_TYPE: str = "refresh"
+PLAYBACK_TOKEN_TYPE: str = "playback"
 
 
 def validate_password(password: str, hashed_password: str) -> bool:
@@ -88,3 +91,22 @@ def create_refresh_token(user: UserGet) -> str:
         payload=payload,
         expire_minutes=auth_settings.refresh_token_expire_minutes,
     )
+
+
+def create_playback_token(
+    *,
+    content_id: uuid.UUID,
+    viewer_id: uuid.UUID | None,
+    expire_seconds: int,
+) -> str:
+    """Query-string token for HLS playlist routes, which native players fetch without headers."""
+    payload = {
+        "sub": str(content_id),
+        "viewer": str(viewer_id) if viewer_id is not None else None,
+    }
+
+    return create_token(
+        token_type=PLAYBACK_TOKEN_TYPE,
+        payload=payload,
+        expire_minutes=math.ceil(expire_seconds / 60),
+    )
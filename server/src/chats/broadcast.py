@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import typing as tp
+import uuid
+from dataclasses import dataclass
+
+import socketio
+
+
+# Protocol 1 clients also get every new message as a JSON string in the legacy
+# "message" event; protocol 2 clients only subscribe to "message:created".
+LEGACY_SOCKET_PROTOCOL = 1
+CURRENT_SOCKET_PROTOCOL = 2
+
+
+def parse_socket_protocol(auth: tp.Any) -> int:
+    protocol = auth.get("protocol") if isinstance(auth, dict) else None
+    if isinstance(protocol, int) and not isinstance(protocol, bool) and protocol >= CURRENT_SOCKET_PROTOCOL:
+        return CURRENT_SOCKET_PROTOCOL
+    return LEGACY_SOCKET_PROTOCOL
+
+
+def chat_room(chat_id: uuid.UUID) -> str:
+    return str(chat_id)
+
+
+def legacy_chat_room(chat_id: uuid.UUID) -> str:
+    return f"{chat_id}:v{LEGACY_SOCKET_PROTOCOL}"
+
+
+@dataclass(slots=True, frozen=True)
+class RawJSON:
+    """An already serialized JSON value, spliced verbatim into outgoing packets."""
+
+    text: str
+
+
+class PacketJSON:
+    """`json` replacement for Socket.IO packets that understands RawJSON values.
+
+    RawJSON is swapped for a per-call placeholder string before encoding and the
+    placeholder is then replaced with the raw text, so payloads serialized once
+    by pydantic are never re-encoded, no matter how many packets carry them.
+    """
+
+    @staticmethod
+    def dumps(obj: tp.Any, **kwargs: tp.Any) -> str:
+        fragments: list[str] = []
+        nonce = uuid.uuid4().hex
+
+        def swap(value: tp.Any) -> tp.Any:
+            if isinstance(value, RawJSON):
+                fragments.append(value.text)
+                return f"{nonce}:{len(fragments) - 1}"
+            if isinstance(value, dict):
+                return {key: swap(item) for key, item in value.items()}
+            if isinstance(value, (list, tuple)):
+                return [swap(item) for item in value]
+            return value
+
+        encoded = json.dumps(swap(obj), **kwargs)
+        for index, fragment in enumerate(fragments):
+            encoded = encoded.replace(f'"{nonce}:{index}"', fragment, 1)
+        return encoded
+
+    @staticmethod
+    def loads(text: str | bytes, **kwargs: tp.Any) -> tp.Any:
+        return json.loads(text, **kwargs)
+
+
+@dataclass(slots=True, frozen=True)
+class RoomEmit:
+    event: str
+    data: tp.Any
+    room: str
+    skip_sid: str | None = None
+
+
+class BatchingAsyncRedisManager(socketio.AsyncRedisManager):
+    """AsyncRedisManager that can publish several room emits as one pub/sub message.
+
+    A batch travels as an ordinary "emit" message with a `batch` list; every
+    host, this one included, replays its entries in order.
+    """
+
+    async def emit_batch(self, emits: tp.Sequence[RoomEmit], namespace: str = "/") -> None:
+        messages = [
+            {
+                "method": "emit",
+                "event": item.event,
+                "data": item.data,
+                "namespace": namespace,
+                "room": item.room,
+                "skip_sid": item.skip_sid,
+                "callback": None,
+                "host_id": self.host_id,
+            }
+            for item in emits
+        ]
+        if not messages:
+            return
+        if len(messages) == 1:
+            batch = messages[0]
+        else:
+            batch = {"method": "emit", "batch": messages, "host_id": self.host_id}
+        await self._handle_emit(batch)
+        await self._publish(batch)
+
+    async def _handle_emit(self, message):  # type: ignore[no-untyped-def]
+        if "batch" in message:
+            for item in message["batch"]:
+                await super()._handle_emit(item)
+            return
+        await super()._handle_emit(message)
+
+
+async def emit_to_rooms(server: socketio.AsyncServer, emits: tp.Sequence[RoomEmit]) -> None:
+    if isinstance(server.manager, BatchingAsyncRedisManager):
+        await server.manager.emit_batch(emits)
+        return
+    for item in emits:
+        await server.emit(item.event, item.data, room=item.room, skip_sid=item.skip_sid)
+
+
+def build_message_created_emits(
+    payload: RawJSON,
+    *,
+    chat_id: uuid.UUID,
+    skip_sid: str | None = None,
+) -> list[RoomEmit]:
+    return [
+        RoomEmit("message:created", payload, room=chat_room(chat_id)),
+        RoomEmit("message", payload.text, room=legacy_chat_room(chat_id), skip_sid=skip_sid),
+    ]
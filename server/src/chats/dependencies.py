@@ -2,6 +2,7 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.assets.dependencies import get_asset_storage
+from src.chats.membership_cache import chat_membership_cache
 from src.chats.repository import ChatRepository
 from src.chats.service import ChatService
 from src.common.database import get_async_session
@@ -23,4 +24,5 @@ def get_chat_service(
             asset_storage=storage,
             projector_registry=content_projector_registry,
         ),
+        membership_cache=chat_membership_cache,
     )
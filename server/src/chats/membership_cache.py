@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import logging
+import time
+import typing as tp
+import uuid
+
+import redis.asyncio as redis
+
+from src.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+CHAT_MEMBERS_CACHE_TTL_SECONDS = 600
+# How long a socket trusts a chat it has already been authorized for before
+# asking Redis again; bounds how late a removed member keeps sending typing events.
+SOCKET_MEMBERSHIP_TTL_SECONDS = 30
+
+
+def build_chat_members_key(chat_id: uuid.UUID) -> str:
+    return f"chats:members:{chat_id}"
+
+
+class ChatMembershipCache:
+    """Redis set per chat of user ids already verified as members.
+
+    Only confirmed memberships are stored, so a miss means "ask Postgres", never
+    "not a member". ChatService drops users from the set as soon as they are
+    removed or leave. The TTL is armed only when the set is created and never
+    extended, so a stale entry a racing verification re-adds after that removal
+    still ages out with the rest of the set.
+    Redis errors are treated as misses.
+    """
+
+    def __init__(self, client: redis.Redis, *, ttl_seconds: int = CHAT_MEMBERS_CACHE_TTL_SECONDS) -> None:
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+
+    async def is_member(self, *, chat_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        try:
+            # redis-py types set commands for both its sync and asyncio clients.
+            is_member = tp.cast(
+                tp.Awaitable[int],
+                self._client.sismember(build_chat_members_key(chat_id), str(user_id)),
+            )
+            return bool(await is_member)
+        except redis.RedisError:
+            logger.warning("Chat membership cache unavailable for chat %s", chat_id, exc_info=True)
+            return False
+
+    async def add_members(self, *, chat_id: uuid.UUID, user_ids: tp.Iterable[uuid.UUID]) -> None:
+        members = [str(user_id) for user_id in user_ids]
+        if not members:
+            return
+        key = build_chat_members_key(chat_id)
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.sadd(key, *members)
+                # NX: refreshing the deadline on every add would let a re-added
+                # stale member live forever in an active chat.
+                pipe.expire(key, self._ttl_seconds, nx=True)
+                await pipe.execute()
+        except redis.RedisError:
+            logger.warning("Failed to cache members of chat %s", chat_id, exc_info=True)
+
+    async def remove_members(self, *, chat_id: uuid.UUID, user_ids: tp.Iterable[uuid.UUID]) -> None:
+        members = [str(user_id) for user_id in user_ids]
+        if not members:
+            return
+        # Unlike a failed add, a failed removal would leave access in place,
+        # so the error propagates to the caller.
+        await tp.cast(tp.Awaitable[int], self._client.srem(build_chat_members_key(chat_id), *members))
+
+    async def forget_chat(self, chat_id: uuid.UUID) -> None:
+        await self._client.delete(build_chat_members_key(chat_id))
+
+
+class SocketChatAuthorizations:
+    """Per-sid chat ids this process has already authorized, with a short expiry."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = SOCKET_MEMBERSHIP_TTL_SECONDS,
+        clock: tp.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._expires_at: dict[str, dict[uuid.UUID, float]] = {}
+
+    def is_authorized(self, sid: str, chat_id: uuid.UUID) -> bool:
+        expires_at = self._expires_at.get(sid, {}).get(chat_id)
+        return expires_at is not None and expires_at > self._clock()
+
+    def authorize(self, sid: str, chat_id: uuid.UUID) -> None:
+        self._expires_at.setdefault(sid, {})[chat_id] = self._clock() + self._ttl_seconds
+
+    def revoke(self, sid: str, chat_id: uuid.UUID) -> None:
+        self._expires_at.get(sid, {}).pop(chat_id, None)
+
+    def drop_sid(self, sid: str) -> None:
+        self._expires_at.pop(sid, None)
+
+
+chat_membership_cache = ChatMembershipCache(
+    redis.from_url(settings.redis.url, decode_responses=True),
+)
@@ -1,6 +1,7 @@
+import datetime
 import uuid
 
-from sqlalchemy import BigInteger, CheckConstraint, ForeignKey, Index, UniqueConstraint, text
+from sqlalchemy import BigInteger, CheckConstraint, DateTime, ForeignKey, Index, Integer, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.chats.enums import ChatMemberRole, ChatType
@@ -32,8 +33,26 @@ class ChatModel(Base):
         default=0,
         server_default=text("0"),
     )
+    # Denormalized from messages on every insert so the dialog list never has to
+    # aggregate the messages table.
+    last_message_id: Mapped[uuid.UUID | None] = mapped_column(
+        ForeignKey(
+            "messages.message_id",
+            ondelete="SET NULL",
+            use_alter=True,
+            name="fk_chats_last_message_id_messages",
+        ),
+        nullable=True,
+    )
+    last_message_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
 
-    messages: Mapped[list["MessageModel"]] = relationship(back_populates="chat")
+    messages: Mapped[list["MessageModel"]] = relationship(
+        back_populates="chat",
+        foreign_keys="MessageModel.chat_id",
+    )
     events: Mapped[list["EventModel"]] = relationship(back_populates="chat")
     timeline_items: Mapped[list["ChatTimelineItemModel"]] = relationship(
         back_populates="chat",
@@ -59,7 +78,12 @@ class MembershipModel(Base):
             "role in ('owner', 'member')",
             name="ck_chat_user_role",
         ),
-        Index("ix_chat_user_user_id", "user_id"),
+        Index(
+            "ix_chat_user_user_last_message_at",
+            "user_id",
+            text("last_message_at DESC NULLS LAST"),
+            "chat_id",
+        ),
         Index("ix_chat_user_last_read_message_id", "last_read_message_id"),
     )
 
@@ -77,6 +101,25 @@ class MembershipModel(Base):
         nullable=True,
     )
     is_muted: Mapped[bool] = mapped_column(default=False)
+    # Copy of chats.last_message_at so a user's dialogs are read in order
+    # straight off ix_chat_user_user_last_message_at.
+    last_message_at: Mapped[datetime.datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    # Unread count is chats.last_timeline_seq - last_read_seq - unread_exempt_count,
+    # where the exempt items after last_read_seq are the member's own messages,
+    # chat events and deleted messages.
+    last_read_seq: Mapped[int] = mapped_column(
+        BigInteger,
+        default=0,
+        server_default=text("0"),
+    )
+    unread_exempt_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default=text("0"),
+    )
 
 
 class ChatTimelineItemModel(Base):
@@ -1,13 +1,14 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import delete, desc, func, insert, literal, or_, select, update
+from sqlalchemy import delete, desc, func, insert, literal, or_, select, true, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm import selectinload
 
 from src.assets.models import AssetModel, ContentAssetModel, MessageAssetModel
 from src.chats.enums import ChatMemberRole, ChatType
 from src.chats.models import ChatModel, ChatTimelineItemModel, MembershipModel
+from src.chats.timeline import compute_unread_count, unread_exempt_items_between
 from src.content.models import ContentModel
 import src.articles.models  # noqa: F401
 import src.moments.models  # noqa: F401
@@ -16,6 +17,7 @@ import src.tags.models  # noqa: F401
 import src.videos.models  # noqa: F401
 from src.events.models import EventModel
 from src.messages.models import MessageModel, MessageSharedContentModel
+from src.messages.repository import populate_shared_content_author_subscriptions
 from src.users.models import UserModel
 
 
@@ -103,6 +105,7 @@ class ChatRepository:
         limit: int,
         before_seq: int | None = None,
         after_seq: int | None = None,
+        viewer_id: uuid.UUID | None = None,
     ) -> list[tuple[ChatTimelineItemModel, MessageModel | EventModel]]:
         query = (
             select(ChatTimelineItemModel)
@@ -146,7 +149,6 @@ class ChatRepository:
                 select(MessageModel)
                 .where(MessageModel.message_id.in_(message_ids))
                 .options(
-                    selectinload(MessageModel.user).selectinload(UserModel.subscribers),
                     selectinload(MessageModel.user)
                     .selectinload(UserModel.avatar_asset)
                     .selectinload(AssetModel.variants),
@@ -157,6 +159,11 @@ class ChatRepository:
                 )
             )
             messages = (await self._session.execute(messages_query)).scalars().all()
+            await populate_shared_content_author_subscriptions(
+                self._session,
+                messages=messages,
+                viewer_id=viewer_id,
+            )
             messages_by_id = {message.message_id: message for message in messages}
 
         events_by_id: dict[uuid.UUID, EventModel] = {}
@@ -272,8 +279,24 @@ class ChatRepository:
         users_ids: list[uuid.UUID],
         role: ChatMemberRole = ChatMemberRole.MEMBER,
     ) -> int:
+        # New members start caught up: the chat's history is not unread for them,
+        # and the dialog sorts by the chat's current last activity.
+        chat = (
+            select(ChatModel.last_timeline_seq, ChatModel.last_message_id, ChatModel.last_message_at)
+            .where(ChatModel.chat_id == chat_id)
+            .subquery()
+        )
         users_query = (
-            select(literal(chat_id), UserModel.user_id, literal(role.value))
+            select(
+                literal(chat_id),
+                UserModel.user_id,
+                literal(role.value),
+                func.coalesce(chat.c.last_timeline_seq, 0),
+                chat.c.last_message_id,
+                chat.c.last_message_at,
+            )
+            .select_from(UserModel)
+            .outerjoin(chat, true())
             .where(
                 UserModel.user_id.in_([user_id for user_id in users_ids]),
             )
@@ -282,7 +305,14 @@ class ChatRepository:
         stmt = (
             insert(MembershipModel)
             .from_select(
-                ["chat_id", "user_id", "role"],
+                [
+                    "chat_id",
+                    "user_id",
+                    "role",
+                    "last_read_seq",
+                    "last_read_message_id",
+                    "last_message_at",
+                ],
                 users_query,
             )
         )
@@ -405,30 +435,17 @@ class ChatRepository:
         offset: int,
         limit: int,
     ) -> list[ChatModel]:
-        latest_message_at_query = (
-            select(
-                MessageModel.chat_id,
-                func.max(MessageModel.created_at).label("last_message_at"),
-            )
-            .group_by(MessageModel.chat_id)
-            .subquery()
-        )
-
         query = (
-            select(ChatModel, MembershipModel, latest_message_at_query.c.last_message_at)
+            select(ChatModel, MembershipModel)
             .join(
                 MembershipModel,
                 MembershipModel.chat_id == ChatModel.chat_id,
             )
-            .outerjoin(
-                latest_message_at_query,
-                latest_message_at_query.c.chat_id == ChatModel.chat_id,
-            )
             .where(MembershipModel.user_id == user_id)
             .options(self._members_load())
             .order_by(
-                desc(latest_message_at_query.c.last_message_at).nulls_last(),
-                ChatModel.chat_id,
+                desc(MembershipModel.last_message_at).nulls_last(),
+                MembershipModel.chat_id,
             )
             .offset(offset)
             .limit(limit)
@@ -437,22 +454,29 @@ class ChatRepository:
         rows = (await self._session.execute(query)).unique().all()
         chats = [row[0] for row in rows]
         memberships_by_chat_id = {row[0].chat_id: row[1] for row in rows}
-        last_message_at_by_chat_id = {row[0].chat_id: row[2] for row in rows}
-
-        chat_ids = [chat.chat_id for chat in chats]
-        last_messages = await self._get_last_messages(chat_ids=chat_ids)
-        unread_counts = await self._get_unread_counts(
-            chat_ids=chat_ids,
-            memberships_by_chat_id=memberships_by_chat_id,
-            user_id=user_id,
+
+        last_messages = await self._get_last_messages(
+            message_ids=[
+                chat.last_message_id
+                for chat in chats
+                if chat.last_message_id is not None
+            ],
+            viewer_id=user_id,
         )
 
         for chat in chats:
             membership = memberships_by_chat_id[chat.chat_id]
             setattr(chat, "membership", membership)
-            setattr(chat, "last_message", last_messages.get(chat.chat_id))
-            setattr(chat, "last_message_at", last_message_at_by_chat_id[chat.chat_id])
-            setattr(chat, "unread_count", unread_counts.get(chat.chat_id, 0))
+            setattr(chat, "last_message", last_messages.get(chat.last_message_id))
+            setattr(
+                chat,
+                "unread_count",
+                compute_unread_count(
+                    last_timeline_seq=chat.last_timeline_seq,
+                    last_read_seq=membership.last_read_seq,
+                    unread_exempt_count=membership.unread_exempt_count,
+                ),
+            )
 
         return chats
 
@@ -462,66 +486,102 @@ class ChatRepository:
         chat_id: uuid.UUID,
         user_id: uuid.UUID,
     ) -> uuid.UUID | None:
-        latest_message_id = await self.get_latest_message_id(chat_id=chat_id)
         stmt = (
             update(MembershipModel)
-            .values(last_read_message_id=latest_message_id)
-            .filter_by(chat_id=chat_id, user_id=user_id)
+            .where(
+                MembershipModel.chat_id == chat_id,
+                MembershipModel.user_id == user_id,
+                ChatModel.chat_id == MembershipModel.chat_id,
+            )
+            .values(
+                last_read_seq=ChatModel.last_timeline_seq,
+                last_read_message_id=ChatModel.last_message_id,
+                unread_exempt_count=0,
+            )
+            .returning(MembershipModel.last_read_message_id)
         )
 
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
         await self._session.commit()
-        return latest_message_id
+        return result.scalar_one_or_none()
 
-    async def get_latest_message_id(
+    async def mark_read_up_to(
         self,
         *,
-        chat_id: uuid.UUID,
-    ) -> uuid.UUID | None:
-        query = (
-            select(MessageModel.message_id)
-            .filter_by(chat_id=chat_id)
-            .order_by(desc(MessageModel.created_at), desc(MessageModel.message_id))
-            .limit(1)
-        )
+        user_id: uuid.UUID,
+        read_seqs: dict[uuid.UUID, int],
+    ) -> dict[uuid.UUID, int]:
+        """Move the user's read markers forward in one transaction; returns the new seq per chat.
+
+        Markers never move backwards or past the chat's last seq. Exempt items
+        read along the way are subtracted, so concurrent increments are kept.
+        """
+        read_up_to: dict[uuid.UUID, int] = {}
+        for chat_id, seq in read_seqs.items():
+            target_seq = func.least(
+                seq,
+                select(ChatModel.last_timeline_seq)
+                .where(ChatModel.chat_id == chat_id)
+                .scalar_subquery(),
+            )
+            last_read_message_id = (
+                select(ChatTimelineItemModel.message_id)
+                .where(
+                    ChatTimelineItemModel.chat_id == chat_id,
+                    ChatTimelineItemModel.chat_seq <= target_seq,
+                    ChatTimelineItemModel.item_type == "message",
+                )
+                .order_by(ChatTimelineItemModel.chat_seq.desc())
+                .limit(1)
+                .scalar_subquery()
+            )
+            exempt_items_read = unread_exempt_items_between(
+                chat_id=chat_id,
+                user_id=user_id,
+                after_seq=MembershipModel.last_read_seq,
+                up_to_seq=target_seq,
+            )
+            stmt = (
+                update(MembershipModel)
+                .where(
+                    MembershipModel.chat_id == chat_id,
+                    MembershipModel.user_id == user_id,
+                    MembershipModel.last_read_seq < target_seq,
+                )
+                .values(
+                    last_read_seq=target_seq,
+                    last_read_message_id=func.coalesce(
+                        last_read_message_id,
+                        MembershipModel.last_read_message_id,
+                    ),
+                    unread_exempt_count=func.greatest(
+                        MembershipModel.unread_exempt_count - exempt_items_read,
+                        0,
+                    ),
+                )
+                .returning(MembershipModel.last_read_seq)
+            )
+            result = await self._session.execute(stmt)
+            last_read_seq = result.scalar_one_or_none()
+            if last_read_seq is not None:
+                read_up_to[chat_id] = last_read_seq
 
-        result = await self._session.execute(query)
-        return result.scalar_one_or_none()
+        await self._session.commit()
+        return read_up_to
 
     async def _get_last_messages(
         self,
         *,
-        chat_ids: list[uuid.UUID],
+        message_ids: list[uuid.UUID],
+        viewer_id: uuid.UUID | None,
     ) -> dict[uuid.UUID, MessageModel]:
-        if not chat_ids:
+        if not message_ids:
             return {}
 
-        ranked_messages = (
-            select(
-                MessageModel.message_id,
-                func.row_number()
-                .over(
-                    partition_by=MessageModel.chat_id,
-                    order_by=[
-                        desc(MessageModel.created_at),
-                        desc(MessageModel.message_id),
-                    ],
-                )
-                .label("rank"),
-            )
-            .where(MessageModel.chat_id.in_(chat_ids))
-            .subquery()
-        )
-
         query = (
             select(MessageModel)
-            .join(
-                ranked_messages,
-                MessageModel.message_id == ranked_messages.c.message_id,
-            )
-            .where(ranked_messages.c.rank == 1)
+            .where(MessageModel.message_id.in_(message_ids))
             .options(
-                selectinload(MessageModel.user).selectinload(UserModel.subscribers),
                 selectinload(MessageModel.user)
                 .selectinload(UserModel.avatar_asset)
                 .selectinload(AssetModel.variants),
@@ -532,51 +592,13 @@ class ChatRepository:
             )
         )
 
-        result = await self._session.execute(query)
-        return {message.chat_id: message for message in result.scalars().all()}
-
-    async def _get_unread_counts(
-        self,
-        *,
-        chat_ids: list[uuid.UUID],
-        memberships_by_chat_id: dict[uuid.UUID, MembershipModel],
-        user_id: uuid.UUID,
-    ) -> dict[uuid.UUID, int]:
-        if not chat_ids:
-            return {}
-
-        read_message = aliased(MessageModel)
-        query = (
-            select(MessageModel.chat_id, func.count(MessageModel.message_id))
-            .join(
-                MembershipModel,
-                MembershipModel.chat_id == MessageModel.chat_id,
-            )
-            .outerjoin(
-                read_message,
-                read_message.message_id == MembershipModel.last_read_message_id,
-            )
-            .where(
-                MessageModel.chat_id.in_(chat_ids),
-                MembershipModel.user_id == user_id,
-                MessageModel.user_id != user_id,
-                or_(
-                    MembershipModel.last_read_message_id.is_(None),
-                    MessageModel.created_at > read_message.created_at,
-                    (
-                        (MessageModel.created_at == read_message.created_at)
-                        & (MessageModel.message_id > read_message.message_id)
-                    ),
-                ),
-            )
-            .group_by(MessageModel.chat_id)
+        messages = (await self._session.execute(query)).scalars().all()
+        await populate_shared_content_author_subscriptions(
+            self._session,
+            messages=messages,
+            viewer_id=viewer_id,
         )
-
-        result = await self._session.execute(query)
-        counts = {chat_id: count for chat_id, count in result.all()}
-        for chat_id in memberships_by_chat_id:
-            counts.setdefault(chat_id, 0)
-        return counts
+        return {message.message_id: message for message in messages}
 
     def _members_load(self):
         return (
@@ -597,7 +619,6 @@ class ChatRepository:
             MessageSharedContentModel.content
         )
         return (
-            content_load.selectinload(ContentModel.author).selectinload(UserModel.subscribers),
             content_load.selectinload(ContentModel.author)
             .selectinload(UserModel.avatar_asset)
             .selectinload(AssetModel.variants),
@@ -20,7 +20,7 @@ from src.events.enums import EventType
 from src.events.schemas import EventCreate
 from src.events.service import EventService
 from src.common.schemas import Status
-from src.users.schemas import UserGet
+from src.users.schemas import UserGet, UserPrincipal
 
 router = APIRouter(
     prefix="/chats",
@@ -31,7 +31,7 @@ router = APIRouter(
 @router.post("/")
 async def create_chat(
     data: ChatCreate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     chat_service: ChatService = Depends(get_chat_service),
     event_service: EventService = Depends(get_event_service),
 ) -> ChatGet:
@@ -58,7 +58,7 @@ async def get_chats(
     order_desc: bool = False,
     offset: int = 0,
     limit: int = 100,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service),
 ) -> list[ChatGet]:
     return await service.get_chats(
@@ -74,7 +74,7 @@ async def search_chats(
     query: str,
     offset: int = 0,
     limit: int = 100,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service),
 ) -> list[ChatGet]:
     return await service.search_chats(
@@ -91,7 +91,7 @@ async def get_joined_chats(
     order_desc: bool = False,
     offset: int = 0,
     limit: int = 100,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service),
 ) -> list[ChatDialogGet]:
     return await service.get_user_joined_chats(
@@ -106,7 +106,7 @@ async def get_joined_chats(
 @router.post("/{chat_id}/read")
 async def mark_chat_read(
     chat_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service),
 ) -> Status:
     await service.mark_chat_read(chat_id=chat_id, user_id=user.user_id)
@@ -116,7 +116,7 @@ async def mark_chat_read(
 @router.get("/{chat_id}")
 async def get_chat(
     chat_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service),
 ) -> ChatGet:
     return await service.get_chat(chat_id=chat_id, user_id=user.user_id)
@@ -125,7 +125,7 @@ async def get_chat(
 @router.get("/{chat_id}/members")
 async def get_chat_members(
     chat_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service),
 ) -> list[UserGet]:
     return await service.get_chat_members(chat_id=chat_id, user_id=user.user_id)
@@ -138,7 +138,7 @@ async def get_chat_history(
     before_seq: int | None = None,
     after_seq: int | None = None,
     offset: int | None = None,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service),
 ) -> list[MessageHistoryItem | EventHistoryItem]:
     _ = offset
@@ -154,7 +154,7 @@ async def get_chat_history(
 @router.post("/{chat_id}/join", status_code=status.HTTP_201_CREATED)
 async def join_chat(
     chat_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     chat_service: ChatService = Depends(get_chat_service),
     event_service: EventService = Depends(get_event_service),
 ) -> Status:
@@ -177,7 +177,7 @@ async def join_chat(
 @router.delete("/{chat_id}/leave")
 async def leave_chat(
     chat_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     chat_service: ChatService = Depends(get_chat_service),
     event_service: EventService = Depends(get_event_service),
 ) -> Status:
@@ -204,7 +204,7 @@ async def leave_chat(
 async def add_members_to_chat(
     chat_id: uuid.UUID,
     members_ids: list[uuid.UUID],
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     chat_service: ChatService = Depends(get_chat_service),
     event_service: EventService = Depends(get_event_service),
 ) -> Status:
@@ -231,7 +231,7 @@ async def add_members_to_chat(
 async def remove_members_from_chat(
     chat_id: uuid.UUID,
     members_ids: list[uuid.UUID],
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     chat_service: ChatService = Depends(get_chat_service),
     event_service: EventService = Depends(get_event_service),
 ) -> Status:
@@ -258,7 +258,7 @@ async def remove_members_from_chat(
 async def update_chat(
     chat_id: uuid.UUID,
     data: ChatUpdate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service),
 ) -> ChatGet:
     return await service.update_chat(
@@ -271,7 +271,7 @@ async def update_chat(
 @router.delete("/{chat_id}")
 async def delete_chat(
     chat_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: ChatService = Depends(get_chat_service),
 ) -> Status:
     await service.delete_chat(
@@ -11,6 +11,7 @@ from src.common.schemas import BaseSchema
 from src.users.schemas import UserAvatarGet, UserGet
 
 TitleStr = Annotated[str, Field(min_length=1, max_length=64)]
+MAX_READ_MARKERS_PER_EVENT = 200
 
 
 class ChatCreate(BaseSchema):
@@ -49,6 +50,7 @@ class ChatDialogGet(ChatGet):
     unread_count: int = 0
     is_muted: bool = False
     last_read_message_id: uuid.UUID | None = None
+    last_read_seq: int = 0
 
 
 class ChatUpdate(BaseSchema):
@@ -60,6 +62,15 @@ class ChatTypingWS(BaseSchema):
     chat_id: uuid.UUID
 
 
+class ChatReadMarkerWS(BaseSchema):
+    chat_id: uuid.UUID
+    seq: int = Field(ge=0)
+
+
+class ChatsReadWS(BaseSchema):
+    reads: list[ChatReadMarkerWS] = Field(min_length=1, max_length=MAX_READ_MARKERS_PER_EVENT)
+
+
 class MessageHistoryItem(MessageGetWithUser):
     item_type: str = "message"
     chat_seq: int
@@ -19,6 +19,7 @@ from src.chats.schemas import (
     ChatCreate,
     ChatDialogGet,
     ChatGet,
+    ChatReadMarkerWS,
     ChatUpdate,
     EventHistoryItem,
     MessageHistoryItem,
@@ -30,10 +31,11 @@ from src.messages.models import MessageModel
 from src.messages.presentation import build_message_get_with_user, build_reply_preview
 from src.messages.schemas import MessageGetWithUser, MessageReplyPreview
 from src.users.presentation import build_user_get
-from src.users.schemas import UserGet
+from src.users.schemas import UserGet, UserPrincipal
 
 if TYPE_CHECKING:
     from src.assets.storage import AssetStorage
+    from src.chats.membership_cache import ChatMembershipCache
 
 
 class ChatService:
@@ -42,10 +44,12 @@ class ChatService:
         repository: ChatRepository,
         storage: AssetStorage | None = None,
         content_service: ContentService | None = None,
+        membership_cache: ChatMembershipCache | None = None,
     ) -> None:
         self._repository = repository
         self._storage = storage
         self._content_service = content_service
+        self._membership_cache = membership_cache
 
     async def create_chat(
         self,
@@ -202,6 +206,7 @@ class ChatService:
             limit=limit,
             before_seq=before_seq,
             after_seq=after_seq,
+            viewer_id=user_id,
         )
 
         items: list[MessageHistoryItem | EventHistoryItem] = []
@@ -227,7 +232,7 @@ class ChatService:
         self,
         *,
         chat_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
     ) -> bool:
         try:
             if not user.is_admin:
@@ -266,9 +271,12 @@ class ChatService:
         ):
             raise FailedToLeaveChat(f"Failed to leave chat with id '{chat_id}'")
 
+        await self._forget_members(chat_id=chat_id, user_ids=[user_id])
+
         # Delete chat if it has no members
         if len(await self._repository.get_members(chat_id=chat_id)) == 0:
             await self._repository.delete(chat_id=chat_id)
+            await self._forget_chat(chat_id)
 
     async def check_chat_exists_and_user_is_owner(
         self,
@@ -297,7 +305,15 @@ class ChatService:
         chat_id: uuid.UUID,
         user_id: uuid.UUID,
     ) -> None:
+        if self._membership_cache is not None and await self._membership_cache.is_member(
+            chat_id=chat_id,
+            user_id=user_id,
+        ):
+            return
+
         if await self._repository.is_member(chat_id=chat_id, user_id=user_id):
+            if self._membership_cache is not None:
+                await self._membership_cache.add_members(chat_id=chat_id, user_ids=[user_id])
             return
 
         try:
@@ -332,11 +348,13 @@ class ChatService:
                 )
             ) == 0:
                 raise CantAddMembers("Failed to add members")
-
-            return added_users_count
         except IntegrityError as exc:
             raise CantAddMembers("Can't add members") from exc
 
+        if self._membership_cache is not None:
+            await self._membership_cache.add_members(chat_id=chat_id, user_ids=members_ids)
+        return added_users_count
+
     async def remove_members_from_chat(
         self,
         *,
@@ -360,6 +378,7 @@ class ChatService:
         ) == 0:
             raise CantRemoveMembers("Can't remove members")
 
+        await self._forget_members(chat_id=chat_id, user_ids=members_ids)
         return removed_users_count
 
     async def update_chat(
@@ -384,6 +403,7 @@ class ChatService:
     ) -> None:
         await self.check_chat_exists_and_user_is_owner(chat_id=chat_id, user_id=user_id)
         await self._repository.delete(chat_id=chat_id)
+        await self._forget_chat(chat_id)
 
     async def search_chats(
         self,
@@ -403,7 +423,7 @@ class ChatService:
 
     async def get_user_joined_chats(
         self,
-        user: UserGet,
+        user: UserPrincipal,
         order: ChatOrder,
         order_desc: bool,
         offset: int,
@@ -428,6 +448,22 @@ class ChatService:
         await self.ensure_user_is_chat_member(chat_id=chat_id, user_id=user_id)
         return await self._repository.mark_read(chat_id=chat_id, user_id=user_id)
 
+    async def mark_chats_read_up_to(
+        self,
+        *,
+        user_id: uuid.UUID,
+        reads: list[ChatReadMarkerWS],
+    ) -> dict[uuid.UUID, int]:
+        """Advance read markers for several chats at once.
+
+        Markers the user does not hold are skipped by the repository, so callers
+        are expected to have checked membership already.
+        """
+        read_seqs: dict[uuid.UUID, int] = {}
+        for read in reads:
+            read_seqs[read.chat_id] = max(read.seq, read_seqs.get(read.chat_id, 0))
+        return await self._repository.mark_read_up_to(user_id=user_id, read_seqs=read_seqs)
+
     async def _build_chat_get(self, chat) -> ChatGet:
         return ChatGet(
             chat_id=chat.chat_id,
@@ -483,6 +519,11 @@ class ChatService:
                 if membership is not None
                 else None
             ),
+            last_read_seq=(
+                getattr(membership, "last_read_seq", 0)
+                if membership is not None
+                else 0
+            ),
         )
 
     async def _build_message_get_with_user(
@@ -503,6 +544,19 @@ class ChatService:
     def _build_reply_preview(self, message) -> MessageReplyPreview:
         return build_reply_preview(message)
 
+    async def _forget_members(
+        self,
+        *,
+        chat_id: uuid.UUID,
+        user_ids: list[uuid.UUID],
+    ) -> None:
+        if self._membership_cache is not None:
+            await self._membership_cache.remove_members(chat_id=chat_id, user_ids=user_ids)
+
+    async def _forget_chat(self, chat_id: uuid.UUID) -> None:
+        if self._membership_cache is not None:
+            await self._membership_cache.forget_chat(chat_id)
+
     def _build_direct_key(
         self,
         user_id: uuid.UUID,
@@ -3,6 +3,7 @@ from typing import Any
 
 from pydantic import BaseModel
 
+from src.chats.typing_state import TypingUser
 from src.messages.schemas import MessageCreate, MessageCreateWS
 
 
@@ -13,6 +14,17 @@ class ChatTypingStatusWS(BaseModel):
     expires_in_seconds: int
 
 
+class ChatTypingUserWS(BaseModel):
+    user_id: uuid.UUID
+    username: str
+
+
+class ChatTypingSnapshotWS(BaseModel):
+    chat_id: uuid.UUID
+    users: list[ChatTypingUserWS]
+    expires_in_seconds: int
+
+
 def build_socket_message_create(
     *,
     chat_id: uuid.UUID,
@@ -43,3 +55,16 @@ def build_socket_typing_status(
         username=username,
         expires_in_seconds=expires_in_seconds,
     ).model_dump(mode="json")
+
+
+def build_socket_typing_snapshot(
+    *,
+    chat_id: uuid.UUID,
+    users: list[TypingUser],
+    expires_in_seconds: int,
+) -> dict[str, Any]:
+    return ChatTypingSnapshotWS(
+        chat_id=chat_id,
+        users=[ChatTypingUserWS(user_id=user.user_id, username=user.username) for user in users],
+        expires_in_seconds=expires_in_seconds,
+    ).model_dump(mode="json")
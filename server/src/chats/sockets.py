@@ -1,4 +1,3 @@
-import json
 import uuid
 from typing import Any
 
@@ -7,12 +6,25 @@ from pydantic import ValidationError
 
 from src.assets.dependencies import get_asset_service, get_asset_storage
 from src.auth.socket import SocketAuthenticationError, authenticate_socket_user
+from src.chats.broadcast import (
+    LEGACY_SOCKET_PROTOCOL,
+    BatchingAsyncRedisManager,
+    PacketJSON,
+    RawJSON,
+    build_message_created_emits,
+    chat_room,
+    emit_to_rooms,
+    legacy_chat_room,
+    parse_socket_protocol,
+)
 from src.chats.dependencies import get_chat_service
 from src.chats.exceptions import ChatNotFound
+from src.chats.membership_cache import SocketChatAuthorizations
 from src.chats import typing_state
-from src.chats.schemas import ChatTypingWS
+from src.chats.schemas import ChatsReadWS, ChatTypingWS
 from src.chats.socket_messages import build_socket_message_create
-from src.chats.socket_messages import build_socket_typing_status
+from src.chats.socket_messages import build_socket_typing_snapshot, build_socket_typing_status
+from src.chats.typing_aggregator import TypingAggregator
 from src.config import settings
 from src.common.database import async_session_maker
 from src.common.exceptions import PermissionDenied
@@ -37,12 +49,13 @@ from src.messages.schemas import (
 from src.users.repository import UserRepository
 from src.users.service import UserService
 
-socketio_manager = socketio.AsyncRedisManager(settings.redis.socketio_manager_url)
+socketio_manager = BatchingAsyncRedisManager(settings.redis.socketio_manager_url)
 
 sio = socketio.AsyncServer(
     async_mode="asgi",
     cors_allowed_origins=settings.ws.allowed_hosts,
     client_manager=socketio_manager,
+    json=PacketJSON,
 )
 
 socket_app = socketio.ASGIApp(
@@ -50,8 +63,27 @@ socket_app = socketio.ASGIApp(
     socketio_path="/ws",
 )
 
+socket_chat_authorizations = SocketChatAuthorizations()
+
+
+async def _emit_typing_snapshot(chat_id: uuid.UUID, users: list[typing_state.TypingUser]) -> None:
+    # Protocol 2 clients build their indicator from these snapshots; legacy
+    # clients keep receiving per-user typing:start/typing:stop instead.
+    await sio.emit(
+        "typing:snapshot",
+        build_socket_typing_snapshot(
+            chat_id=chat_id,
+            users=users,
+            expires_in_seconds=typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS,
+        ),
+        room=chat_room(chat_id),
+    )
+
+
+typing_aggregator = TypingAggregator(emit=_emit_typing_snapshot)
 
-def _success_response(data: dict[str, Any] | None = None) -> dict[str, Any]:
+
+def _success_response(data: dict[str, Any] | RawJSON | None = None) -> dict[str, Any]:
     response: dict[str, Any] = {"ok": True}
     if data is not None:
         response["data"] = data
@@ -83,7 +115,56 @@ async def _get_socket_user_context(sid: str) -> tuple[uuid.UUID, str]:
     return user_id, username
 
 
+async def _authorize_chat_member(
+    sid: str,
+    *,
+    chat_id: uuid.UUID,
+    user_id: uuid.UUID,
+    allow_recent: bool = True,
+) -> dict[str, Any] | None:
+    """Error response if the user may not act in the chat, otherwise None.
+
+    With `allow_recent`, a chat this socket was authorized for in the last
+    SOCKET_MEMBERSHIP_TTL_SECONDS passes without any I/O. Otherwise ChatService
+    checks the Redis membership set, which removals clear immediately, and only
+    queries Postgres on a miss.
+    """
+    if allow_recent and socket_chat_authorizations.is_authorized(sid, chat_id):
+        return None
+
+    async with async_session_maker() as session:
+        service = get_chat_service(session)
+        try:
+            await service.ensure_user_is_chat_member(
+                chat_id=chat_id,
+                user_id=user_id,
+            )
+        except ChatNotFound as exc:
+            socket_chat_authorizations.revoke(sid, chat_id)
+            return _error_response("not_found", str(exc))
+        except PermissionDenied as exc:
+            socket_chat_authorizations.revoke(sid, chat_id)
+            return _error_response("forbidden", str(exc))
+
+    socket_chat_authorizations.authorize(sid, chat_id)
+    return None
+
+
+async def _get_socket_protocol(sid: str) -> int:
+    session = await sio.get_session(sid)
+    return session.get("protocol", LEGACY_SOCKET_PROTOCOL)
+
+
 async def _build_message_ws_payload(message, *, viewer_id: uuid.UUID | None = None) -> dict[str, Any]:
+    return _build_message_ws(message).model_dump(mode="json")
+
+
+async def _serialize_message_ws_payload(message) -> RawJSON:
+    """The message payload encoded once, for fan-out and the sender's ack alike."""
+    return RawJSON(_build_message_ws(message).model_dump_json())
+
+
+def _build_message_ws(message) -> MessageGetWS:
     avatar = message.user.avatar
     return MessageGetWS(
         message_id=message.message_id,
@@ -103,7 +184,7 @@ async def _build_message_ws_payload(message, *, viewer_id: uuid.UUID | None = No
         attachments=message.attachments,
         shared_content=message.shared_content,
         reactions=message.reactions,
-    ).model_dump(mode="json")
+    )
 
 
 def _build_message_reaction_event_payload(
@@ -148,10 +229,16 @@ async def connect(
         {
             "user_id": user.user_id,
             "username": user.username,
+            "protocol": parse_socket_protocol(auth),
         },
     )
 
 
+@sio.event
+async def disconnect(sid: str) -> None:
+    socket_chat_authorizations.drop_sid(sid)
+
+
 @sio.on("join")
 async def on_join(
     sid: str,
@@ -165,19 +252,13 @@ async def on_join(
     except SocketAuthenticationError as exc:
         return _error_response("unauthorized", str(exc))
 
-    async with async_session_maker() as session:
-        service = get_chat_service(session)
-        try:
-            await service.ensure_user_is_chat_member(
-                chat_id=chat_id,
-                user_id=user_id,
-            )
-        except ChatNotFound as exc:
-            return _error_response("not_found", str(exc))
-        except PermissionDenied as exc:
-            return _error_response("forbidden", str(exc))
+    error = await _authorize_chat_member(sid, chat_id=chat_id, user_id=user_id, allow_recent=False)
+    if error is not None:
+        return error
 
-    await sio.enter_room(sid, str(chat_id))
+    await sio.enter_room(sid, chat_room(chat_id))
+    if await _get_socket_protocol(sid) == LEGACY_SOCKET_PROTOCOL:
+        await sio.enter_room(sid, legacy_chat_room(chat_id))
     return _success_response()
 
 
@@ -191,7 +272,9 @@ async def on_leave(
     except (KeyError, TypeError, ValueError):
         return _error_response("bad_request", "Invalid chat_id")
 
-    await sio.leave_room(sid, str(chat_id))
+    socket_chat_authorizations.revoke(sid, chat_id)
+    await sio.leave_room(sid, chat_room(chat_id))
+    await sio.leave_room(sid, legacy_chat_room(chat_id))
     return _success_response()
 
 
@@ -208,33 +291,27 @@ async def on_typing_start(
     except SocketAuthenticationError as exc:
         return _error_response("unauthorized", str(exc))
 
-    async with async_session_maker() as session:
-        service = get_chat_service(session)
-        try:
-            await service.ensure_user_is_chat_member(
-                chat_id=msg.chat_id,
-                user_id=user_id,
-            )
-        except ChatNotFound as exc:
-            return _error_response("not_found", str(exc))
-        except PermissionDenied as exc:
-            return _error_response("forbidden", str(exc))
+    error = await _authorize_chat_member(sid, chat_id=msg.chat_id, user_id=user_id)
+    if error is not None:
+        return error
 
     await typing_state.mark_chat_typing(
         chat_id=msg.chat_id,
         user_id=user_id,
         username=username,
     )
-    payload = build_socket_typing_status(
-        chat_id=msg.chat_id,
-        user_id=user_id,
-        username=username,
-        expires_in_seconds=typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS,
-    )
+    typing_aggregator.touch(msg.chat_id)
+    # Protocol 1 clients expire a typist unless every throttled re-send is
+    # rebroadcast, so this goes out on each accepted start, not just the flip.
     await sio.emit(
         "typing:start",
-        payload,
-        room=str(msg.chat_id),
+        build_socket_typing_status(
+            chat_id=msg.chat_id,
+            user_id=user_id,
+            username=username,
+            expires_in_seconds=typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS,
+        ),
+        room=legacy_chat_room(msg.chat_id),
         skip_sid=sid,
     )
     return _success_response(
@@ -255,36 +332,59 @@ async def on_typing_stop(
     except SocketAuthenticationError as exc:
         return _error_response("unauthorized", str(exc))
 
-    async with async_session_maker() as session:
-        service = get_chat_service(session)
-        try:
-            await service.ensure_user_is_chat_member(
-                chat_id=msg.chat_id,
-                user_id=user_id,
-            )
-        except ChatNotFound as exc:
-            return _error_response("not_found", str(exc))
-        except PermissionDenied as exc:
-            return _error_response("forbidden", str(exc))
+    error = await _authorize_chat_member(sid, chat_id=msg.chat_id, user_id=user_id)
+    if error is not None:
+        return error
 
-    await typing_state.clear_chat_typing(
+    stopped = await typing_state.clear_chat_typing(
         chat_id=msg.chat_id,
         user_id=user_id,
     )
-    await sio.emit(
-        "typing:stop",
-        build_socket_typing_status(
-            chat_id=msg.chat_id,
-            user_id=user_id,
-            username=username,
-            expires_in_seconds=typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS,
-        ),
-        room=str(msg.chat_id),
-        skip_sid=sid,
-    )
+    if stopped:
+        typing_aggregator.touch(msg.chat_id)
+        await sio.emit(
+            "typing:stop",
+            build_socket_typing_status(
+                chat_id=msg.chat_id,
+                user_id=user_id,
+                username=username,
+                expires_in_seconds=typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS,
+            ),
+            room=legacy_chat_room(msg.chat_id),
+            skip_sid=sid,
+        )
     return _success_response()
 
 
+@sio.on("chats:read")
+async def on_chats_read(
+    sid: str,
+    data: dict[str, Any],
+) -> dict[str, Any]:
+    try:
+        msg = ChatsReadWS.model_validate(data)
+        user_id = await _get_socket_user_id(sid)
+    except (KeyError, TypeError, ValueError, ValidationError):
+        return _error_response("bad_request", "Invalid read markers payload")
+    except SocketAuthenticationError as exc:
+        return _error_response("unauthorized", str(exc))
+
+    # No per-chat membership check: markers only move on the user's own
+    # membership rows, so chats they are not in are simply left out.
+    async with async_session_maker() as session:
+        service = get_chat_service(session)
+        read_up_to = await service.mark_chats_read_up_to(user_id=user_id, reads=msg.reads)
+
+    return _success_response(
+        {
+            "reads": [
+                {"chat_id": str(chat_id), "last_read_seq": seq}
+                for chat_id, seq in read_up_to.items()
+            ]
+        }
+    )
+
+
 @sio.on("message")
 async def on_message(
     sid: str,
@@ -299,18 +399,13 @@ async def on_message(
     except SocketAuthenticationError as exc:
         return _error_response("unauthorized", str(exc))
 
-    async with async_session_maker() as session:
-        chat_service = get_chat_service(session)
-        try:
-            await chat_service.ensure_user_is_chat_member(
-                chat_id=chat_id,
-                user_id=user_id,
-            )
-        except ChatNotFound as exc:
-            return _error_response("not_found", str(exc))
-        except PermissionDenied as exc:
-            return _error_response("forbidden", str(exc))
+    # Posting is not covered by the socket's recent authorizations; a removed
+    # member must not be able to post while they are still cached locally.
+    error = await _authorize_chat_member(sid, chat_id=chat_id, user_id=user_id, allow_recent=False)
+    if error is not None:
+        return error
 
+    async with async_session_maker() as session:
         message_service = get_message_service(session)
         try:
             message = await message_service.create_message(
@@ -326,19 +421,8 @@ async def on_message(
             return _error_response("bad_request", str(exc))
         except ContentNotFound as exc:
             return _error_response("forbidden", str(exc))
-    message_payload = await _build_message_ws_payload(message)
-
-    await sio.emit(
-        "message:created",
-        message_payload,
-        room=str(chat_id),
-    )
-    await sio.emit(
-        "message",
-        json.dumps(message_payload),
-        room=str(chat_id),
-        skip_sid=sid,
-    )
+    message_payload = await _serialize_message_ws_payload(message)
+    await emit_to_rooms(sio, build_message_created_emits(message_payload, chat_id=chat_id, skip_sid=sid))
     return _success_response(message_payload)
 
 
@@ -1,9 +1,11 @@
+import datetime
 import uuid
 
-from sqlalchemy import insert, select, update
+from sqlalchemy import ColumnElement, ScalarSelect, SQLColumnExpression, case, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.chats.models import ChatModel, ChatTimelineItemModel
+from src.chats.models import ChatModel, ChatTimelineItemModel, MembershipModel
+from src.messages.models import MessageModel
 
 
 async def allocate_chat_seq(
@@ -26,8 +28,35 @@ async def create_message_timeline_item(
     session: AsyncSession,
     chat_id: uuid.UUID,
     message_id: uuid.UUID,
+    author_id: uuid.UUID,
+    created_at: datetime.datetime,
 ) -> int:
-    chat_seq = await allocate_chat_seq(session=session, chat_id=chat_id)
+    """Append the message to the chat timeline and refresh the chat's dialog state.
+
+    The seq allocation locks the chat row until commit, so concurrent messages
+    update last_message_* in seq order. Only the author's unread state changes:
+    their own message is exempt from their unread count.
+    """
+    result = await session.execute(
+        update(ChatModel)
+        .where(ChatModel.chat_id == chat_id)
+        .values(
+            last_timeline_seq=ChatModel.last_timeline_seq + 1,
+            last_message_id=message_id,
+            last_message_at=created_at,
+        )
+        .returning(ChatModel.last_timeline_seq)
+    )
+    chat_seq = result.scalar_one()
+    await session.execute(
+        update(MembershipModel)
+        .where(MembershipModel.chat_id == chat_id)
+        .values(
+            last_message_at=created_at,
+            unread_exempt_count=MembershipModel.unread_exempt_count
+            + case((MembershipModel.user_id == author_id, 1), else_=0),
+        )
+    )
     await session.execute(
         insert(ChatTimelineItemModel).values(
             chat_id=chat_id,
@@ -46,6 +75,12 @@ async def create_event_timeline_item(
     event_id: uuid.UUID,
 ) -> int:
     chat_seq = await allocate_chat_seq(session=session, chat_id=chat_id)
+    # Events are rare next to messages, so touching every membership is fine here.
+    await session.execute(
+        update(MembershipModel)
+        .where(MembershipModel.chat_id == chat_id)
+        .values(unread_exempt_count=MembershipModel.unread_exempt_count + 1)
+    )
     await session.execute(
         insert(ChatTimelineItemModel).values(
             chat_id=chat_id,
@@ -68,3 +103,84 @@ async def get_message_chat_seq(
         .limit(1)
     )
     return result.scalar_one_or_none()
+
+
+def compute_unread_count(
+    *,
+    last_timeline_seq: int,
+    last_read_seq: int,
+    unread_exempt_count: int,
+) -> int:
+    return max(last_timeline_seq - last_read_seq - unread_exempt_count, 0)
+
+
+def unread_exempt_items_between(
+    *,
+    chat_id: uuid.UUID,
+    user_id: uuid.UUID,
+    after_seq: int | SQLColumnExpression[int],
+    up_to_seq: ColumnElement[int] | int,
+) -> ScalarSelect[int]:
+    """Count of timeline items in (after_seq, up_to_seq] that never were unread for the user."""
+    return (
+        select(func.count())
+        .select_from(ChatTimelineItemModel)
+        .outerjoin(MessageModel, MessageModel.message_id == ChatTimelineItemModel.message_id)
+        .where(
+            ChatTimelineItemModel.chat_id == chat_id,
+            ChatTimelineItemModel.chat_seq > after_seq,
+            ChatTimelineItemModel.chat_seq <= up_to_seq,
+            or_(
+                ChatTimelineItemModel.item_type == "event",
+                MessageModel.user_id == user_id,
+                MessageModel.deleted_at.is_not(None),
+            ),
+        )
+        .scalar_subquery()
+    )
+
+
+async def exempt_deleted_message(
+    *,
+    session: AsyncSession,
+    chat_id: uuid.UUID,
+    message_id: uuid.UUID,
+    author_id: uuid.UUID,
+) -> None:
+    """Stop counting a deleted message as unread for members who had not read it yet.
+
+    The author is skipped: their own message was exempt from the start.
+    """
+    message_seq = (
+        select(ChatTimelineItemModel.chat_seq)
+        .where(ChatTimelineItemModel.message_id == message_id)
+        .scalar_subquery()
+    )
+    await session.execute(
+        update(MembershipModel)
+        .where(
+            MembershipModel.chat_id == chat_id,
+            MembershipModel.user_id != author_id,
+            MembershipModel.last_read_seq < message_seq,
+        )
+        .values(unread_exempt_count=MembershipModel.unread_exempt_count + 1)
+    )
+
+
+async def mark_chat_read_for_all_members(
+    *,
+    session: AsyncSession,
+    chat_id: uuid.UUID,
+) -> None:
+    await session.execute(
+        update(MembershipModel)
+        .where(
+            MembershipModel.chat_id == chat_id,
+            ChatModel.chat_id == MembershipModel.chat_id,
+        )
+        .values(
+            last_read_seq=ChatModel.last_timeline_seq,
+            last_read_message_id=ChatModel.last_message_id,
+            unread_exempt_count=0,
+        )
+    )
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import typing as tp
+import uuid
+
+from src.chats import typing_state
+
+
+logger = logging.getLogger(__name__)
+
+TYPING_SNAPSHOT_INTERVAL_SECONDS = 0.5
+# Clients drop a typing user TYPING_STATUS_EXPIRES_IN_SECONDS after the last
+# snapshot that listed them, so a non-empty snapshot is re-sent this often.
+TYPING_SNAPSHOT_REFRESH_SECONDS = typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS / 3
+
+TypingSnapshotEmitter = tp.Callable[[uuid.UUID, list[typing_state.TypingUser]], tp.Awaitable[None]]
+
+
+def build_typing_snapshot_digest(users: tp.Sequence[typing_state.TypingUser], *, now: float) -> str:
+    """Who is typing; a non-empty set also carries its refresh window, so it changes once per window."""
+    if not users:
+        return ""
+    user_ids = ",".join(sorted(str(user.user_id) for user in users))
+    return f"{user_ids}@{int(now // TYPING_SNAPSHOT_REFRESH_SECONDS)}"
+
+
+class TypingAggregator:
+    """Coalesces typing start/stop events into at most one snapshot per chat per interval.
+
+    Handlers only call `touch`; a background loop then reads the chat's typing
+    set and broadcasts it when it differs from the last snapshot any host sent,
+    or when a non-empty set enters a new refresh window. Chats with someone
+    typing stay on the loop so expired statuses also produce a snapshot. The
+    loop stops when there is nothing left to watch.
+    """
+
+    def __init__(
+        self,
+        *,
+        emit: TypingSnapshotEmitter,
+        interval_seconds: float = TYPING_SNAPSHOT_INTERVAL_SECONDS,
+        clock: tp.Callable[[], float] = time.time,
+    ) -> None:
+        self._emit = emit
+        self._interval_seconds = interval_seconds
+        # Wall time, so every host agrees on the refresh window.
+        self._clock = clock
+        self._pending: set[uuid.UUID] = set()
+        self._active: set[uuid.UUID] = set()
+        self._last_digests: dict[uuid.UUID, str] = {}
+        self._task: asyncio.Task | None = None
+
+    def touch(self, chat_id: uuid.UUID) -> None:
+        self._pending.add(chat_id)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self) -> None:
+        chat_ids = self._pending | self._active
+        self._pending = set()
+        for chat_id in chat_ids:
+            try:
+                await self._flush_chat(chat_id)
+            except Exception:
+                logger.exception("Failed to flush typing snapshot for chat %s", chat_id)
+
+    async def _flush_chat(self, chat_id: uuid.UUID) -> None:
+        users = await typing_state.get_chat_typing_users(chat_id=chat_id)
+        if users:
+            self._active.add(chat_id)
+        else:
+            self._active.discard(chat_id)
+
+        digest = build_typing_snapshot_digest(users, now=self._clock())
+        if self._last_digests.get(chat_id, "") == digest:
+            return
+        if users:
+            self._last_digests[chat_id] = digest
+        else:
+            self._last_digests.pop(chat_id, None)
+
+        # A missing previous digest counts as a change: the stored one may have
+        # expired while clients still show someone typing.
+        previous = await typing_state.swap_chat_typing_snapshot(chat_id=chat_id, digest=digest)
+        if previous is None or previous != digest:
+            await self._emit(chat_id, users)
+
+    async def _run(self) -> None:
+        while self._pending or self._active:
+            await asyncio.sleep(self._interval_seconds)
+            await self.flush()
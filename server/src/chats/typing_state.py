@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import time
 import uuid
+from dataclasses import dataclass
 
 import redis.asyncio as redis
 
@@ -15,12 +17,23 @@ typing_redis = redis.from_url(
 )
 
 
-def build_chat_typing_key(
-    *,
-    chat_id: uuid.UUID,
-    user_id: uuid.UUID,
-) -> str:
-    return f"chats:typing:{chat_id}:{user_id}"
+@dataclass(slots=True, frozen=True)
+class TypingUser:
+    user_id: uuid.UUID
+    username: str
+
+
+def build_chat_typing_key(chat_id: uuid.UUID) -> str:
+    """Sorted set of user ids typing in the chat, scored by when their status expires."""
+    return f"chats:typing:{chat_id}"
+
+
+def build_chat_typing_names_key(chat_id: uuid.UUID) -> str:
+    return f"chats:typing:{chat_id}:names"
+
+
+def build_chat_typing_snapshot_key(chat_id: uuid.UUID) -> str:
+    return f"chats:typing:{chat_id}:snapshot"
 
 
 async def mark_chat_typing(
@@ -28,17 +41,68 @@ async def mark_chat_typing(
     chat_id: uuid.UUID,
     user_id: uuid.UUID,
     username: str,
-) -> None:
-    await typing_redis.set(
-        build_chat_typing_key(chat_id=chat_id, user_id=user_id),
-        username,
-        ex=TYPING_STATUS_EXPIRES_IN_SECONDS,
-    )
+    now: float | None = None,
+) -> bool:
+    """Refresh the user's typing status; True if they were not already typing."""
+    now = time.time() if now is None else now
+    key = build_chat_typing_key(chat_id)
+    names_key = build_chat_typing_names_key(chat_id)
+    async with typing_redis.pipeline(transaction=True) as pipe:
+        pipe.zscore(key, str(user_id))
+        pipe.zadd(key, {str(user_id): now + TYPING_STATUS_EXPIRES_IN_SECONDS})
+        pipe.hset(names_key, str(user_id), username)
+        pipe.expire(key, TYPING_STATUS_EXPIRES_IN_SECONDS)
+        pipe.expire(names_key, TYPING_STATUS_EXPIRES_IN_SECONDS)
+        previous_expires_at, *_ = await pipe.execute()
+    return previous_expires_at is None or float(previous_expires_at) <= now
 
 
 async def clear_chat_typing(
     *,
     chat_id: uuid.UUID,
     user_id: uuid.UUID,
-) -> None:
-    await typing_redis.delete(build_chat_typing_key(chat_id=chat_id, user_id=user_id))
+) -> bool:
+    """Drop the user's typing status; True if they were typing."""
+    async with typing_redis.pipeline(transaction=True) as pipe:
+        pipe.zrem(build_chat_typing_key(chat_id), str(user_id))
+        pipe.hdel(build_chat_typing_names_key(chat_id), str(user_id))
+        removed, _ = await pipe.execute()
+    return bool(removed)
+
+
+async def get_chat_typing_users(
+    *,
+    chat_id: uuid.UUID,
+    now: float | None = None,
+) -> list[TypingUser]:
+    """Users whose typing status has not expired, pruning the ones that have."""
+    now = time.time() if now is None else now
+    key = build_chat_typing_key(chat_id)
+    async with typing_redis.pipeline(transaction=True) as pipe:
+        pipe.zrangebyscore(key, f"({now}", "+inf")
+        pipe.hgetall(build_chat_typing_names_key(chat_id))
+        pipe.zremrangebyscore(key, "-inf", now)
+        user_ids, names, _ = await pipe.execute()
+    return [
+        TypingUser(user_id=uuid.UUID(user_id), username=names[user_id])
+        for user_id in user_ids
+        if user_id in names
+    ]
+
+
+async def swap_chat_typing_snapshot(
+    *,
+    chat_id: uuid.UUID,
+    digest: str,
+) -> str | None:
+    """Store the digest of the last broadcast snapshot and return the previous one.
+
+    Shared by every socket host, so a snapshot is broadcast once per change or
+    refresh window however many hosts are aggregating the chat.
+    """
+    return await typing_redis.set(
+        build_chat_typing_snapshot_key(chat_id),
+        digest,
+        ex=TYPING_STATUS_EXPIRES_IN_SECONDS * 2,
+        get=True,
+    )
@@ -16,7 +16,7 @@ from src.comments.schemas import (
 )
 from src.comments.service import CommentService
 from src.common.schemas import Status
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 
 router = APIRouter(tags=["Comments"])
 
@@ -26,7 +26,7 @@ async def get_root_comments(
     content_id: uuid.UUID,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=DEFAULT_COMMENTS_LIMIT, ge=1, le=MAX_COMMENTS_LIMIT),
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     comment_service: CommentService = Depends(get_comment_service),
 ) -> CommentsPageGet:
     return await comment_service.get_root_comments(
@@ -41,7 +41,7 @@ async def get_root_comments(
 async def create_root_comment(
     content_id: uuid.UUID,
     data: CommentCreate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     comment_service: CommentService = Depends(get_comment_service),
 ) -> CommentGet:
     return await comment_service.create_root_comment(
@@ -56,7 +56,7 @@ async def get_replies(
     comment_id: uuid.UUID,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=DEFAULT_COMMENTS_LIMIT, ge=1, le=MAX_COMMENTS_LIMIT),
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     comment_service: CommentService = Depends(get_comment_service),
 ) -> RepliesPageGet:
     return await comment_service.get_replies(
@@ -71,7 +71,7 @@ async def get_replies(
 async def create_reply(
     comment_id: uuid.UUID,
     data: CommentCreate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     comment_service: CommentService = Depends(get_comment_service),
 ) -> CommentGet:
     return await comment_service.create_reply(
@@ -85,7 +85,7 @@ async def create_reply(
 async def update_comment(
     comment_id: uuid.UUID,
     data: CommentUpdate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     comment_service: CommentService = Depends(get_comment_service),
 ) -> CommentGet:
     return await comment_service.update_comment(
@@ -98,7 +98,7 @@ async def update_comment(
 @router.delete("/comments/{comment_id}")
 async def delete_comment(
     comment_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     comment_service: CommentService = Depends(get_comment_service),
 ) -> Status:
     await comment_service.delete_comment(
@@ -111,7 +111,7 @@ async def delete_comment(
 @router.post("/comments/{comment_id}/like")
 async def like_comment(
     comment_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     comment_service: CommentService = Depends(get_comment_service),
 ) -> CommentReactionGet:
     return await comment_service.add_like(
@@ -123,7 +123,7 @@ async def like_comment(
 @router.delete("/comments/{comment_id}/like")
 async def unlike_comment(
     comment_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     comment_service: CommentService = Depends(get_comment_service),
 ) -> CommentReactionGet:
     return await comment_service.remove_like(
@@ -135,7 +135,7 @@ async def unlike_comment(
 @router.post("/comments/{comment_id}/dislike")
 async def dislike_comment(
     comment_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     comment_service: CommentService = Depends(get_comment_service),
 ) -> CommentReactionGet:
     return await comment_service.add_dislike(
@@ -147,7 +147,7 @@ async def dislike_comment(
 @router.delete("/comments/{comment_id}/dislike")
 async def undislike_comment(
     comment_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     comment_service: CommentService = Depends(get_comment_service),
 ) -> CommentReactionGet:
     return await comment_service.remove_dislike(
@@ -26,7 +26,7 @@ from src.content.access import can_access_comments, can_view_content
 from src.content.enums import ReactionTypeEnum
 from src.users.presentation import build_user_get
 from src.users.repository import UserRepository
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 
 if TYPE_CHECKING:
     from src.activity.service import ActivityService
@@ -49,7 +49,7 @@ class CommentService:
         content_id: uuid.UUID,
         offset: int,
         limit: int,
-        user: UserGet | None = None,
+        user: UserPrincipal | None = None,
     ) -> CommentsPageGet:
         viewer_id = user.user_id if user else None
         await self._get_readable_content(content_id=content_id, viewer_id=viewer_id)
@@ -66,7 +66,7 @@ class CommentService:
         self,
         *,
         content_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
         data: CommentCreate,
     ) -> CommentGet:
         content = await self._get_commentable_content(content_id=content_id, viewer_id=user.user_id)
@@ -106,7 +106,7 @@ class CommentService:
         comment_id: uuid.UUID,
         offset: int,
         limit: int,
-        user: UserGet | None = None,
+        user: UserPrincipal | None = None,
     ) -> RepliesPageGet:
         viewer_id = user.user_id if user else None
         parent_comment = await self._get_comment_state_or_raise(comment_id=comment_id)
@@ -144,7 +144,7 @@ class CommentService:
         self,
         *,
         comment_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
         data: CommentCreate,
     ) -> CommentGet:
         parent_comment = await self._get_comment_state_or_raise(comment_id=comment_id)
@@ -199,7 +199,7 @@ class CommentService:
         self,
         *,
         comment_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
         data: CommentUpdate,
     ) -> CommentGet:
         comment = await self._get_comment_state_or_raise(comment_id=comment_id)
@@ -232,7 +232,7 @@ class CommentService:
         self,
         *,
         comment_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
     ) -> None:
         comment = await self._get_comment_state_or_raise(comment_id=comment_id)
         await self._get_manageable_content(
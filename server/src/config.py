@@ -74,6 +74,9 @@ class StorageSettings(ConfigBase):
     addressing_style: Literal["virtual", "path"] = "virtual"
     presigned_upload_ttl_seconds: int = 900
     presigned_download_ttl_seconds: int = 900
+    presigned_url_cache_margin_seconds: int = 60
+    presigned_url_cache_max_size: int = 10_000
+    max_pool_connections: int = 50
 
     model_config = SettingsConfigDict(env_prefix="storage_")
 
@@ -105,6 +108,14 @@ class AssetsSettings(ConfigBase):
     orphan_grace_hours: int = 24
     stale_upload_grace_hours: int = 24
     multipart_part_size_mb: int = 10
+    video_single_pass_transcode: bool = True
+    video_transcode_threads: int = 0
+    video_hls_enabled: bool = True
+    video_hls_segment_seconds: int = 4
+    # Uploads only overlap encoding with video_single_pass_transcode off; a
+    # single-pass run hands over every rendition at once when it finishes.
+    video_pipelined_upload: bool = True
+    image_render_workers: int = 2
 
     model_config = SettingsConfigDict(env_prefix="assets_")
 
@@ -133,6 +144,8 @@ class CelerySettings(ConfigBase):
     broker_url: str
     result_backend: str
     media_queue_name: str = "media"
+    worker_db_pool_size: int = 2
+    worker_db_max_overflow: int = 2
 
     model_config = SettingsConfigDict(env_prefix="celery_")
 
@@ -142,10 +155,35 @@ class Neo4jSettings(ConfigBase):
     user: str = "neo4j"
     password: str = "password"
     database: str = "neo4j"
+    max_connection_pool_size: int = 50
+    connection_acquisition_timeout_seconds: float = 10.0
+    connection_timeout_seconds: float = 5.0
+    max_connection_lifetime_seconds: int = 60 * 60
+    slow_query_ms: int = 500
+    profile_slow_queries: bool = False
 
     model_config = SettingsConfigDict(env_prefix="neo4j_")
 
 
+class RecommendationsSettings(ConfigBase):
+    backend: Literal["neo4j", "sparse"] = "neo4j"
+    sparse_index_ttl_seconds: int = 10 * 60
+    rebuild_chunk_size: int = 1000
+    rebuild_write_concurrency: int = 4
+    candidate_store_enabled: bool = True
+    candidate_list_size: int = 500
+    candidate_ttl_seconds: int = 6 * 60 * 60
+    candidate_refresh_interval_seconds: int = 15 * 60
+    candidate_refresh_concurrency: int = 8
+    result_cache_enabled: bool = True
+    result_cache_ttl_seconds: int = 60 * 60
+    active_user_days: int = 14
+    active_user_limit: int = 10_000
+    affinity_reconcile_interval_seconds: int = 24 * 60 * 60
+
+    model_config = SettingsConfigDict(env_prefix="recommendations_")
+
+
 class Settings(BaseSettings):
     db: DBSettings = Field(default_factory=DBSettings)  # type: ignore
     logging: LoggingConfig = Field(default_factory=LoggingConfig)  # type: ignore
@@ -158,6 +196,7 @@ class Settings(BaseSettings):
     redis: RedisSettings = Field(default_factory=RedisSettings)  # type: ignore
     celery: CelerySettings = Field(default_factory=CelerySettings)  # type: ignore
     neo4j: Neo4jSettings = Field(default_factory=Neo4jSettings)  # type: ignore
+    recommendations: RecommendationsSettings = Field(default_factory=RecommendationsSettings)  # type: ignore
 
 
 settings = Settings()
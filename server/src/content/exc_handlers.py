@@ -1,6 +1,6 @@
 from fastapi import HTTPException, Request, status
 
-from src.content.exceptions import ContentNotFound, InvalidContentAction
+from src.content.exceptions import ContentNotFound, InvalidContentAction, InvalidContentCursor
 
 
 async def content_not_found_handler(request: Request, exc: ContentNotFound) -> HTTPException:
@@ -15,3 +15,10 @@ async def invalid_content_action_handler(request: Request, exc: InvalidContentAc
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         detail=exc.message,
     )
+
+
+async def invalid_content_cursor_handler(request: Request, exc: InvalidContentCursor) -> HTTPException:
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=exc.message,
+    )
@@ -8,3 +8,9 @@ class InvalidContentAction(Exception):
     def __init__(self, message: str = "Invalid content action") -> None:
         self.message = message
         super().__init__(message)
+
+
+class InvalidContentCursor(Exception):
+    def __init__(self, message: str = "Invalid content cursor") -> None:
+        self.message = message
+        super().__init__(message)
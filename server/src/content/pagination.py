@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime
+import json
+import typing as tp
+import uuid
+from dataclasses import dataclass
+
+from fastapi import Response
+from sqlalchemy import and_, literal, or_, tuple_
+
+from src.content.exceptions import InvalidContentCursor
+
+if tp.TYPE_CHECKING:
+    from src.content.schemas import ContentGalleryItemGet
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+VIDEO_SCORE_CURSOR_KEY = "video_score"
+VIDEO_PUBLISHED_CURSOR_KEY = "video_published"
+
+# Item attributes (besides the content_id tiebreaker) each cursor key is built from.
+_CURSOR_KEY_FIELDS: dict[str, tuple[str, ...]] = {
+    "content_id": (),
+    "created_at": ("created_at",),
+    "updated_at": ("updated_at",),
+    "published_at": ("published_at",),
+    VIDEO_SCORE_CURSOR_KEY: ("score", "published_at", "created_at"),
+    VIDEO_PUBLISHED_CURSOR_KEY: ("published_at", "created_at"),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class ContentCursor:
+    key: str
+    order_desc: bool
+    values: tuple[tp.Any, ...]
+    content_id: uuid.UUID
+
+
+@dataclass(slots=True, frozen=True)
+class ContentGalleryPage:
+    """Gallery items of one page of posts; the cursor follows posts, not items."""
+
+    items: list[ContentGalleryItemGet]
+    next_cursor: str | None
+
+
+def video_recommendation_score(views_count, likes_count, comments_count):  # type: ignore[no-untyped-def]
+    # Works for both ORM columns and plain ints so SQL ordering and cursors agree.
+    return views_count * 2 + likes_count * 4 + comments_count * 3
+
+
+def encode_content_cursor(cursor: ContentCursor) -> str:
+    payload = {
+        "k": cursor.key,
+        "d": cursor.order_desc,
+        "v": [_dump_value(value) for value in cursor.values],
+        "id": str(cursor.content_id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_content_cursor(
+    token: str,
+    *,
+    key: str,
+    order_desc: bool,
+) -> ContentCursor:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        cursor = ContentCursor(
+            key=payload["k"],
+            order_desc=bool(payload["d"]),
+            values=tuple(_load_value(value) for value in payload["v"]),
+            content_id=uuid.UUID(payload["id"]),
+        )
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as exc:
+        raise InvalidContentCursor("Malformed content cursor") from exc
+
+    if cursor.key != key or cursor.order_desc != order_desc:
+        raise InvalidContentCursor("Content cursor does not match the requested ordering")
+    if len(cursor.values) != len(_CURSOR_KEY_FIELDS[key]):
+        raise InvalidContentCursor("Malformed content cursor")
+    return cursor
+
+
+def resolve_content_cursor(
+    token: str | None,
+    *,
+    key: str,
+    order_desc: bool,
+    offset: int,
+) -> ContentCursor | None:
+    if token is None:
+        return None
+    if offset:
+        raise InvalidContentCursor("Use either offset or cursor, not both")
+    return decode_content_cursor(token, key=key, order_desc=order_desc)
+
+
+def build_keyset_condition(
+    columns: tp.Sequence[tp.Any],
+    cursor: ContentCursor,
+    *,
+    tiebreaker: tp.Any,
+):  # type: ignore[no-untyped-def]
+    """Rows strictly after the cursor in `ORDER BY columns..., tiebreaker` order.
+
+    Postgres sorts NULLs first for DESC and last for ASC, so a single nullable
+    sort column (drafts without `published_at`) gets explicit NULL branches.
+    """
+    if not columns:
+        return tiebreaker < cursor.content_id if cursor.order_desc else tiebreaker > cursor.content_id
+
+    if len(columns) == 1 and cursor.values[0] is None:
+        column = columns[0]
+        if cursor.order_desc:
+            return or_(
+                and_(column.is_(None), tiebreaker < cursor.content_id),
+                column.is_not(None),
+            )
+        return and_(column.is_(None), tiebreaker > cursor.content_id)
+
+    row = tuple_(*columns, tiebreaker)
+    bound = tuple_(*(literal(value) for value in cursor.values), literal(cursor.content_id))
+    if cursor.order_desc:
+        return row < bound
+    if len(columns) == 1:
+        return or_(row > bound, columns[0].is_(None))
+    return row > bound
+
+
+def build_next_content_cursor(
+    items: tp.Sequence[tp.Any],
+    *,
+    key: str,
+    order_desc: bool,
+    limit: int,
+) -> str | None:
+    if limit <= 0 or len(items) < limit:
+        return None
+
+    last = items[-1]
+    return encode_content_cursor(
+        ContentCursor(
+            key=key,
+            order_desc=order_desc,
+            values=tuple(_cursor_value(last, field) for field in _CURSOR_KEY_FIELDS[key]),
+            content_id=last.content_id,
+        )
+    )
+
+
+def set_next_cursor_header(
+    response: Response,
+    items: tp.Sequence[tp.Any],
+    *,
+    key: str,
+    order_desc: bool,
+    limit: int,
+) -> None:
+    next_cursor = build_next_content_cursor(items, key=key, order_desc=order_desc, limit=limit)
+    set_next_cursor_value(response, next_cursor)
+
+
+def set_next_cursor_value(response: Response, next_cursor: str | None) -> None:
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+
+def _cursor_value(item: tp.Any, field: str) -> tp.Any:
+    if field == "score":
+        return video_recommendation_score(item.views_count, item.likes_count, item.comments_count)
+    return getattr(item, field)
+
+
+def _dump_value(value: tp.Any) -> tp.Any:
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return value
+
+
+def _load_value(value: tp.Any) -> tp.Any:
+    if isinstance(value, str):
+        return datetime.datetime.fromisoformat(value)
+    if value is None or isinstance(value, int):
+        return value
+    raise ValueError("Unsupported cursor value")
@@ -11,6 +11,7 @@ from src.content.schemas import ContentListItemGet
 from src.moments.presentation import build_moment_get
 from src.posts.presentation import build_post_attachment_get
 from src.users.presentation import build_user_get
+from src.users.schemas import UserGet
 from src.videos.enums import VideoProcessingStatusEnum
 from src.videos.presentation import build_video_card_get
 
@@ -29,6 +30,28 @@ class ContentProjectorRegistry:
             raise ContentProjectorNotFound(f"No content projector registered for {content_type.value}")
         return projector
 
+    async def project_feed_items(
+        self,
+        items: list,
+        *,
+        viewer_id: uuid.UUID | None,
+        storage: AssetStorage,
+    ) -> list[ContentListItemGet]:
+        """Project a page at once, serializing each distinct author a single time."""
+        authors: dict[uuid.UUID, UserGet] = {}
+        for item in items:
+            if item.author_id not in authors:
+                authors[item.author_id] = await build_user_get(item.author, viewer_id=viewer_id, storage=storage)
+        return [
+            await self.get(item.content_type).project_feed_item(
+                item,
+                viewer_id=viewer_id,
+                storage=storage,
+                author=authors[item.author_id],
+            )
+            for item in items
+        ]
+
 
 class BaseContentProjector:
     async def project_feed_item(
@@ -37,6 +60,7 @@ class BaseContentProjector:
         *,
         viewer_id: uuid.UUID | None,
         storage: AssetStorage,
+        author: UserGet | None = None,
     ) -> ContentListItemGet:
         raise NotImplementedError
 
@@ -48,8 +72,9 @@ class PostContentProjector(BaseContentProjector):
         *,
         viewer_id: uuid.UUID | None,
         storage: AssetStorage,
+        author: UserGet | None = None,
     ) -> ContentListItemGet:
-        payload = await _base_payload(item, viewer_id=viewer_id, storage=storage)
+        payload = await _base_payload(item, viewer_id=viewer_id, storage=storage, author=author)
         media_attachments = []
         file_attachments = []
         sorted_links = sorted(
@@ -88,8 +113,9 @@ class ArticleContentProjector(BaseContentProjector):
         *,
         viewer_id: uuid.UUID | None,
         storage: AssetStorage,
+        author: UserGet | None = None,
     ) -> ContentListItemGet:
-        payload = await _base_payload(item, viewer_id=viewer_id, storage=storage)
+        payload = await _base_payload(item, viewer_id=viewer_id, storage=storage, author=author)
         cover: ArticleAssetGet | None = None
         for link in getattr(item, "asset_links", []):
             if getattr(link, "deleted_at", None) is None and link.attachment_type.value == "cover":
@@ -115,8 +141,9 @@ class VideoContentProjector(BaseContentProjector):
         *,
         viewer_id: uuid.UUID | None,
         storage: AssetStorage,
+        author: UserGet | None = None,
     ) -> ContentListItemGet:
-        payload = await _base_payload(item, viewer_id=viewer_id, storage=storage)
+        payload = await _base_payload(item, viewer_id=viewer_id, storage=storage, author=author)
         card = await build_video_card_get(item, viewer_id=viewer_id, storage=storage)
         return ContentListItemGet(
             **payload,
@@ -139,8 +166,9 @@ class MomentContentProjector(BaseContentProjector):
         *,
         viewer_id: uuid.UUID | None,
         storage: AssetStorage,
+        author: UserGet | None = None,
     ) -> ContentListItemGet:
-        payload = await _base_payload(item, viewer_id=viewer_id, storage=storage)
+        payload = await _base_payload(item, viewer_id=viewer_id, storage=storage, author=author)
         moment = await build_moment_get(
             item,
             viewer_id=viewer_id,
@@ -165,6 +193,7 @@ async def _base_payload(
     *,
     viewer_id: uuid.UUID | None,
     storage: AssetStorage,
+    author: UserGet | None = None,
 ) -> dict:
     return {
         "content_id": item.content_id,
@@ -178,7 +207,11 @@ async def _base_payload(
         "likes_count": item.likes_count,
         "dislikes_count": item.dislikes_count,
         "views_count": getattr(item, "views_count", 0),
-        "user": await build_user_get(item.author, viewer_id=viewer_id, storage=storage),
+        "user": author if author is not None else await build_user_get(
+            item.author,
+            viewer_id=viewer_id,
+            storage=storage,
+        ),
         "tags": item.tags,
         "my_reaction": item.my_reaction,
         "is_owner": item.author_id == viewer_id,
@@ -4,7 +4,7 @@ import datetime
 import uuid
 from dataclasses import dataclass
 
-from sqlalchemy import and_, delete, desc, exists, func, insert, or_, select, update
+from sqlalchemy import ColumnElement, and_, delete, desc, exists, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -22,8 +22,14 @@ from src.content.enums import (
     ReactionTypeEnum,
 )
 from src.content.enums_list import ContentOrder
+from src.content.pagination import (
+    ContentCursor,
+    build_keyset_condition,
+    video_recommendation_score,
+)
 from src.content.models import ContentModel, ContentReactionModel, ContentViewSessionModel
 from src.users.models import SubscriptionModel, UserModel
+from src.users.repository import populate_viewer_subscriptions
 from src.videos.enums import VideoProcessingStatusEnum
 from src.videos.models import VideoPlaybackDetailsModel
 
@@ -53,6 +59,7 @@ class ContentRepository:
         order_desc: bool,
         offset: int,
         limit: int,
+        cursor: ContentCursor | None = None,
     ) -> list[ContentModel]:
         stmt = (
             self._build_content_query(viewer_id=viewer_id)
@@ -72,12 +79,10 @@ class ContentRepository:
                     VideoPlaybackDetailsModel.processing_status == VideoProcessingStatusEnum.READY,
                 )
             )
-            .order_by(self._order_by_clause(order=order, order_desc=order_desc))
-            .offset(offset)
-            .limit(limit)
         )
+        stmt = self._paginate(stmt, order=order, order_desc=order_desc, offset=offset, limit=limit, cursor=cursor)
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
 
     async def get_user_subscriptions_feed(
         self,
@@ -88,6 +93,7 @@ class ContentRepository:
         order_desc: bool,
         offset: int,
         limit: int,
+        cursor: ContentCursor | None = None,
     ) -> list[ContentModel]:
         subs_subquery = (
             select(SubscriptionModel.subscribed_id)
@@ -117,14 +123,9 @@ class ContentRepository:
         )
         if content_type is not None:
             stmt = stmt.where(ContentModel.content_type == content_type)
-        stmt = (
-            stmt
-            .order_by(self._order_by_clause(order=order, order_desc=order_desc))
-            .offset(offset)
-            .limit(limit)
-        )
+        stmt = self._paginate(stmt, order=order, order_desc=order_desc, offset=offset, limit=limit, cursor=cursor)
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=user_id)
+        return await self._many(result, viewer_id=user_id)
 
     async def get_single(
         self,
@@ -134,7 +135,7 @@ class ContentRepository:
     ) -> ContentModel | None:
         stmt = self._build_content_query(viewer_id=viewer_id).where(ContentModel.content_id == content_id)
         result = await self._session.execute(stmt)
-        return self._one_or_none(result, viewer_id=viewer_id)
+        return await self._one_or_none(result, viewer_id=viewer_id)
 
     async def get_video_recommendations(
         self,
@@ -142,20 +143,25 @@ class ContentRepository:
         viewer_id: uuid.UUID | None,
         offset: int,
         limit: int,
+        cursor: ContentCursor | None = None,
     ) -> list[ContentModel]:
-        score = (
-            ContentModel.views_count * 2
-            + ContentModel.likes_count * 4
-            + ContentModel.comments_count * 3
-        )
+        score = video_recommendation_score(
+            ContentModel.views_count,
+            ContentModel.likes_count,
+            ContentModel.comments_count,
+        )
+        sort_columns = (score, ContentModel.published_at, ContentModel.created_at)
+        stmt = self._video_ready_public_query(viewer_id=viewer_id)
+        if cursor is not None:
+            stmt = stmt.where(build_keyset_condition(sort_columns, cursor, tiebreaker=ContentModel.content_id))
         stmt = (
-            self._video_ready_public_query(viewer_id=viewer_id)
-            .order_by(desc(score), desc(ContentModel.published_at), desc(ContentModel.created_at))
+            stmt
+            .order_by(*(desc(column) for column in sort_columns), desc(ContentModel.content_id))
             .offset(offset)
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
 
     async def get_video_subscriptions(
         self,
@@ -163,21 +169,28 @@ class ContentRepository:
         user_id: uuid.UUID,
         offset: int,
         limit: int,
+        cursor: ContentCursor | None = None,
     ) -> list[ContentModel]:
         subs_subquery = (
             select(SubscriptionModel.subscribed_id)
             .where(SubscriptionModel.subscriber_id == user_id)
             .subquery()
         )
+        sort_columns = (ContentModel.published_at, ContentModel.created_at)
         stmt = (
             self._video_ready_public_query(viewer_id=user_id)
             .where(ContentModel.author_id.in_(select(subs_subquery.c.subscribed_id)))
-            .order_by(desc(ContentModel.published_at), desc(ContentModel.created_at))
+        )
+        if cursor is not None:
+            stmt = stmt.where(build_keyset_condition(sort_columns, cursor, tiebreaker=ContentModel.content_id))
+        stmt = (
+            stmt
+            .order_by(*(desc(column) for column in sort_columns), desc(ContentModel.content_id))
             .offset(offset)
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=user_id)
+        return await self._many(result, viewer_id=user_id)
 
     async def get_history_sessions(
         self,
@@ -225,7 +238,6 @@ class ContentRepository:
         stmt = (
             stmt
             .options(
-                selectinload(ContentModel.author).selectinload(UserModel.subscribers),
                 selectinload(ContentModel.author)
                 .selectinload(UserModel.avatar_asset)
                 .selectinload(AssetModel.variants),
@@ -250,6 +262,11 @@ class ContentRepository:
             item.my_reaction = await self._get_reaction_type(content_id=item.content_id, user_id=viewer_id)
             item.is_owner = item.author_id == viewer_id
             items.append((item, session))
+        await populate_viewer_subscriptions(
+            self._session,
+            users=[item.author for item, _ in items],
+            viewer_id=viewer_id,
+        )
         return items
 
     async def get_author_publications(
@@ -263,6 +280,7 @@ class ContentRepository:
         order_desc: bool,
         offset: int,
         limit: int,
+        cursor: ContentCursor | None = None,
     ) -> list[ContentModel]:
         stmt = (
             self._build_content_query(viewer_id=viewer_id)
@@ -290,41 +308,17 @@ class ContentRepository:
         if content_type is not None:
             stmt = stmt.where(ContentModel.content_type == content_type)
 
-        if viewer_id == author_id:
-            if profile_filter == ContentProfileFilterEnum.ALL:
-                stmt = stmt.where(
-                    ContentModel.status.in_(
-                        [
-                            ContentStatusEnum.PUBLISHED,
-                            ContentStatusEnum.DRAFT,
-                        ]
-                    )
-                )
-            elif profile_filter == ContentProfileFilterEnum.DRAFTS:
-                stmt = stmt.where(ContentModel.status == ContentStatusEnum.DRAFT)
-            elif profile_filter == ContentProfileFilterEnum.PRIVATE:
-                stmt = (
-                    stmt.where(ContentModel.status == ContentStatusEnum.PUBLISHED)
-                    .where(ContentModel.visibility == ContentVisibilityEnum.PRIVATE)
-                )
-            else:
-                stmt = (
-                    stmt.where(ContentModel.status == ContentStatusEnum.PUBLISHED)
-                    .where(ContentModel.visibility == ContentVisibilityEnum.PUBLIC)
-                )
-        else:
-            stmt = (
-                stmt.where(ContentModel.status == ContentStatusEnum.PUBLISHED)
-                .where(ContentModel.visibility == ContentVisibilityEnum.PUBLIC)
+        stmt = stmt.where(
+            *self._author_profile_conditions(
+                author_id=author_id,
+                viewer_id=viewer_id,
+                profile_filter=profile_filter,
             )
-
-        stmt = (
-            stmt.order_by(self._order_by_clause(order=order, order_desc=order_desc))
-            .offset(offset)
-            .limit(limit)
         )
+
+        stmt = self._paginate(stmt, order=order, order_desc=order_desc, offset=offset, limit=limit, cursor=cursor)
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
 
     async def get_author_gallery_posts(
         self,
@@ -336,6 +330,7 @@ class ContentRepository:
         order_desc: bool,
         offset: int,
         limit: int,
+        cursor: ContentCursor | None = None,
     ) -> list[ContentModel]:
         media_exists = exists(
             select(1)
@@ -355,41 +350,43 @@ class ContentRepository:
             .where(media_exists)
         )
 
-        if viewer_id == author_id:
-            if profile_filter == ContentProfileFilterEnum.ALL:
-                stmt = stmt.where(
-                    ContentModel.status.in_(
-                        [
-                            ContentStatusEnum.PUBLISHED,
-                            ContentStatusEnum.DRAFT,
-                        ]
-                    )
-                )
-            elif profile_filter == ContentProfileFilterEnum.DRAFTS:
-                stmt = stmt.where(ContentModel.status == ContentStatusEnum.DRAFT)
-            elif profile_filter == ContentProfileFilterEnum.PRIVATE:
-                stmt = (
-                    stmt.where(ContentModel.status == ContentStatusEnum.PUBLISHED)
-                    .where(ContentModel.visibility == ContentVisibilityEnum.PRIVATE)
-                )
-            else:
-                stmt = (
-                    stmt.where(ContentModel.status == ContentStatusEnum.PUBLISHED)
-                    .where(ContentModel.visibility == ContentVisibilityEnum.PUBLIC)
-                )
-        else:
-            stmt = (
-                stmt.where(ContentModel.status == ContentStatusEnum.PUBLISHED)
-                .where(ContentModel.visibility == ContentVisibilityEnum.PUBLIC)
+        stmt = stmt.where(
+            *self._author_profile_conditions(
+                author_id=author_id,
+                viewer_id=viewer_id,
+                profile_filter=profile_filter,
             )
-
-        stmt = (
-            stmt.order_by(self._order_by_clause(order=order, order_desc=order_desc))
-            .offset(offset)
-            .limit(limit)
         )
+
+        stmt = self._paginate(stmt, order=order, order_desc=order_desc, offset=offset, limit=limit, cursor=cursor)
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
+
+    def _author_profile_conditions(
+        self,
+        *,
+        author_id: uuid.UUID,
+        viewer_id: uuid.UUID | None,
+        profile_filter: ContentProfileFilterEnum,
+    ) -> list[ColumnElement[bool]]:
+        """SQL form of `can_view_content` narrowed by the profile tab.
+
+        Everything a viewer may not see is filtered here, not after the fetch,
+        so a page holds exactly `limit` rows whenever more exist.
+        """
+        if viewer_id != author_id or profile_filter == ContentProfileFilterEnum.PUBLIC:
+            return [
+                ContentModel.status == ContentStatusEnum.PUBLISHED,
+                ContentModel.visibility == ContentVisibilityEnum.PUBLIC,
+            ]
+        if profile_filter == ContentProfileFilterEnum.DRAFTS:
+            return [ContentModel.status == ContentStatusEnum.DRAFT]
+        if profile_filter == ContentProfileFilterEnum.PRIVATE:
+            return [
+                ContentModel.status == ContentStatusEnum.PUBLISHED,
+                ContentModel.visibility == ContentVisibilityEnum.PRIVATE,
+            ]
+        return [ContentModel.status.in_([ContentStatusEnum.PUBLISHED, ContentStatusEnum.DRAFT])]
 
     async def set_reaction(
         self,
@@ -625,7 +622,6 @@ class ContentRepository:
     def _build_content_query(self, viewer_id: uuid.UUID | None):
         reaction_subquery = self._reaction_subquery(viewer_id=viewer_id)
         base_options = (
-            selectinload(ContentModel.author).selectinload(UserModel.subscribers),
             selectinload(ContentModel.author)
             .selectinload(UserModel.avatar_asset)
             .selectinload(AssetModel.variants),
@@ -679,7 +675,7 @@ class ContentRepository:
             .subquery()
         )
 
-    def _many(self, result, viewer_id: uuid.UUID | None) -> list[ContentModel]:  # type: ignore[no-untyped-def]
+    async def _many(self, result, viewer_id: uuid.UUID | None) -> list[ContentModel]:  # type: ignore[no-untyped-def]
         if viewer_id is None:
             items = list(result.scalars().unique().all())
             for item in items:
@@ -692,9 +688,14 @@ class ContentRepository:
             item.my_reaction = my_reaction
             item.is_owner = item.author_id == viewer_id
             items.append(item)
+        await populate_viewer_subscriptions(
+            self._session,
+            users=[item.author for item in items],
+            viewer_id=viewer_id,
+        )
         return items
 
-    def _one_or_none(self, result, viewer_id: uuid.UUID | None) -> ContentModel | None:  # type: ignore[no-untyped-def]
+    async def _one_or_none(self, result, viewer_id: uuid.UUID | None) -> ContentModel | None:  # type: ignore[no-untyped-def]
         if viewer_id is None:
             item = result.scalar_one_or_none()
             if item is not None:
@@ -707,6 +708,7 @@ class ContentRepository:
         item, my_reaction = row
         item.my_reaction = my_reaction
         item.is_owner = item.author_id == viewer_id
+        await populate_viewer_subscriptions(self._session, users=[item.author], viewer_id=viewer_id)
         return item
 
     async def _get_reaction(
@@ -747,12 +749,35 @@ class ContentRepository:
             )
         )
 
-    def _order_by_clause(self, order: ContentOrder, order_desc: bool):
+    def _paginate(
+        self,
+        stmt,
+        *,
+        order: ContentOrder,
+        order_desc: bool,
+        offset: int,
+        limit: int,
+        cursor: ContentCursor | None,
+    ):  # type: ignore[no-untyped-def]
+        sort_columns = self._sort_columns(order)
+        if cursor is not None:
+            stmt = stmt.where(build_keyset_condition(sort_columns, cursor, tiebreaker=ContentModel.content_id))
+        return (
+            stmt.order_by(*self._order_by_clauses(order=order, order_desc=order_desc))
+            .offset(offset)
+            .limit(limit)
+        )
+
+    def _sort_columns(self, order: ContentOrder) -> tuple:
         order_mapping = {
-            ContentOrder.ID: ContentModel.content_id,
-            ContentOrder.CREATED_AT: ContentModel.created_at,
-            ContentOrder.UPDATED_AT: ContentModel.updated_at,
-            ContentOrder.PUBLISHED_AT: ContentModel.published_at,
+            ContentOrder.ID: (),
+            ContentOrder.CREATED_AT: (ContentModel.created_at,),
+            ContentOrder.UPDATED_AT: (ContentModel.updated_at,),
+            ContentOrder.PUBLISHED_AT: (ContentModel.published_at,),
         }
-        column = order_mapping[order]
-        return desc(column) if order_desc else column
+        return order_mapping[order]
+
+    def _order_by_clauses(self, order: ContentOrder, order_desc: bool) -> list:
+        # content_id breaks ties so keyset cursors never skip or repeat rows.
+        columns = (*self._sort_columns(order), ContentModel.content_id)
+        return [desc(column) if order_desc else column for column in columns]
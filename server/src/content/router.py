@@ -1,11 +1,17 @@
 import uuid
 
-from fastapi import APIRouter, Body, Depends, Query
+from fastapi import APIRouter, Body, Depends, Query, Response
 
 from src.auth.dependencies import get_current_optional_user, get_current_user
 from src.content.dependencies import get_content_service
 from src.content.enums_list import ContentOrder
 from src.content.enums import ContentProfileFilterEnum, ContentTypeEnum
+from src.content.pagination import (
+    VIDEO_PUBLISHED_CURSOR_KEY,
+    VIDEO_SCORE_CURSOR_KEY,
+    set_next_cursor_header,
+    set_next_cursor_value,
+)
 from src.content.schemas import (
     ContentGalleryItemGet,
     ContentHistoryItemGet,
@@ -17,7 +23,7 @@ from src.content.schemas import (
     ContentViewSessionStart,
 )
 from src.content.service import ContentService
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 
 router = APIRouter(
     prefix="/contents",
@@ -27,25 +33,31 @@ router = APIRouter(
 
 @router.get("/list")
 async def get_feed(
+    response: Response,
     order: ContentOrder = ContentOrder.CREATED_AT,
     desc: bool = True,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=0, lt=1000),
-    user: UserGet | None = Depends(get_current_optional_user),
+    cursor: str | None = None,
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> list[ContentListItemGet]:
     viewer_id = user.user_id if user is not None else None
-    return await content_service.get_feed(
+    items = await content_service.get_feed(
         order=order,
         desc=desc,
         offset=offset,
         limit=limit,
         viewer_id=viewer_id,
+        cursor=cursor,
     )
+    set_next_cursor_header(response, items, key=order.value, order_desc=desc, limit=limit)
+    return items
 
 
 @router.get("/publications")
 async def get_author_publications(
+    response: Response,
     author_id: uuid.UUID,
     content_type: ContentTypeEnum | None = None,
     profile_filter: ContentProfileFilterEnum = ContentProfileFilterEnum.PUBLIC,
@@ -53,11 +65,12 @@ async def get_author_publications(
     desc: bool = True,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=0, lt=1000),
-    user: UserGet | None = Depends(get_current_optional_user),
+    cursor: str | None = None,
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> list[ContentListItemGet]:
     viewer_id = user.user_id if user is not None else None
-    return await content_service.get_publications(
+    items = await content_service.get_publications(
         author_id=author_id,
         viewer_id=viewer_id,
         content_type=content_type,
@@ -66,22 +79,27 @@ async def get_author_publications(
         desc=desc,
         offset=offset,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor_header(response, items, key=order.value, order_desc=desc, limit=limit)
+    return items
 
 
 @router.get("/gallery")
 async def get_author_gallery(
+    response: Response,
     author_id: uuid.UUID,
     profile_filter: ContentProfileFilterEnum = ContentProfileFilterEnum.PUBLIC,
     order: ContentOrder = ContentOrder.CREATED_AT,
     desc: bool = True,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=0, lt=1000),
-    user: UserGet | None = Depends(get_current_optional_user),
+    cursor: str | None = None,
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> list[ContentGalleryItemGet]:
     viewer_id = user.user_id if user is not None else None
-    return await content_service.get_gallery(
+    page = await content_service.get_gallery(
         author_id=author_id,
         viewer_id=viewer_id,
         profile_filter=profile_filter,
@@ -89,55 +107,73 @@ async def get_author_gallery(
         desc=desc,
         offset=offset,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor_value(response, page.next_cursor)
+    return page.items
 
 
 @router.get("/subscriptions")
 async def get_subscriptions_feed(
+    response: Response,
     content_type: ContentTypeEnum | None = None,
     order: ContentOrder = ContentOrder.CREATED_AT,
     desc: bool = True,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=0, lt=1000),
-    user: UserGet = Depends(get_current_user),
+    cursor: str | None = None,
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> list[ContentListItemGet]:
-    return await content_service.get_subscriptions_feed(
+    items = await content_service.get_subscriptions_feed(
         user_id=user.user_id,
         content_type=content_type,
         order=order,
         desc=desc,
         offset=offset,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor_header(response, items, key=order.value, order_desc=desc, limit=limit)
+    return items
 
 
 @router.get("/videos/recommendations")
 async def get_video_recommendations(
+    response: Response,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=0, lt=1000),
-    user: UserGet | None = Depends(get_current_optional_user),
+    cursor: str | None = None,
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> list[ContentListItemGet]:
-    return await content_service.get_video_recommendations(
+    items = await content_service.get_video_recommendations(
         viewer_id=user.user_id if user else None,
         offset=offset,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor_header(response, items, key=VIDEO_SCORE_CURSOR_KEY, order_desc=True, limit=limit)
+    return items
 
 
 @router.get("/videos/subscriptions")
 async def get_video_subscriptions(
+    response: Response,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=0, lt=1000),
-    user: UserGet = Depends(get_current_user),
+    cursor: str | None = None,
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> list[ContentListItemGet]:
-    return await content_service.get_video_subscriptions(
+    items = await content_service.get_video_subscriptions(
         user_id=user.user_id,
         offset=offset,
         limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor_header(response, items, key=VIDEO_PUBLISHED_CURSOR_KEY, order_desc=True, limit=limit)
+    return items
 
 
 @router.get("/history")
@@ -145,7 +181,7 @@ async def get_content_history(
     content_type: ContentTypeEnum | None = None,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=0, lt=1000),
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> list[ContentHistoryItemGet]:
     return await content_service.get_history(
@@ -160,7 +196,7 @@ async def get_content_history(
 async def set_content_reaction(
     content_id: uuid.UUID,
     data: ContentReactionWrite,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> ContentReactionGet:
     return await content_service.set_reaction(
@@ -174,7 +210,7 @@ async def set_content_reaction(
 async def remove_content_reaction(
     content_id: uuid.UUID,
     data: ContentReactionWrite | None = Body(default=None),
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> ContentReactionGet:
     return await content_service.remove_reaction(
@@ -188,7 +224,7 @@ async def remove_content_reaction(
 async def start_content_view_session(
     content_id: uuid.UUID,
     data: ContentViewSessionStart,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> ContentViewSessionGet:
     return await content_service.start_view_session(
@@ -203,7 +239,7 @@ async def heartbeat_content_view_session(
     content_id: uuid.UUID,
     session_id: uuid.UUID,
     data: ContentViewSessionHeartbeat,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> ContentViewSessionGet:
     return await content_service.heartbeat_view_session(
@@ -219,7 +255,7 @@ async def finish_content_view_session(
     content_id: uuid.UUID,
     session_id: uuid.UUID,
     data: ContentViewSessionHeartbeat,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> ContentViewSessionGet:
     return await content_service.finish_view_session(
@@ -105,6 +105,7 @@ class ContentGalleryItemGet(BaseSchema):
     asset_id: uuid.UUID
     position: int = Field(ge=0)
     created_at: datetime.datetime
+    updated_at: datetime.datetime | None = None
     published_at: datetime.datetime | None = None
     excerpt: str | None = None
     canonical_path: str
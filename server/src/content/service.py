@@ -14,6 +14,13 @@ from src.content.enums import (
 )
 from src.content.enums_list import ContentOrder
 from src.content.exceptions import ContentNotFound
+from src.content.pagination import (
+    VIDEO_PUBLISHED_CURSOR_KEY,
+    VIDEO_SCORE_CURSOR_KEY,
+    ContentGalleryPage,
+    build_next_content_cursor,
+    resolve_content_cursor,
+)
 from src.content.repository import ContentRepository
 from src.content.schemas import (
     ContentGalleryItemGet,
@@ -26,7 +33,7 @@ from src.content.schemas import (
     ContentViewSessionStart,
 )
 from src.posts.presentation import build_post_attachment_get
-from src.users.schemas import UserGet
+from src.users.schemas import UserGet, UserPrincipal
 from src.videos.enums import VideoProcessingStatusEnum
 
 if TYPE_CHECKING:
@@ -56,6 +63,7 @@ class ContentService:
         offset: int,
         limit: int,
         viewer_id: uuid.UUID | None,
+        cursor: str | None = None,
     ) -> list[ContentListItemGet]:
         content_items = await self._repository.get_feed(
             viewer_id=viewer_id,
@@ -63,6 +71,7 @@ class ContentService:
             order_desc=desc,
             offset=offset,
             limit=limit,
+            cursor=resolve_content_cursor(cursor, key=order.value, order_desc=desc, offset=offset),
         )
         return [await self._build_feed_item(item, viewer_id=viewer_id) for item in content_items]
 
@@ -75,6 +84,7 @@ class ContentService:
         desc: bool,
         offset: int,
         limit: int,
+        cursor: str | None = None,
     ) -> list[ContentListItemGet]:
         content_items = await self._repository.get_user_subscriptions_feed(
             user_id=user_id,
@@ -83,6 +93,7 @@ class ContentService:
             order_desc=desc,
             offset=offset,
             limit=limit,
+            cursor=resolve_content_cursor(cursor, key=order.value, order_desc=desc, offset=offset),
         )
         return [await self._build_feed_item(item, viewer_id=user_id) for item in content_items]
 
@@ -92,11 +103,13 @@ class ContentService:
         viewer_id: uuid.UUID | None,
         offset: int,
         limit: int,
+        cursor: str | None = None,
     ) -> list[ContentListItemGet]:
         content_items = await self._repository.get_video_recommendations(
             viewer_id=viewer_id,
             offset=offset,
             limit=limit,
+            cursor=resolve_content_cursor(cursor, key=VIDEO_SCORE_CURSOR_KEY, order_desc=True, offset=offset),
         )
         return [await self._build_feed_item(item, viewer_id=viewer_id) for item in content_items]
 
@@ -106,11 +119,13 @@ class ContentService:
         user_id: uuid.UUID,
         offset: int,
         limit: int,
+        cursor: str | None = None,
     ) -> list[ContentListItemGet]:
         content_items = await self._repository.get_video_subscriptions(
             user_id=user_id,
             offset=offset,
             limit=limit,
+            cursor=resolve_content_cursor(cursor, key=VIDEO_PUBLISHED_CURSOR_KEY, order_desc=True, offset=offset),
         )
         return [await self._build_feed_item(item, viewer_id=user_id) for item in content_items]
 
@@ -125,6 +140,7 @@ class ContentService:
         desc: bool,
         offset: int,
         limit: int,
+        cursor: str | None = None,
     ) -> list[ContentListItemGet]:
         content_items = await self._repository.get_author_publications(
             author_id=author_id,
@@ -135,11 +151,9 @@ class ContentService:
             order_desc=desc,
             offset=offset,
             limit=limit,
+            cursor=resolve_content_cursor(cursor, key=order.value, order_desc=desc, offset=offset),
         )
-        visible_items = [
-            item for item in content_items if can_view_content(content=item, viewer_id=viewer_id)
-        ]
-        return [await self._build_feed_item(item, viewer_id=viewer_id) for item in visible_items]
+        return [await self._build_feed_item(item, viewer_id=viewer_id) for item in content_items]
 
     async def get_gallery(
         self,
@@ -151,7 +165,8 @@ class ContentService:
         desc: bool,
         offset: int,
         limit: int,
-    ) -> list[ContentGalleryItemGet]:
+        cursor: str | None = None,
+    ) -> ContentGalleryPage:
         posts = await self._repository.get_author_gallery_posts(
             author_id=author_id,
             viewer_id=viewer_id,
@@ -160,12 +175,11 @@ class ContentService:
             order_desc=desc,
             offset=offset,
             limit=limit,
+            cursor=resolve_content_cursor(cursor, key=order.value, order_desc=desc, offset=offset),
         )
 
         result: list[ContentGalleryItemGet] = []
         for post in posts:
-            if not can_view_content(content=post, viewer_id=viewer_id):
-                continue
             sorted_links = sorted(
                 [
                     link
@@ -189,6 +203,7 @@ class ContentService:
                         asset_id=attachment.asset_id,
                         position=attachment.position,
                         created_at=post.created_at,
+                        updated_at=post.updated_at,
                         published_at=post.published_at,
                         excerpt=(
                             post.post_details.body_text
@@ -199,13 +214,16 @@ class ContentService:
                         attachment=attachment,
                     )
                 )
-        return result
+        return ContentGalleryPage(
+            items=result,
+            next_cursor=build_next_content_cursor(posts, key=order.value, order_desc=desc, limit=limit),
+        )
 
     async def set_reaction(
         self,
         *,
         content_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
         reaction_type: ReactionTypeEnum,
     ) -> ContentReactionGet:
         content = await self._get_reactable_content(content_id=content_id, viewer_id=user.user_id)
@@ -228,7 +246,7 @@ class ContentService:
         self,
         *,
         content_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
         reaction_type: ReactionTypeEnum | None = None,
     ) -> ContentReactionGet:
         content = await self._get_reactable_content(content_id=content_id, viewer_id=user.user_id)
@@ -254,7 +272,7 @@ class ContentService:
         self,
         *,
         content_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
         data: ContentViewSessionStart,
     ) -> ContentViewSessionGet:
         content = await self._get_trackable_content(content_id=content_id, viewer_id=user.user_id)
@@ -320,7 +338,7 @@ class ContentService:
         *,
         content_id: uuid.UUID,
         session_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
         data: ContentViewSessionHeartbeat,
     ) -> ContentViewSessionGet:
         return await self._update_view_session(
@@ -335,7 +353,7 @@ class ContentService:
         *,
         content_id: uuid.UUID,
         session_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
         data: ContentViewSessionHeartbeat,
     ) -> ContentViewSessionGet:
         data.ended = True
@@ -349,7 +367,7 @@ class ContentService:
     async def get_history(
         self,
         *,
-        user: UserGet,
+        user: UserPrincipal,
         content_type: ContentTypeEnum | None = None,
         offset: int,
         limit: int,
@@ -543,7 +561,7 @@ class ContentService:
         *,
         content_id: uuid.UUID,
         session_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
         data: ContentViewSessionHeartbeat,
     ) -> ContentViewSessionGet:
         content = await self._get_trackable_content(content_id=content_id, viewer_id=user.user_id)
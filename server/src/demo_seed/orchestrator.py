@@ -694,6 +694,7 @@ async def run_seed_command(context: SeedRunContext, reset: bool) -> dict:
 
         logger.info("Stage: reconciliation")
         await repo.refresh_chat_last_sequence()
+        await repo.reconcile_chat_dialog_state()
         await repo.reconcile_subscriber_counters()
         await repo.reconcile_comment_counters()
         await repo.reconcile_reaction_counters()
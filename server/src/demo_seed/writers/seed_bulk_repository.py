@@ -161,6 +161,59 @@ class SeedBulkRepository:
             .values(last_timeline_seq=subquery.c.max_seq)
         )
 
+    async def reconcile_chat_dialog_state(self) -> None:
+        latest_messages = (
+            select(MessageModel.chat_id, MessageModel.message_id, MessageModel.created_at)
+            .distinct(MessageModel.chat_id)
+            .order_by(
+                MessageModel.chat_id,
+                MessageModel.created_at.desc(),
+                MessageModel.message_id.desc(),
+            )
+            .subquery()
+        )
+        await self._session.execute(
+            update(ChatModel)
+            .where(ChatModel.chat_id == latest_messages.c.chat_id)
+            .values(
+                last_message_id=latest_messages.c.message_id,
+                last_message_at=latest_messages.c.created_at,
+            )
+        )
+        # Seeded memberships have read nothing, so everything but messages by
+        # someone else is exempt from their unread count.
+        await self._session.execute(
+            update(MembershipModel)
+            .where(MembershipModel.chat_id == ChatModel.chat_id)
+            .values(
+                last_message_at=ChatModel.last_message_at,
+                last_read_seq=0,
+                unread_exempt_count=ChatModel.last_timeline_seq,
+            )
+        )
+        unread = (
+            select(
+                MembershipModel.chat_id,
+                MembershipModel.user_id,
+                func.count(MessageModel.message_id).label("count"),
+            )
+            .join(MessageModel, MessageModel.chat_id == MembershipModel.chat_id)
+            .where(
+                MessageModel.user_id != MembershipModel.user_id,
+                MessageModel.deleted_at.is_(None),
+            )
+            .group_by(MembershipModel.chat_id, MembershipModel.user_id)
+            .subquery()
+        )
+        await self._session.execute(
+            update(MembershipModel)
+            .where(
+                MembershipModel.chat_id == unread.c.chat_id,
+                MembershipModel.user_id == unread.c.user_id,
+            )
+            .values(unread_exempt_count=MembershipModel.unread_exempt_count - unread.c.count)
+        )
+
     async def reconcile_subscriber_counters(self) -> None:
         subquery = (
             select(
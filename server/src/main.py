@@ -2,7 +2,7 @@ from fastapi import FastAPI
 
 from src.admin.admin import create_admin
 from src.config import settings
-from src.setup_app import setup_app
+from src.setup_app import lifespan, setup_app
 
 
 app = FastAPI(
@@ -12,6 +12,7 @@ app = FastAPI(
     debug=settings.project.debug,
     openapi_url="/openapi.json",
     docs_url="/docs",
+    lifespan=lifespan,
 )
 
 admin = create_admin(app)
@@ -9,6 +9,7 @@ from src.messages.exceptions import (
     CantUpdateMessage,
     InvalidMessageAssets,
     InvalidMessageReply,
+    InvalidMessageSearchCursor,
 )
 
 
@@ -45,3 +46,10 @@ async def cant_react_to_message_handler(request: Request, exc: CantReactToMessag
         status_code=status.HTTP_400_BAD_REQUEST,
         detail=str(exc),
     )
+
+
+async def invalid_message_search_cursor_handler(request: Request, exc: InvalidMessageSearchCursor) -> NoReturn:
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=str(exc),
+    )
@@ -16,3 +16,7 @@ class InvalidMessageAssets(Exception):
 
 class CantReactToMessage(Exception):
     """Raised when trying to react to a deleted or unavailable message"""
+
+
+class InvalidMessageSearchCursor(Exception):
+    """Raised when a message search cursor is malformed or combined with offset"""
@@ -1,7 +1,8 @@
 import datetime
 import uuid
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, UniqueConstraint, func
+from sqlalchemy import Computed, DateTime, Enum, ForeignKey, Index, UniqueConstraint, func, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.common.models import Base
@@ -23,11 +24,23 @@ class MessageModel(Base):
         ),
         Index("ix_messages_chat_created_at", "chat_id", "created_at"),
         Index("ix_messages_chat_reply_to_message_id", "chat_id", "reply_to_message_id"),
+        Index(
+            "ix_messages_chat_search_vector",
+            "chat_id",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
     message_id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     client_message_id: Mapped[uuid.UUID | None] = mapped_column(nullable=True)
     content: Mapped[str]
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(content, ''))", persisted=True),
+        deferred=True,
+    )
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -50,7 +63,10 @@ class MessageModel(Base):
     )
 
     chat_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("chats.chat_id", ondelete="CASCADE"))
-    chat: Mapped["ChatModel"] = relationship(back_populates="messages")
+    chat: Mapped["ChatModel"] = relationship(
+        back_populates="messages",
+        foreign_keys=[chat_id],
+    )
     timeline_item: Mapped["ChatTimelineItemModel | None"] = relationship(
         back_populates="message",
         cascade="all, delete-orphan",
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime
+import json
+import uuid
+from dataclasses import dataclass
+
+from src.messages.exceptions import InvalidMessageSearchCursor
+
+
+@dataclass(slots=True, frozen=True)
+class MessageSearchCursor:
+    """Position of the last returned search hit in `created_at DESC, message_id DESC` order."""
+
+    created_at: datetime.datetime
+    message_id: uuid.UUID
+
+
+def encode_message_search_cursor(cursor: MessageSearchCursor) -> str:
+    payload = {"t": cursor.created_at.isoformat(), "id": str(cursor.message_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_message_search_cursor(token: str) -> MessageSearchCursor:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return MessageSearchCursor(
+            created_at=datetime.datetime.fromisoformat(payload["t"]),
+            message_id=uuid.UUID(payload["id"]),
+        )
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError) as exc:
+        raise InvalidMessageSearchCursor("Malformed message search cursor") from exc
+
+
+def resolve_message_search_cursor(token: str | None, *, offset: int) -> MessageSearchCursor | None:
+    if token is None:
+        return None
+    if offset:
+        raise InvalidMessageSearchCursor("Use either offset or cursor, not both")
+    return decode_message_search_cursor(token)
@@ -1,13 +1,18 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import delete, desc, func, insert, literal_column, select, update
+from sqlalchemy import delete, desc, func, insert, literal, literal_column, select, tuple_, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.assets.models import AssetModel, ContentAssetModel, MessageAssetModel
-from src.chats.timeline import create_message_timeline_item, get_message_chat_seq
+from src.chats.timeline import (
+    create_message_timeline_item,
+    exempt_deleted_message,
+    get_message_chat_seq,
+    mark_chat_read_for_all_members,
+)
 from src.content.models import ContentModel
 import src.articles.models  # noqa: F401
 import src.moments.models  # noqa: F401
@@ -16,7 +21,27 @@ import src.tags.models  # noqa: F401
 import src.videos.models  # noqa: F401
 from src.content.enums import ReactionTypeEnum
 from src.messages.models import MessageModel, MessageReactionModel, MessageSharedContentModel
+from src.messages.pagination import MessageSearchCursor
 from src.users.models import UserModel
+from src.users.repository import populate_viewer_subscriptions
+
+SEARCH_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=24, MinWords=8, MaxFragments=2"
+
+
+async def populate_shared_content_author_subscriptions(
+    session: AsyncSession,
+    *,
+    messages: Any,
+    viewer_id: uuid.UUID | None,
+) -> None:
+    """Annotate authors of content shared into `messages` with the viewer's `is_subscribed`."""
+    authors = []
+    for message in messages:
+        shared_content = getattr(message, "shared_content", None)
+        content = getattr(shared_content, "content", None)
+        if content is not None:
+            authors.append(content.author)
+    await populate_viewer_subscriptions(session, users=authors, viewer_id=viewer_id)
 
 
 class MessageRepository:
@@ -25,7 +50,6 @@ class MessageRepository:
 
     def _message_load_options(self):
         return [
-            selectinload(MessageModel.user).selectinload(UserModel.subscribers),
             selectinload(MessageModel.user)
             .selectinload(UserModel.avatar_asset)
             .selectinload(AssetModel.variants),
@@ -58,6 +82,8 @@ class MessageRepository:
             session=self._session,
             chat_id=message.chat_id,
             message_id=message.message_id,
+            author_id=message.user_id,
+            created_at=message.created_at,
         )
         await self._session.commit()
         message = await self.get_single(message_id=message.message_id)
@@ -101,6 +127,8 @@ class MessageRepository:
                 session=self._session,
                 chat_id=message.chat_id,
                 message_id=message.message_id,
+                author_id=message.user_id,
+                created_at=message.created_at,
             )
 
         await self._session.commit()
@@ -129,6 +157,7 @@ class MessageRepository:
         order_desc: bool,
         offset: int,
         limit: int,
+        viewer_id: uuid.UUID | None = None,
     ) -> list[MessageModel]:
         query = (
             select(MessageModel)
@@ -140,7 +169,13 @@ class MessageRepository:
         )
 
         result = await self._session.execute(query)
-        return list(reversed(result.scalars().all()))
+        messages = list(reversed(result.scalars().all()))
+        await populate_shared_content_author_subscriptions(
+            self._session,
+            messages=messages,
+            viewer_id=viewer_id,
+        )
+        return messages
 
     async def delete(self, **filters) -> int:
         stmt = (
@@ -170,8 +205,15 @@ class MessageRepository:
         )
 
         result = await self._session.execute(stmt)
+        message = result.scalar_one()
+        await exempt_deleted_message(
+            session=self._session,
+            chat_id=message.chat_id,
+            message_id=message.message_id,
+            author_id=message.user_id,
+        )
         await self._session.commit()
-        return result.scalar_one()
+        return message
 
     async def delete_multi(
         self,
@@ -185,6 +227,7 @@ class MessageRepository:
         )
 
         result = await self._session.execute(stmt)
+        await mark_chat_read_for_all_members(session=self._session, chat_id=chat_id)
         await self._session.commit()
         return result.rowcount
 
@@ -208,44 +251,86 @@ class MessageRepository:
 
     async def search(
         self,
+        *,
         query_text: str,
-        order: str,
-        order_desc: bool,
-        offset: int,
+        chat_id: uuid.UUID,
         limit: int,
-        **filters,
-    ) -> tuple[list[MessageModel], int]:
-        search_vector = func.to_tsvector(
-            literal_column("'simple'"),
-            func.coalesce(MessageModel.content, literal_column("''")),
-        )
+        offset: int = 0,
+        before: MessageSearchCursor | None = None,
+    ) -> list[MessageModel]:
+        """Newest-first matches with `search_headline` set on each returned message.
+
+        The page is picked from the (chat_id, search_vector) GIN index first;
+        ts_headline then only runs for the rows on that page.
+        """
         search_query = func.websearch_to_tsquery(literal_column("'simple'"), query_text)
-        where_clauses = (
-            MessageModel.deleted_at.is_(None),
-            search_vector.op("@@")(search_query),
+        page_query = (
+            select(MessageModel.message_id)
+            .where(*self._search_clauses(search_query, chat_id=chat_id))
+            .order_by(desc(MessageModel.created_at), desc(MessageModel.message_id))
+            .limit(limit)
         )
-        query = (
-            select(MessageModel)
-            .filter_by(**filters)
-            .where(*where_clauses)
-            .order_by(
-                desc(MessageModel.created_at),
-                desc(MessageModel.message_id),
+        if before is not None:
+            page_query = page_query.where(
+                tuple_(MessageModel.created_at, MessageModel.message_id)
+                < tuple_(literal(before.created_at), literal(before.message_id))
             )
-            .offset(offset)
-            .limit(limit)
-            .options(*self._message_load_options())
+        elif offset:
+            page_query = page_query.offset(offset)
+        page = page_query.subquery()
+
+        # Content is HTML-escaped before highlighting, so the <mark> tags are
+        # the only markup in the snippet.
+        escaped_content = func.replace(
+            func.replace(func.replace(MessageModel.content, "&", "&amp;"), "<", "&lt;"),
+            ">",
+            "&gt;",
         )
-        count_query = (
-            select(func.count())
-            .select_from(MessageModel)
-            .filter_by(**filters)
-            .where(*where_clauses)
+        headline = func.ts_headline(
+            literal_column("'simple'"),
+            escaped_content,
+            search_query,
+            literal(SEARCH_HEADLINE_OPTIONS),
+        )
+        query = (
+            select(MessageModel, headline.label("search_headline"))
+            .join(page, page.c.message_id == MessageModel.message_id)
+            .order_by(desc(MessageModel.created_at), desc(MessageModel.message_id))
+            .options(*self._message_load_options())
         )
 
         result = await self._session.execute(query)
-        count_result = await self._session.execute(count_query)
-        return list(result.scalars().all()), int(count_result.scalar_one())
+        messages = []
+        for message, search_headline in result.all():
+            message.search_headline = search_headline
+            messages.append(message)
+        return messages
+
+    async def count_search_matches(
+        self,
+        *,
+        query_text: str,
+        chat_id: uuid.UUID,
+        cap: int,
+    ) -> int:
+        """Number of matches, counting no further than `cap`."""
+        search_query = func.websearch_to_tsquery(literal_column("'simple'"), query_text)
+        matches = (
+            select(MessageModel.message_id)
+            .where(*self._search_clauses(search_query, chat_id=chat_id))
+            .limit(cap)
+            .subquery()
+        )
+        result = await self._session.execute(select(func.count()).select_from(matches))
+        return int(result.scalar_one())
+
+    def _search_clauses(self, search_query, *, chat_id: uuid.UUID):  # type: ignore[no-untyped-def]
+        # Mirrors ix_messages_chat_search_vector, including its partial predicate.
+        return (
+            MessageModel.chat_id == chat_id,
+            MessageModel.deleted_at.is_(None),
+            MessageModel.search_vector.op("@@")(search_query),
+        )
 
     async def get_reply_target(
         self,
@@ -367,7 +452,6 @@ class MessageRepository:
             MessageSharedContentModel.content
         )
         return (
-            content_load.selectinload(ContentModel.author).selectinload(UserModel.subscribers),
             content_load.selectinload(ContentModel.author)
             .selectinload(UserModel.avatar_asset)
             .selectinload(AssetModel.variants),
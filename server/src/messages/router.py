@@ -3,7 +3,8 @@ import uuid
 from fastapi import APIRouter, Depends, Query
 
 from src.auth.dependencies import get_current_user
-from src.chats.sockets import _build_message_ws_payload, sio
+from src.chats.broadcast import RoomEmit, chat_room, emit_to_rooms
+from src.chats.sockets import _serialize_message_ws_payload, sio
 from src.chats.dependencies import get_chat_service
 from src.chats.service import ChatService
 from src.messages.dependencies import get_message_service
@@ -16,7 +17,7 @@ from src.messages.schemas import (
 )
 from src.messages.service import MessageService
 from src.common.schemas import Status
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 
 router = APIRouter(
     prefix="/messages",
@@ -30,7 +31,7 @@ async def get_chat_messages(
     order: MessagesOrder = MessagesOrder.CREATED_AT,
     offset: int = 0,
     limit: int = 100,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: MessageService = Depends(get_message_service),
     chat_service: ChatService = Depends(get_chat_service),
 ) -> list[MessageGetWithUser]:
@@ -52,7 +53,8 @@ async def search_chat_messages(
     order: MessagesOrder = MessagesOrder.CREATED_AT,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=50),
-    user: UserGet = Depends(get_current_user),
+    cursor: str | None = None,
+    user: UserPrincipal = Depends(get_current_user),
     service: MessageService = Depends(get_message_service),
     chat_service: ChatService = Depends(get_chat_service),
 ) -> MessageSearchGet:
@@ -65,32 +67,34 @@ async def search_chat_messages(
         order_desc=True,
         offset=offset,
         limit=limit,
+        cursor=cursor,
     )
 
 
 @router.post("/share-content")
 async def share_content_to_chats(
     data: SharedContentMessagesCreate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: MessageService = Depends(get_message_service),
 ) -> list[MessageGetWithUser]:
     messages = await service.share_content_to_chats(
         data=data,
         user_id=user.user_id,
     )
-    for message in messages:
-        await sio.emit(
-            "message:created",
-            await _build_message_ws_payload(message),
-            room=str(message.chat_id),
-        )
+    await emit_to_rooms(
+        sio,
+        [
+            RoomEmit("message:created", await _serialize_message_ws_payload(message), room=chat_room(message.chat_id))
+            for message in messages
+        ],
+    )
     return messages
 
 
 @router.delete("/")
 async def clear_chat_messages(
     chat_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     message_service: MessageService = Depends(get_message_service),
     chat_service: ChatService = Depends(get_chat_service),
 ) -> Status:
@@ -104,7 +108,7 @@ async def clear_chat_messages(
 @router.delete("/{message_id}")
 async def delete_message(
     message_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: MessageService = Depends(get_message_service),
 ) -> Status:
     await service.delete_message(message_id=message_id, user_id=user.user_id)
@@ -115,7 +119,7 @@ async def delete_message(
 async def update_message(
     message_id: uuid.UUID,
     data: MessageUpdate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     service: MessageService = Depends(get_message_service),
 ) -> MessageGetWithUser:
     return await service.update_message(
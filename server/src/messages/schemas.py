@@ -139,11 +139,20 @@ class MessageGetWithUser(MessageGet):
     user: UserGet
 
 
+class MessageSearchItemGet(MessageGetWithUser):
+    # HTML-escaped snippet of the message with matches wrapped in <mark>.
+    highlight: str | None = None
+
+
 class MessageSearchGet(BaseModel):
-    items: list[MessageGetWithUser] = Field(default_factory=list)
-    total: int = Field(ge=0)
+    items: list[MessageSearchItemGet] = Field(default_factory=list)
+    # Counted up to MESSAGE_SEARCH_TOTAL_CAP and only for offset requests;
+    # cursor requests leave it empty.
+    total: int | None = Field(default=None, ge=0)
     offset: int = Field(ge=0)
     limit: int = Field(ge=1)
+    has_more: bool = False
+    next_cursor: str | None = None
 
 
 class MessageUpdate(BaseSchema):
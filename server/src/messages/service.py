@@ -20,6 +20,11 @@ from src.messages.exceptions import (
     InvalidMessageAssets,
     InvalidMessageReply,
 )
+from src.messages.pagination import (
+    MessageSearchCursor,
+    encode_message_search_cursor,
+    resolve_message_search_cursor,
+)
 from src.messages.presentation import DELETED_MESSAGE_STUB, build_message_get_with_user
 from src.messages.repository import MessageRepository
 from src.messages.schemas import (
@@ -27,6 +32,7 @@ from src.messages.schemas import (
     MessageGetWithUser,
     MessageReplyPreview,
     MessageSearchGet,
+    MessageSearchItemGet,
     SharedContentMessagesCreate,
     MessageUpdate,
 )
@@ -35,6 +41,9 @@ if TYPE_CHECKING:
     from src.assets.storage import AssetStorage
 
 
+MESSAGE_SEARCH_TOTAL_CAP = 1000
+
+
 class MessageService:
     def __init__(
         self,
@@ -153,6 +162,7 @@ class MessageService:
             offset=offset,
             limit=limit,
             chat_id=chat_id,
+            viewer_id=viewer_id,
         )
         return [
             await self._build_message_with_user(message, viewer_id=viewer_id)
@@ -332,28 +342,56 @@ class MessageService:
         order_desc: bool,
         offset: int,
         limit: int,
+        cursor: str | None = None,
     ) -> MessageSearchGet:
+        before = resolve_message_search_cursor(cursor, offset=offset)
         normalized_query = query.strip()
         if not normalized_query:
             return MessageSearchGet(items=[], total=0, offset=offset, limit=limit)
 
-        messages, total = await self._repository.search(
+        messages = await self._repository.search(
             query_text=normalized_query,
-            order=order,
-            order_desc=order_desc,
-            offset=offset,
-            limit=limit,
             chat_id=chat_id,
+            limit=limit + 1,
+            offset=offset,
+            before=before,
         )
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+
+        total = None
+        if before is None:
+            if not has_more and (messages or not offset):
+                total = offset + len(messages)
+            else:
+                total = await self._repository.count_search_matches(
+                    query_text=normalized_query,
+                    chat_id=chat_id,
+                    cap=MESSAGE_SEARCH_TOTAL_CAP,
+                )
+
         items = [
-            await self._build_message_with_user(message, viewer_id=viewer_id)
+            MessageSearchItemGet(
+                **(await self._build_message_with_user(message, viewer_id=viewer_id)).model_dump(),
+                highlight=getattr(message, "search_headline", None),
+            )
             for message in messages
         ]
+        next_cursor = None
+        if has_more and messages:
+            next_cursor = encode_message_search_cursor(
+                MessageSearchCursor(
+                    created_at=messages[-1].created_at,
+                    message_id=messages[-1].message_id,
+                )
+            )
         return MessageSearchGet(
             items=items,
             total=total,
             offset=offset,
             limit=limit,
+            has_more=has_more,
+            next_cursor=next_cursor,
         )
 
     async def _build_message_with_user(
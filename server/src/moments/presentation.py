@@ -8,7 +8,7 @@ from src.assets.storage import AssetStorage
 from src.moments.schemas import MomentEditorGet, MomentGet
 from src.users.presentation import build_user_get
 from src.videos.enums import VideoProcessingStatusEnum
-from src.videos.presentation import build_playback_sources, build_video_asset_get
+from src.videos.presentation import build_playback_sources, build_streaming_sources, build_video_asset_get
 
 
 async def build_moment_get(
@@ -23,8 +23,15 @@ async def build_moment_get(
     cover = await build_video_asset_get(cover_link, storage=storage) if cover_link is not None else None
     source_asset = await build_video_asset_get(source_link, storage=storage) if source_link is not None else None
     playback_sources = []
+    streaming_sources = []
     if include_playback_sources and source_link is not None:
         playback_sources = await build_playback_sources(source_link, storage=storage)
+        streaming_sources = build_streaming_sources(
+            source_link,
+            base_path=f"/moments/{moment.content_id}/playback",
+            content_id=moment.content_id,
+            viewer_id=viewer_id,
+        )
 
     playback = moment.video_playback_details
     details = moment.moment_details
@@ -58,6 +65,7 @@ async def build_moment_get(
         cover=cover,
         source_asset=source_asset,
         playback_sources=playback_sources,
+        streaming_sources=streaming_sources,
         my_reaction=moment.my_reaction,
         is_owner=moment.author_id == viewer_id,
     )
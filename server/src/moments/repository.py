@@ -14,6 +14,7 @@ from src.content.models import ContentModel, ContentReactionModel, ContentViewSe
 from src.moments.enums import MomentOrder, MomentProfileFilter
 from src.moments.models import MomentDetailsModel
 from src.users.models import UserModel
+from src.users.repository import populate_viewer_subscriptions
 from src.videos.enums import VideoOrientationEnum, VideoProcessingStatusEnum
 from src.videos.models import VideoPlaybackDetailsModel
 
@@ -102,7 +103,7 @@ class MomentRepository:
     ) -> ContentModel | None:
         stmt = self._build_moment_query(viewer_id=viewer_id).where(ContentModel.content_id == content_id)
         result = await self._session.execute(stmt)
-        return self._one_or_none(result, viewer_id=viewer_id)
+        return await self._one_or_none(result, viewer_id=viewer_id)
 
     async def get_feed(
         self,
@@ -123,7 +124,7 @@ class MomentRepository:
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
 
     async def get_author_moments(
         self,
@@ -172,7 +173,7 @@ class MomentRepository:
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
 
     async def update_moment(
         self,
@@ -428,7 +429,6 @@ class MomentRepository:
     def _build_moment_query(self, viewer_id: uuid.UUID | None):
         reaction_subquery = self._reaction_subquery(viewer_id=viewer_id)
         base_options = (
-            selectinload(ContentModel.author).selectinload(UserModel.subscribers),
             selectinload(ContentModel.author)
             .selectinload(UserModel.avatar_asset)
             .selectinload(AssetModel.variants),
@@ -482,7 +482,7 @@ class MomentRepository:
             column = ContentModel.content_id
         return desc(column) if order_desc else column
 
-    def _many(self, result, viewer_id: uuid.UUID | None) -> list[ContentModel]:  # type: ignore[no-untyped-def]
+    async def _many(self, result, viewer_id: uuid.UUID | None) -> list[ContentModel]:  # type: ignore[no-untyped-def]
         if viewer_id is None:
             moments = list(result.scalars().unique().all())
             for moment in moments:
@@ -494,9 +494,14 @@ class MomentRepository:
             moment.my_reaction = my_reaction
             moment.is_owner = moment.author_id == viewer_id
             moments.append(moment)
+        await populate_viewer_subscriptions(
+            self._session,
+            users=[moment.author for moment in moments],
+            viewer_id=viewer_id,
+        )
         return moments
 
-    def _one_or_none(self, result, viewer_id: uuid.UUID | None) -> ContentModel | None:  # type: ignore[no-untyped-def]
+    async def _one_or_none(self, result, viewer_id: uuid.UUID | None) -> ContentModel | None:  # type: ignore[no-untyped-def]
         if viewer_id is None:
             moment = result.scalar_one_or_none()
             if moment is not None:
@@ -509,4 +514,5 @@ class MomentRepository:
         moment, my_reaction = row
         moment.my_reaction = my_reaction
         moment.is_owner = moment.author_id == viewer_id
+        await populate_viewer_subscriptions(self._session, users=[moment.author], viewer_id=viewer_id)
         return moment
@@ -1,14 +1,16 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
-from src.auth.dependencies import get_current_optional_user, get_current_user
+from src.auth.dependencies import get_current_optional_user, get_current_user, get_playback_grant
+from src.auth.schemas import PlaybackGrant
 from src.common.schemas import Status
 from src.moments.dependencies import get_moment_service
 from src.moments.enums import MomentOrder, MomentProfileFilter
 from src.moments.schemas import MomentCreate, MomentEditorGet, MomentGet, MomentUpdate
 from src.moments.service import MomentService
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
+from src.videos.hls import HLS_MIME_TYPE
 
 
 router = APIRouter(
@@ -20,7 +22,7 @@ router = APIRouter(
 @router.post("/")
 async def create_moment(
     data: MomentCreate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     moment_service: MomentService = Depends(get_moment_service),
 ) -> MomentGet:
     return await moment_service.create_moment(user=user, data=data)
@@ -34,7 +36,7 @@ async def get_moments(
     limit: int = Query(default=100, ge=0, lt=1000),
     user_id: uuid.UUID | None = None,
     profile_filter: MomentProfileFilter = MomentProfileFilter.PUBLIC,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     moment_service: MomentService = Depends(get_moment_service),
 ) -> list[MomentGet]:
     return await moment_service.get_moments(
@@ -52,16 +54,37 @@ async def get_moments(
 async def get_moments_feed(
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     moment_service: MomentService = Depends(get_moment_service),
 ) -> list[MomentGet]:
     return await moment_service.get_feed(user=user, offset=offset, limit=limit)
 
 
+@router.get("/{moment_id}/playback/master.m3u8")
+async def get_moment_master_playlist(
+    moment_id: uuid.UUID,
+    grant: PlaybackGrant = Depends(get_playback_grant),
+    moment_service: MomentService = Depends(get_moment_service),
+) -> Response:
+    playlist = await moment_service.get_hls_playlist(moment_id=moment_id, grant=grant)
+    return Response(content=playlist, media_type=HLS_MIME_TYPE)
+
+
+@router.get("/{moment_id}/playback/{quality}.m3u8")
+async def get_moment_media_playlist(
+    moment_id: uuid.UUID,
+    quality: str,
+    grant: PlaybackGrant = Depends(get_playback_grant),
+    moment_service: MomentService = Depends(get_moment_service),
+) -> Response:
+    playlist = await moment_service.get_hls_playlist(moment_id=moment_id, grant=grant, quality=quality)
+    return Response(content=playlist, media_type=HLS_MIME_TYPE)
+
+
 @router.get("/{moment_id}")
 async def get_moment(
     moment_id: uuid.UUID,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     moment_service: MomentService = Depends(get_moment_service),
 ) -> MomentGet:
     return await moment_service.get_moment(moment_id=moment_id, user=user)
@@ -70,7 +93,7 @@ async def get_moment(
 @router.get("/{moment_id}/editor")
 async def get_moment_editor(
     moment_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     moment_service: MomentService = Depends(get_moment_service),
 ) -> MomentEditorGet:
     return await moment_service.get_moment_editor(moment_id=moment_id, user=user)
@@ -80,7 +103,7 @@ async def get_moment_editor(
 async def update_moment(
     moment_id: uuid.UUID,
     data: MomentUpdate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     moment_service: MomentService = Depends(get_moment_service),
 ) -> MomentGet:
     return await moment_service.update_moment(user=user, moment_id=moment_id, data=data)
@@ -89,7 +112,7 @@ async def update_moment(
 @router.delete("/{moment_id}")
 async def delete_moment(
     moment_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     moment_service: MomentService = Depends(get_moment_service),
 ) -> Status:
     await moment_service.delete_moment(user=user, moment_id=moment_id)
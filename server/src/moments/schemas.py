@@ -57,6 +57,7 @@ class MomentGet(BaseSchema):
     cover: VideoAssetGet | None = None
     source_asset: VideoAssetGet | None = None
     playback_sources: list[VideoPlaybackSourceGet] = Field(default_factory=list)
+    streaming_sources: list[VideoPlaybackSourceGet] = Field(default_factory=list)
     my_reaction: ReactionTypeEnum | None = None
     is_owner: bool
 
@@ -14,6 +14,7 @@ from src.assets.models import AssetModel
 from src.assets.repository import AssetRepository
 from src.assets.service import AssetService
 from src.assets.storage import AssetStorage, detect_extension
+from src.auth.schemas import PlaybackGrant
 from src.common.exceptions import PermissionDenied
 from src.content.access import can_view_content
 from src.content.enums import ContentStatusEnum, ContentVisibilityEnum
@@ -23,8 +24,9 @@ from src.moments.presentation import build_moment_editor_get, build_moment_get
 from src.moments.repository import MomentRepository
 from src.moments.schemas import MomentCreate, MomentEditorGet, MomentGet, MomentUpdate
 from src.tags.service import TagService
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 from src.videos.enums import VideoOrientationEnum, VideoProcessingStatusEnum
+from src.videos.presentation import build_hls_playlist
 
 
 MOMENT_SOURCE_ALLOWED_STATUSES = {
@@ -66,7 +68,7 @@ class MomentService:
     async def create_moment(
         self,
         *,
-        user: UserGet,
+        user: UserPrincipal,
         data: MomentCreate,
     ) -> MomentGet:
         caption = data.caption.strip()
@@ -126,7 +128,7 @@ class MomentService:
     async def get_feed(
         self,
         *,
-        user: UserGet | None,
+        user: UserPrincipal | None,
         offset: int,
         limit: int,
     ) -> list[MomentGet]:
@@ -142,7 +144,7 @@ class MomentService:
         offset: int,
         limit: int,
         user_id: uuid.UUID | None,
-        user: UserGet | None,
+        user: UserPrincipal | None,
         profile_filter: MomentProfileFilter,
     ) -> list[MomentGet]:
         viewer_id = user.user_id if user else None
@@ -164,7 +166,7 @@ class MomentService:
         self,
         *,
         moment_id: uuid.UUID,
-        user: UserGet | None,
+        user: UserPrincipal | None,
     ) -> MomentGet:
         viewer_id = user.user_id if user else None
         moment = await self._repository.get_single(content_id=moment_id, viewer_id=viewer_id)
@@ -172,11 +174,34 @@ class MomentService:
             raise MomentNotFound(f"Moment with id {moment_id!s} not found")
         return await self._build_moment_get(moment, viewer_id=viewer_id)
 
+    async def get_hls_playlist(
+        self,
+        *,
+        moment_id: uuid.UUID,
+        grant: PlaybackGrant,
+        quality: str | None = None,
+    ) -> str:
+        if grant.content_id != moment_id:
+            raise MomentNotFound(f"Moment with id {moment_id!s} not found")
+        viewer_id = grant.viewer_id
+        moment = await self._repository.get_single(content_id=moment_id, viewer_id=viewer_id)
+        if moment is None or not self._can_view_moment(moment=moment, viewer_id=viewer_id):
+            raise MomentNotFound(f"Moment with id {moment_id!s} not found")
+        playlist = await build_hls_playlist(
+            moment,
+            quality=quality,
+            storage=self._asset_storage,
+            playback_token=grant.token,
+        )
+        if playlist is None:
+            raise MomentNotFound(f"Moment with id {moment_id!s} has no streaming playlist")
+        return playlist
+
     async def get_moment_editor(
         self,
         *,
         moment_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
     ) -> MomentEditorGet:
         moment = await self._repository.get_single(content_id=moment_id, viewer_id=user.user_id)
         if moment is None or moment.author_id != user.user_id or moment.deleted_at is not None:
@@ -186,7 +211,7 @@ class MomentService:
     async def update_moment(
         self,
         *,
-        user: UserGet,
+        user: UserPrincipal,
         moment_id: uuid.UUID,
         data: MomentUpdate,
     ) -> MomentGet:
@@ -283,7 +308,7 @@ class MomentService:
             raise MomentNotFound(f"Moment with id {moment_id!s} not found")
         return await self._build_moment_get(updated, viewer_id=user.user_id)
 
-    async def delete_moment(self, *, user: UserGet, moment_id: uuid.UUID) -> None:
+    async def delete_moment(self, *, user: UserPrincipal, moment_id: uuid.UUID) -> None:
         moment = await self._repository.get_single(content_id=moment_id, viewer_id=user.user_id)
         if moment is None or moment.author_id != user.user_id:
             raise PermissionDenied(f"User with id {user.user_id} can't delete moment with id {moment_id}")
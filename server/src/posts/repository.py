@@ -20,6 +20,7 @@ from src.content.repository import ContentReactionRemoveResult, ContentReactionS
 from src.posts.enums import PostOrder, PostProfileFilter
 from src.posts.models import PostDetailsModel
 from src.users.models import SubscriptionModel, UserModel
+from src.users.repository import populate_viewer_subscriptions
 
 
 class PostRepository:
@@ -73,7 +74,7 @@ class PostRepository:
     ) -> ContentModel | None:
         stmt = self._build_post_query(viewer_id=viewer_id).where(ContentModel.content_id == content_id)
         result = await self._session.execute(stmt)
-        return self._one_or_none(result, viewer_id=viewer_id)
+        return await self._one_or_none(result, viewer_id=viewer_id)
 
     async def get_feed(
         self,
@@ -94,7 +95,7 @@ class PostRepository:
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
 
     async def get_author_posts(
         self,
@@ -144,7 +145,7 @@ class PostRepository:
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
 
     async def get_user_subscriptions_posts(
         self,
@@ -172,7 +173,7 @@ class PostRepository:
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=user_id)
+        return await self._many(result, viewer_id=user_id)
 
     async def update_post(
         self,
@@ -393,7 +394,6 @@ class PostRepository:
                 select(ContentModel)
                 .where(ContentModel.content_type == ContentTypeEnum.POST)
                 .options(
-                    selectinload(ContentModel.author).selectinload(UserModel.subscribers),
                     selectinload(ContentModel.author)
                     .selectinload(UserModel.avatar_asset)
                     .selectinload(AssetModel.variants),
@@ -416,7 +416,6 @@ class PostRepository:
             )
             .where(ContentModel.content_type == ContentTypeEnum.POST)
             .options(
-                selectinload(ContentModel.author).selectinload(UserModel.subscribers),
                 selectinload(ContentModel.author)
                 .selectinload(UserModel.avatar_asset)
                 .selectinload(AssetModel.variants),
@@ -441,7 +440,7 @@ class PostRepository:
             .subquery()
         )
 
-    def _many(self, result, viewer_id: uuid.UUID | None) -> list[ContentModel]:  # type: ignore[no-untyped-def]
+    async def _many(self, result, viewer_id: uuid.UUID | None) -> list[ContentModel]:  # type: ignore[no-untyped-def]
         if viewer_id is None:
             posts = list(result.scalars().unique().all())
             for post in posts:
@@ -454,9 +453,14 @@ class PostRepository:
             post.my_reaction = my_reaction
             post.is_owner = post.author_id == viewer_id
             posts.append(post)
+        await populate_viewer_subscriptions(
+            self._session,
+            users=[post.author for post in posts],
+            viewer_id=viewer_id,
+        )
         return posts
 
-    def _one_or_none(self, result, viewer_id: uuid.UUID | None) -> ContentModel | None:  # type: ignore[no-untyped-def]
+    async def _one_or_none(self, result, viewer_id: uuid.UUID | None) -> ContentModel | None:  # type: ignore[no-untyped-def]
         if viewer_id is None:
             post = result.scalar_one_or_none()
             if post is not None:
@@ -471,6 +475,7 @@ class PostRepository:
         post, my_reaction = row
         post.my_reaction = my_reaction
         post.is_owner = post.author_id == viewer_id
+        await populate_viewer_subscriptions(self._session, users=[post.author], viewer_id=viewer_id)
         return post
 
     def _order_by_clause(self, order: PostOrder, order_desc: bool):
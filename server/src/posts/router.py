@@ -8,7 +8,7 @@ from src.posts.dependencies import get_post_service
 from src.posts.enums import PostOrder, PostProfileFilter
 from src.posts.schemas import PostCreate, PostGet, PostRating, PostUpdate
 from src.posts.service import PostService
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 
 router = APIRouter(
     prefix="/posts",
@@ -19,7 +19,7 @@ router = APIRouter(
 @router.post("/")
 async def create_post(
     data: PostCreate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     post_service: PostService = Depends(get_post_service),
 ) -> PostGet:
     return await post_service.create_post(user, data)
@@ -33,7 +33,7 @@ async def get_posts(
     limit: int = Query(default=100, ge=0, lt=1000),
     user_id: uuid.UUID | None = None,
     profile_filter: PostProfileFilter = PostProfileFilter.PUBLIC,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     post_service: PostService = Depends(get_post_service),
 ) -> list[PostGet]:
     return await post_service.get_posts(
@@ -58,7 +58,7 @@ async def get_subscriptions_posts(
     desc: bool = True,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=0, lt=1000),
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     post_service: PostService = Depends(get_post_service),
 ) -> list[PostGet]:
     return await post_service.get_user_subscriptions_posts(
@@ -73,7 +73,7 @@ async def get_subscriptions_posts(
 @router.get("/{post_id}")
 async def get_post_by_id(
     post_id: uuid.UUID,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     post_service: PostService = Depends(get_post_service),
 ) -> PostGet:
     return await post_service.get_post(post_id=post_id, user=user)
@@ -83,7 +83,7 @@ async def get_post_by_id(
 async def update_post(
     post_id: uuid.UUID,
     data: PostUpdate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     post_service: PostService = Depends(get_post_service),
 ) -> PostGet:
     return await post_service.update_post(
@@ -96,7 +96,7 @@ async def update_post(
 @router.delete("/{post_id}")
 async def delete_post(
     post_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     post_service: PostService = Depends(get_post_service),
 ) -> Status:
     await post_service.delete_post(user=user, post_id=post_id)
@@ -106,7 +106,7 @@ async def delete_post(
 @router.post("/{post_id}/like")
 async def like_post(
     post_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     post_service: PostService = Depends(get_post_service),
 ) -> PostRating:
     return await post_service.add_like_to_post(
@@ -118,7 +118,7 @@ async def like_post(
 @router.delete("/{post_id}/like")
 async def unlike_post(
     post_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     post_service: PostService = Depends(get_post_service),
 ) -> PostRating:
     return await post_service.remove_like_from_post(
@@ -130,7 +130,7 @@ async def unlike_post(
 @router.post("/{post_id}/dislike")
 async def dislike_post(
     post_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     post_service: PostService = Depends(get_post_service),
 ) -> PostRating:
     return await post_service.add_dislike_to_post(
@@ -142,7 +142,7 @@ async def dislike_post(
 @router.delete("/{post_id}/dislike")
 async def undislike_post(
     post_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     post_service: PostService = Depends(get_post_service),
 ) -> PostRating:
     return await post_service.remove_dislike_from_post(
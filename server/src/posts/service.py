@@ -24,7 +24,7 @@ from src.posts.presentation import build_post_get
 from src.posts.repository import PostRepository
 from src.posts.schemas import PostAttachmentWrite, PostCreate, PostGet, PostRating, PostUpdate
 from src.tags.service import TagService
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 
 if TYPE_CHECKING:
     from src.activity.service import ActivityService
@@ -61,7 +61,7 @@ class PostService:
 
     async def create_post(
         self,
-        user: UserGet,
+        user: UserPrincipal,
         data: PostCreate,
     ) -> PostGet:
         now = self._now()
@@ -111,7 +111,7 @@ class PostService:
     async def get_post(
         self,
         post_id: uuid.UUID,
-        user: UserGet | None = None,
+        user: UserPrincipal | None = None,
     ) -> PostGet:
         viewer_id = user.user_id if user else None
         post = await self._repository.get_single(content_id=post_id, viewer_id=viewer_id)
@@ -127,7 +127,7 @@ class PostService:
         offset: int,
         limit: int,
         user_id: uuid.UUID | None = None,
-        user: UserGet | None = None,
+        user: UserPrincipal | None = None,
         profile_filter: PostProfileFilter = PostProfileFilter.PUBLIC,
     ) -> list[PostGet]:
         viewer_id = user.user_id if user else None
@@ -155,7 +155,7 @@ class PostService:
 
     async def update_post(
         self,
-        user: UserGet,
+        user: UserPrincipal,
         post_id: uuid.UUID,
         data: PostUpdate,
     ) -> PostGet:
@@ -239,7 +239,7 @@ class PostService:
 
     async def delete_post(
         self,
-        user: UserGet,
+        user: UserPrincipal,
         post_id: uuid.UUID,
     ) -> None:
         post = await self._repository.get_single(content_id=post_id, viewer_id=user.user_id)
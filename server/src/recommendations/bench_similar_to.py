@@ -0,0 +1,159 @@
+"""Benchmark: SIMILAR_TO rebuild time on synthetic recommendation graphs.
+
+Wipes the target Neo4j database, loads a synthetic graph per size and times a
+full `recompute_similar_to()` plus an incremental batch:
+
+    python -m src.recommendations.bench_similar_to --sizes 10000 100000 --confirm-clear
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import datetime
+import random
+import time
+import uuid
+
+from src.config import settings
+from src.recommendations.graph_repository import RecommendationGraphRepository, create_neo4j_driver
+
+USERS_PER_CONTENT = 0.1
+TAGS_PER_CONTENT = 3
+VIEWS_PER_USER = 30
+LIKES_PER_USER = 8
+COMMENTS_PER_USER = 2
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.recommendations.bench_similar_to",
+        description="Time SIMILAR_TO recomputation on synthetic graphs",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--incremental-batch", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--confirm-clear",
+        action="store_true",
+        help="required: every run deletes all nodes in the configured Neo4j database",
+    )
+    return parser
+
+
+async def _seed_graph(repository: RecommendationGraphRepository, *, content_count: int, rng: random.Random) -> list[uuid.UUID]:
+    user_ids = [uuid.uuid4() for _ in range(max(1, int(content_count * USERS_PER_CONTENT)))]
+    tag_ids = [uuid.uuid4() for _ in range(max(50, content_count // 100))]
+    content_ids = [uuid.uuid4() for _ in range(content_count)]
+    now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    # Skewed tag and content popularity, so hub tags and hit content exist like they do in production.
+    tag_weights = [1.0 / (rank + 1) for rank in range(len(tag_ids))]
+    content_weights = [1.0 / (rank + 1) ** 0.8 for rank in range(content_count)]
+
+    authors = {content_id: rng.choice(user_ids) for content_id in content_ids}
+
+    await repository.upsert_users(user_ids)
+    await repository.upsert_content_nodes(
+        [
+            {
+                "content_id": str(content_id),
+                "author_id": str(author_id),
+                "content_type": rng.choice(["post", "article", "video", "moment"]),
+                "status": "published",
+                "visibility": "public",
+                "created_at": now,
+                "published_at": now,
+                "likes_count": 0,
+                "dislikes_count": 0,
+                "comments_count": 0,
+                "views_count": 0,
+                "quality_score": rng.random(),
+            }
+            for content_id, author_id in authors.items()
+        ]
+    )
+    await repository.upsert_authored_edges(
+        [{"user_id": str(author_id), "content_id": str(content_id)} for content_id, author_id in authors.items()]
+    )
+    await repository.replace_content_tags(
+        content_ids=content_ids,
+        tag_rows=[
+            {"content_id": str(content_id), "tag_id": str(tag_id), "tag_slug": f"tag-{tag_id.hex[:8]}"}
+            for content_id in content_ids
+            for tag_id in set(rng.choices(tag_ids, weights=tag_weights, k=TAGS_PER_CONTENT))
+        ],
+    )
+
+    viewed: list[dict] = []
+    liked: list[dict] = []
+    commented: list[dict] = []
+    for user_id in user_ids:
+        seen = set(rng.choices(content_ids, weights=content_weights, k=VIEWS_PER_USER))
+        for content_id in seen:
+            viewed.append(
+                {
+                    "user_id": str(user_id),
+                    "content_id": str(content_id),
+                    "views_count": 1,
+                    "progress_percent": rng.randint(0, 100),
+                    "last_seen_at": now,
+                }
+            )
+        for content_id in rng.sample(sorted(seen), k=min(LIKES_PER_USER, len(seen))):
+            liked.append({"user_id": str(user_id), "content_id": str(content_id), "created_at": now})
+        for content_id in rng.sample(sorted(seen), k=min(COMMENTS_PER_USER, len(seen))):
+            commented.append(
+                {
+                    "user_id": str(user_id),
+                    "content_id": str(content_id),
+                    "comments_count": 1,
+                    "last_commented_at": now,
+                }
+            )
+    await repository.set_viewed_edges(viewed)
+    await repository.set_liked_edges(liked)
+    await repository.set_commented_edges(commented)
+    return content_ids
+
+
+async def _run(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    repository = RecommendationGraphRepository(driver=create_neo4j_driver(), database=settings.neo4j.database)
+    try:
+        for size in args.sizes:
+            await repository.clear_graph()
+            await repository.ensure_schema()
+            started = time.perf_counter()
+            content_ids = await _seed_graph(repository, content_count=size, rng=rng)
+            seeded = time.perf_counter() - started
+
+            started = time.perf_counter()
+            await repository.recompute_similar_to()
+            full = time.perf_counter() - started
+
+            sample = rng.sample(content_ids, k=min(args.incremental_batch, len(content_ids)))
+            started = time.perf_counter()
+            await repository.recompute_similar_to(sample)
+            incremental = time.perf_counter() - started
+
+            edges = await repository._read("MATCH ()-[r:SIMILAR_TO]->() RETURN count(r) AS edges")
+            print(f"content nodes: {size}")
+            print(f"  seed:                     {seeded:.1f}s")
+            print(f"  full rebuild:             {full:.1f}s ({size / full:.0f} nodes/s)")
+            print(f"  incremental ({len(sample)} ids): {incremental:.2f}s")
+            print(f"  SIMILAR_TO edges:         {edges[0]['edges']}")
+    finally:
+        await repository.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not args.confirm_clear:
+        print("refusing to run without --confirm-clear: the benchmark wipes the Neo4j database")
+        return 2
+    asyncio.run(_run(args))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
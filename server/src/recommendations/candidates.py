@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import uuid
+from dataclasses import dataclass
+
+import redis.asyncio as redis
+
+from src.config import settings
+from src.recommendations.scoring import FRESHNESS_WEIGHT, compute_freshness_score
+
+
+logger = logging.getLogger(__name__)
+
+# Stored for users whose graph query returned nothing, so an empty list is a hit
+# rather than a miss that sends every request back to Neo4j.
+_EMPTY_MEMBER = "-"
+
+
+@dataclass(slots=True, frozen=True)
+class RecommendationCandidate:
+    content_id: uuid.UUID
+    content_type: str
+    base_score: float
+    published_at: datetime.datetime | None
+
+
+@dataclass(slots=True, frozen=True)
+class RankedRecommendationCandidate:
+    content_id: uuid.UUID
+    score: float
+
+
+def build_recommendation_candidates_key(user_id: uuid.UUID) -> str:
+    return f"recommendations:candidates:{user_id}"
+
+
+def rank_recommendation_candidates(
+    candidates: list[RecommendationCandidate],
+    *,
+    now: datetime.datetime,
+    content_type: str | None,
+    excluded_content_ids: set[uuid.UUID],
+) -> list[RankedRecommendationCandidate]:
+    """Re-apply freshness to the stored base scores, matching the live graph ordering."""
+    ranked: list[tuple[float, datetime.datetime, RecommendationCandidate]] = []
+    for candidate in candidates:
+        if content_type is not None and candidate.content_type != content_type:
+            continue
+        if candidate.content_id in excluded_content_ids:
+            continue
+        score = candidate.base_score + compute_freshness_score(candidate.published_at, now=now) * FRESHNESS_WEIGHT
+        published_sort = candidate.published_at or datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
+        ranked.append((score, published_sort, candidate))
+    ranked.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    return [
+        RankedRecommendationCandidate(content_id=candidate.content_id, score=score)
+        for score, _, candidate in ranked
+    ]
+
+
+class RecommendationCandidateStore:
+    """Top-N feed candidates per user, one Redis sorted set each.
+
+    Members carry the content type and publication time next to the id, so the
+    feed can filter and re-rank a list without touching Neo4j or Postgres.
+    """
+
+    def __init__(self, client: redis.Redis, *, ttl_seconds: int) -> None:
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+
+    async def replace(self, user_id: uuid.UUID, candidates: list[RecommendationCandidate]) -> None:
+        key = build_recommendation_candidates_key(user_id)
+        mapping = {self._encode_member(candidate): candidate.base_score for candidate in candidates}
+        if not mapping:
+            mapping = {_EMPTY_MEMBER: 0.0}
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.zadd(key, mapping)
+            pipe.expire(key, self._ttl_seconds)
+            await pipe.execute()
+
+    async def get(self, user_id: uuid.UUID) -> list[RecommendationCandidate] | None:
+        rows = await self._client.zrevrange(
+            build_recommendation_candidates_key(user_id),
+            0,
+            -1,
+            withscores=True,
+        )
+        if not rows:
+            return None
+        candidates: list[RecommendationCandidate] = []
+        for member, score in rows:
+            candidate = self._decode_member(member, float(score))
+            if candidate is not None:
+                candidates.append(candidate)
+        return candidates
+
+    async def delete(self, user_id: uuid.UUID) -> None:
+        await self._client.delete(build_recommendation_candidates_key(user_id))
+
+    @staticmethod
+    def _encode_member(candidate: RecommendationCandidate) -> str:
+        published_at = (
+            str(int(candidate.published_at.timestamp())) if candidate.published_at is not None else ""
+        )
+        return f"{candidate.content_id}|{candidate.content_type}|{published_at}"
+
+    @staticmethod
+    def _decode_member(member: str | bytes, score: float) -> RecommendationCandidate | None:
+        if isinstance(member, bytes):
+            member = member.decode()
+        if member == _EMPTY_MEMBER:
+            return None
+        try:
+            content_id, content_type, published_at = member.split("|")
+            return RecommendationCandidate(
+                content_id=uuid.UUID(content_id),
+                content_type=content_type,
+                base_score=score,
+                published_at=(
+                    datetime.datetime.fromtimestamp(int(published_at), tz=datetime.timezone.utc)
+                    if published_at
+                    else None
+                ),
+            )
+        except ValueError:
+            logger.warning("Skipping malformed recommendation candidate %r", member)
+            return None
+
+
+def build_recommendation_candidate_store(
+    client: redis.Redis | None = None,
+) -> RecommendationCandidateStore | None:
+    if not settings.recommendations.candidate_store_enabled:
+        return None
+    return RecommendationCandidateStore(
+        client if client is not None else redis.from_url(settings.redis.url, decode_responses=True),
+        ttl_seconds=settings.recommendations.candidate_ttl_seconds,
+    )
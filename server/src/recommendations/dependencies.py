@@ -1,38 +1,105 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import typing as tp
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.assets.dependencies import get_asset_storage
-from src.common.database import get_async_session
+from src.common.database import async_session_maker, get_async_session
 from src.content.projectors import build_default_content_projector_registry
+from src.recommendations.candidates import RecommendationCandidateStore, build_recommendation_candidate_store
 from src.recommendations.graph_repository import RecommendationGraphRepository, create_neo4j_driver
+from src.recommendations.overfetch import AdaptiveOverfetch
 from src.recommendations.postgres_repository import RecommendationPostgresRepository
-from src.recommendations.service import RecommendationService
+from src.recommendations.result_cache import RecommendationResultCache, build_recommendation_result_cache
+from src.recommendations.service import RecommendationScorer, RecommendationService
 from src.recommendations.sync_service import RecommendationGraphSyncService
 from src.config import settings
 
+if tp.TYPE_CHECKING:
+    from src.recommendations.sparse_engine import SparseRecommendationEngine
 
-async def get_recommendation_graph_repository() -> AsyncGenerator[RecommendationGraphRepository, None]:
-    driver = create_neo4j_driver()
-    repository = RecommendationGraphRepository(driver=driver, database=settings.neo4j.database)
-    try:
-        yield repository
-    finally:
-        await repository.close()
+
+_neo4j_driver = None
+_candidate_store: RecommendationCandidateStore | None = None
+_result_cache: RecommendationResultCache | None = None
+# Drop rates are learned across requests, so the tracker lives as long as the process.
+_overfetch = AdaptiveOverfetch()
+_sparse_engine: SparseRecommendationEngine | None = None
+
+
+def get_neo4j_driver():  # type: ignore[no-untyped-def]
+    """App-lifetime driver; its connection pool is shared by every request."""
+    global _neo4j_driver
+    if _neo4j_driver is None:
+        _neo4j_driver = create_neo4j_driver()
+    return _neo4j_driver
+
+
+async def close_neo4j_driver() -> None:
+    global _neo4j_driver
+    if _neo4j_driver is not None:
+        driver, _neo4j_driver = _neo4j_driver, None
+        await driver.close()
+
+
+def get_recommendation_candidate_store() -> RecommendationCandidateStore | None:
+    global _candidate_store
+    if _candidate_store is None:
+        _candidate_store = build_recommendation_candidate_store()
+    return _candidate_store
+
+
+def get_recommendation_result_cache() -> RecommendationResultCache | None:
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = build_recommendation_result_cache()
+    return _result_cache
+
+
+def get_sparse_recommendation_engine() -> SparseRecommendationEngine:
+    global _sparse_engine
+    if _sparse_engine is None:
+        # numpy and scipy are only imported once the sparse backend is actually used.
+        from src.recommendations.sparse_engine import SparseRecommendationEngine
+
+        _sparse_engine = SparseRecommendationEngine(
+            index_loader=_load_sparse_recommendation_index,
+            ttl_seconds=settings.recommendations.sparse_index_ttl_seconds,
+        )
+    return _sparse_engine
+
+
+async def _load_sparse_recommendation_index():  # type: ignore[no-untyped-def]
+    from src.recommendations.sparse_engine import load_sparse_recommendation_index
+
+    async with async_session_maker() as session:
+        return await load_sparse_recommendation_index(RecommendationPostgresRepository(session))
+
+
+def get_recommendation_graph_repository() -> RecommendationGraphRepository:
+    return RecommendationGraphRepository(driver=get_neo4j_driver(), database=settings.neo4j.database)
+
+
+def get_recommendation_scorer() -> RecommendationScorer:
+    if settings.recommendations.backend == "sparse":
+        return get_sparse_recommendation_engine()
+    return get_recommendation_graph_repository()
 
 
 async def get_recommendation_service(
     async_session: AsyncSession = Depends(get_async_session),
-    graph_repository: RecommendationGraphRepository = Depends(get_recommendation_graph_repository),
+    graph_repository: RecommendationScorer = Depends(get_recommendation_scorer),
 ) -> RecommendationService:
     return RecommendationService(
         graph_repository=graph_repository,
         postgres_repository=RecommendationPostgresRepository(async_session),
         projector_registry=build_default_content_projector_registry(),
         asset_storage=get_asset_storage(),
+        candidate_store=get_recommendation_candidate_store(),
+        result_cache=get_recommendation_result_cache(),
+        overfetch=_overfetch,
     )
 
 
@@ -43,4 +110,9 @@ async def get_recommendation_graph_sync_service(
     return RecommendationGraphSyncService(
         postgres_repository=RecommendationPostgresRepository(async_session),
         graph_repository=graph_repository,
+        candidate_store=get_recommendation_candidate_store(),
+        candidate_list_size=settings.recommendations.candidate_list_size,
+        result_cache=get_recommendation_result_cache(),
+        rebuild_chunk_size=settings.recommendations.rebuild_chunk_size,
+        rebuild_write_concurrency=settings.recommendations.rebuild_write_concurrency,
     )
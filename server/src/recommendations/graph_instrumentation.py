@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import bisect
+import contextvars
+import functools
+import logging
+import typing as tp
+from dataclasses import dataclass, field
+
+
+logger = logging.getLogger(__name__)
+
+F = tp.TypeVar("F", bound=tp.Callable[..., tp.Awaitable[tp.Any]])
+
+# Upper bounds; the last bucket of each histogram counts everything above them.
+DURATION_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ROW_COUNT_BUCKETS = (0, 1, 10, 100, 1_000, 10_000)
+
+_current_query_name: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "recommendation_graph_query_name",
+    default="unnamed",
+)
+
+
+def current_graph_query_name() -> str:
+    return _current_query_name.get()
+
+
+def graph_query(method: F) -> F:
+    """Tag every Neo4j query issued inside `method` with the method's name."""
+
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):  # type: ignore[no-untyped-def]
+        token = _current_query_name.set(method.__name__)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _current_query_name.reset(token)
+
+    return tp.cast(F, wrapper)
+
+
+@dataclass(slots=True)
+class GraphQueryStats:
+    count: int = 0
+    failures: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    # Time reported by the server; the remainder of total_seconds is pool wait,
+    # network and client-side decoding.
+    server_seconds: float = 0.0
+    rows: int = 0
+    duration_histogram: list[int] = field(default_factory=lambda: [0] * (len(DURATION_BUCKETS_SECONDS) + 1))
+    rows_histogram: list[int] = field(default_factory=lambda: [0] * (len(ROW_COUNT_BUCKETS) + 1))
+
+    def record(self, seconds: float, *, rows: int, server_seconds: float | None, failed: bool) -> None:
+        self.count += 1
+        self.failures += int(failed)
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.server_seconds += server_seconds or 0.0
+        self.rows += rows
+        self.duration_histogram[bisect.bisect_left(DURATION_BUCKETS_SECONDS, seconds)] += 1
+        self.rows_histogram[bisect.bisect_left(ROW_COUNT_BUCKETS, rows)] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "total_seconds": round(self.total_seconds, 3),
+            "avg_seconds": round(self.total_seconds / self.count, 4) if self.count else 0.0,
+            "max_seconds": round(self.max_seconds, 3),
+            "server_seconds": round(self.server_seconds, 3),
+            "rows": self.rows,
+            "duration_histogram": _histogram_to_dict(DURATION_BUCKETS_SECONDS, self.duration_histogram),
+            "rows_histogram": _histogram_to_dict(ROW_COUNT_BUCKETS, self.rows_histogram),
+        }
+
+
+class GraphQueryRecorder:
+    """Per-method timing and result-size histograms for RecommendationGraphRepository.
+
+    Queries slower than `slow_query_seconds` are logged; with `profile_slow_queries`
+    the repository also captures their plan (PROFILE for reads, EXPLAIN for writes).
+    """
+
+    def __init__(self, *, slow_query_seconds: float, profile_slow_queries: bool) -> None:
+        self.slow_query_seconds = slow_query_seconds
+        self.profile_slow_queries = profile_slow_queries
+        self.stats: dict[str, GraphQueryStats] = {}
+
+    def is_slow(self, seconds: float) -> bool:
+        return seconds >= self.slow_query_seconds
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        *,
+        rows: int,
+        server_seconds: float | None,
+        failed: bool,
+    ) -> None:
+        self.stats.setdefault(name, GraphQueryStats()).record(
+            seconds,
+            rows=rows,
+            server_seconds=server_seconds,
+            failed=failed,
+        )
+        if self.is_slow(seconds):
+            logger.warning(
+                "Slow Neo4j query %s: %.3fs (server %.3fs, %d rows)",
+                name,
+                seconds,
+                server_seconds or 0.0,
+                rows,
+            )
+        else:
+            logger.debug("Neo4j query %s: %.3fs, %d rows", name, seconds, rows)
+
+    def log_plan(self, name: str, plan: dict | None) -> None:
+        if plan is None:
+            return
+        logger.warning("Plan for slow Neo4j query %s:\n%s", name, format_query_plan(plan))
+
+    def snapshot(self) -> dict[str, dict]:
+        return {name: stats.to_dict() for name, stats in sorted(self.stats.items())}
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+
+def format_query_plan(plan: dict, depth: int = 0) -> str:
+    arguments = plan.get("args") or plan.get("arguments") or {}
+    details = arguments.get("Details") if isinstance(arguments, dict) else None
+    line = "  " * depth + str(plan.get("operatorType", "?"))
+    if "rows" in plan or "dbHits" in plan:
+        line += f" rows={plan.get('rows', 0)} dbHits={plan.get('dbHits', 0)}"
+    if details:
+        line += f" {details}"
+    children = plan.get("children") or []
+    return "\n".join([line, *(format_query_plan(child, depth + 1) for child in children)])
+
+
+def _histogram_to_dict(bounds: tuple[float, ...], counts: list[int]) -> dict[str, int]:
+    labels = [f"<={bound}" for bound in bounds] + [f">{bounds[-1]}"]
+    return {label: count for label, count in zip(labels, counts) if count}
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import datetime
+import logging
+import time
 import uuid
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
 from neo4j import AsyncGraphDatabase
 
 from src.config import settings
 from src.recommendations.enums import RecommendationSyncStateKey
+from src.recommendations.graph_instrumentation import GraphQueryRecorder, current_graph_query_name, graph_query
 from src.recommendations.scoring import (
     AUTHOR_AFFINITY_WEIGHT,
+    AUTHOR_COMMENT_WEIGHT,
+    AUTHOR_DISLIKE_WEIGHT,
+    AUTHOR_FOLLOW_WEIGHT,
+    AUTHOR_LIKE_WEIGHT,
+    AUTHOR_VIEW_WEIGHT,
     COLLABORATIVE_COMMENT_WEIGHT,
     COLLABORATIVE_LIKE_WEIGHT,
     COLLABORATIVE_VIEW_WEIGHT,
@@ -18,10 +26,17 @@ from src.recommendations.scoring import (
     CONTENT_QUALITY_WEIGHT,
     FRESHNESS_DECAY_DAYS,
     FRESHNESS_WEIGHT,
+    INTEREST_COMMENT_WEIGHT,
+    INTEREST_DISLIKE_WEIGHT,
+    INTEREST_LIKE_WEIGHT,
+    INTEREST_VIEW_WEIGHT,
     TAG_AFFINITY_WEIGHT,
 )
 
 
+logger = logging.getLogger(__name__)
+
+
 @dataclass(slots=True)
 class SimilarContentGraphResult:
     content_id: uuid.UUID
@@ -36,6 +51,14 @@ class RecommendationFeedGraphResult:
     reason: str
 
 
+@dataclass(slots=True)
+class RecommendationCandidateGraphResult:
+    content_id: uuid.UUID
+    content_type: str
+    base_score: float
+    published_at: datetime.datetime | None
+
+
 @dataclass(slots=True)
 class RecommendationAuthorGraphResult:
     user_id: uuid.UUID
@@ -50,24 +73,172 @@ class RecommendationGraphSyncState:
     last_full_rebuild_at: datetime.datetime | None
 
 
+@dataclass(slots=True)
+class EngagementGraphState:
+    liked: bool = False
+    disliked: bool = False
+    views_count: int = 0
+    comments_count: int = 0
+
+
+# INTERESTED_IN and AFFINITY_TO_AUTHOR keep the raw signed sum in `score` and
+# expose max(score, 0) as `weight`, so incremental deltas can be applied to a
+# pair that is currently net-negative. Edges whose score returns to zero are
+# dropped.
+_AFFINITY_SCORE_EPSILON = 1e-9
+
+_RECOMPUTE_SIMILAR_TO_QUERY = """
+UNWIND $content_ids AS source_content_id
+MATCH (c1:Content {content_id: source_content_id})
+OPTIONAL MATCH (c1)-[old:SIMILAR_TO]->(:Content)
+DELETE old
+WITH DISTINCT c1
+CALL (c1) {
+    MATCH (c1)-[:HAS_TAG]->(tag:Tag)
+    CALL (c1, tag) {
+        MATCH (tag)<-[:HAS_TAG]-(c2:Content)
+        WHERE c2 <> c1
+        RETURN c2
+        LIMIT $fanout_limit
+    }
+    RETURN c2, 'tag' AS signal, count(*) AS hits
+    UNION ALL
+    MATCH (c1)<-[:AUTHORED]-(author:User)
+    CALL (c1, author) {
+        MATCH (author)-[:AUTHORED]->(c2:Content)
+        WHERE c2 <> c1
+        RETURN c2
+        LIMIT $fanout_limit
+    }
+    RETURN c2, 'author' AS signal, 1 AS hits
+    UNION ALL
+    MATCH (c1)<-[engaged:LIKED|VIEWED|COMMENTED]-(engager:User)
+    WITH c1, engager, type(engaged) AS engagement
+    LIMIT $engager_limit
+    CALL (c1, engager, engagement) {
+        MATCH (engager)-[co:LIKED|VIEWED|COMMENTED]->(c2:Content)
+        WHERE c2 <> c1 AND type(co) = engagement
+        RETURN c2
+        LIMIT $fanout_limit
+    }
+    RETURN c2, engagement AS signal, count(*) AS hits
+}
+WITH
+    c1,
+    c2,
+    sum(CASE signal WHEN 'tag' THEN hits ELSE 0 END) AS shared_tags,
+    sum(CASE signal WHEN 'LIKED' THEN hits ELSE 0 END) AS co_liked,
+    sum(CASE signal WHEN 'VIEWED' THEN hits ELSE 0 END) AS co_viewed,
+    sum(CASE signal WHEN 'COMMENTED' THEN hits ELSE 0 END) AS co_commented,
+    max(CASE signal WHEN 'author' THEN 3.0 ELSE 0.0 END) AS same_author_boost
+WITH
+    c1,
+    c2,
+    shared_tags,
+    co_liked,
+    co_viewed,
+    co_commented,
+    same_author_boost,
+    (
+        (toFloat(shared_tags) * 2.5)
+        + (toFloat(co_liked) * 3.0)
+        + (toFloat(co_viewed) * 1.0)
+        + (toFloat(co_commented) * 2.0)
+        + same_author_boost
+        + (coalesce(c2.quality_score, 0.0) * 0.15)
+    ) AS score
+WHERE score > 0
+ORDER BY score DESC
+WITH c1, collect({
+    other: c2,
+    score: score,
+    shared_tags: shared_tags,
+    co_liked: co_liked,
+    co_viewed: co_viewed,
+    co_commented: co_commented,
+    same_author_boost: same_author_boost
+})[..$per_content_limit] AS recs
+UNWIND recs AS rec
+WITH c1, rec, rec.other AS other
+MERGE (c1)-[rel:SIMILAR_TO]->(other)
+SET
+    rel.score = rec.score,
+    rel.shared_tags = rec.shared_tags,
+    rel.co_liked = rec.co_liked,
+    rel.co_viewed = rec.co_viewed,
+    rel.co_commented = rec.co_commented,
+    rel.reason = CASE
+        WHEN rec.same_author_boost > 0
+            AND rec.same_author_boost >= (toFloat(rec.shared_tags) * 2.5)
+            AND rec.same_author_boost >= ((toFloat(rec.co_liked) * 3.0) + (toFloat(rec.co_viewed) * 1.0) + (toFloat(rec.co_commented) * 2.0))
+            THEN 'same_author'
+        WHEN rec.shared_tags > 0
+            AND (toFloat(rec.shared_tags) * 2.5) >= ((toFloat(rec.co_liked) * 3.0) + (toFloat(rec.co_viewed) * 1.0) + (toFloat(rec.co_commented) * 2.0))
+            THEN 'shared_tags'
+        WHEN (rec.co_liked + rec.co_viewed + rec.co_commented) > 0
+            THEN 'shared_audience'
+        ELSE 'quality'
+    END,
+    rel.updated_at = datetime()
+"""
+
+
 def create_neo4j_driver():
     return AsyncGraphDatabase.driver(
         settings.neo4j.uri,
         auth=(settings.neo4j.user, settings.neo4j.password),
+        max_connection_pool_size=settings.neo4j.max_connection_pool_size,
+        connection_acquisition_timeout=settings.neo4j.connection_acquisition_timeout_seconds,
+        connection_timeout=settings.neo4j.connection_timeout_seconds,
+        max_connection_lifetime=settings.neo4j.max_connection_lifetime_seconds,
     )
 
 
+_query_recorder: GraphQueryRecorder | None = None
+
+
+def get_graph_query_recorder() -> GraphQueryRecorder:
+    """Process-wide recorder, so stats survive the per-request repository instances."""
+    global _query_recorder
+    if _query_recorder is None:
+        _query_recorder = GraphQueryRecorder(
+            slow_query_seconds=settings.neo4j.slow_query_ms / 1000,
+            profile_slow_queries=settings.neo4j.profile_slow_queries,
+        )
+    return _query_recorder
+
+
 class RecommendationGraphRepository:
-    def __init__(self, *, driver, database: str) -> None:  # type: ignore[no-untyped-def]
+    def __init__(
+        self,
+        *,
+        driver,  # type: ignore[no-untyped-def]
+        database: str,
+        recorder: GraphQueryRecorder | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
         self._driver = driver
         self._database = database
+        self._recorder = recorder if recorder is not None else get_graph_query_recorder()
+        self._clock = clock
 
     async def close(self) -> None:
         await self._driver.close()
 
-    async def clear_graph(self) -> None:
-        await self._write("MATCH (n) DETACH DELETE n")
+    @graph_query
+    async def clear_graph(self, *, batch_size: int = 10_000) -> None:
+        # Deleting in batches keeps the transaction state bounded on large graphs.
+        await self._run_autocommit(
+            """
+            MATCH (n)
+            CALL (n) {
+                DETACH DELETE n
+            } IN TRANSACTIONS OF $batch_size ROWS
+            """,
+            {"batch_size": batch_size},
+        )
 
+    @graph_query
     async def ensure_schema(self) -> None:
         statements = [
             "CREATE CONSTRAINT recomm_user_id_unique IF NOT EXISTS FOR (u:User) REQUIRE u.user_id IS UNIQUE",
@@ -82,6 +253,7 @@ class RecommendationGraphRepository:
         for statement in statements:
             await self._write(statement)
 
+    @graph_query
     async def upsert_users(self, user_ids: list[uuid.UUID]) -> None:
         rows = [{"user_id": str(user_id)} for user_id in user_ids]
         await self._run_batched(
@@ -92,6 +264,7 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def upsert_subscriptions(self, rows: list[tuple[uuid.UUID, uuid.UUID]]) -> None:
         payload = [
             {
@@ -110,6 +283,7 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def upsert_content_nodes(self, rows: list[dict[str, Any]]) -> None:
         await self._run_batched(
             rows,
@@ -132,6 +306,7 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def upsert_authored_edges(self, rows: list[dict[str, str]]) -> None:
         await self._run_batched(
             rows,
@@ -143,6 +318,7 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def replace_content_tags(self, *, content_ids: list[uuid.UUID], tag_rows: list[dict[str, str]]) -> None:
         content_rows = [{"content_id": str(content_id)} for content_id in content_ids]
         if content_rows:
@@ -166,9 +342,11 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def clear_reactions(self) -> None:
         await self._write("MATCH (:User)-[rel:LIKED|DISLIKED]->(:Content) DELETE rel")
 
+    @graph_query
     async def set_liked_edges(self, rows: list[dict[str, Any]]) -> None:
         await self._run_batched(
             rows,
@@ -185,6 +363,7 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def set_disliked_edges(self, rows: list[dict[str, Any]]) -> None:
         await self._run_batched(
             rows,
@@ -201,6 +380,7 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def remove_liked_edges(self, rows: list[dict[str, str]]) -> None:
         await self._run_batched(
             rows,
@@ -211,6 +391,7 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def remove_disliked_edges(self, rows: list[dict[str, str]]) -> None:
         await self._run_batched(
             rows,
@@ -221,9 +402,11 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def clear_viewed_edges(self) -> None:
         await self._write("MATCH (:User)-[rel:VIEWED]->(:Content) DELETE rel")
 
+    @graph_query
     async def set_viewed_edges(self, rows: list[dict[str, Any]]) -> None:
         await self._run_batched(
             rows,
@@ -240,6 +423,7 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def increment_viewed_edges(self, rows: list[dict[str, Any]]) -> None:
         await self._run_batched(
             rows,
@@ -264,9 +448,11 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def clear_commented_edges(self) -> None:
         await self._write("MATCH (:User)-[rel:COMMENTED]->(:Content) DELETE rel")
 
+    @graph_query
     async def set_commented_edges(self, rows: list[dict[str, Any]]) -> None:
         await self._run_batched(
             rows,
@@ -282,6 +468,7 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def increment_commented_edges(self, rows: list[dict[str, Any]]) -> None:
         await self._run_batched(
             rows,
@@ -298,6 +485,7 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def remove_follow_edges(self, rows: list[dict[str, str]]) -> None:
         await self._run_batched(
             rows,
@@ -308,6 +496,7 @@ class RecommendationGraphRepository:
             """,
         )
 
+    @graph_query
     async def recompute_interested_in(self, user_ids: list[uuid.UUID] | None = None) -> None:
         payload = [str(user_id) for user_id in (user_ids or [])]
         await self._write(
@@ -319,25 +508,35 @@ class RecommendationGraphRepository:
             WITH DISTINCT u
             CALL (u) {
                 MATCH (u)-[:LIKED]->(:Content)-[:HAS_TAG]->(tag:Tag)
-                RETURN tag, 4.0 AS weight
+                RETURN tag, $like_weight AS weight
                 UNION ALL
                 MATCH (u)-[:DISLIKED]->(:Content)-[:HAS_TAG]->(tag:Tag)
-                RETURN tag, -4.0 AS weight
+                RETURN tag, $dislike_weight AS weight
                 UNION ALL
                 MATCH (u)-[viewed:VIEWED]->(:Content)-[:HAS_TAG]->(tag:Tag)
-                RETURN tag, toFloat(coalesce(viewed.views_count, 1)) AS weight
+                RETURN tag, toFloat(coalesce(viewed.views_count, 1)) * $view_weight AS weight
                 UNION ALL
                 MATCH (u)-[commented:COMMENTED]->(:Content)-[:HAS_TAG]->(tag:Tag)
-                RETURN tag, toFloat(coalesce(commented.comments_count, 1)) * 3.0 AS weight
+                RETURN tag, toFloat(coalesce(commented.comments_count, 1)) * $comment_weight AS weight
             }
             WITH u, tag, sum(weight) AS score
-            WHERE tag IS NOT NULL AND score > 0
+            WHERE tag IS NOT NULL AND abs(score) >= $epsilon
             MERGE (u)-[rel:INTERESTED_IN]->(tag)
-            SET rel.weight = score, rel.updated_at = datetime()
+            SET rel.score = score,
+                rel.weight = CASE WHEN score > 0 THEN score ELSE 0.0 END,
+                rel.updated_at = datetime()
             """,
-            {"user_ids": payload},
+            {
+                "user_ids": payload,
+                "like_weight": INTEREST_LIKE_WEIGHT,
+                "dislike_weight": INTEREST_DISLIKE_WEIGHT,
+                "view_weight": INTEREST_VIEW_WEIGHT,
+                "comment_weight": INTEREST_COMMENT_WEIGHT,
+                "epsilon": _AFFINITY_SCORE_EPSILON,
+            },
         )
 
+    @graph_query
     async def recompute_affinity_to_author(self, user_ids: list[uuid.UUID] | None = None) -> None:
         payload = [str(user_id) for user_id in (user_ids or [])]
         await self._write(
@@ -350,122 +549,196 @@ class RecommendationGraphRepository:
             CALL (u) {
                 MATCH (u)-[:LIKED]->(:Content)<-[:AUTHORED]-(author:User)
                 WHERE author.user_id <> u.user_id
-                RETURN author, 5.0 AS weight
+                RETURN author, $like_weight AS weight
                 UNION ALL
                 MATCH (u)-[:DISLIKED]->(:Content)<-[:AUTHORED]-(author:User)
                 WHERE author.user_id <> u.user_id
-                RETURN author, -6.0 AS weight
+                RETURN author, $dislike_weight AS weight
                 UNION ALL
                 MATCH (u)-[viewed:VIEWED]->(:Content)<-[:AUTHORED]-(author:User)
                 WHERE author.user_id <> u.user_id
-                RETURN author, toFloat(coalesce(viewed.views_count, 1)) AS weight
+                RETURN author, toFloat(coalesce(viewed.views_count, 1)) * $view_weight AS weight
                 UNION ALL
                 MATCH (u)-[commented:COMMENTED]->(:Content)<-[:AUTHORED]-(author:User)
                 WHERE author.user_id <> u.user_id
-                RETURN author, toFloat(coalesce(commented.comments_count, 1)) * 4.0 AS weight
+                RETURN author, toFloat(coalesce(commented.comments_count, 1)) * $comment_weight AS weight
                 UNION ALL
                 MATCH (u)-[:FOLLOWS]->(author:User)
                 WHERE author.user_id <> u.user_id
-                RETURN author, 6.0 AS weight
+                RETURN author, $follow_weight AS weight
             }
             WITH u, author, sum(weight) AS score
-            WHERE author IS NOT NULL AND score > 0
+            WHERE author IS NOT NULL AND abs(score) >= $epsilon
             MERGE (u)-[rel:AFFINITY_TO_AUTHOR]->(author)
-            SET rel.weight = score, rel.updated_at = datetime()
+            SET rel.score = score,
+                rel.weight = CASE WHEN score > 0 THEN score ELSE 0.0 END,
+                rel.updated_at = datetime()
             """,
-            {"user_ids": payload},
+            {
+                "user_ids": payload,
+                "like_weight": AUTHOR_LIKE_WEIGHT,
+                "dislike_weight": AUTHOR_DISLIKE_WEIGHT,
+                "view_weight": AUTHOR_VIEW_WEIGHT,
+                "comment_weight": AUTHOR_COMMENT_WEIGHT,
+                "follow_weight": AUTHOR_FOLLOW_WEIGHT,
+                "epsilon": _AFFINITY_SCORE_EPSILON,
+            },
         )
 
-    async def recompute_similar_to(
+    @graph_query
+    async def get_engagement_states(
         self,
-        content_ids: list[uuid.UUID] | None = None,
+        pairs: list[tuple[uuid.UUID, uuid.UUID]],
         *,
-        per_content_limit: int = 100,
-    ) -> None:
-        payload = [str(content_id) for content_id in (content_ids or [])]
-        await self._write(
+        batch_size: int = 1000,
+    ) -> dict[tuple[uuid.UUID, uuid.UUID], EngagementGraphState]:
+        """Current LIKED/DISLIKED/VIEWED/COMMENTED state per (user, content) pair."""
+        states = {pair: EngagementGraphState() for pair in pairs}
+        unique_pairs = list(states)
+        for offset in range(0, len(unique_pairs), batch_size):
+            chunk = unique_pairs[offset: offset + batch_size]
+            rows = await self._read(
+                """
+                UNWIND $pairs AS pair
+                MATCH (:User {user_id: pair.user_id})-[rel:LIKED|DISLIKED|VIEWED|COMMENTED]->(:Content {content_id: pair.content_id})
+                RETURN
+                    pair.user_id AS user_id,
+                    pair.content_id AS content_id,
+                    type(rel) AS kind,
+                    coalesce(rel.views_count, rel.comments_count, 1) AS amount
+                """,
+                {"pairs": [{"user_id": str(user_id), "content_id": str(content_id)} for user_id, content_id in chunk]},
+            )
+            for row in rows:
+                state = states[(uuid.UUID(row["user_id"]), uuid.UUID(row["content_id"]))]
+                kind = row["kind"]
+                if kind == "LIKED":
+                    state.liked = True
+                elif kind == "DISLIKED":
+                    state.disliked = True
+                elif kind == "VIEWED":
+                    state.views_count = int(row["amount"] or 0)
+                elif kind == "COMMENTED":
+                    state.comments_count = int(row["amount"] or 0)
+        return states
+
+    @graph_query
+    async def get_follow_states(
+        self,
+        pairs: list[tuple[uuid.UUID, uuid.UUID]],
+        *,
+        batch_size: int = 1000,
+    ) -> dict[tuple[uuid.UUID, uuid.UUID], bool]:
+        states = dict.fromkeys(pairs, False)
+        unique_pairs = list(states)
+        for offset in range(0, len(unique_pairs), batch_size):
+            chunk = unique_pairs[offset: offset + batch_size]
+            rows = await self._read(
+                """
+                UNWIND $pairs AS pair
+                MATCH (:User {user_id: pair.subscriber_id})-[:FOLLOWS]->(:User {user_id: pair.subscribed_id})
+                RETURN pair.subscriber_id AS subscriber_id, pair.subscribed_id AS subscribed_id
+                """,
+                {
+                    "pairs": [
+                        {"subscriber_id": str(subscriber_id), "subscribed_id": str(subscribed_id)}
+                        for subscriber_id, subscribed_id in chunk
+                    ]
+                },
+            )
+            for row in rows:
+                states[(uuid.UUID(row["subscriber_id"]), uuid.UUID(row["subscribed_id"]))] = True
+        return states
+
+    @graph_query
+    async def apply_interest_deltas(self, rows: list[dict[str, Any]]) -> None:
+        """Add `delta` to INTERESTED_IN for every tag of `content_id`, per row."""
+        await self._run_batched(
+            rows,
             """
-            MATCH (c1:Content)
-            WHERE size($content_ids) = 0 OR c1.content_id IN $content_ids
-            OPTIONAL MATCH (c1)-[old:SIMILAR_TO]->(:Content)
-            DELETE old
-            WITH DISTINCT c1
-            MATCH (c2:Content)
-            WHERE c2.content_id <> c1.content_id
-            WITH c1, c2
-            OPTIONAL MATCH (c1)-[:HAS_TAG]->(tag:Tag)<-[:HAS_TAG]-(c2)
-            WITH c1, c2, count(tag) AS shared_tags
-            OPTIONAL MATCH (c1)<-[:LIKED]-(:User)-[:LIKED]->(c2)
-            WITH c1, c2, shared_tags, count(*) AS co_liked
-            OPTIONAL MATCH (c1)<-[:VIEWED]-(:User)-[:VIEWED]->(c2)
-            WITH c1, c2, shared_tags, co_liked, count(*) AS co_viewed
-            OPTIONAL MATCH (c1)<-[:COMMENTED]-(:User)-[:COMMENTED]->(c2)
-            WITH
-                c1,
-                c2,
-                shared_tags,
-                co_liked,
-                co_viewed,
-                count(*) AS co_commented,
-                CASE WHEN c1.author_id = c2.author_id THEN 3.0 ELSE 0.0 END AS same_author_boost,
-                coalesce(c2.quality_score, 0.0) AS quality_score
-            WITH
-                c1,
-                c2,
-                shared_tags,
-                co_liked,
-                co_viewed,
-                co_commented,
-                same_author_boost,
-                quality_score,
-                (
-                    (toFloat(shared_tags) * 2.5)
-                    + (toFloat(co_liked) * 3.0)
-                    + (toFloat(co_viewed) * 1.0)
-                    + (toFloat(co_commented) * 2.0)
-                    + same_author_boost
-                    + (quality_score * 0.15)
-                ) AS score
-            WHERE score > 0
-            ORDER BY score DESC
-            WITH c1, collect({
-                other: c2,
-                score: score,
-                shared_tags: shared_tags,
-                co_liked: co_liked,
-                co_viewed: co_viewed,
-                co_commented: co_commented,
-                same_author_boost: same_author_boost
-            })[..$per_content_limit] AS recs
-            UNWIND recs AS rec
-            WITH c1, rec, rec.other AS other
-            MERGE (c1)-[rel:SIMILAR_TO]->(other)
-            SET
-                rel.score = rec.score,
-                rel.shared_tags = rec.shared_tags,
-                rel.co_liked = rec.co_liked,
-                rel.co_viewed = rec.co_viewed,
-                rel.co_commented = rec.co_commented,
-                rel.reason = CASE
-                    WHEN rec.same_author_boost > 0
-                        AND rec.same_author_boost >= (toFloat(rec.shared_tags) * 2.5)
-                        AND rec.same_author_boost >= ((toFloat(rec.co_liked) * 3.0) + (toFloat(rec.co_viewed) * 1.0) + (toFloat(rec.co_commented) * 2.0))
-                        THEN 'same_author'
-                    WHEN rec.shared_tags > 0
-                        AND (toFloat(rec.shared_tags) * 2.5) >= ((toFloat(rec.co_liked) * 3.0) + (toFloat(rec.co_viewed) * 1.0) + (toFloat(rec.co_commented) * 2.0))
-                        THEN 'shared_tags'
-                    WHEN (rec.co_liked + rec.co_viewed + rec.co_commented) > 0
-                        THEN 'shared_audience'
-                    ELSE 'quality'
-                END,
+            UNWIND $rows AS row
+            MATCH (u:User {user_id: row.user_id})
+            MATCH (:Content {content_id: row.content_id})-[:HAS_TAG]->(tag:Tag)
+            WITH u, tag, sum(row.delta) AS delta
+            MERGE (u)-[rel:INTERESTED_IN]->(tag)
+            ON CREATE SET rel.score = 0.0
+            SET rel.score = coalesce(rel.score, rel.weight, 0.0) + delta
+            SET rel.weight = CASE WHEN rel.score > 0 THEN rel.score ELSE 0.0 END,
                 rel.updated_at = datetime()
+            WITH rel
+            WHERE abs(rel.score) < $epsilon
+            DELETE rel
             """,
-            {
-                "content_ids": payload,
-                "per_content_limit": per_content_limit,
-            },
+            parameters={"epsilon": _AFFINITY_SCORE_EPSILON},
+        )
+
+    @graph_query
+    async def apply_author_affinity_deltas(self, rows: list[dict[str, Any]]) -> None:
+        """Add `delta` to AFFINITY_TO_AUTHOR towards the author of `content_id` or `author_id`."""
+        await self._run_batched(
+            rows,
+            """
+            UNWIND $rows AS row
+            MATCH (u:User {user_id: row.user_id})
+            CALL (row) {
+                MATCH (:Content {content_id: row.content_id})<-[:AUTHORED]-(author:User)
+                RETURN author
+                UNION
+                MATCH (author:User {user_id: row.author_id})
+                RETURN author
+            }
+            WITH u, author, row.delta AS delta
+            WHERE author.user_id <> u.user_id
+            WITH u, author, sum(delta) AS delta
+            MERGE (u)-[rel:AFFINITY_TO_AUTHOR]->(author)
+            ON CREATE SET rel.score = 0.0
+            SET rel.score = coalesce(rel.score, rel.weight, 0.0) + delta
+            SET rel.weight = CASE WHEN rel.score > 0 THEN rel.score ELSE 0.0 END,
+                rel.updated_at = datetime()
+            WITH rel
+            WHERE abs(rel.score) < $epsilon
+            DELETE rel
+            """,
+            parameters={"epsilon": _AFFINITY_SCORE_EPSILON},
         )
 
+    @graph_query
+    async def recompute_similar_to(
+        self,
+        content_ids: list[uuid.UUID] | None = None,
+        *,
+        per_content_limit: int = 100,
+        batch_size: int = 500,
+        fanout_limit: int = 200,
+        engager_limit: int = 100,
+    ) -> None:
+        """Rebuild SIMILAR_TO for `content_ids` (all content when empty).
+
+        Candidates are only content reachable through a shared tag, the same
+        author or a co-engaging user, so cost follows graph degree rather than
+        the total number of content nodes. `fanout_limit` caps how much content is
+        taken through any single tag, author or user, and `engager_limit` caps
+        how many engaging users are expanded per content, which keeps popular
+        tags and heavy users from dominating a batch.
+        """
+        if content_ids:
+            payload = [str(content_id) for content_id in content_ids]
+        else:
+            rows = await self._read("MATCH (c:Content) RETURN c.content_id AS content_id")
+            payload = [row["content_id"] for row in rows if isinstance(row.get("content_id"), str)]
+
+        for offset in range(0, len(payload), batch_size):
+            await self._write(
+                _RECOMPUTE_SIMILAR_TO_QUERY,
+                {
+                    "content_ids": payload[offset: offset + batch_size],
+                    "per_content_limit": per_content_limit,
+                    "fanout_limit": fanout_limit,
+                    "engager_limit": engager_limit,
+                },
+            )
+
+    @graph_query
     async def get_sync_state(
         self,
         *,
@@ -489,6 +762,7 @@ class RecommendationGraphRepository:
             last_full_rebuild_at=self._normalize_neo4j_datetime(row.get("last_full_rebuild_at")),
         )
 
+    @graph_query
     async def upsert_sync_state(
         self,
         *,
@@ -514,6 +788,7 @@ class RecommendationGraphRepository:
             },
         )
 
+    @graph_query
     async def get_similar_content(
         self,
         *,
@@ -550,6 +825,7 @@ class RecommendationGraphRepository:
             )
         return result
 
+    @graph_query
     async def get_recommendation_feed(
         self,
         *,
@@ -559,7 +835,74 @@ class RecommendationGraphRepository:
         offset: int,
         limit: int,
     ) -> list[RecommendationFeedGraphResult]:
-        rows = await self._read(
+        rows = await self._read_recommendation_feed(
+            viewer_id=viewer_id,
+            content_type=content_type,
+            sort=sort,
+            offset=offset,
+            limit=limit,
+            freshness_weight=FRESHNESS_WEIGHT,
+        )
+
+        result: list[RecommendationFeedGraphResult] = []
+        for row in rows:
+            candidate_content_id = row.get("content_id")
+            if not isinstance(candidate_content_id, str):
+                continue
+            result.append(
+                RecommendationFeedGraphResult(
+                    content_id=uuid.UUID(candidate_content_id),
+                    score=float(row.get("score") or 0.0),
+                    reason=str(row.get("reason") or "personalized_graph_feed"),
+                )
+            )
+        return result
+
+    @graph_query
+    async def get_recommendation_candidates(
+        self,
+        *,
+        viewer_id: uuid.UUID,
+        limit: int,
+    ) -> list[RecommendationCandidateGraphResult]:
+        # Freshness changes by the hour, so it is left out of the stored score and
+        # applied when the list is read.
+        rows = await self._read_recommendation_feed(
+            viewer_id=viewer_id,
+            content_type=None,
+            sort="relevance",
+            offset=0,
+            limit=limit,
+            freshness_weight=0.0,
+        )
+
+        result: list[RecommendationCandidateGraphResult] = []
+        for row in rows:
+            candidate_content_id = row.get("content_id")
+            candidate_content_type = row.get("content_type")
+            if not isinstance(candidate_content_id, str) or not isinstance(candidate_content_type, str):
+                continue
+            result.append(
+                RecommendationCandidateGraphResult(
+                    content_id=uuid.UUID(candidate_content_id),
+                    content_type=candidate_content_type,
+                    base_score=float(row.get("score") or 0.0),
+                    published_at=self._normalize_neo4j_datetime(row.get("published_at")),
+                )
+            )
+        return result
+
+    async def _read_recommendation_feed(
+        self,
+        *,
+        viewer_id: uuid.UUID | None,
+        content_type: str | None,
+        sort: str,
+        offset: int,
+        limit: int,
+        freshness_weight: float,
+    ) -> list[dict[str, Any]]:
+        return await self._read(
             """
             OPTIONAL MATCH (viewer:User {user_id: $viewer_id})
             MATCH (candidate:Content)
@@ -660,7 +1003,9 @@ class RecommendationGraphRepository:
             RETURN
                 candidate.content_id AS content_id,
                 score AS score,
-                'personalized_graph_feed' AS reason
+                'personalized_graph_feed' AS reason,
+                candidate.content_type AS content_type,
+                published_sort AS published_at
             """,
             {
                 "viewer_id": str(viewer_id) if viewer_id is not None else None,
@@ -672,7 +1017,7 @@ class RecommendationGraphRepository:
                 "author_affinity_weight": AUTHOR_AFFINITY_WEIGHT,
                 "collaborative_weight": COLLABORATIVE_WEIGHT,
                 "content_quality_weight": CONTENT_QUALITY_WEIGHT,
-                "freshness_weight": FRESHNESS_WEIGHT,
+                "freshness_weight": freshness_weight,
                 "freshness_decay_days": FRESHNESS_DECAY_DAYS,
                 "collaborative_like_weight": COLLABORATIVE_LIKE_WEIGHT,
                 "collaborative_view_weight": COLLABORATIVE_VIEW_WEIGHT,
@@ -680,20 +1025,7 @@ class RecommendationGraphRepository:
             },
         )
 
-        result: list[RecommendationFeedGraphResult] = []
-        for row in rows:
-            candidate_content_id = row.get("content_id")
-            if not isinstance(candidate_content_id, str):
-                continue
-            result.append(
-                RecommendationFeedGraphResult(
-                    content_id=uuid.UUID(candidate_content_id),
-                    score=float(row.get("score") or 0.0),
-                    reason=str(row.get("reason") or "personalized_graph_feed"),
-                )
-            )
-        return result
-
+    @graph_query
     async def get_recommended_authors(
         self,
         *,
@@ -706,13 +1038,16 @@ class RecommendationGraphRepository:
             MATCH (viewer:User {user_id: $viewer_id})
             CALL {
                 WITH viewer
-                MATCH (viewer)-[:INTERESTED_IN]->(:Tag)<-[:HAS_TAG]-(:Content)<-[:AUTHORED]-(candidate:User)
-                WHERE candidate.user_id <> viewer.user_id
+                MATCH (viewer)-[interest:INTERESTED_IN]->(:Tag)<-[:HAS_TAG]-(:Content)<-[:AUTHORED]-(candidate:User)
+                WHERE interest.weight > 0 AND candidate.user_id <> viewer.user_id
                 RETURN DISTINCT candidate.user_id AS candidate_id
                 UNION
                 WITH viewer
-                MATCH (viewer)-[:INTERESTED_IN]->(:Tag)<-[:INTERESTED_IN]-(peer:User)-[:FOLLOWS]->(candidate:User)
-                WHERE peer.user_id <> viewer.user_id AND candidate.user_id <> viewer.user_id
+                MATCH (viewer)-[interest:INTERESTED_IN]->(:Tag)<-[peer_interest:INTERESTED_IN]-(peer:User)-[:FOLLOWS]->(candidate:User)
+                WHERE interest.weight > 0
+                    AND peer_interest.weight > 0
+                    AND peer.user_id <> viewer.user_id
+                    AND candidate.user_id <> viewer.user_id
                 RETURN DISTINCT candidate.user_id AS candidate_id
             }
             WITH viewer, candidate_id
@@ -833,31 +1168,114 @@ class RecommendationGraphRepository:
             )
         return result
 
-    async def _run_batched(self, rows: list[dict[str, Any]], query: str, *, batch_size: int = 1000) -> None:
+    async def _run_batched(
+        self,
+        rows: list[dict[str, Any]],
+        query: str,
+        *,
+        batch_size: int = 1000,
+        parameters: dict[str, Any] | None = None,
+    ) -> None:
         if not rows:
             return
         for offset in range(0, len(rows), batch_size):
             chunk = rows[offset: offset + batch_size]
-            await self._write(query, {"rows": chunk})
+            await self._write(query, {**(parameters or {}), "rows": chunk})
 
     async def _write(self, query: str, parameters: dict[str, Any] | None = None) -> None:
-        async with self._driver.session(database=self._database) as session:
-            await session.execute_write(self._run_query, query, parameters or {})
+        parameters = parameters or {}
+        started = self._clock()
+        summary = None
+        try:
+            async with self._driver.session(database=self._database) as session:
+                summary = await session.execute_write(self._run_query, query, parameters)
+        finally:
+            await self._observe(query, parameters, started=started, rows=0, summary=summary, readonly=False)
+
+    async def _run_autocommit(self, query: str, parameters: dict[str, Any] | None = None) -> None:
+        # CALL { ... } IN TRANSACTIONS only runs in an implicit transaction.
+        parameters = parameters or {}
+        started = self._clock()
+        summary = None
+        try:
+            async with self._driver.session(database=self._database) as session:
+                result = await session.run(query, parameters)
+                summary = await result.consume()
+        finally:
+            await self._observe(query, parameters, started=started, rows=0, summary=summary, readonly=False)
 
     async def _read(self, query: str, parameters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        async with self._driver.session(database=self._database) as session:
-            return await session.execute_read(self._fetch_query, query, parameters or {})
+        parameters = parameters or {}
+        started = self._clock()
+        records: list[dict[str, Any]] = []
+        summary = None
+        try:
+            async with self._driver.session(database=self._database) as session:
+                records, summary = await session.execute_read(self._fetch_query, query, parameters)
+            return records
+        finally:
+            await self._observe(
+                query,
+                parameters,
+                started=started,
+                rows=len(records),
+                summary=summary,
+                readonly=True,
+            )
+
+    async def _observe(
+        self,
+        query: str,
+        parameters: dict[str, Any],
+        *,
+        started: float,
+        rows: int,
+        summary,  # type: ignore[no-untyped-def]
+        readonly: bool,
+    ) -> None:
+        elapsed = self._clock() - started
+        name = current_graph_query_name()
+        server_seconds = None
+        if summary is not None:
+            server_seconds = (
+                (summary.result_available_after or 0) + (summary.result_consumed_after or 0)
+            ) / 1000
+        self._recorder.record(
+            name,
+            elapsed,
+            rows=rows,
+            server_seconds=server_seconds,
+            failed=summary is None,
+        )
+        if summary is not None and self._recorder.profile_slow_queries and self._recorder.is_slow(elapsed):
+            self._recorder.log_plan(name, await self._capture_plan(query, parameters, readonly=readonly))
+
+    async def _capture_plan(self, query: str, parameters: dict[str, Any], *, readonly: bool) -> dict | None:
+        # Reads are re-run under PROFILE for db hits; writes only get EXPLAIN so
+        # capturing a plan never applies them twice.
+        try:
+            async with self._driver.session(database=self._database) as session:
+                if readonly:
+                    _, summary = await session.execute_read(self._fetch_query, f"PROFILE {query}", parameters)
+                    return summary.profile
+                result = await session.run(f"EXPLAIN {query}", parameters)
+                summary = await result.consume()
+                return summary.plan
+        except Exception:
+            logger.exception("Failed to capture Neo4j query plan")
+            return None
 
     @staticmethod
     async def _run_query(tx, query: str, parameters: dict[str, Any]):  # type: ignore[no-untyped-def]
         result = await tx.run(query, parameters)
-        await result.consume()
+        return await result.consume()
 
     @staticmethod
-    async def _fetch_query(tx, query: str, parameters: dict[str, Any]) -> list[dict[str, Any]]:  # type: ignore[no-untyped-def]
+    async def _fetch_query(tx, query: str, parameters: dict[str, Any]):  # type: ignore[no-untyped-def]
         result = await tx.run(query, parameters)
         records = await result.data()
-        return [dict(record) for record in records]
+        summary = await result.consume()
+        return [dict(record) for record in records], summary
 
     @staticmethod
     def _datetime_to_iso(value: datetime.datetime | None) -> str | None:
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import math
+
+
+class AdaptiveOverfetch:
+    """Sizes graph requests from the share of rows that recently survived visibility filtering.
+
+    Until a surface has been observed it asks for `max_factor` times the page,
+    which is what the service always did before. After that the factor follows
+    an exponential moving average of the keep rate, with `headroom` on top.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_factor: float = 4.0,
+        headroom: float = 1.25,
+        smoothing: float = 0.2,
+    ) -> None:
+        self._max_factor = max_factor
+        self._headroom = headroom
+        self._smoothing = smoothing
+        self._keep_rates: dict[str, float] = {}
+
+    def graph_limit(self, surface: str, limit: int) -> int:
+        keep_rate = self._keep_rates.get(surface)
+        if keep_rate is None or keep_rate <= 0:
+            factor = self._max_factor
+        else:
+            # Half steps keep the limit stable between nearby keep rates.
+            factor = min(self._max_factor, max(1.0, math.ceil(self._headroom / keep_rate * 2) / 2))
+        return max(limit, math.ceil(limit * factor))
+
+    def max_limit(self, limit: int) -> int:
+        """The largest `graph_limit` this instance can return for `limit`."""
+        return max(limit, math.ceil(limit * self._max_factor))
+
+    def observe(self, surface: str, *, fetched: int, kept: int) -> None:
+        if fetched <= 0:
+            return
+        rate = kept / fetched
+        previous = self._keep_rates.get(surface)
+        self._keep_rates[surface] = rate if previous is None else previous + self._smoothing * (rate - previous)
+
+    def keep_rate(self, surface: str) -> float | None:
+        return self._keep_rates.get(surface)
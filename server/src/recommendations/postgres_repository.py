@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import datetime
 import uuid
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import Row, and_, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -18,6 +19,7 @@ from src.content.models import ContentModel, ContentReactionModel, ContentViewSe
 import src.tags.models  # noqa: F401
 from src.tags.models import ContentTagModel, TagModel
 from src.users.models import SubscriptionModel, UserModel
+from src.users.repository import populate_viewer_subscriptions
 from src.videos.enums import VideoProcessingStatusEnum
 from src.videos.models import VideoPlaybackDetailsModel
 
@@ -94,6 +96,10 @@ class RecommendationPostgresRepository:
         result = await self._session.execute(select(UserModel.user_id))
         return list(result.scalars().all())
 
+    async def iter_all_user_ids(self, *, chunk_size: int) -> AsyncIterator[list[uuid.UUID]]:
+        async for rows in self._stream(select(UserModel.user_id), chunk_size=chunk_size):
+            yield [row.user_id for row in rows]
+
     async def get_user_ids_by_ids(self, user_ids: list[uuid.UUID]) -> list[uuid.UUID]:
         if not user_ids:
             return []
@@ -109,7 +115,6 @@ class RecommendationPostgresRepository:
         result = await self._session.execute(
             select(UserModel)
             .where(UserModel.user_id.in_(user_ids))
-            .options(selectinload(UserModel.subscribers))
             .options(
                 selectinload(UserModel.avatar_asset)
                 .selectinload(AssetModel.variants)
@@ -125,6 +130,45 @@ class RecommendationPostgresRepository:
         )
         return set(result.scalars().all())
 
+    async def get_active_user_ids(self, *, since: datetime.datetime, limit: int) -> list[uuid.UUID]:
+        result = await self._session.execute(
+            select(ActivityEventModel.user_id)
+            .where(ActivityEventModel.created_at >= since)
+            .group_by(ActivityEventModel.user_id)
+            .order_by(desc(func.max(ActivityEventModel.created_at)))
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_excluded_content_ids(
+        self,
+        *,
+        viewer_id: uuid.UUID,
+        content_ids: list[uuid.UUID],
+        seen_progress_percent: int = 90,
+    ) -> set[uuid.UUID]:
+        """Candidates the viewer disliked or watched through since their list was built."""
+        if not content_ids:
+            return set()
+
+        disliked = await self._session.execute(
+            select(ContentReactionModel.content_id).where(
+                ContentReactionModel.user_id == viewer_id,
+                ContentReactionModel.content_id.in_(content_ids),
+                ContentReactionModel.reaction_type == ReactionTypeEnum.DISLIKE,
+            )
+        )
+        seen = await self._session.execute(
+            select(ContentViewSessionModel.content_id)
+            .where(
+                ContentViewSessionModel.viewer_id == viewer_id,
+                ContentViewSessionModel.content_id.in_(content_ids),
+                ContentViewSessionModel.progress_percent >= seen_progress_percent,
+            )
+            .distinct()
+        )
+        return set(disliked.scalars().all()) | set(seen.scalars().all())
+
     async def get_public_author_ids_by_ids(self, *, author_ids: list[uuid.UUID]) -> set[uuid.UUID]:
         if not author_ids:
             return set()
@@ -139,14 +183,20 @@ class RecommendationPostgresRepository:
         return set(result.scalars().all())
 
     async def get_all_subscriptions(self) -> list[tuple[uuid.UUID, uuid.UUID]]:
-        result = await self._session.execute(
-            select(SubscriptionModel.subscriber_id, SubscriptionModel.subscribed_id)
-        )
+        result = await self._session.execute(self._subscriptions_stmt())
         return [(row.subscriber_id, row.subscribed_id) for row in result.all()]
 
+    async def iter_all_subscriptions(self, *, chunk_size: int) -> AsyncIterator[list[tuple[uuid.UUID, uuid.UUID]]]:
+        async for rows in self._stream(self._subscriptions_stmt(), chunk_size=chunk_size):
+            yield [(row.subscriber_id, row.subscribed_id) for row in rows]
+
     async def get_all_content_nodes(self) -> list[ContentGraphRow]:
         return await self._get_content_nodes_query()
 
+    async def iter_all_content_nodes(self, *, chunk_size: int) -> AsyncIterator[list[ContentGraphRow]]:
+        async for rows in self._stream(self._content_nodes_stmt(), chunk_size=chunk_size):
+            yield [self._to_content_graph_row(row) for row in rows]
+
     async def get_content_nodes_by_ids(self, content_ids: list[uuid.UUID]) -> list[ContentGraphRow]:
         if not content_ids:
             return []
@@ -155,76 +205,38 @@ class RecommendationPostgresRepository:
     async def get_all_content_tags(self) -> list[ContentTagGraphRow]:
         return await self._get_content_tags_query()
 
+    async def iter_all_content_tags(self, *, chunk_size: int) -> AsyncIterator[list[ContentTagGraphRow]]:
+        async for rows in self._stream(self._content_tags_stmt(), chunk_size=chunk_size):
+            yield [self._to_content_tag_graph_row(row) for row in rows]
+
     async def get_content_tags_by_content_ids(self, content_ids: list[uuid.UUID]) -> list[ContentTagGraphRow]:
         if not content_ids:
             return []
         return await self._get_content_tags_query(content_ids=content_ids)
 
     async def get_all_content_reactions(self) -> list[ContentReactionGraphRow]:
-        result = await self._session.execute(
-            select(
-                ContentReactionModel.user_id,
-                ContentReactionModel.content_id,
-                ContentReactionModel.reaction_type,
-                ContentReactionModel.created_at,
-            )
-            .where(ContentReactionModel.reaction_type.in_([ReactionTypeEnum.LIKE, ReactionTypeEnum.DISLIKE]))
-        )
-        return [
-            ContentReactionGraphRow(
-                user_id=row.user_id,
-                content_id=row.content_id,
-                reaction_type=row.reaction_type,
-                created_at=row.created_at,
-            )
-            for row in result.all()
-        ]
+        result = await self._session.execute(self._content_reactions_stmt())
+        return [self._to_reaction_graph_row(row) for row in result.all()]
+
+    async def iter_all_content_reactions(self, *, chunk_size: int) -> AsyncIterator[list[ContentReactionGraphRow]]:
+        async for rows in self._stream(self._content_reactions_stmt(), chunk_size=chunk_size):
+            yield [self._to_reaction_graph_row(row) for row in rows]
 
     async def get_all_content_views(self) -> list[ContentViewedGraphRow]:
-        result = await self._session.execute(
-            select(
-                ContentViewSessionModel.viewer_id,
-                ContentViewSessionModel.content_id,
-                func.count(ContentViewSessionModel.view_session_id).label("views_count"),
-                func.max(ContentViewSessionModel.progress_percent).label("progress_percent"),
-                func.max(ContentViewSessionModel.last_seen_at).label("last_seen_at"),
-            )
-            .where(ContentViewSessionModel.viewer_id.is_not(None))
-            .group_by(ContentViewSessionModel.viewer_id, ContentViewSessionModel.content_id)
-        )
-        return [
-            ContentViewedGraphRow(
-                user_id=row.viewer_id,
-                content_id=row.content_id,
-                views_count=int(row.views_count or 0),
-                progress_percent=int(row.progress_percent or 0),
-                last_seen_at=row.last_seen_at,
-            )
-            for row in result.all()
-            if row.viewer_id is not None and row.last_seen_at is not None
-        ]
+        result = await self._session.execute(self._content_views_stmt())
+        return self._to_viewed_graph_rows(result.all())
+
+    async def iter_all_content_views(self, *, chunk_size: int) -> AsyncIterator[list[ContentViewedGraphRow]]:
+        async for rows in self._stream(self._content_views_stmt(), chunk_size=chunk_size):
+            yield self._to_viewed_graph_rows(rows)
 
     async def get_all_content_comments(self) -> list[ContentCommentedGraphRow]:
-        result = await self._session.execute(
-            select(
-                CommentModel.author_id,
-                CommentModel.content_id,
-                func.count(CommentModel.comment_id).label("comments_count"),
-                func.max(CommentModel.created_at).label("last_commented_at"),
-            )
-            .where(CommentModel.deleted_at.is_(None))
-            .group_by(CommentModel.author_id, CommentModel.content_id)
-        )
-        return [
-            ContentCommentedGraphRow(
-                user_id=row.author_id,
-                content_id=row.content_id,
-                comments_count=int(row.comments_count or 0),
-                last_commented_at=row.last_commented_at,
-            )
-            for row in result.all()
-            if row.last_commented_at is not None
-        ]
+        result = await self._session.execute(self._content_comments_stmt())
+        return self._to_commented_graph_rows(result.all())
+
+    async def iter_all_content_comments(self, *, chunk_size: int) -> AsyncIterator[list[ContentCommentedGraphRow]]:
+        async for rows in self._stream(self._content_comments_stmt(), chunk_size=chunk_size):
+            yield self._to_commented_graph_rows(rows)
 
     async def get_latest_activity_cursor(self) -> ActivityCursor | None:
         result = await self._session.execute(
@@ -287,6 +299,28 @@ class RecommendationPostgresRepository:
             for row in result.all()
         ]
 
+    async def filter_visible_content_ids(
+        self,
+        *,
+        content_ids: list[uuid.UUID],
+        content_type: ContentTypeEnum | None = None,
+    ) -> set[uuid.UUID]:
+        """Ids that pass the feed visibility rules, without loading any content rows."""
+        if not content_ids:
+            return set()
+
+        query = (
+            select(ContentModel.content_id)
+            .select_from(ContentModel)
+            .outerjoin(VideoPlaybackDetailsModel)
+            .where(ContentModel.content_id.in_(content_ids))
+            .where(*self._content_visibility_clauses())
+        )
+        if content_type is not None:
+            query = query.where(ContentModel.content_type == content_type)
+        result = await self._session.execute(query)
+        return set(result.scalars().all())
+
     async def get_visible_content_by_ids(
         self,
         *,
@@ -305,17 +339,22 @@ class RecommendationPostgresRepository:
         result = await self._session.execute(query)
 
         if viewer_id is None:
-            items = list(result.scalars().unique().all())
-            for item in items:
+            models = list(result.scalars().unique().all())
+            for item in models:
                 item.my_reaction = None
                 item.is_owner = False
-            return {item.content_id: item for item in items}
+            return {item.content_id: item for item in models}
 
         items: dict[uuid.UUID, ContentModel] = {}
         for item, my_reaction in result.unique().all():
             item.my_reaction = my_reaction
             item.is_owner = item.author_id == viewer_id
             items[item.content_id] = item
+        await populate_viewer_subscriptions(
+            self._session,
+            users=[item.author for item in items.values()],
+            viewer_id=viewer_id,
+        )
         return items
 
     async def get_recommendation_fallback_content(
@@ -390,11 +429,35 @@ class RecommendationPostgresRepository:
             items.append(item)
         return items
 
+    async def _stream(self, stmt, *, chunk_size: int) -> AsyncIterator[Sequence[Row]]:  # type: ignore[no-untyped-def]
+        # Server-side cursor: Postgres hands rows over `chunk_size` at a time, so a
+        # full dump never sits in memory at once.
+        result = await self._session.stream(stmt.execution_options(yield_per=chunk_size))
+        async for partition in result.partitions():
+            yield partition
+
     async def _get_content_nodes_query(
         self,
         *,
         content_ids: list[uuid.UUID] | None = None,
     ) -> list[ContentGraphRow]:
+        result = await self._session.execute(self._content_nodes_stmt(content_ids=content_ids))
+        return [self._to_content_graph_row(row) for row in result.all()]
+
+    async def _get_content_tags_query(
+        self,
+        *,
+        content_ids: list[uuid.UUID] | None = None,
+    ) -> list[ContentTagGraphRow]:
+        result = await self._session.execute(self._content_tags_stmt(content_ids=content_ids))
+        return [self._to_content_tag_graph_row(row) for row in result.all()]
+
+    @staticmethod
+    def _subscriptions_stmt():  # type: ignore[no-untyped-def]
+        return select(SubscriptionModel.subscriber_id, SubscriptionModel.subscribed_id)
+
+    @staticmethod
+    def _content_nodes_stmt(*, content_ids: list[uuid.UUID] | None = None):  # type: ignore[no-untyped-def]
         stmt = select(
             ContentModel.content_id,
             ContentModel.author_id,
@@ -408,33 +471,12 @@ class RecommendationPostgresRepository:
             ContentModel.comments_count,
             ContentModel.views_count,
         )
-
         if content_ids is not None:
             stmt = stmt.where(ContentModel.content_id.in_(content_ids))
+        return stmt
 
-        result = await self._session.execute(stmt)
-        return [
-            ContentGraphRow(
-                content_id=row.content_id,
-                author_id=row.author_id,
-                content_type=row.content_type,
-                status=row.status,
-                visibility=row.visibility,
-                created_at=row.created_at,
-                published_at=row.published_at,
-                likes_count=row.likes_count,
-                dislikes_count=row.dislikes_count,
-                comments_count=row.comments_count,
-                views_count=row.views_count,
-            )
-            for row in result.all()
-        ]
-
-    async def _get_content_tags_query(
-        self,
-        *,
-        content_ids: list[uuid.UUID] | None = None,
-    ) -> list[ContentTagGraphRow]:
+    @staticmethod
+    def _content_tags_stmt(*, content_ids: list[uuid.UUID] | None = None):  # type: ignore[no-untyped-def]
         stmt = (
             select(
                 ContentTagModel.content_id,
@@ -445,21 +487,110 @@ class RecommendationPostgresRepository:
         )
         if content_ids is not None:
             stmt = stmt.where(ContentTagModel.content_id.in_(content_ids))
+        return stmt
+
+    @staticmethod
+    def _content_reactions_stmt():  # type: ignore[no-untyped-def]
+        return (
+            select(
+                ContentReactionModel.user_id,
+                ContentReactionModel.content_id,
+                ContentReactionModel.reaction_type,
+                ContentReactionModel.created_at,
+            )
+            .where(ContentReactionModel.reaction_type.in_([ReactionTypeEnum.LIKE, ReactionTypeEnum.DISLIKE]))
+        )
+
+    @staticmethod
+    def _content_views_stmt():  # type: ignore[no-untyped-def]
+        return (
+            select(
+                ContentViewSessionModel.viewer_id,
+                ContentViewSessionModel.content_id,
+                func.count(ContentViewSessionModel.view_session_id).label("views_count"),
+                func.max(ContentViewSessionModel.progress_percent).label("progress_percent"),
+                func.max(ContentViewSessionModel.last_seen_at).label("last_seen_at"),
+            )
+            .where(ContentViewSessionModel.viewer_id.is_not(None))
+            .group_by(ContentViewSessionModel.viewer_id, ContentViewSessionModel.content_id)
+        )
 
-        result = await self._session.execute(stmt)
+    @staticmethod
+    def _content_comments_stmt():  # type: ignore[no-untyped-def]
+        return (
+            select(
+                CommentModel.author_id,
+                CommentModel.content_id,
+                func.count(CommentModel.comment_id).label("comments_count"),
+                func.max(CommentModel.created_at).label("last_commented_at"),
+            )
+            .where(CommentModel.deleted_at.is_(None))
+            .group_by(CommentModel.author_id, CommentModel.content_id)
+        )
+
+    @staticmethod
+    def _to_content_graph_row(row) -> ContentGraphRow:  # type: ignore[no-untyped-def]
+        return ContentGraphRow(
+            content_id=row.content_id,
+            author_id=row.author_id,
+            content_type=row.content_type,
+            status=row.status,
+            visibility=row.visibility,
+            created_at=row.created_at,
+            published_at=row.published_at,
+            likes_count=row.likes_count,
+            dislikes_count=row.dislikes_count,
+            comments_count=row.comments_count,
+            views_count=row.views_count,
+        )
+
+    @staticmethod
+    def _to_content_tag_graph_row(row) -> ContentTagGraphRow:  # type: ignore[no-untyped-def]
+        return ContentTagGraphRow(
+            content_id=row.content_id,
+            tag_id=row.tag_id,
+            tag_slug=row.slug,
+        )
+
+    @staticmethod
+    def _to_reaction_graph_row(row) -> ContentReactionGraphRow:  # type: ignore[no-untyped-def]
+        return ContentReactionGraphRow(
+            user_id=row.user_id,
+            content_id=row.content_id,
+            reaction_type=row.reaction_type,
+            created_at=row.created_at,
+        )
+
+    @staticmethod
+    def _to_viewed_graph_rows(rows) -> list[ContentViewedGraphRow]:  # type: ignore[no-untyped-def]
         return [
-            ContentTagGraphRow(
+            ContentViewedGraphRow(
+                user_id=row.viewer_id,
                 content_id=row.content_id,
-                tag_id=row.tag_id,
-                tag_slug=row.slug,
+                views_count=int(row.views_count or 0),
+                progress_percent=int(row.progress_percent or 0),
+                last_seen_at=row.last_seen_at,
             )
-            for row in result.all()
+            for row in rows
+            if row.viewer_id is not None and row.last_seen_at is not None
+        ]
+
+    @staticmethod
+    def _to_commented_graph_rows(rows) -> list[ContentCommentedGraphRow]:  # type: ignore[no-untyped-def]
+        return [
+            ContentCommentedGraphRow(
+                user_id=row.author_id,
+                content_id=row.content_id,
+                comments_count=int(row.comments_count or 0),
+                last_commented_at=row.last_commented_at,
+            )
+            for row in rows
+            if row.last_commented_at is not None
         ]
 
     def _build_content_query(self, viewer_id: uuid.UUID | None):
         reaction_subquery = self._reaction_subquery(viewer_id=viewer_id)
         base_options = (
-            selectinload(ContentModel.author).selectinload(UserModel.subscribers),
             selectinload(ContentModel.author)
             .selectinload(UserModel.avatar_asset)
             .selectinload(AssetModel.variants),
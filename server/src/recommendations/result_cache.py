@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import uuid
+
+import redis.asyncio as redis
+
+from src.config import settings
+from src.recommendations.graph_repository import RecommendationAuthorGraphResult, SimilarContentGraphResult
+
+
+logger = logging.getLogger(__name__)
+
+RESULT_VERSION_KEY = "recommendations:results:version"
+
+
+def build_recommendation_result_version(
+    *,
+    last_event_at: datetime.datetime | None,
+    last_event_id: uuid.UUID | None,
+    last_full_rebuild_at: datetime.datetime | None,
+) -> str:
+    """Cache version for a graph sync cursor; changes whenever a sync moves the cursor."""
+    event_at = str(int(last_event_at.timestamp() * 1_000_000)) if last_event_at is not None else "-"
+    event_id = last_event_id.hex if last_event_id is not None else "-"
+    rebuild_at = str(int(last_full_rebuild_at.timestamp())) if last_full_rebuild_at is not None else "-"
+    return f"{event_at}.{event_id}.{rebuild_at}"
+
+
+def build_similar_content_result_key(
+    version: str,
+    *,
+    content_id: uuid.UUID,
+    content_type: str | None,
+    limit: int,
+) -> str:
+    return f"recommendations:results:{version}:similar:{content_id}:{content_type or 'all'}:{limit}"
+
+
+def build_recommended_authors_result_key(
+    version: str,
+    *,
+    viewer_id: uuid.UUID,
+    offset: int,
+    limit: int,
+) -> str:
+    return f"recommendations:results:{version}:authors:{viewer_id}:{offset}:{limit}"
+
+
+class RecommendationResultCache:
+    """Ranked similar-content and recommended-author ids, versioned by the graph sync cursor.
+
+    Only graph output is stored; hydration and viewer-specific filtering still run
+    per request. Entries are keyed by the page size the client asked for; the
+    service stores its largest overfetch for that size and slices on read.
+    Entries of an old version are never read again and expire by TTL.
+    """
+
+    def __init__(self, client: redis.Redis, *, ttl_seconds: int) -> None:
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+
+    async def get_version(self) -> str | None:
+        version = await self._client.get(RESULT_VERSION_KEY)
+        if isinstance(version, bytes):
+            version = version.decode()
+        return version or None
+
+    async def set_version(self, version: str) -> None:
+        await self._client.set(RESULT_VERSION_KEY, version)
+
+    async def get_similar_content(
+        self,
+        version: str,
+        *,
+        content_id: uuid.UUID,
+        content_type: str | None,
+        limit: int,
+    ) -> list[SimilarContentGraphResult] | None:
+        rows = await self._get_rows(
+            build_similar_content_result_key(version, content_id=content_id, content_type=content_type, limit=limit)
+        )
+        if rows is None:
+            return None
+        return [SimilarContentGraphResult(content_id=item_id, score=score, reason=reason) for item_id, score, reason in rows]
+
+    async def set_similar_content(
+        self,
+        version: str,
+        *,
+        content_id: uuid.UUID,
+        content_type: str | None,
+        limit: int,
+        rows: list[SimilarContentGraphResult],
+    ) -> None:
+        await self._set_rows(
+            build_similar_content_result_key(version, content_id=content_id, content_type=content_type, limit=limit),
+            [(row.content_id, row.score, row.reason) for row in rows],
+        )
+
+    async def get_recommended_authors(
+        self,
+        version: str,
+        *,
+        viewer_id: uuid.UUID,
+        offset: int,
+        limit: int,
+    ) -> list[RecommendationAuthorGraphResult] | None:
+        rows = await self._get_rows(
+            build_recommended_authors_result_key(version, viewer_id=viewer_id, offset=offset, limit=limit)
+        )
+        if rows is None:
+            return None
+        return [RecommendationAuthorGraphResult(user_id=item_id, score=score, reason=reason) for item_id, score, reason in rows]
+
+    async def set_recommended_authors(
+        self,
+        version: str,
+        *,
+        viewer_id: uuid.UUID,
+        offset: int,
+        limit: int,
+        rows: list[RecommendationAuthorGraphResult],
+    ) -> None:
+        await self._set_rows(
+            build_recommended_authors_result_key(version, viewer_id=viewer_id, offset=offset, limit=limit),
+            [(row.user_id, row.score, row.reason) for row in rows],
+        )
+
+    async def _get_rows(self, key: str) -> list[tuple[uuid.UUID, float, str]] | None:
+        payload = await self._client.get(key)
+        if payload is None:
+            return None
+        try:
+            return [(uuid.UUID(item_id), float(score), str(reason)) for item_id, score, reason in json.loads(payload)]
+        except (TypeError, ValueError):
+            logger.warning("Dropping malformed recommendation result cache entry %s", key)
+            return None
+
+    async def _set_rows(self, key: str, rows: list[tuple[uuid.UUID, float, str]]) -> None:
+        payload = json.dumps([[str(item_id), score, reason] for item_id, score, reason in rows])
+        await self._client.set(key, payload, ex=self._ttl_seconds)
+
+
+def build_recommendation_result_cache(
+    client: redis.Redis | None = None,
+) -> RecommendationResultCache | None:
+    if not settings.recommendations.result_cache_enabled:
+        return None
+    return RecommendationResultCache(
+        client if client is not None else redis.from_url(settings.redis.url, decode_responses=True),
+        ttl_seconds=settings.recommendations.result_cache_ttl_seconds,
+    )
@@ -3,9 +3,12 @@ import uuid
 from fastapi import APIRouter, Depends, Query
 
 from src.auth.dependencies import get_current_optional_user, get_current_user
+from src.common.exceptions import PermissionDenied
 from src.content.enums import ContentTypeEnum
 from src.content.schemas import ContentListItemGet
 from src.recommendations.dependencies import get_recommendation_service
+from src.recommendations.graph_instrumentation import GraphQueryRecorder
+from src.recommendations.graph_repository import get_graph_query_recorder
 from src.recommendations.schemas import (
     RecommendedAuthorItemGet,
     RecommendationFeedContentTypeEnum,
@@ -13,7 +16,7 @@ from src.recommendations.schemas import (
     SimilarContentListGet,
 )
 from src.recommendations.service import RecommendationService
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 
 
 router = APIRouter(
@@ -28,7 +31,7 @@ async def get_recommendations_feed(
     sort: RecommendationFeedSortEnum = RecommendationFeedSortEnum.RELEVANCE,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     recommendation_service: RecommendationService = Depends(get_recommendation_service),
 ) -> list[ContentListItemGet]:
     return await recommendation_service.get_recommendations_feed(
@@ -44,7 +47,7 @@ async def get_recommendations_feed(
 async def get_recommended_authors(
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     recommendation_service: RecommendationService = Depends(get_recommendation_service),
 ) -> list[RecommendedAuthorItemGet]:
     return await recommendation_service.get_recommended_authors(
@@ -59,7 +62,7 @@ async def get_similar_content(
     content_id: uuid.UUID,
     limit: int = Query(default=8, ge=1, le=50),
     content_type: ContentTypeEnum | None = None,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     recommendation_service: RecommendationService = Depends(get_recommendation_service),
 ) -> SimilarContentListGet:
     return await recommendation_service.get_similar_content(
@@ -68,3 +71,14 @@ async def get_similar_content(
         limit=limit,
         content_type=content_type,
     )
+
+
+@router.get("/graph-query-stats")
+async def get_graph_query_stats(
+    user: UserPrincipal = Depends(get_current_user),
+    recorder: GraphQueryRecorder = Depends(get_graph_query_recorder),
+) -> dict[str, dict]:
+    """Neo4j timings recorded by this API process since it started."""
+    if not user.is_admin:
+        raise PermissionDenied("Only admins can read graph query stats")
+    return recorder.snapshot()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import datetime
+
 
 TAG_AFFINITY_WEIGHT = 1.0
 AUTHOR_AFFINITY_WEIGHT = 1.0
@@ -12,6 +14,19 @@ COLLABORATIVE_LIKE_WEIGHT = 3.0
 COLLABORATIVE_VIEW_WEIGHT = 1.0
 COLLABORATIVE_COMMENT_WEIGHT = 2.5
 
+# Per-edge contributions to INTERESTED_IN (user -> tag of the content) and
+# AFFINITY_TO_AUTHOR (user -> author of the content, or a followed user).
+INTEREST_LIKE_WEIGHT = 4.0
+INTEREST_DISLIKE_WEIGHT = -4.0
+INTEREST_VIEW_WEIGHT = 1.0
+INTEREST_COMMENT_WEIGHT = 3.0
+
+AUTHOR_LIKE_WEIGHT = 5.0
+AUTHOR_DISLIKE_WEIGHT = -6.0
+AUTHOR_VIEW_WEIGHT = 1.0
+AUTHOR_COMMENT_WEIGHT = 4.0
+AUTHOR_FOLLOW_WEIGHT = 6.0
+
 
 def compute_content_quality_score(
     *,
@@ -26,3 +41,45 @@ def compute_content_quality_score(
         + (comments_count * 5.0)
         + (views_count * 1.0)
     )
+
+
+def compute_freshness_score(
+    published_at: datetime.datetime | None,
+    *,
+    now: datetime.datetime,
+) -> float:
+    # Mirrors the Cypher feed query: whole days since publication, decayed hyperbolically.
+    if published_at is None:
+        return 1.0
+    age_days = abs((now - published_at).days)
+    return 1.0 / (1.0 + (age_days / FRESHNESS_DECAY_DAYS))
+
+
+def compute_interest_contribution(
+    *,
+    liked: bool,
+    disliked: bool,
+    views_count: int,
+    comments_count: int,
+) -> float:
+    return (
+        (INTEREST_LIKE_WEIGHT if liked else 0.0)
+        + (INTEREST_DISLIKE_WEIGHT if disliked else 0.0)
+        + (views_count * INTEREST_VIEW_WEIGHT)
+        + (comments_count * INTEREST_COMMENT_WEIGHT)
+    )
+
+
+def compute_author_affinity_contribution(
+    *,
+    liked: bool,
+    disliked: bool,
+    views_count: int,
+    comments_count: int,
+) -> float:
+    return (
+        (AUTHOR_LIKE_WEIGHT if liked else 0.0)
+        + (AUTHOR_DISLIKE_WEIGHT if disliked else 0.0)
+        + (views_count * AUTHOR_VIEW_WEIGHT)
+        + (comments_count * AUTHOR_COMMENT_WEIGHT)
+    )
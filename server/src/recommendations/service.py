@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import datetime
 import logging
+import typing as tp
 import uuid
 
 from src.content.enums import ContentTypeEnum
 from src.content.projectors import ContentProjectorRegistry
 from src.content.schemas import ContentListItemGet
+from src.recommendations.candidates import RecommendationCandidateStore, rank_recommendation_candidates
 from src.recommendations.graph_repository import (
     RecommendationAuthorGraphResult,
     RecommendationFeedGraphResult,
-    RecommendationGraphRepository,
+    SimilarContentGraphResult,
 )
+from src.recommendations.overfetch import AdaptiveOverfetch
 from src.recommendations.postgres_repository import RecommendationPostgresRepository
+from src.recommendations.result_cache import RecommendationResultCache
 from src.recommendations.schemas import (
     RecommendedAuthorItemGet,
     RecommendationFeedContentTypeEnum,
@@ -24,20 +29,61 @@ from src.users.presentation import build_user_get
 
 logger = logging.getLogger(__name__)
 
+T = tp.TypeVar("T")
+RowT = tp.TypeVar("RowT", SimilarContentGraphResult, RecommendationFeedGraphResult)
+
+
+class RecommendationScorer(tp.Protocol):
+    """Read side shared by the Neo4j repository and the in-process sparse engine."""
+
+    async def get_similar_content(
+        self,
+        *,
+        content_id: uuid.UUID,
+        limit: int,
+        content_type: str | None,
+    ) -> list[SimilarContentGraphResult]: ...
+
+    async def get_recommendation_feed(
+        self,
+        *,
+        viewer_id: uuid.UUID | None,
+        content_type: str | None,
+        sort: str,
+        offset: int,
+        limit: int,
+    ) -> list[RecommendationFeedGraphResult]: ...
+
+    async def get_recommended_authors(
+        self,
+        *,
+        viewer_id: uuid.UUID,
+        offset: int,
+        limit: int,
+    ) -> list[RecommendationAuthorGraphResult]: ...
+
 
 class RecommendationService:
     def __init__(
         self,
         *,
-        graph_repository: RecommendationGraphRepository,
+        graph_repository: RecommendationScorer,
         postgres_repository: RecommendationPostgresRepository,
         projector_registry: ContentProjectorRegistry,
         asset_storage,
+        candidate_store: RecommendationCandidateStore | None = None,
+        result_cache: RecommendationResultCache | None = None,
+        overfetch: AdaptiveOverfetch | None = None,
+        clock: tp.Callable[[], datetime.datetime] = lambda: datetime.datetime.now(datetime.timezone.utc),
     ) -> None:
         self._graph_repository = graph_repository
         self._postgres_repository = postgres_repository
         self._projector_registry = projector_registry
         self._asset_storage = asset_storage
+        self._candidate_store = candidate_store
+        self._result_cache = result_cache
+        self._overfetch = overfetch if overfetch is not None else AdaptiveOverfetch()
+        self._clock = clock
 
     async def get_similar_content(
         self,
@@ -47,50 +93,61 @@ class RecommendationService:
         limit: int,
         content_type: ContentTypeEnum | None,
     ) -> SimilarContentListGet:
-        graph_limit = max(limit * 4, limit)
-        try:
-            graph_rows = await self._graph_repository.get_similar_content(
+        graph_limit = self._overfetch.graph_limit("similar_content", limit)
+        graph_content_type = content_type.value if content_type is not None else None
+        # Cached lists always hold the largest overfetch for the page size, so a hit
+        # has enough rows whatever `graph_limit` is by the time it is read.
+        version, graph_rows = await self._read_result_cache(
+            lambda cache, version: cache.get_similar_content(
+                version,
                 content_id=content_id,
-                limit=graph_limit,
-                content_type=content_type.value if content_type is not None else None,
+                content_type=graph_content_type,
+                limit=limit,
+            )
+        )
+        if graph_rows is None:
+            try:
+                graph_rows = await self._graph_repository.get_similar_content(
+                    content_id=content_id,
+                    limit=self._overfetch.max_limit(limit) if version is not None else graph_limit,
+                    content_type=graph_content_type,
+                )
+            except Exception:
+                logger.exception("Neo4j similar-content query failed")
+                return SimilarContentListGet(items=[], limit=limit)
+            await self._write_result_cache(
+                version,
+                lambda cache, version: cache.set_similar_content(
+                    version,
+                    content_id=content_id,
+                    content_type=graph_content_type,
+                    limit=limit,
+                    rows=graph_rows,
+                ),
             )
-        except Exception:
-            logger.exception("Neo4j similar-content query failed")
-            return SimilarContentListGet(items=[], limit=limit)
 
         if not graph_rows:
             return SimilarContentListGet(items=[], limit=limit)
 
-        hydrated = await self._postgres_repository.get_visible_content_by_ids(
-            content_ids=[row.content_id for row in graph_rows],
+        page = await self._hydrate_rows(
+            "similar_content",
+            rows=graph_rows[:graph_limit],
             viewer_id=viewer_id,
+            content_type=content_type,
+            limit=limit,
         )
-
-        items: list[SimilarContentItemGet] = []
-        for row in graph_rows:
-            content = hydrated.get(row.content_id)
-            if content is None:
-                continue
-            if content_type is not None and content.content_type != content_type:
-                continue
-            projector = self._projector_registry.get(content.content_type)
-            projected = await projector.project_feed_item(
-                content,
-                viewer_id=viewer_id,
-                storage=self._asset_storage,
-            )
-            items.append(
+        return SimilarContentListGet(
+            items=[
                 SimilarContentItemGet(
                     content_id=row.content_id,
                     score=row.score,
                     reason=row.reason,
                     content=projected,
                 )
-            )
-            if len(items) >= limit:
-                break
-
-        return SimilarContentListGet(items=items, limit=limit)
+                for row, projected in page
+            ],
+            limit=limit,
+        )
 
     async def get_recommendations_feed(
         self,
@@ -102,28 +159,39 @@ class RecommendationService:
         limit: int,
     ) -> list[ContentListItemGet]:
         target_content_type = self._resolve_content_type(content_type)
-        graph_limit = max(limit * 4, limit)
+        graph_limit = self._overfetch.graph_limit("feed", limit)
 
-        graph_rows = []
+        graph_rows: list[RecommendationFeedGraphResult] | None = None
         graph_failed = False
-        try:
-            graph_rows = await self._graph_repository.get_recommendation_feed(
+        if viewer_id is not None and sort == RecommendationFeedSortEnum.RELEVANCE:
+            graph_rows = await self._get_precomputed_feed_rows(
                 viewer_id=viewer_id,
-                content_type=target_content_type.value if target_content_type is not None else None,
-                sort=sort.value,
+                content_type=target_content_type,
                 offset=offset,
                 limit=graph_limit,
             )
-        except Exception:
-            graph_failed = True
-            logger.exception("Neo4j recommendations feed query failed")
+        if graph_rows is None:
+            graph_rows = []
+            try:
+                graph_rows = await self._graph_repository.get_recommendation_feed(
+                    viewer_id=viewer_id,
+                    content_type=target_content_type.value if target_content_type is not None else None,
+                    sort=sort.value,
+                    offset=offset,
+                    limit=graph_limit,
+                )
+            except Exception:
+                graph_failed = True
+                logger.exception("Neo4j recommendations feed query failed")
 
-        items = await self._hydrate_recommendation_rows(
+        page = await self._hydrate_rows(
+            "feed",
             rows=graph_rows,
             viewer_id=viewer_id,
             content_type=target_content_type,
             limit=limit,
         )
+        items = [projected for _, projected in page]
         if len(items) >= limit:
             return items
 
@@ -136,11 +204,13 @@ class RecommendationService:
             limit=fallback_needed,
             exclude_content_ids=[item.content_id for item in items],
         )
-        for content in fallback_items:
-            items.append(await self._project_content(content=content, viewer_id=viewer_id))
-            if len(items) >= limit:
-                break
-
+        items.extend(
+            await self._projector_registry.project_feed_items(
+                fallback_items[:fallback_needed],
+                viewer_id=viewer_id,
+                storage=self._asset_storage,
+            )
+        )
         return items
 
     async def get_recommended_authors(
@@ -152,16 +222,34 @@ class RecommendationService:
     ) -> list[RecommendedAuthorItemGet]:
         graph_limit = max(limit * 4, limit)
 
-        graph_rows: list[RecommendationAuthorGraphResult] = []
-        try:
-            graph_rows = await self._graph_repository.get_recommended_authors(
+        version, graph_rows = await self._read_result_cache(
+            lambda cache, version: cache.get_recommended_authors(
+                version,
                 viewer_id=viewer_id,
                 offset=offset,
-                limit=graph_limit,
+                limit=limit,
+            )
+        )
+        if graph_rows is None:
+            try:
+                graph_rows = await self._graph_repository.get_recommended_authors(
+                    viewer_id=viewer_id,
+                    offset=offset,
+                    limit=graph_limit,
+                )
+            except Exception:
+                logger.exception("Neo4j recommended-authors query failed")
+                return []
+            await self._write_result_cache(
+                version,
+                lambda cache, version: cache.set_recommended_authors(
+                    version,
+                    viewer_id=viewer_id,
+                    offset=offset,
+                    limit=limit,
+                    rows=graph_rows,
+                ),
             )
-        except Exception:
-            logger.exception("Neo4j recommended-authors query failed")
-            return []
 
         if not graph_rows:
             return []
@@ -188,6 +276,7 @@ class RecommendationService:
                 author_model,
                 viewer_id=viewer_id,
                 storage=self._asset_storage,
+                subscribed_ids=subscribed_author_ids,
             )
             if bool(author.is_subscribed):
                 continue
@@ -205,40 +294,111 @@ class RecommendationService:
 
         return items
 
-    async def _hydrate_recommendation_rows(
+    async def _read_result_cache(
+        self,
+        read: tp.Callable[[RecommendationResultCache, str], tp.Awaitable[T | None]],
+    ) -> tuple[str | None, T | None]:
+        """Cached graph rows for the current sync version; (None, None) disables caching."""
+        if self._result_cache is None:
+            return None, None
+        try:
+            version = await self._result_cache.get_version()
+            if version is None:
+                return None, None
+            return version, await read(self._result_cache, version)
+        except Exception:
+            logger.exception("Recommendation result cache read failed")
+            return None, None
+
+    async def _write_result_cache(
+        self,
+        version: str | None,
+        write: tp.Callable[[RecommendationResultCache, str], tp.Awaitable[None]],
+    ) -> None:
+        if self._result_cache is None or version is None:
+            return
+        try:
+            await write(self._result_cache, version)
+        except Exception:
+            logger.exception("Recommendation result cache write failed")
+
+    async def _get_precomputed_feed_rows(
         self,
         *,
-        rows: list[RecommendationFeedGraphResult],
+        viewer_id: uuid.UUID,
+        content_type: ContentTypeEnum | None,
+        offset: int,
+        limit: int,
+    ) -> list[RecommendationFeedGraphResult] | None:
+        """Page through the viewer's stored candidates; None means use the live graph query."""
+        if self._candidate_store is None:
+            return None
+        try:
+            candidates = await self._candidate_store.get(viewer_id)
+        except Exception:
+            logger.exception("Recommendation candidate store read failed")
+            return None
+        if candidates is None:
+            return None
+
+        excluded_content_ids = await self._postgres_repository.get_excluded_content_ids(
+            viewer_id=viewer_id,
+            content_ids=[candidate.content_id for candidate in candidates],
+        )
+        ranked = rank_recommendation_candidates(
+            candidates,
+            now=self._clock(),
+            content_type=content_type.value if content_type is not None else None,
+            excluded_content_ids=excluded_content_ids,
+        )
+        return [
+            RecommendationFeedGraphResult(
+                content_id=candidate.content_id,
+                score=candidate.score,
+                reason="personalized_graph_feed",
+            )
+            for candidate in ranked[offset: offset + limit]
+        ]
+
+    async def _hydrate_rows(
+        self,
+        surface: str,
+        *,
+        rows: list[RowT],
         viewer_id: uuid.UUID | None,
         content_type: ContentTypeEnum | None,
         limit: int,
-    ) -> list[ContentListItemGet]:
+    ) -> list[tuple[RowT, ContentListItemGet]]:
+        """Project the first `limit` visible rows, in graph order.
+
+        Visibility and content type are checked on ids first, so the full eager-load
+        tree is only fetched for the rows that make it onto the page.
+        """
         if not rows:
             return []
 
-        hydrated = await self._postgres_repository.get_visible_content_by_ids(
+        visible_ids = await self._postgres_repository.filter_visible_content_ids(
             content_ids=[row.content_id for row in rows],
-            viewer_id=viewer_id,
+            content_type=content_type,
         )
-        items: list[ContentListItemGet] = []
-        for row in rows:
-            content = hydrated.get(row.content_id)
-            if content is None:
-                continue
-            if content_type is not None and content.content_type != content_type:
-                continue
-            items.append(await self._project_content(content=content, viewer_id=viewer_id))
-            if len(items) >= limit:
-                break
-        return items
+        visible_rows = [row for row in rows if row.content_id in visible_ids]
+        self._overfetch.observe(surface, fetched=len(rows), kept=len(visible_rows))
+        visible_rows = visible_rows[:limit]
+        if not visible_rows:
+            return []
 
-    async def _project_content(self, *, content, viewer_id: uuid.UUID | None) -> ContentListItemGet:
-        projector = self._projector_registry.get(content.content_type)
-        return await projector.project_feed_item(
-            content,
+        hydrated = await self._postgres_repository.get_visible_content_by_ids(
+            content_ids=[row.content_id for row in visible_rows],
+            viewer_id=viewer_id,
+        )
+        # Rows hidden between the two queries are dropped rather than backfilled.
+        page = [(row, hydrated[row.content_id]) for row in visible_rows if row.content_id in hydrated]
+        projected = await self._projector_registry.project_feed_items(
+            [content for _, content in page],
             viewer_id=viewer_id,
             storage=self._asset_storage,
         )
+        return [(row, item) for (row, _), item in zip(page, projected)]
 
     @staticmethod
     def _resolve_content_type(
@@ -0,0 +1,526 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import time
+import typing as tp
+import uuid
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import sparse
+
+from src.content.enums import ContentStatusEnum, ContentVisibilityEnum, ReactionTypeEnum
+from src.recommendations.graph_repository import (
+    RecommendationAuthorGraphResult,
+    RecommendationFeedGraphResult,
+    SimilarContentGraphResult,
+)
+from src.recommendations.postgres_repository import (
+    ContentCommentedGraphRow,
+    ContentGraphRow,
+    ContentReactionGraphRow,
+    ContentTagGraphRow,
+    ContentViewedGraphRow,
+    RecommendationPostgresRepository,
+)
+from src.recommendations.scoring import (
+    AUTHOR_AFFINITY_WEIGHT,
+    AUTHOR_COMMENT_WEIGHT,
+    AUTHOR_DISLIKE_WEIGHT,
+    AUTHOR_FOLLOW_WEIGHT,
+    AUTHOR_LIKE_WEIGHT,
+    AUTHOR_VIEW_WEIGHT,
+    COLLABORATIVE_COMMENT_WEIGHT,
+    COLLABORATIVE_LIKE_WEIGHT,
+    COLLABORATIVE_VIEW_WEIGHT,
+    COLLABORATIVE_WEIGHT,
+    CONTENT_QUALITY_WEIGHT,
+    FRESHNESS_DECAY_DAYS,
+    FRESHNESS_WEIGHT,
+    INTEREST_COMMENT_WEIGHT,
+    INTEREST_DISLIKE_WEIGHT,
+    INTEREST_LIKE_WEIGHT,
+    INTEREST_VIEW_WEIGHT,
+    TAG_AFFINITY_WEIGHT,
+    compute_content_quality_score,
+)
+
+
+logger = logging.getLogger(__name__)
+
+SEEN_PROGRESS_PERCENT = 90
+_SECONDS_PER_DAY = 86400.0
+
+
+@dataclass(slots=True)
+class SparseRecommendationIndex:
+    """User, tag and content interaction matrices mirroring the Neo4j graph.
+
+    Rows and columns are positions in `user_ids` / `content_ids`; tags only need
+    a column each. Derived edges (INTERESTED_IN, AFFINITY_TO_AUTHOR) are
+    computed once at build time with the same weights the graph recompute uses.
+    """
+
+    user_ids: list[uuid.UUID]
+    user_index: dict[uuid.UUID, int]
+    content_ids: list[uuid.UUID]
+    content_index: dict[uuid.UUID, int]
+    content_types: np.ndarray
+    content_authors: np.ndarray
+    content_published: np.ndarray
+    content_published_ts: np.ndarray
+    content_quality: np.ndarray
+    content_likes: np.ndarray
+    content_dislikes: np.ndarray
+    content_comments: np.ndarray
+    content_views: np.ndarray
+    content_tags: sparse.csr_matrix
+    content_authored: sparse.csr_matrix
+    liked: sparse.csr_matrix
+    disliked: sparse.csr_matrix
+    viewed: sparse.csr_matrix
+    commented: sparse.csr_matrix
+    seen: sparse.csr_matrix
+    engaged: sparse.csr_matrix
+    collaborative: sparse.csr_matrix
+    follows: sparse.csr_matrix
+    interests: sparse.csr_matrix
+    author_affinity: sparse.csr_matrix
+
+
+def build_sparse_recommendation_index(
+    *,
+    user_ids: list[uuid.UUID],
+    subscriptions: list[tuple[uuid.UUID, uuid.UUID]],
+    content_rows: list[ContentGraphRow],
+    content_tags: list[ContentTagGraphRow],
+    reactions: list[ContentReactionGraphRow],
+    views: list[ContentViewedGraphRow],
+    comments: list[ContentCommentedGraphRow],
+) -> SparseRecommendationIndex:
+    user_ids = list(dict.fromkeys([*user_ids, *(row.author_id for row in content_rows)]))
+    user_index = {user_id: position for position, user_id in enumerate(user_ids)}
+    content_ids = [row.content_id for row in content_rows]
+    content_index = {content_id: position for position, content_id in enumerate(content_ids)}
+    tag_index: dict[uuid.UUID, int] = {}
+    for row in content_tags:
+        tag_index.setdefault(row.tag_id, len(tag_index))
+
+    users, contents, tags = len(user_ids), len(content_ids), len(tag_index)
+
+    def user_content_matrix(pairs: list[tuple[uuid.UUID, uuid.UUID, float]]) -> sparse.csr_matrix:
+        rows, cols, data = [], [], []
+        for user_id, content_id, value in pairs:
+            if user_id in user_index and content_id in content_index:
+                rows.append(user_index[user_id])
+                cols.append(content_index[content_id])
+                data.append(value)
+        return sparse.csr_matrix((data, (rows, cols)), shape=(users, contents), dtype=np.float64)
+
+    liked = user_content_matrix(
+        [(row.user_id, row.content_id, 1.0) for row in reactions if row.reaction_type == ReactionTypeEnum.LIKE]
+    )
+    disliked = user_content_matrix(
+        [(row.user_id, row.content_id, 1.0) for row in reactions if row.reaction_type == ReactionTypeEnum.DISLIKE]
+    )
+    view_counts = user_content_matrix([(row.user_id, row.content_id, float(row.views_count or 1)) for row in views])
+    comment_counts = user_content_matrix(
+        [(row.user_id, row.content_id, float(row.comments_count or 1)) for row in comments]
+    )
+    seen = user_content_matrix(
+        [(row.user_id, row.content_id, 1.0) for row in views if row.progress_percent >= SEEN_PROGRESS_PERCENT]
+    )
+    viewed = _binary(view_counts)
+    commented = _binary(comment_counts)
+
+    tag_matrix = sparse.csr_matrix(
+        (
+            np.ones(len(content_tags)),
+            (
+                [content_index.get(row.content_id, contents) for row in content_tags],
+                [tag_index[row.tag_id] for row in content_tags],
+            ),
+        ),
+        shape=(contents + 1, tags),
+    )[:contents]
+    tag_matrix = _binary(tag_matrix)
+    content_authors = np.array([user_index[row.author_id] for row in content_rows], dtype=np.int64)
+    authored = sparse.csr_matrix(
+        (np.ones(contents), (np.arange(contents), content_authors)),
+        shape=(contents, users),
+    )
+    follows = sparse.csr_matrix(
+        (
+            np.ones(len(subscriptions)),
+            (
+                [user_index.get(subscriber_id, users) for subscriber_id, _ in subscriptions],
+                [user_index.get(subscribed_id, users) for _, subscribed_id in subscriptions],
+            ),
+        ),
+        shape=(users + 1, users + 1),
+    )[:users, :users]
+    follows = _binary(follows.tocsr())
+
+    # Same per-edge weights as recompute_interested_in / recompute_affinity_to_author.
+    interests = _positive(
+        (
+            INTEREST_LIKE_WEIGHT * liked
+            + INTEREST_DISLIKE_WEIGHT * disliked
+            + INTEREST_VIEW_WEIGHT * view_counts
+            + INTEREST_COMMENT_WEIGHT * comment_counts
+        )
+        @ tag_matrix
+    )
+    author_affinity = (
+        AUTHOR_LIKE_WEIGHT * liked
+        + AUTHOR_DISLIKE_WEIGHT * disliked
+        + AUTHOR_VIEW_WEIGHT * view_counts
+        + AUTHOR_COMMENT_WEIGHT * comment_counts
+    ) @ authored + AUTHOR_FOLLOW_WEIGHT * follows
+    author_affinity = author_affinity.tolil()
+    author_affinity.setdiag(0.0)
+    author_affinity = _positive(author_affinity.tocsr())
+
+    published_ts = np.array(
+        [(row.published_at or row.created_at).timestamp() for row in content_rows],
+        dtype=np.float64,
+    )
+    return SparseRecommendationIndex(
+        user_ids=user_ids,
+        user_index=user_index,
+        content_ids=content_ids,
+        content_index=content_index,
+        content_types=np.array([row.content_type.value for row in content_rows], dtype=object),
+        content_authors=content_authors,
+        content_published=np.array(
+            [
+                row.status == ContentStatusEnum.PUBLISHED and row.visibility == ContentVisibilityEnum.PUBLIC
+                for row in content_rows
+            ],
+            dtype=bool,
+        ),
+        content_published_ts=published_ts,
+        content_quality=np.array(
+            [
+                compute_content_quality_score(
+                    likes_count=row.likes_count,
+                    dislikes_count=row.dislikes_count,
+                    comments_count=row.comments_count,
+                    views_count=row.views_count,
+                )
+                for row in content_rows
+            ],
+            dtype=np.float64,
+        ),
+        content_likes=np.array([row.likes_count for row in content_rows], dtype=np.float64),
+        content_dislikes=np.array([row.dislikes_count for row in content_rows], dtype=np.float64),
+        content_comments=np.array([row.comments_count for row in content_rows], dtype=np.float64),
+        content_views=np.array([row.views_count for row in content_rows], dtype=np.float64),
+        content_tags=tag_matrix,
+        content_authored=authored,
+        liked=liked,
+        disliked=disliked,
+        viewed=viewed,
+        commented=commented,
+        seen=seen,
+        engaged=_binary(liked + viewed + commented),
+        collaborative=(
+            COLLABORATIVE_LIKE_WEIGHT * liked
+            + COLLABORATIVE_VIEW_WEIGHT * viewed
+            + COLLABORATIVE_COMMENT_WEIGHT * commented
+        ).tocsr(),
+        follows=follows,
+        interests=interests,
+        author_affinity=author_affinity,
+    )
+
+
+async def load_sparse_recommendation_index(
+    postgres_repository: RecommendationPostgresRepository,
+) -> SparseRecommendationIndex:
+    user_ids = await postgres_repository.get_all_user_ids()
+    subscriptions = await postgres_repository.get_all_subscriptions()
+    content_rows = await postgres_repository.get_all_content_nodes()
+    content_tags = await postgres_repository.get_all_content_tags()
+    reactions = await postgres_repository.get_all_content_reactions()
+    views = await postgres_repository.get_all_content_views()
+    comments = await postgres_repository.get_all_content_comments()
+    return await asyncio.to_thread(
+        lambda: build_sparse_recommendation_index(
+            user_ids=user_ids,
+            subscriptions=subscriptions,
+            content_rows=content_rows,
+            content_tags=content_tags,
+            reactions=reactions,
+            views=views,
+            comments=comments,
+        )
+    )
+
+
+class SparseRecommendationEngine:
+    """In-process scorer with the same read interface as RecommendationGraphRepository.
+
+    Scores every candidate for a viewer with a handful of sparse mat-vec
+    products over an index loaded from Postgres, reloaded once it is older than
+    `ttl_seconds`.
+    """
+
+    def __init__(
+        self,
+        *,
+        index_loader: tp.Callable[[], tp.Awaitable[SparseRecommendationIndex]],
+        ttl_seconds: float,
+        clock: tp.Callable[[], datetime.datetime] = lambda: datetime.datetime.now(datetime.timezone.utc),
+        monotonic: tp.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._index_loader = index_loader
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._monotonic = monotonic
+        self._index: SparseRecommendationIndex | None = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get_index(self) -> SparseRecommendationIndex:
+        if self._index is not None and self._monotonic() - self._loaded_at < self._ttl_seconds:
+            return self._index
+        async with self._lock:
+            if self._index is None or self._monotonic() - self._loaded_at >= self._ttl_seconds:
+                started = self._monotonic()
+                self._index = await self._index_loader()
+                self._loaded_at = self._monotonic()
+                logger.info(
+                    "Loaded sparse recommendation index: %d users, %d content in %.2fs",
+                    len(self._index.user_ids),
+                    len(self._index.content_ids),
+                    self._loaded_at - started,
+                )
+        return self._index
+
+    async def close(self) -> None:
+        return None
+
+    async def get_similar_content(
+        self,
+        *,
+        content_id: uuid.UUID,
+        limit: int,
+        content_type: str | None,
+    ) -> list[SimilarContentGraphResult]:
+        index = await self.get_index()
+        source = index.content_index.get(content_id)
+        if source is None:
+            return []
+
+        shared_tags = _column(index.content_tags @ index.content_tags[source].T)
+        co_liked = _column(index.liked.T @ index.liked[:, source])
+        co_viewed = _column(index.viewed.T @ index.viewed[:, source])
+        co_commented = _column(index.commented.T @ index.commented[:, source])
+        same_author = np.where(index.content_authors == index.content_authors[source], 3.0, 0.0)
+
+        tag_score = shared_tags * 2.5
+        audience_score = co_liked * 3.0 + co_viewed * 1.0 + co_commented * 2.0
+        score = tag_score + audience_score + same_author + index.content_quality * 0.15
+
+        mask = (shared_tags > 0) | (co_liked > 0) | (co_viewed > 0) | (co_commented > 0) | (same_author > 0)
+        mask &= score > 0
+        mask[source] = False
+        if content_type is not None:
+            mask &= index.content_types == content_type
+
+        result: list[SimilarContentGraphResult] = []
+        for position in _top(score, mask, limit):
+            if same_author[position] > 0 and same_author[position] >= tag_score[position] and same_author[position] >= audience_score[position]:
+                reason = "same_author"
+            elif shared_tags[position] > 0 and tag_score[position] >= audience_score[position]:
+                reason = "shared_tags"
+            elif co_liked[position] + co_viewed[position] + co_commented[position] > 0:
+                reason = "shared_audience"
+            else:
+                reason = "quality"
+            result.append(
+                SimilarContentGraphResult(
+                    content_id=index.content_ids[position],
+                    score=float(score[position]),
+                    reason=reason,
+                )
+            )
+        return result
+
+    async def get_recommendation_feed(
+        self,
+        *,
+        viewer_id: uuid.UUID | None,
+        content_type: str | None,
+        sort: str,
+        offset: int,
+        limit: int,
+    ) -> list[RecommendationFeedGraphResult]:
+        index = await self.get_index()
+        now = self._clock().timestamp()
+        viewer = index.user_index.get(viewer_id) if viewer_id is not None else None
+
+        mask = index.content_published.copy()
+        if content_type is not None:
+            mask &= index.content_types == content_type
+
+        age_days = np.abs(np.trunc((now - index.content_published_ts) / _SECONDS_PER_DAY))
+        score = (
+            index.content_quality * CONTENT_QUALITY_WEIGHT
+            + (1.0 / (1.0 + age_days / FRESHNESS_DECAY_DAYS)) * FRESHNESS_WEIGHT
+        )
+        if viewer is not None:
+            mask &= index.content_authors != viewer
+            mask[index.disliked[viewer].indices] = False
+            mask[index.seen[viewer].indices] = False
+
+            tag_affinity = index.content_tags @ _row(index.interests, viewer)
+            author_affinity = _row(index.author_affinity, viewer)[index.content_authors]
+            # Peers weighted by how many distinct items they share with the viewer.
+            overlap = index.engaged @ _row(index.engaged, viewer)
+            overlap[viewer] = 0.0
+            collaborative = index.collaborative.T @ overlap
+            score = score + (
+                tag_affinity * TAG_AFFINITY_WEIGHT
+                + author_affinity * AUTHOR_AFFINITY_WEIGHT
+                + collaborative * COLLABORATIVE_WEIGHT
+            )
+
+        candidates = np.flatnonzero(mask)
+        if sort == "newest":
+            order = np.argsort(-index.content_published_ts[candidates], kind="stable")
+        elif sort == "oldest":
+            order = np.argsort(index.content_published_ts[candidates], kind="stable")
+        else:
+            order = np.lexsort((-index.content_published_ts[candidates], -score[candidates]))
+        page = candidates[order][offset: offset + limit]
+        return [
+            RecommendationFeedGraphResult(
+                content_id=index.content_ids[position],
+                score=float(score[position]),
+                reason="personalized_graph_feed",
+            )
+            for position in page
+        ]
+
+    async def get_recommended_authors(
+        self,
+        *,
+        viewer_id: uuid.UUID,
+        offset: int,
+        limit: int,
+    ) -> list[RecommendationAuthorGraphResult]:
+        index = await self.get_index()
+        viewer = index.user_index.get(viewer_id)
+        if viewer is None:
+            return []
+        users = len(index.user_ids)
+
+        viewer_interests = index.interests[viewer]
+        interest_tags = viewer_interests.indices
+        tag_paths = index.content_tags[:, interest_tags]
+        content_tag_affinity = tag_paths @ viewer_interests.data
+        tag_affinity = index.content_authored.T @ content_tag_affinity
+        topic_authors = np.zeros(users, dtype=bool)
+        topic_authors[index.content_authors[np.flatnonzero(_column(tag_paths.sum(axis=1)) > 0)]] = True
+
+        # Peer similarity is the overlap of interest weights on the viewer's tags.
+        peer_interests = index.interests[:, interest_tags].tocsr()
+        peer_interests.data = np.minimum(peer_interests.data, viewer_interests.data[peer_interests.indices])
+        peer_similarity = _column(peer_interests.sum(axis=1))
+        peer_similarity[viewer] = 0.0
+        similar_users_follow_score = index.follows.T @ peer_similarity
+        shares_tag = np.zeros(users)
+        shares_tag[np.flatnonzero(np.diff(peer_interests.indptr))] = 1.0
+        shares_tag[viewer] = 0.0
+        followed_by_peers = (index.follows.T @ shares_tag) > 0
+
+        published = index.content_published
+        authors = index.content_authors[published]
+        published_count = np.bincount(authors, minlength=users)
+        raw_quality = np.bincount(
+            authors,
+            weights=(
+                index.content_likes * 4.0
+                + index.content_comments * 5.0
+                + index.content_views * 1.0
+                - index.content_dislikes * 6.0
+            )[published],
+            minlength=users,
+        )
+        age_days = np.abs(np.trunc((self._clock().timestamp() - index.content_published_ts[published]) / _SECONDS_PER_DAY))
+        recent_publication_score = np.bincount(authors, weights=1.0 / (1.0 + age_days / 30.0), minlength=users)
+        author_quality_score = np.sign(raw_quality) * np.log1p(np.abs(raw_quality))
+
+        score = (
+            tag_affinity
+            + similar_users_follow_score * 1.5
+            + author_quality_score * 2.0
+            + recent_publication_score * 1.2
+        )
+        mask = (topic_authors | followed_by_peers) & (published_count > 0)
+        mask[viewer] = False
+        mask[index.follows[viewer].indices] = False
+
+        ranked = sorted(np.flatnonzero(mask), key=lambda position: (-score[position], str(index.user_ids[position])))
+        result: list[RecommendationAuthorGraphResult] = []
+        for position in ranked[offset: offset + limit]:
+            signals = (
+                tag_affinity[position],
+                similar_users_follow_score[position],
+                author_quality_score[position],
+                recent_publication_score[position],
+            )
+            if signals[0] >= max(signals[1:]):
+                reason = "topic_author_affinity"
+            elif signals[1] >= max(signals[2:]):
+                reason = "similar_users_follow"
+            elif signals[2] >= signals[3]:
+                reason = "author_quality"
+            else:
+                reason = "recent_publication"
+            result.append(
+                RecommendationAuthorGraphResult(
+                    user_id=index.user_ids[position],
+                    score=float(score[position]),
+                    reason=reason,
+                )
+            )
+        return result
+
+
+def _binary(matrix: sparse.spmatrix) -> sparse.csr_matrix:
+    matrix = sparse.csr_matrix(matrix)
+    matrix.sum_duplicates()
+    matrix.data = (matrix.data != 0).astype(np.float64)
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def _positive(matrix: sparse.spmatrix) -> sparse.csr_matrix:
+    matrix = sparse.csr_matrix(matrix)
+    matrix.data = np.where(matrix.data > 0, matrix.data, 0.0)
+    matrix.eliminate_zeros()
+    return matrix
+
+
+def _row(matrix: sparse.csr_matrix, position: int) -> np.ndarray:
+    return matrix[position].toarray().ravel()
+
+
+def _column(value: tp.Any) -> np.ndarray:
+    if sparse.issparse(value):
+        value = value.toarray()
+    return np.asarray(value, dtype=np.float64).ravel()
+
+
+def _top(score: np.ndarray, mask: np.ndarray, limit: int) -> np.ndarray:
+    candidates = np.flatnonzero(mask)
+    if limit <= 0:
+        return candidates[:0]
+    if len(candidates) > limit:
+        candidates = candidates[np.argpartition(-score[candidates], limit - 1)[:limit]]
+    return candidates[np.argsort(-score[candidates], kind="stable")]
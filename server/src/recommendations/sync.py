@@ -2,13 +2,24 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import datetime
 import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import redis.asyncio as redis
 
 from src.common.database import async_session_maker
 from src.common.model_registry import import_all_models
 from src.config import settings
-from src.recommendations.graph_repository import RecommendationGraphRepository, create_neo4j_driver
+from src.recommendations.candidates import build_recommendation_candidate_store
+from src.recommendations.graph_repository import (
+    RecommendationGraphRepository,
+    create_neo4j_driver,
+    get_graph_query_recorder,
+)
 from src.recommendations.postgres_repository import RecommendationPostgresRepository
+from src.recommendations.result_cache import build_recommendation_result_cache
 from src.recommendations.sync_service import RecommendationGraphSyncService
 
 
@@ -19,15 +30,28 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "command",
-        choices=["full-rebuild", "incremental-sync"],
+        choices=["full-rebuild", "incremental-sync", "refresh-candidates", "reconcile-affinities"],
     )
     return parser
 
 
+@asynccontextmanager
+async def _redis_client() -> AsyncIterator[redis.Redis]:
+    """One Redis client per run, shared by the candidate store and result cache.
+
+    Each task runs in its own event loop, so the client is closed with it.
+    """
+    client = redis.from_url(settings.redis.url, decode_responses=True)
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
 async def run_full_rebuild() -> dict:
     import_all_models()
 
-    async with async_session_maker() as session:
+    async with async_session_maker() as session, _redis_client() as redis_client:
         driver = create_neo4j_driver()
         await _wait_for_neo4j(driver=driver, database=settings.neo4j.database)
         graph_repository = RecommendationGraphRepository(
@@ -38,6 +62,12 @@ async def run_full_rebuild() -> dict:
             service = RecommendationGraphSyncService(
                 postgres_repository=RecommendationPostgresRepository(session),
                 graph_repository=graph_repository,
+                candidate_store=build_recommendation_candidate_store(redis_client),
+                candidate_list_size=settings.recommendations.candidate_list_size,
+                candidate_refresh_concurrency=settings.recommendations.candidate_refresh_concurrency,
+                result_cache=build_recommendation_result_cache(redis_client),
+                rebuild_chunk_size=settings.recommendations.rebuild_chunk_size,
+                rebuild_write_concurrency=settings.recommendations.rebuild_write_concurrency,
             )
             return await service.full_rebuild()
         finally:
@@ -47,7 +77,7 @@ async def run_full_rebuild() -> dict:
 async def run_incremental_sync() -> dict:
     import_all_models()
 
-    async with async_session_maker() as session:
+    async with async_session_maker() as session, _redis_client() as redis_client:
         driver = create_neo4j_driver()
         await _wait_for_neo4j(driver=driver, database=settings.neo4j.database)
         graph_repository = RecommendationGraphRepository(
@@ -58,12 +88,64 @@ async def run_incremental_sync() -> dict:
             service = RecommendationGraphSyncService(
                 postgres_repository=RecommendationPostgresRepository(session),
                 graph_repository=graph_repository,
+                candidate_store=build_recommendation_candidate_store(redis_client),
+                candidate_list_size=settings.recommendations.candidate_list_size,
+                candidate_refresh_concurrency=settings.recommendations.candidate_refresh_concurrency,
+                result_cache=build_recommendation_result_cache(redis_client),
             )
             return await service.incremental_sync()
         finally:
             await graph_repository.close()
 
 
+async def run_candidate_refresh() -> dict:
+    import_all_models()
+
+    async with async_session_maker() as session, _redis_client() as redis_client:
+        driver = create_neo4j_driver()
+        await _wait_for_neo4j(driver=driver, database=settings.neo4j.database)
+        graph_repository = RecommendationGraphRepository(
+            driver=driver,
+            database=settings.neo4j.database,
+        )
+        try:
+            service = RecommendationGraphSyncService(
+                postgres_repository=RecommendationPostgresRepository(session),
+                graph_repository=graph_repository,
+                candidate_store=build_recommendation_candidate_store(redis_client),
+                candidate_list_size=settings.recommendations.candidate_list_size,
+                candidate_refresh_concurrency=settings.recommendations.candidate_refresh_concurrency,
+            )
+            return await service.refresh_active_user_candidates(
+                active_since=datetime.datetime.now(datetime.timezone.utc)
+                - datetime.timedelta(days=settings.recommendations.active_user_days),
+                limit=settings.recommendations.active_user_limit,
+            )
+        finally:
+            await graph_repository.close()
+
+
+async def run_affinity_reconciliation() -> dict:
+    import_all_models()
+
+    async with async_session_maker() as session:
+        driver = create_neo4j_driver()
+        await _wait_for_neo4j(driver=driver, database=settings.neo4j.database)
+        graph_repository = RecommendationGraphRepository(
+            driver=driver,
+            database=settings.neo4j.database,
+        )
+        try:
+            service = RecommendationGraphSyncService(
+                postgres_repository=RecommendationPostgresRepository(session),
+                graph_repository=graph_repository,
+                rebuild_chunk_size=settings.recommendations.rebuild_chunk_size,
+            )
+            return await service.reconcile_affinities()
+        finally:
+            await graph_repository.close()
+
+
 async def _wait_for_neo4j(*, driver, database: str, attempts: int = 30, delay_seconds: float = 1.0) -> None:  # type: ignore[no-untyped-def]
     last_error: Exception | None = None
     for _ in range(attempts):
@@ -79,15 +161,30 @@ async def _wait_for_neo4j(*, driver, database: str, attempts: int = 30, delay_se
         raise last_error
 
 
+def _print_report(result: dict) -> None:
+    report = {**result, "graph_queries": get_graph_query_recorder().snapshot()}
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
 async def run_cli_async(args: argparse.Namespace) -> int:
     if args.command == "full-rebuild":
         result = await run_full_rebuild()
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        _print_report(result)
         return 0
 
     if args.command == "incremental-sync":
         result = await run_incremental_sync()
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        _print_report(result)
+        return 0
+
+    if args.command == "refresh-candidates":
+        result = await run_candidate_refresh()
+        _print_report(result)
+        return 0
+
+    if args.command == "reconcile-affinities":
+        result = await run_affinity_reconciliation()
+        _print_report(result)
         return 0
 
     return 1
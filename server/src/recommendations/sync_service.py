@@ -1,24 +1,57 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
+import time
+import typing as tp
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from src.activity.enums import ActivityActionTypeEnum
 from src.content.enums import ReactionTypeEnum
+from src.recommendations.candidates import RecommendationCandidate, RecommendationCandidateStore
 from src.recommendations.enums import RecommendationSyncMode
-from src.recommendations.graph_repository import RecommendationGraphRepository
+from src.recommendations.graph_repository import EngagementGraphState, RecommendationGraphRepository
 from src.recommendations.postgres_repository import (
     ActivityEventGraphRow,
+    ContentCommentedGraphRow,
     ContentGraphRow,
+    ContentReactionGraphRow,
+    ContentTagGraphRow,
+    ContentViewedGraphRow,
     RecommendationPostgresRepository,
 )
-from src.recommendations.scoring import compute_content_quality_score
+from src.recommendations.result_cache import RecommendationResultCache, build_recommendation_result_version
+from src.recommendations.scoring import (
+    AUTHOR_FOLLOW_WEIGHT,
+    compute_author_affinity_contribution,
+    compute_content_quality_score,
+    compute_interest_contribution,
+)
 
 
 logger = logging.getLogger(__name__)
 
+T = tp.TypeVar("T")
+
+
+@dataclass(slots=True)
+class SyncPhaseReport:
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "seconds": round(self.seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
 
 @dataclass(slots=True)
 class SyncRunReport:
@@ -31,6 +64,9 @@ class SyncRunReport:
     views: int = 0
     comments: int = 0
     events: int = 0
+    candidate_users: int = 0
+    affinity_deltas: int = 0
+    phases: dict[str, SyncPhaseReport] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
         return {
@@ -43,6 +79,9 @@ class SyncRunReport:
             "views": self.views,
             "comments": self.comments,
             "events": self.events,
+            "candidate_users": self.candidate_users,
+            "affinity_deltas": self.affinity_deltas,
+            "phases": {name: phase.to_dict() for name, phase in self.phases.items()},
         }
 
 
@@ -53,71 +92,159 @@ class RecommendationGraphSyncService:
         postgres_repository: RecommendationPostgresRepository,
         graph_repository: RecommendationGraphRepository,
         incremental_batch_size: int = 2000,
+        candidate_store: RecommendationCandidateStore | None = None,
+        candidate_list_size: int = 500,
+        result_cache: RecommendationResultCache | None = None,
+        rebuild_chunk_size: int = 1000,
+        rebuild_write_concurrency: int = 4,
+        candidate_refresh_concurrency: int = 8,
+        clock: tp.Callable[[], float] = time.perf_counter,
     ) -> None:
         self._postgres_repository = postgres_repository
         self._graph_repository = graph_repository
         self._incremental_batch_size = incremental_batch_size
+        self._candidate_store = candidate_store
+        self._candidate_list_size = candidate_list_size
+        self._result_cache = result_cache
+        self._rebuild_chunk_size = rebuild_chunk_size
+        self._rebuild_write_concurrency = max(1, rebuild_write_concurrency)
+        self._candidate_refresh_concurrency = max(1, candidate_refresh_concurrency)
+        self._clock = clock
 
     async def full_rebuild(self) -> dict:
         report = SyncRunReport(mode=RecommendationSyncMode.FULL_REBUILD)
+        chunk_size = self._rebuild_chunk_size
 
         await self._graph_repository.clear_graph()
         await self._graph_repository.ensure_schema()
 
-        user_ids = await self._postgres_repository.get_all_user_ids()
-        await self._graph_repository.upsert_users(user_ids)
-        report.users = len(user_ids)
+        # The graph was just cleared, so each phase only adds nodes and edges; phases
+        # run in order because edges need both endpoints to exist.
+        report.users = await self._run_rebuild_phase(
+            report,
+            "users",
+            self._postgres_repository.iter_all_user_ids(chunk_size=chunk_size),
+            self._graph_repository.upsert_users,
+        )
+        report.subscriptions = await self._run_rebuild_phase(
+            report,
+            "subscriptions",
+            self._postgres_repository.iter_all_subscriptions(chunk_size=chunk_size),
+            self._graph_repository.upsert_subscriptions,
+        )
+        report.content = await self._run_rebuild_phase(
+            report,
+            "content",
+            self._postgres_repository.iter_all_content_nodes(chunk_size=chunk_size),
+            self._sync_content_nodes,
+        )
+        report.content_tags = await self._run_rebuild_phase(
+            report,
+            "content_tags",
+            self._postgres_repository.iter_all_content_tags(chunk_size=chunk_size),
+            self._write_content_tags,
+        )
+        report.reactions = await self._run_rebuild_phase(
+            report,
+            "reactions",
+            self._postgres_repository.iter_all_content_reactions(chunk_size=chunk_size),
+            self._write_reactions,
+        )
+        report.views = await self._run_rebuild_phase(
+            report,
+            "views",
+            self._postgres_repository.iter_all_content_views(chunk_size=chunk_size),
+            self._write_views,
+        )
+        report.comments = await self._run_rebuild_phase(
+            report,
+            "comments",
+            self._postgres_repository.iter_all_content_comments(chunk_size=chunk_size),
+            self._write_comments,
+        )
+
+        started = self._clock()
+        await self._graph_repository.recompute_interested_in()
+        await self._graph_repository.recompute_affinity_to_author()
+        await self._graph_repository.recompute_similar_to()
+        report.phases["recompute"] = SyncPhaseReport(rows=report.content, seconds=self._clock() - started)
 
-        subscriptions = await self._postgres_repository.get_all_subscriptions()
-        await self._graph_repository.upsert_subscriptions(subscriptions)
-        report.subscriptions = len(subscriptions)
+        latest_activity_cursor = await self._postgres_repository.get_latest_activity_cursor()
+        now = datetime.datetime.now(datetime.timezone.utc)
+        await self._save_sync_state(
+            last_event_at=latest_activity_cursor.created_at if latest_activity_cursor is not None else None,
+            last_event_id=latest_activity_cursor.activity_event_id if latest_activity_cursor is not None else None,
+            last_full_rebuild_at=now,
+        )
 
-        content_rows = await self._postgres_repository.get_all_content_nodes()
-        await self._sync_content_nodes(content_rows)
-        report.content = len(content_rows)
+        return report.to_dict()
 
-        content_tags = await self._postgres_repository.get_all_content_tags()
+    async def _run_rebuild_phase(
+        self,
+        report: SyncRunReport,
+        name: str,
+        chunks: tp.AsyncIterator[list[T]],
+        write: tp.Callable[[list[T]], tp.Coroutine[tp.Any, tp.Any, None]],
+    ) -> int:
+        """Write chunks as they stream in, with at most `rebuild_write_concurrency` in flight."""
+        started = self._clock()
+        rows = 0
+        pending: set[asyncio.Task[None]] = set()
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                while len(pending) >= self._rebuild_write_concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+                pending.add(asyncio.create_task(write(chunk)))
+                rows += len(chunk)
+            if pending:
+                done, pending = await asyncio.wait(pending)
+                for task in done:
+                    task.result()
+        except BaseException:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            raise
+
+        phase = SyncPhaseReport(rows=rows, seconds=self._clock() - started)
+        report.phases[name] = phase
+        logger.info(
+            "Recommendation rebuild phase %s: %d rows in %.2fs (%.0f rows/s)",
+            name,
+            phase.rows,
+            phase.seconds,
+            phase.rows_per_second,
+        )
+        return rows
+
+    async def _write_content_tags(self, rows: list[ContentTagGraphRow]) -> None:
         await self._graph_repository.replace_content_tags(
-            content_ids=[row.content_id for row in content_rows],
+            content_ids=[],
             tag_rows=[
                 {
                     "content_id": str(row.content_id),
                     "tag_id": str(row.tag_id),
                     "tag_slug": row.tag_slug,
                 }
-                for row in content_tags
+                for row in rows
             ],
         )
-        report.content_tags = len(content_tags)
 
-        reactions = await self._postgres_repository.get_all_content_reactions()
-        await self._graph_repository.clear_reactions()
-        await self._graph_repository.set_liked_edges(
-            rows=[
-                {
-                    "user_id": str(row.user_id),
-                    "content_id": str(row.content_id),
-                    "created_at": self._datetime_to_iso(row.created_at),
-                }
-                for row in reactions
-                if row.reaction_type == ReactionTypeEnum.LIKE
-            ]
-        )
-        await self._graph_repository.set_disliked_edges(
-            rows=[
-                {
-                    "user_id": str(row.user_id),
-                    "content_id": str(row.content_id),
-                    "created_at": self._datetime_to_iso(row.created_at),
-                }
-                for row in reactions
-                if row.reaction_type == ReactionTypeEnum.DISLIKE
-            ]
-        )
-        report.reactions = len(reactions)
-
-        views = await self._postgres_repository.get_all_content_views()
-        await self._graph_repository.clear_viewed_edges()
+    async def _write_reactions(self, rows: list[ContentReactionGraphRow]) -> None:
+        liked_rows = [self._reaction_to_graph_row(row) for row in rows if row.reaction_type == ReactionTypeEnum.LIKE]
+        disliked_rows = [
+            self._reaction_to_graph_row(row) for row in rows if row.reaction_type == ReactionTypeEnum.DISLIKE
+        ]
+        if liked_rows:
+            await self._graph_repository.set_liked_edges(rows=liked_rows)
+        if disliked_rows:
+            await self._graph_repository.set_disliked_edges(rows=disliked_rows)
+
+    async def _write_views(self, rows: list[ContentViewedGraphRow]) -> None:
         await self._graph_repository.set_viewed_edges(
             rows=[
                 {
@@ -127,13 +254,11 @@ class RecommendationGraphSyncService:
                     "progress_percent": row.progress_percent,
                     "last_seen_at": self._datetime_to_iso(row.last_seen_at),
                 }
-                for row in views
+                for row in rows
             ]
         )
-        report.views = len(views)
 
-        comments = await self._postgres_repository.get_all_content_comments()
-        await self._graph_repository.clear_commented_edges()
+    async def _write_comments(self, rows: list[ContentCommentedGraphRow]) -> None:
         await self._graph_repository.set_commented_edges(
             rows=[
                 {
@@ -142,24 +267,16 @@ class RecommendationGraphSyncService:
                     "comments_count": row.comments_count,
                     "last_commented_at": self._datetime_to_iso(row.last_commented_at),
                 }
-                for row in comments
+                for row in rows
             ]
         )
-        report.comments = len(comments)
-
-        await self._graph_repository.recompute_interested_in()
-        await self._graph_repository.recompute_affinity_to_author()
-        await self._graph_repository.recompute_similar_to()
-
-        latest_activity_cursor = await self._postgres_repository.get_latest_activity_cursor()
-        now = datetime.datetime.now(datetime.timezone.utc)
-        await self._graph_repository.upsert_sync_state(
-            last_event_at=latest_activity_cursor.created_at if latest_activity_cursor is not None else None,
-            last_event_id=latest_activity_cursor.activity_event_id if latest_activity_cursor is not None else None,
-            last_full_rebuild_at=now,
-        )
 
-        return report.to_dict()
+    def _reaction_to_graph_row(self, row: ContentReactionGraphRow) -> dict[str, str | None]:
+        return {
+            "user_id": str(row.user_id),
+            "content_id": str(row.content_id),
+            "created_at": self._datetime_to_iso(row.created_at),
+        }
 
     async def incremental_sync(self) -> dict:
         report = SyncRunReport(mode=RecommendationSyncMode.INCREMENTAL_SYNC)
@@ -172,6 +289,10 @@ class RecommendationGraphSyncService:
 
         touched_user_ids: set[uuid.UUID] = set()
         touched_content_ids: set[uuid.UUID] = set()
+        # Graph state of every pair touched by this run, as it was before the first
+        # write; INTERESTED_IN and AFFINITY_TO_AUTHOR only get the difference.
+        engagement_before: dict[tuple[uuid.UUID, uuid.UUID], EngagementGraphState] = {}
+        follows_before: dict[tuple[uuid.UUID, uuid.UUID], bool] = {}
 
         while True:
             events = await self._postgres_repository.get_activity_events_since(
@@ -194,6 +315,21 @@ class RecommendationGraphSyncService:
                 unfollowed_rows,
             ) = self._map_events_to_graph_updates(events)
 
+            new_engagement_pairs = [
+                pair
+                for pair in dict.fromkeys(
+                    (event.user_id, event.content_id) for event in events if event.content_id is not None
+                )
+                if pair not in engagement_before
+            ]
+            if new_engagement_pairs:
+                engagement_before.update(await self._graph_repository.get_engagement_states(new_engagement_pairs))
+            new_follow_pairs = [
+                pair for pair in dict.fromkeys(followed_rows + unfollowed_rows) if pair not in follows_before
+            ]
+            if new_follow_pairs:
+                follows_before.update(await self._graph_repository.get_follow_states(new_follow_pairs))
+
             if followed_rows:
                 await self._graph_repository.upsert_subscriptions(followed_rows)
             if unfollowed_rows:
@@ -263,21 +399,175 @@ class RecommendationGraphSyncService:
             )
             report.content_tags = len(tags)
 
-        if touched_user_ids:
-            await self._graph_repository.recompute_interested_in(list(touched_user_ids))
-            await self._graph_repository.recompute_affinity_to_author(list(touched_user_ids))
+        report.affinity_deltas = await self._apply_affinity_deltas(engagement_before, follows_before)
 
         if touched_content_ids:
             await self._graph_repository.recompute_similar_to(list(touched_content_ids))
 
-        await self._graph_repository.upsert_sync_state(
+        await self._save_sync_state(
             last_event_at=cursor_at,
             last_event_id=cursor_id,
             last_full_rebuild_at=(state.last_full_rebuild_at if state is not None else None),
         )
 
+        if touched_user_ids:
+            report.candidate_users = await self.refresh_candidates(list(touched_user_ids))
+
         return report.to_dict()
 
+    async def _save_sync_state(
+        self,
+        *,
+        last_event_at: datetime.datetime | None,
+        last_event_id: uuid.UUID | None,
+        last_full_rebuild_at: datetime.datetime | None,
+    ) -> None:
+        await self._graph_repository.upsert_sync_state(
+            last_event_at=last_event_at,
+            last_event_id=last_event_id,
+            last_full_rebuild_at=last_full_rebuild_at,
+        )
+        if self._result_cache is None:
+            return
+        # Cached similar-content and author results are keyed by this version, so
+        # moving it retires everything computed from the previous graph state.
+        try:
+            await self._result_cache.set_version(
+                build_recommendation_result_version(
+                    last_event_at=last_event_at,
+                    last_event_id=last_event_id,
+                    last_full_rebuild_at=last_full_rebuild_at,
+                )
+            )
+        except Exception:
+            logger.exception("Failed to publish recommendation result cache version")
+
+    async def _apply_affinity_deltas(
+        self,
+        engagement_before: dict[tuple[uuid.UUID, uuid.UUID], EngagementGraphState],
+        follows_before: dict[tuple[uuid.UUID, uuid.UUID], bool],
+    ) -> int:
+        """Shift INTERESTED_IN and AFFINITY_TO_AUTHOR by what changed for the touched pairs.
+
+        Runs after content and tag sync, so deltas land on the current tags and author.
+        Contributions of content whose tags changed stay on the old tags until the
+        next `reconcile_affinities` run.
+        """
+        engagement_after = (
+            await self._graph_repository.get_engagement_states(list(engagement_before)) if engagement_before else {}
+        )
+        follows_after = await self._graph_repository.get_follow_states(list(follows_before)) if follows_before else {}
+
+        interest_rows: list[dict[str, str | float | None]] = []
+        author_rows: list[dict[str, str | float | None]] = []
+        for (user_id, content_id), before in engagement_before.items():
+            after = engagement_after[(user_id, content_id)]
+            interest_delta = self._interest_contribution(after) - self._interest_contribution(before)
+            if interest_delta:
+                interest_rows.append({"user_id": str(user_id), "content_id": str(content_id), "delta": interest_delta})
+            author_delta = self._author_affinity_contribution(after) - self._author_affinity_contribution(before)
+            if author_delta:
+                author_rows.append(
+                    {"user_id": str(user_id), "content_id": str(content_id), "author_id": None, "delta": author_delta}
+                )
+        for (user_id, target_user_id), followed in follows_before.items():
+            if follows_after[(user_id, target_user_id)] == followed:
+                continue
+            author_rows.append(
+                {
+                    "user_id": str(user_id),
+                    "content_id": None,
+                    "author_id": str(target_user_id),
+                    "delta": -AUTHOR_FOLLOW_WEIGHT if followed else AUTHOR_FOLLOW_WEIGHT,
+                }
+            )
+
+        if interest_rows:
+            await self._graph_repository.apply_interest_deltas(interest_rows)
+        if author_rows:
+            await self._graph_repository.apply_author_affinity_deltas(author_rows)
+        return len(interest_rows) + len(author_rows)
+
+    async def reconcile_affinities(self) -> dict:
+        """Recompute INTERESTED_IN and AFFINITY_TO_AUTHOR from scratch, one user chunk at a time.
+
+        Incremental sync only applies deltas, so this periodically corrects drift
+        from tag edits, deleted content and anything else the deltas do not see.
+        """
+        users = 0
+        async for user_ids in self._postgres_repository.iter_all_user_ids(chunk_size=self._rebuild_chunk_size):
+            await self._graph_repository.recompute_interested_in(user_ids)
+            await self._graph_repository.recompute_affinity_to_author(user_ids)
+            users += len(user_ids)
+        return {"users": users}
+
+    @staticmethod
+    def _interest_contribution(state: EngagementGraphState) -> float:
+        return compute_interest_contribution(
+            liked=state.liked,
+            disliked=state.disliked,
+            views_count=state.views_count,
+            comments_count=state.comments_count,
+        )
+
+    @staticmethod
+    def _author_affinity_contribution(state: EngagementGraphState) -> float:
+        return compute_author_affinity_contribution(
+            liked=state.liked,
+            disliked=state.disliked,
+            views_count=state.views_count,
+            comments_count=state.comments_count,
+        )
+
+    async def refresh_active_user_candidates(self, *, active_since: datetime.datetime, limit: int) -> dict:
+        user_ids = await self._postgres_repository.get_active_user_ids(since=active_since, limit=limit)
+        return {"candidate_users": await self.refresh_candidates(user_ids)}
+
+    async def refresh_candidates(self, user_ids: list[uuid.UUID]) -> int:
+        """Rebuild the stored feed candidate list of each user; returns how many were written.
+
+        At most `candidate_refresh_concurrency` feed queries run at once.
+        """
+        candidate_store = self._candidate_store
+        if candidate_store is None:
+            return 0
+
+        semaphore = asyncio.Semaphore(self._candidate_refresh_concurrency)
+
+        async def refresh(user_id: uuid.UUID) -> bool:
+            async with semaphore:
+                return await self._refresh_user_candidates(candidate_store, user_id)
+
+        refreshed = await asyncio.gather(*(refresh(user_id) for user_id in user_ids))
+        return sum(refreshed)
+
+    async def _refresh_user_candidates(
+        self,
+        candidate_store: RecommendationCandidateStore,
+        user_id: uuid.UUID,
+    ) -> bool:
+        try:
+            rows = await self._graph_repository.get_recommendation_candidates(
+                viewer_id=user_id,
+                limit=self._candidate_list_size,
+            )
+            await candidate_store.replace(
+                user_id,
+                [
+                    RecommendationCandidate(
+                        content_id=row.content_id,
+                        content_type=row.content_type,
+                        base_score=row.base_score,
+                        published_at=row.published_at,
+                    )
+                    for row in rows
+                ],
+            )
+        except Exception:
+            logger.exception("Failed to refresh recommendation candidates for user %s", user_id)
+            return False
+        return True
+
     async def _sync_content_nodes(self, content_rows: list[ContentGraphRow]) -> None:
         await self._graph_repository.upsert_content_nodes(
             rows=[
@@ -4,7 +4,7 @@ import asyncio
 import logging
 
 from src.assets.celery_app import celery_app
-from src.recommendations.sync import run_incremental_sync
+from src.recommendations.sync import run_affinity_reconciliation, run_candidate_refresh, run_incremental_sync
 
 
 logger = logging.getLogger(__name__)
@@ -17,3 +17,21 @@ def recommendations_incremental_sync_task() -> dict:
     except Exception:
         logger.exception("recommendations incremental sync failed")
         raise
+
+
+@celery_app.task(name="recommendations.refresh_candidates")
+def recommendations_refresh_candidates_task() -> dict:
+    try:
+        return asyncio.run(run_candidate_refresh())
+    except Exception:
+        logger.exception("recommendations candidate refresh failed")
+        raise
+
+
+@celery_app.task(name="recommendations.reconcile_affinities")
+def recommendations_reconcile_affinities_task() -> dict:
+    try:
+        return asyncio.run(run_affinity_reconciliation())
+    except Exception:
+        logger.exception("recommendations affinity reconciliation failed")
+        raise
@@ -24,6 +24,7 @@ import src.posts.models  # noqa: F401
 from src.search.enums import SearchPopularPeriodEnum, SearchSortEnum
 import src.tags.models  # noqa: F401
 from src.users.models import UserModel
+from src.users.repository import populate_viewer_subscriptions
 from src.videos.enums import VideoProcessingStatusEnum
 from src.videos.models import VideoPlaybackDetailsModel
 
@@ -111,23 +112,7 @@ class SearchRepository:
         limit: int,
     ) -> tuple[list[SearchAuthorMatch], bool]:
         ts_query = func.websearch_to_tsquery(literal_column("'simple'"), query_text)
-        username = func.coalesce(UserModel.username, literal_column("''"))
-        display_name = func.coalesce(UserModel.display_name, literal_column("''"))
-        bio = func.coalesce(UserModel.bio, literal_column("''"))
-        vector = func.to_tsvector(
-            literal_column("'simple'"),
-            username + literal(" ") + display_name + literal(" ") + bio,
-        )
-        rank = func.ts_rank_cd(vector, ts_query)
-        score = func.greatest(
-            rank + (func.greatest(func.similarity(username, query_text), func.similarity(display_name, query_text)) * 0.25),
-            literal(0.0),
-        )
-        search_match = or_(
-            vector.op("@@")(ts_query),
-            username.bool_op("%")(query_text),
-            display_name.bool_op("%")(query_text),
-        )
+        score, search_match = self._author_match(ts_query=ts_query, query_text=query_text)
 
         stmt = (
             select(
@@ -188,23 +173,7 @@ class SearchRepository:
             .where(content_match)
         )
 
-        username = func.coalesce(UserModel.username, literal_column("''"))
-        display_name = func.coalesce(UserModel.display_name, literal_column("''"))
-        bio = func.coalesce(UserModel.bio, literal_column("''"))
-        author_vector = func.to_tsvector(
-            literal_column("'simple'"),
-            username + literal(" ") + display_name + literal(" ") + bio,
-        )
-        author_rank = func.ts_rank_cd(author_vector, ts_query)
-        author_score = func.greatest(
-            author_rank + (func.greatest(func.similarity(username, query_text), func.similarity(display_name, query_text)) * 0.25),
-            literal(0.0),
-        )
-        author_match = or_(
-            author_vector.op("@@")(ts_query),
-            username.bool_op("%")(query_text),
-            display_name.bool_op("%")(query_text),
-        )
+        author_score, author_match = self._author_match(ts_query=ts_query, query_text=query_text)
 
         author_select = (
             select(
@@ -410,39 +379,48 @@ class SearchRepository:
         result = await self._session.execute(query)
 
         if viewer_id is None:
-            items = list(result.scalars().unique().all())
-            for item in items:
+            models = list(result.scalars().unique().all())
+            for item in models:
                 item.my_reaction = None
                 item.is_owner = False
-            return {item.content_id: item for item in items}
+            return {item.content_id: item for item in models}
 
         items: dict[uuid.UUID, ContentModel] = {}
         for item, my_reaction in result.unique().all():
             item.my_reaction = my_reaction
             item.is_owner = item.author_id == viewer_id
             items[item.content_id] = item
+        await populate_viewer_subscriptions(
+            self._session,
+            users=[item.author for item in items.values()],
+            viewer_id=viewer_id,
+        )
         return items
 
-    async def get_users_by_ids(self, *, user_ids: list[uuid.UUID]) -> dict[uuid.UUID, UserModel]:
+    async def get_users_by_ids(
+        self,
+        *,
+        user_ids: list[uuid.UUID],
+        viewer_id: uuid.UUID | None = None,
+    ) -> dict[uuid.UUID, UserModel]:
         if not user_ids:
             return {}
 
         result = await self._session.execute(
             select(UserModel)
             .where(UserModel.user_id.in_(user_ids))
-            .options(selectinload(UserModel.subscribers))
             .options(
                 selectinload(UserModel.avatar_asset)
                 .selectinload(AssetModel.variants)
             )
         )
         users = list(result.scalars().all())
+        await populate_viewer_subscriptions(self._session, users=users, viewer_id=viewer_id)
         return {user.user_id: user for user in users}
 
     def _build_content_query(self, viewer_id: uuid.UUID | None):
         reaction_subquery = self._reaction_subquery(viewer_id=viewer_id)
         base_options = (
-            selectinload(ContentModel.author).selectinload(UserModel.subscribers),
             selectinload(ContentModel.author)
             .selectinload(UserModel.avatar_asset)
             .selectinload(AssetModel.variants),
@@ -507,6 +485,29 @@ class SearchRepository:
             ),
         ]
 
+    def _author_match(self, *, ts_query, query_text: str):  # type: ignore[no-untyped-def]
+        # Every predicate is on a bare column so the planner can combine
+        # ix_users_search_vector and the username/display_name trigram indexes.
+        # similarity() of a NULL display_name is NULL, which greatest() skips.
+        rank = func.ts_rank_cd(UserModel.search_vector, ts_query)
+        score = func.greatest(
+            rank
+            + (
+                func.greatest(
+                    func.similarity(UserModel.username, query_text),
+                    func.similarity(UserModel.display_name, query_text),
+                )
+                * 0.25
+            ),
+            literal(0.0),
+        )
+        search_match = or_(
+            UserModel.search_vector.op("@@")(ts_query),
+            UserModel.username.bool_op("%")(query_text),
+            UserModel.display_name.bool_op("%")(query_text),
+        )
+        return score, search_match
+
     def _apply_content_sort(self, stmt, *, sort: SearchSortEnum, score):  # type: ignore[no-untyped-def]
         sort_timestamp = func.coalesce(ContentModel.published_at, ContentModel.created_at)
         if sort == SearchSortEnum.NEWEST:
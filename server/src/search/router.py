@@ -7,7 +7,7 @@ from src.search.dependencies import get_search_service
 from src.search.enums import SearchContentTypeEnum, SearchPopularPeriodEnum, SearchSortEnum, SearchTypeEnum
 from src.search.schemas import SearchListGet
 from src.search.service import SearchService
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 
 router = APIRouter(
     prefix="/search",
@@ -22,7 +22,7 @@ async def search(
     sort: SearchSortEnum = SearchSortEnum.RELEVANCE,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     search_service: SearchService = Depends(get_search_service),
 ) -> SearchListGet:
     return await search_service.search(
@@ -41,7 +41,7 @@ async def search_popular(
     period: SearchPopularPeriodEnum = SearchPopularPeriodEnum.WEEK,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     search_service: SearchService = Depends(get_search_service),
 ) -> SearchListGet:
     return await search_service.search_popular(
@@ -58,7 +58,7 @@ async def search_popular_authors(
     period: SearchPopularPeriodEnum = SearchPopularPeriodEnum.WEEK,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     search_service: SearchService = Depends(get_search_service),
 ) -> SearchListGet:
     return await search_service.search_popular_authors(
@@ -44,6 +44,7 @@ class SearchService:
             )
             authors = await self._repository.get_users_by_ids(
                 user_ids=[match.author_id for match in author_matches],
+                viewer_id=viewer_id,
             )
             items = []
             for match in author_matches:
@@ -77,7 +78,7 @@ class SearchService:
                 content_ids=content_ids,
                 viewer_id=viewer_id,
             )
-            author_map = await self._repository.get_users_by_ids(user_ids=author_ids)
+            author_map = await self._repository.get_users_by_ids(user_ids=author_ids, viewer_id=viewer_id)
             items = []
             for match in mixed_matches:
                 if match.result_type == "content" and match.content_id is not None:
@@ -206,6 +207,7 @@ class SearchService:
         )
         authors = await self._repository.get_users_by_ids(
             user_ids=[match.author_id for match in author_matches],
+            viewer_id=viewer_id,
         )
 
         items = []
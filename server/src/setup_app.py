@@ -1,7 +1,12 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.assets.dependencies import get_asset_storage, get_image_renderer
 from src.config import settings
+from src.recommendations.dependencies import close_neo4j_driver
 
 # WebSockets
 from src.chats.sockets import socket_app as ws_app
@@ -59,8 +64,13 @@ from src.articles.exc_handlers import article_not_found_handler, invalid_article
 from src.articles.exceptions import ArticleNotFound, InvalidArticle
 from src.comments.exc_handlers import comment_not_found_handler, invalid_comment_handler
 from src.comments.exceptions import CommentNotFound, InvalidComment
-from src.content.exc_handlers import content_not_found_handler, invalid_content_action_handler
-from src.content.exceptions import ContentNotFound, InvalidContentAction
+from src.content.exc_handlers import (
+    content_not_found_handler,
+    invalid_content_action_handler,
+    invalid_content_cursor_handler,
+)
+from src.content.exceptions import ContentNotFound, InvalidContentAction, InvalidContentCursor
+from src.content.pagination import NEXT_CURSOR_HEADER
 from src.tags.exc_handlers import invalid_tag_handler
 from src.tags.exceptions import InvalidTag
 
@@ -87,6 +97,7 @@ from src.messages.exc_handlers import (
     cant_update_message_handler,
     invalid_message_assets_handler,
     invalid_message_reply_handler,
+    invalid_message_search_cursor_handler,
 )
 from src.messages.exceptions import (
     CantDeleteMessage,
@@ -94,6 +105,7 @@ from src.messages.exceptions import (
     CantUpdateMessage,
     InvalidMessageAssets,
     InvalidMessageReply,
+    InvalidMessageSearchCursor,
 )
 
 from src.s3.exc_handlers import (
@@ -164,6 +176,7 @@ def register_exception_handlers(app: FastAPI) -> None:
     app.add_exception_handler(InvalidComment, invalid_comment_handler)  # type: ignore
     app.add_exception_handler(ContentNotFound, content_not_found_handler)  # type: ignore
     app.add_exception_handler(InvalidContentAction, invalid_content_action_handler)  # type: ignore
+    app.add_exception_handler(InvalidContentCursor, invalid_content_cursor_handler)  # type: ignore
     app.add_exception_handler(InvalidTag, invalid_tag_handler)  # type: ignore
 
     app.add_exception_handler(ChatNotFound, chat_not_found_handler)  # type: ignore
@@ -175,6 +188,7 @@ def register_exception_handlers(app: FastAPI) -> None:
 
     app.add_exception_handler(CantDeleteMessage, cant_delete_message_handler)  # type: ignore
     app.add_exception_handler(CantReactToMessage, cant_react_to_message_handler)  # type: ignore
+    app.add_exception_handler(InvalidMessageSearchCursor, invalid_message_search_cursor_handler)  # type: ignore
     app.add_exception_handler(CantUpdateMessage, cant_update_message_handler)  # type: ignore
     app.add_exception_handler(InvalidMessageAssets, invalid_message_assets_handler)  # type: ignore
     app.add_exception_handler(InvalidMessageReply, invalid_message_reply_handler)  # type: ignore
@@ -197,9 +211,22 @@ def register_middleware(app: FastAPI) -> None:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
         allow_headers=["Content-Type", "Authorization", "Accept"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    asset_storage = get_asset_storage()
+    await asset_storage.open()
+    try:
+        yield
+    finally:
+        get_image_renderer().shutdown()
+        await asset_storage.close()
+        await close_neo4j_driver()
+
+
 def setup_app(app: FastAPI) -> None:
     register_routes(app)
     register_exception_handlers(app)
@@ -3,7 +3,7 @@ import typing as tp
 import uuid
 
 from sqlalchemy import JSON, DateTime, ForeignKey, Index, Text, text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.common.models import Base
@@ -31,6 +31,13 @@ class UserModel(Base):
             postgresql_using="gin",
             postgresql_ops={"username": "gin_trgm_ops"},
         ),
+        Index(
+            "users_display_name_trgm_idx",
+            "display_name",
+            postgresql_using="gin",
+            postgresql_ops={"display_name": "gin_trgm_ops"},
+        ),
+        Index("ix_users_search_vector", "search_vector", postgresql_using="gin"),
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
@@ -55,6 +62,12 @@ class UserModel(Base):
         server_default=text("'[]'::jsonb"),
     )
     hashed_password: Mapped[str]
+    # Maintained by the trg_users_search_vector_refresh trigger from username, display_name and bio.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        nullable=False,
+        server_default=text("''::tsvector"),
+    )
 
     subscribers_count: Mapped[int] = mapped_column(default=0)
 
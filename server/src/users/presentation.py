@@ -9,23 +9,16 @@ from sqlalchemy.exc import NoInspectionAvailable
 from sqlalchemy.orm.attributes import NO_VALUE
 
 from src.assets.enums import AssetVariantStatusEnum, AssetVariantTypeEnum
-from src.config import settings
 from src.users.schemas import UserAvatarCrop, UserAvatarGet, UserGet
 
 if TYPE_CHECKING:
     from src.assets.storage import AssetStorage
 
 
-_avatar_storage: AssetStorage | None = None
-
-
 def get_avatar_storage() -> AssetStorage:
-    global _avatar_storage
-    if _avatar_storage is None:
-        from src.assets.storage import AssetStorage
+    from src.assets.dependencies import get_asset_storage
 
-        _avatar_storage = AssetStorage(settings.storage)
-    return _avatar_storage
+    return get_asset_storage()
 
 
 async def build_user_get(
@@ -33,6 +26,7 @@ async def build_user_get(
     *,
     viewer_id: uuid.UUID | None = None,
     storage: AssetStorage | None = None,
+    subscribed_ids: tp.Container[uuid.UUID] | None = None,
 ) -> UserGet:
     return UserGet(
         user_id=user.user_id,
@@ -44,12 +38,10 @@ async def build_user_get(
         links=getattr(user, "links", []) or [],
         subscribers_count=user.subscribers_count,
         is_admin=user.is_admin,
-        is_subscribed=(
-            viewer_id is not None
-            and viewer_id in [
-                subscriber.user_id
-                for subscriber in _loaded_relationship_or_default(user, "subscribers", [])
-            ]
+        is_subscribed=_resolve_is_subscribed(
+            user,
+            viewer_id=viewer_id,
+            subscribed_ids=subscribed_ids,
         ),
     )
 
@@ -59,9 +51,15 @@ async def build_user_get_many(
     *,
     viewer_id: uuid.UUID | None = None,
     storage: AssetStorage | None = None,
+    subscribed_ids: tp.Container[uuid.UUID] | None = None,
 ) -> list[UserGet]:
     return [
-        await build_user_get(user, viewer_id=viewer_id, storage=storage)
+        await build_user_get(
+            user,
+            viewer_id=viewer_id,
+            storage=storage,
+            subscribed_ids=subscribed_ids,
+        )
         for user in users
     ]
 
@@ -104,6 +102,28 @@ async def build_user_avatar_get(
     )
 
 
+def _resolve_is_subscribed(
+    user: tp.Any,
+    *,
+    viewer_id: uuid.UUID | None,
+    subscribed_ids: tp.Container[uuid.UUID] | None,
+) -> bool:
+    if viewer_id is None:
+        return False
+    if subscribed_ids is not None:
+        return user.user_id in subscribed_ids
+
+    # Repositories annotate authors via `populate_viewer_subscriptions`;
+    # the subscribers relationship is only consulted when it is already loaded.
+    is_subscribed = getattr(user, "is_subscribed", None)
+    if is_subscribed is not None:
+        return bool(is_subscribed)
+    return viewer_id in [
+        subscriber.user_id
+        for subscriber in _loaded_relationship_or_default(user, "subscribers", [])
+    ]
+
+
 def _loaded_relationship_or_default(
     instance: tp.Any,
     name: str,
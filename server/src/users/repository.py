@@ -1,7 +1,7 @@
 import typing as tp
 import uuid
 
-from sqlalchemy import delete, desc, func, insert, or_, select, update
+from sqlalchemy import Row, delete, desc, func, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -9,6 +9,46 @@ from src.assets.models import AssetModel
 from src.users.models import SubscriptionModel, UserModel
 
 
+async def get_subscribed_ids(
+    session: AsyncSession,
+    *,
+    subscriber_id: uuid.UUID,
+    user_ids: tp.Iterable[uuid.UUID],
+) -> set[uuid.UUID]:
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return set()
+
+    result = await session.execute(
+        select(SubscriptionModel.subscribed_id)
+        .where(SubscriptionModel.subscriber_id == subscriber_id)
+        .where(SubscriptionModel.subscribed_id.in_(user_ids))
+    )
+    return set(result.scalars().all())
+
+
+async def populate_viewer_subscriptions(
+    session: AsyncSession,
+    *,
+    users: tp.Iterable[UserModel | None],
+    viewer_id: uuid.UUID | None,
+) -> None:
+    """Annotate users with `is_subscribed` for the viewer using a single lookup per page."""
+    users_by_id = {user.user_id: user for user in users if user is not None}
+    if not users_by_id:
+        return
+
+    subscribed_ids: set[uuid.UUID] = set()
+    if viewer_id is not None:
+        subscribed_ids = await get_subscribed_ids(
+            session,
+            subscriber_id=viewer_id,
+            user_ids=users_by_id,
+        )
+    for user_id, user in users_by_id.items():
+        setattr(user, "is_subscribed", user_id in subscribed_ids)
+
+
 class UserRepository:
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -34,6 +74,17 @@ class UserRepository:
         result = await self._session.execute(query)
         return result.scalar_one()
 
+    async def get_principal(
+        self,
+        *,
+        user_id: uuid.UUID,
+    ) -> Row[tuple[uuid.UUID, str, bool]]:
+        result = await self._session.execute(
+            select(UserModel.user_id, UserModel.username, UserModel.is_admin)
+            .where(UserModel.user_id == user_id)
+        )
+        return result.one()
+
     async def get_many_by_ids(
         self,
         *,
@@ -172,15 +223,16 @@ class UserRepository:
         subscriber_id: uuid.UUID,
     ) -> bool:
         user = await self.get_single(user_id=user_id)
-        subscriber = await self.get_single(user_id=subscriber_id)
+        await self.get_single(user_id=subscriber_id)
 
-        if subscriber not in user.subscribers:
-            user.subscribers.append(subscriber)
-            user.subscribers_count += 1
+        if await self._is_subscribed(user_id=user_id, subscriber_id=subscriber_id):
+            return False
 
-            await self._session.commit()
-            return True
-        return False
+        self._session.add(SubscriptionModel(subscriber_id=subscriber_id, subscribed_id=user_id))
+        user.subscribers_count += 1
+
+        await self._session.commit()
+        return True
 
     async def unsubscribe(
         self,
@@ -188,14 +240,32 @@ class UserRepository:
         subscriber_id: uuid.UUID,
     ) -> bool:
         user = await self.get_single(user_id=user_id)
-        subscriber = await self.get_single(user_id=subscriber_id)
+        await self.get_single(user_id=subscriber_id)
 
-        user.subscribers.remove(subscriber)
+        result = await self._session.execute(
+            delete(SubscriptionModel)
+            .where(SubscriptionModel.subscriber_id == subscriber_id)
+            .where(SubscriptionModel.subscribed_id == user_id)
+        )
+        if result.rowcount == 0:
+            raise ValueError("Subscription not found")
         user.subscribers_count -= 1
 
         await self._session.commit()
         return True
 
+    async def get_subscribed_ids(
+        self,
+        *,
+        subscriber_id: uuid.UUID,
+        user_ids: tp.Iterable[uuid.UUID],
+    ) -> set[uuid.UUID]:
+        return await get_subscribed_ids(
+            self._session,
+            subscriber_id=subscriber_id,
+            user_ids=user_ids,
+        )
+
     async def get_subscriptions(
         self,
         user_id: uuid.UUID,
@@ -217,10 +287,20 @@ class UserRepository:
     def _user_query(self):
         return (
             select(UserModel)
-            .options(selectinload(UserModel.subscribed))
-            .options(selectinload(UserModel.subscribers))
             .options(
                 selectinload(UserModel.avatar_asset)
                 .selectinload(AssetModel.variants)
             )
         )
+
+    async def _is_subscribed(
+        self,
+        *,
+        user_id: uuid.UUID,
+        subscriber_id: uuid.UUID,
+    ) -> bool:
+        subscribed_ids = await self.get_subscribed_ids(
+            subscriber_id=subscriber_id,
+            user_ids=[user_id],
+        )
+        return user_id in subscribed_ids
@@ -3,7 +3,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
 
-from src.auth.dependencies import get_current_optional_user, get_current_user
+from src.auth.dependencies import get_current_optional_user, get_current_user, get_current_user_profile
 from src.common.schemas import Status
 from src.users.dependencies import get_user_service
 from src.users.enums import UserOrder
@@ -12,6 +12,7 @@ from src.users.schemas import (
     UserCreate,
     UserGet,
     UserPasswordUpdate,
+    UserPrincipal,
     UserProfileUpdate,
     UserUpdate,
 )
@@ -33,7 +34,7 @@ async def create_user(
 
 @router.get("/me")
 async def get_current_user_info(
-    user: UserGet = Depends(get_current_user),
+    user: UserGet = Depends(get_current_user_profile),
 ) -> UserGet:
     return user
 
@@ -44,7 +45,7 @@ async def get_users(
     desc: bool = False,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=0, lt=1000),
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     user_service: UserService = Depends(get_user_service),
 ) -> list[UserGet]:
     return await user_service.get_users(
@@ -61,7 +62,7 @@ async def search_users(
     query: Annotated[str, Query(max_length=50)],
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=0, lt=1000),
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     user_service: UserService = Depends(get_user_service),
 ) -> list[UserGet]:
     return await user_service.search_users(
@@ -75,7 +76,7 @@ async def search_users(
 @router.get("/")
 async def get_user_by_id(
     user_id: UUID,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     user_service: UserService = Depends(get_user_service),
 ) -> UserGet:
     return await user_service.get_user(user_id=user_id, curr_user=user)
@@ -84,7 +85,7 @@ async def get_user_by_id(
 @router.put("/me/profile")
 async def update_profile(
     data: UserProfileUpdate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> UserGet:
     return await user_service.update_profile(user_id=user.user_id, data=data)
@@ -97,7 +98,7 @@ async def update_profile(
 )
 async def update_user_legacy(
     data: UserUpdate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> UserGet:
     return await user_service.update_profile(
@@ -112,7 +113,7 @@ async def update_user_legacy(
 )
 async def update_password(
     data: UserPasswordUpdate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> Status:
     await user_service.change_password(user_id=user.user_id, data=data)
@@ -121,7 +122,7 @@ async def update_password(
 
 @router.delete("/")
 async def delete_user(
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> Status:
     await user_service.delete_user(user_id=user.user_id)
@@ -131,7 +132,7 @@ async def delete_user(
 @router.post("/subscribe")
 async def subscribe_to_user(
     user_id: UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> Status:
     await user_service.subscribe(user_id=user_id, subscriber_id=user.user_id)
@@ -141,7 +142,7 @@ async def subscribe_to_user(
 @router.delete("/unsubscribe")
 async def unsubscribe_from_user(
     user_id: UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> Status:
     await user_service.unsubscribe(user_id=user_id, subscriber_id=user.user_id)
@@ -153,7 +154,7 @@ async def get_subscriptions(
     user_id: UUID,
     offset: int = 0,
     limit: int = 100,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     user_service: UserService = Depends(get_user_service),
 ) -> list[UserGet]:
     return await user_service.get_subscriptions(
@@ -167,7 +168,7 @@ async def get_subscriptions(
 @router.put("/me/avatar")
 async def update_avatar(
     data: UserAvatarUpdate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> UserGet:
     return await user_service.update_avatar(user_id=user.user_id, data=data)
@@ -175,7 +176,7 @@ async def update_avatar(
 
 @router.delete("/me/avatar")
 async def delete_avatar(
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     user_service: UserService = Depends(get_user_service),
 ) -> UserGet:
     return await user_service.delete_avatar(user_id=user.user_id)
@@ -184,7 +185,7 @@ async def delete_avatar(
 @router.get("/{username}")
 async def get_user_by_username(
     username: str,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     user_service: UserService = Depends(get_user_service),
 ) -> UserGet:
     return await user_service.get_user(username=username, curr_user=user)
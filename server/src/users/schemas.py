@@ -55,6 +55,12 @@ class UserGet(BaseSchema):
     is_subscribed: bool | None = None
 
 
+class UserPrincipal(BaseSchema):
+    user_id: uuid.UUID
+    username: Username
+    is_admin: bool
+
+
 class UserGetWithPassword(BaseSchema):
     user_id: uuid.UUID
     username: Username
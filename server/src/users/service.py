@@ -8,6 +8,7 @@ from sqlalchemy.exc import IntegrityError, NoResultFound
 
 from src.assets.service import AssetService
 from src.assets.storage import AssetStorage
+from src.auth.principal import principal_cache
 from src.auth.utils import validate_password
 from src.s3.exceptions import CantDeleteFileFromStorage
 from src.users.enums import UserOrder
@@ -27,6 +28,7 @@ from src.users.schemas import (
     UserCreate,
     UserGet,
     UserGetWithPassword,
+    UserPrincipal,
     UserAvatarUpdate,
     UserPasswordUpdate,
     UserProfileUpdate,
@@ -81,7 +83,7 @@ class UserService:
 
     async def get_user(
         self,
-        curr_user: UserGet | None = None,
+        curr_user: UserPrincipal | None = None,
         include_password: bool = False,
         **filters,
     ) -> UserGet | UserGetWithPassword:
@@ -100,15 +102,29 @@ class UserService:
             user,
             viewer_id=curr_user.user_id if curr_user else None,
             storage=self._avatar_storage,
+            subscribed_ids=await self._get_viewer_subscribed_ids([user], curr_user=curr_user),
         )
 
+    async def get_user_principal(
+        self,
+        user_id: uuid.UUID,
+    ) -> UserPrincipal:
+        """Get the minimal user record used to authorize requests."""
+
+        try:
+            row = await self._repository.get_principal(user_id=user_id)
+        except NoResultFound as exc:
+            raise UserNotFound(f"User with id {user_id} not found") from exc
+
+        return UserPrincipal.model_validate(row)
+
     async def get_users(
         self,
         order: UserOrder,
         desc: bool,
         offset: int,
         limit: int,
-        curr_user: UserGet | None = None,
+        curr_user: UserPrincipal | None = None,
     ) -> list[UserGet]:
         """Get users with pagination and sorting."""
 
@@ -123,6 +139,7 @@ class UserService:
             users,
             viewer_id=curr_user.user_id if curr_user else None,
             storage=self._avatar_storage,
+            subscribed_ids=await self._get_viewer_subscribed_ids(users, curr_user=curr_user),
         )
 
     async def search_users(
@@ -130,7 +147,7 @@ class UserService:
         query: str,
         offset: int,
         limit: int,
-        curr_user: UserGet | None = None,
+        curr_user: UserPrincipal | None = None,
     ) -> list[UserGet]:
         """Search users with pagination and sorting."""
 
@@ -144,6 +161,7 @@ class UserService:
             users,
             viewer_id=curr_user.user_id if curr_user else None,
             storage=self._avatar_storage,
+            subscribed_ids=await self._get_viewer_subscribed_ids(users, curr_user=curr_user),
         )
 
     async def update_user(
@@ -181,6 +199,7 @@ class UserService:
                 data=payload,
                 user_id=user_id,
             )
+            principal_cache.invalidate(user_id)
             return await build_user_get(user, storage=self._avatar_storage)
 
         except IntegrityError as exc:
@@ -221,6 +240,7 @@ class UserService:
             raise CantDeleteFileFromStorage("Failed to delete file from S3")
 
         await self._repository.delete(user_id=user_id)
+        principal_cache.invalidate(user_id)
 
     async def subscribe(
         self,
@@ -275,7 +295,7 @@ class UserService:
     async def get_subscriptions(
         self,
         user_id: uuid.UUID,
-        curr_user: UserGet | None = None,
+        curr_user: UserPrincipal | None = None,
         offset: int = 0,
         limit: int = 100,
     ) -> list[UserGet]:
@@ -291,6 +311,20 @@ class UserService:
             users,
             viewer_id=curr_user.user_id if curr_user else None,
             storage=self._avatar_storage,
+            subscribed_ids=await self._get_viewer_subscribed_ids(users, curr_user=curr_user),
+        )
+
+    async def _get_viewer_subscribed_ids(
+        self,
+        users: list,
+        *,
+        curr_user: UserPrincipal | None,
+    ) -> set[uuid.UUID]:
+        if curr_user is None:
+            return set()
+        return await self._repository.get_subscribed_ids(
+            subscriber_id=curr_user.user_id,
+            user_ids=[user.user_id for user in users],
         )
 
     async def _delete_all_files_from_storage(
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import math
+import typing as tp
+from urllib.parse import urlencode
+
+from src.assets.enums import AssetVariantStatusEnum, AssetVariantTypeEnum
+from src.assets.storage import AssetStorage
+
+HLS_MIME_TYPE = "application/vnd.apple.mpegurl"
+HLS_MASTER_PLAYLIST = "master.m3u8"
+# Extra lifetime for playlist tokens and segment URLs beyond the video's duration,
+# covering pauses, seeking back and slow starts.
+HLS_URL_TTL_SLACK_SECONDS = 30 * 60
+
+HLS_VARIANTS = (
+    AssetVariantTypeEnum.VIDEO_1080P,
+    AssetVariantTypeEnum.VIDEO_720P,
+    AssetVariantTypeEnum.VIDEO_480P,
+    AssetVariantTypeEnum.VIDEO_360P,
+)
+
+
+def hls_renditions(asset: tp.Any | None) -> list[tuple[str, tp.Any]]:
+    """Ready renditions that were packaged as HLS, highest quality first."""
+    if asset is None:
+        return []
+    renditions: list[tuple[str, tp.Any]] = []
+    for variant_type in HLS_VARIANTS:
+        for variant in getattr(asset, "variants", []):
+            metadata = getattr(variant, "variant_metadata", None) or {}
+            if (
+                getattr(variant, "asset_variant_type", None) == variant_type
+                and getattr(variant, "status", None) == AssetVariantStatusEnum.READY
+                and metadata.get("hls")
+            ):
+                renditions.append((metadata.get("quality") or variant_type.value, variant))
+                break
+    return renditions
+
+
+def hls_url_ttl_seconds(asset: tp.Any | None) -> int:
+    """How long playlist tokens and segment URLs must stay valid to play the whole video."""
+    duration = max(
+        (_duration_seconds(variant.variant_metadata["hls"]) for _, variant in hls_renditions(asset)),
+        default=0.0,
+    )
+    return math.ceil(duration) + HLS_URL_TTL_SLACK_SECONDS
+
+
+def playback_query(playback_token: str) -> str:
+    return urlencode({"token": playback_token})
+
+
+def render_master_playlist(asset: tp.Any | None, *, playback_token: str) -> str | None:
+    renditions = hls_renditions(asset)
+    if not renditions:
+        return None
+
+    lines = ["#EXTM3U", "#EXT-X-VERSION:7", "#EXT-X-INDEPENDENT-SEGMENTS"]
+    for quality, variant in renditions:
+        hls = variant.variant_metadata["hls"]
+        attributes = [f"BANDWIDTH={_peak_bandwidth(hls, fallback=variant.bitrate)}"]
+        if variant.bitrate:
+            attributes.append(f"AVERAGE-BANDWIDTH={variant.bitrate}")
+        if variant.width and variant.height:
+            attributes.append(f"RESOLUTION={variant.width}x{variant.height}")
+        lines.append(f"#EXT-X-STREAM-INF:{','.join(attributes)}")
+        lines.append(f"{quality}.m3u8?{playback_query(playback_token)}")
+    return "\n".join(lines) + "\n"
+
+
+async def render_media_playlist(
+    asset: tp.Any | None,
+    *,
+    quality: str,
+    storage: AssetStorage,
+) -> str | None:
+    variant = next((variant for label, variant in hls_renditions(asset) if label == quality), None)
+    if variant is None:
+        return None
+
+    hls = variant.variant_metadata["hls"]
+    # Players fetch segments for as long as the video plays, so the URL is signed for
+    # the whole duration instead of reusing a cached one that may be about to expire.
+    url = await storage.generate_presigned_get(
+        bucket=variant.storage_bucket,
+        key=hls["key"],
+        expires_in_seconds=math.ceil(_duration_seconds(hls)) + HLS_URL_TTL_SLACK_SECONDS,
+    )
+    map_length, map_offset = hls["map"]
+    lines = [
+        "#EXTM3U",
+        "#EXT-X-VERSION:7",
+        f"#EXT-X-TARGETDURATION:{hls['target_duration']}",
+        "#EXT-X-MEDIA-SEQUENCE:0",
+        "#EXT-X-PLAYLIST-TYPE:VOD",
+        "#EXT-X-INDEPENDENT-SEGMENTS",
+        f'#EXT-X-MAP:URI="{url}",BYTERANGE="{map_length}@{map_offset}"',
+    ]
+    for duration, length, offset in hls["segments"]:
+        lines.append(f"#EXTINF:{duration:.6f},")
+        lines.append(f"#EXT-X-BYTERANGE:{length}@{offset}")
+        lines.append(url)
+    lines.append("#EXT-X-ENDLIST")
+    return "\n".join(lines) + "\n"
+
+
+def _peak_bandwidth(hls: dict[str, tp.Any], *, fallback: int | None) -> int:
+    peak = max(
+        (length * 8 / duration for duration, length, _ in hls["segments"] if duration > 0),
+        default=0,
+    )
+    return math.ceil(peak) or fallback or 1
+
+
+def _duration_seconds(hls: dict[str, tp.Any]) -> float:
+    return sum(duration for duration, _, _ in hls["segments"])
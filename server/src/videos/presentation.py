@@ -6,8 +6,18 @@ import uuid
 from src.assets.enums import AssetTypeEnum, AssetVariantStatusEnum, AssetVariantTypeEnum, AttachmentTypeEnum
 from src.assets.schemas import AssetVariantGet
 from src.assets.storage import AssetStorage
+from src.auth.utils import create_playback_token
 from src.users.presentation import build_user_get
 from src.videos.enums import VideoProcessingStatusEnum
+from src.videos.hls import (
+    HLS_MASTER_PLAYLIST,
+    HLS_MIME_TYPE,
+    hls_renditions,
+    hls_url_ttl_seconds,
+    playback_query,
+    render_master_playlist,
+    render_media_playlist,
+)
 from src.videos.schemas import VideoAssetGet, VideoCardGet, VideoEditorGet, VideoGet, VideoPlaybackSourceGet
 
 
@@ -89,13 +99,21 @@ async def build_video_get(
     source_link = _find_link(video, AttachmentTypeEnum.VIDEO_SOURCE)
     source_asset = await build_video_asset_get(source_link, storage=storage) if source_link is not None else None
     playback_sources = []
+    streaming_sources = []
     if include_playback_sources and source_link is not None:
         playback_sources = await build_playback_sources(source_link, storage=storage)
+        streaming_sources = build_streaming_sources(
+            source_link,
+            base_path=f"/videos/{video.content_id}/playback",
+            content_id=video.content_id,
+            viewer_id=viewer_id,
+        )
 
     return VideoGet(
         **card.model_dump(),
         source_asset=source_asset,
         playback_sources=playback_sources,
+        streaming_sources=streaming_sources,
         chapters=video.video_details.chapters if video.video_details is not None else [],
         publish_requested_at=(
             video.video_details.publish_requested_at if video.video_details is not None else None
@@ -226,6 +244,50 @@ async def build_playback_sources(
     return generated + originals
 
 
+def build_streaming_sources(
+    link: tp.Any,
+    *,
+    base_path: str,
+    content_id: uuid.UUID,
+    viewer_id: uuid.UUID | None,
+) -> list[VideoPlaybackSourceGet]:
+    asset = getattr(link, "asset", None)
+    renditions = hls_renditions(asset)
+    if not renditions:
+        return []
+    _, top_variant = renditions[0]
+    playback_token = create_playback_token(
+        content_id=content_id,
+        viewer_id=viewer_id,
+        expire_seconds=hls_url_ttl_seconds(asset),
+    )
+    return [
+        VideoPlaybackSourceGet(
+            id="hls",
+            label="Auto",
+            src=f"{base_path}/{HLS_MASTER_PLAYLIST}?{playback_query(playback_token)}",
+            mimeType=HLS_MIME_TYPE,
+            width=top_variant.width,
+            height=top_variant.height,
+        )
+    ]
+
+
+async def build_hls_playlist(
+    content: tp.Any,
+    *,
+    quality: str | None,
+    storage: AssetStorage,
+    playback_token: str,
+) -> str | None:
+    """Master playlist when `quality` is None, otherwise that rendition's media playlist."""
+    source_link = _find_link(content, AttachmentTypeEnum.VIDEO_SOURCE)
+    asset = getattr(source_link, "asset", None)
+    if quality is None:
+        return render_master_playlist(asset, playback_token=playback_token)
+    return await render_media_playlist(asset, quality=quality, storage=storage)
+
+
 def _find_link(video: tp.Any, attachment_type: AttachmentTypeEnum) -> tp.Any | None:
     return next(
         (
@@ -14,6 +14,7 @@ from src.content.enums import ContentStatusEnum, ContentTypeEnum, ContentVisibil
 from src.content.models import ContentModel, ContentReactionModel, ContentViewSessionModel
 from src.content.repository import ContentReactionRemoveResult, ContentReactionSetResult
 from src.users.models import UserModel
+from src.users.repository import populate_viewer_subscriptions
 from src.videos.enums import VideoOrder, VideoProcessingStatusEnum, VideoProfileFilter
 from src.videos.models import VideoDetailsModel, VideoPlaybackDetailsModel
 
@@ -106,7 +107,7 @@ class VideoRepository:
     ) -> ContentModel | None:
         stmt = self._build_video_query(viewer_id=viewer_id).where(ContentModel.content_id == content_id)
         result = await self._session.execute(stmt)
-        return self._one_or_none(result, viewer_id=viewer_id)
+        return await self._one_or_none(result, viewer_id=viewer_id)
 
     async def get_feed(
         self,
@@ -129,7 +130,7 @@ class VideoRepository:
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
 
     async def get_author_videos(
         self,
@@ -178,7 +179,7 @@ class VideoRepository:
             .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return self._many(result, viewer_id=viewer_id)
+        return await self._many(result, viewer_id=viewer_id)
 
     async def update_video(
         self,
@@ -533,7 +534,6 @@ class VideoRepository:
     def _build_video_query(self, viewer_id: uuid.UUID | None):
         reaction_subquery = self._reaction_subquery(viewer_id=viewer_id)
         base_options = (
-            selectinload(ContentModel.author).selectinload(UserModel.subscribers),
             selectinload(ContentModel.author)
             .selectinload(UserModel.avatar_asset)
             .selectinload(AssetModel.variants),
@@ -566,7 +566,7 @@ class VideoRepository:
             .subquery()
         )
 
-    def _many(self, result, viewer_id: uuid.UUID | None) -> list[ContentModel]:  # type: ignore[no-untyped-def]
+    async def _many(self, result, viewer_id: uuid.UUID | None) -> list[ContentModel]:  # type: ignore[no-untyped-def]
         if viewer_id is None:
             videos = list(result.scalars().unique().all())
             for video in videos:
@@ -578,9 +578,14 @@ class VideoRepository:
             video.my_reaction = my_reaction
             video.is_owner = video.author_id == viewer_id
             videos.append(video)
+        await populate_viewer_subscriptions(
+            self._session,
+            users=[video.author for video in videos],
+            viewer_id=viewer_id,
+        )
         return videos
 
-    def _one_or_none(self, result, viewer_id: uuid.UUID | None) -> ContentModel | None:  # type: ignore[no-untyped-def]
+    async def _one_or_none(self, result, viewer_id: uuid.UUID | None) -> ContentModel | None:  # type: ignore[no-untyped-def]
         if viewer_id is None:
             video = result.scalar_one_or_none()
             if video is not None:
@@ -593,6 +598,7 @@ class VideoRepository:
         video, my_reaction = row
         video.my_reaction = my_reaction
         video.is_owner = video.author_id == viewer_id
+        await populate_viewer_subscriptions(self._session, users=[video.author], viewer_id=viewer_id)
         return video
 
     def _order_by_clause(self, order: VideoOrder, order_desc: bool):
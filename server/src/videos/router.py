@@ -1,13 +1,15 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
-from src.auth.dependencies import get_current_optional_user, get_current_user
+from src.auth.dependencies import get_current_optional_user, get_current_user, get_playback_grant
+from src.auth.schemas import PlaybackGrant
 from src.common.schemas import Status
 from src.content.dependencies import get_content_service
 from src.content.enums import ReactionTypeEnum
 from src.content.service import ContentService
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
+from src.videos.hls import HLS_MIME_TYPE
 from src.videos.dependencies import get_video_service
 from src.videos.enums import VideoOrder, VideoProfileFilter
 from src.videos.schemas import VideoCardGet, VideoCreate, VideoEditorGet, VideoGet, VideoRating, VideoUpdate
@@ -22,7 +24,7 @@ router = APIRouter(
 @router.post("/")
 async def create_video(
     data: VideoCreate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     video_service: VideoService = Depends(get_video_service),
 ) -> VideoGet:
     return await video_service.create_video(user=user, data=data)
@@ -36,7 +38,7 @@ async def get_videos(
     limit: int = Query(default=100, ge=0, lt=1000),
     user_id: uuid.UUID | None = None,
     profile_filter: VideoProfileFilter = VideoProfileFilter.PUBLIC,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     video_service: VideoService = Depends(get_video_service),
 ) -> list[VideoCardGet]:
     return await video_service.get_videos(
@@ -50,10 +52,31 @@ async def get_videos(
     )
 
 
+@router.get("/{video_id}/playback/master.m3u8")
+async def get_video_master_playlist(
+    video_id: uuid.UUID,
+    grant: PlaybackGrant = Depends(get_playback_grant),
+    video_service: VideoService = Depends(get_video_service),
+) -> Response:
+    playlist = await video_service.get_hls_playlist(video_id=video_id, grant=grant)
+    return Response(content=playlist, media_type=HLS_MIME_TYPE)
+
+
+@router.get("/{video_id}/playback/{quality}.m3u8")
+async def get_video_media_playlist(
+    video_id: uuid.UUID,
+    quality: str,
+    grant: PlaybackGrant = Depends(get_playback_grant),
+    video_service: VideoService = Depends(get_video_service),
+) -> Response:
+    playlist = await video_service.get_hls_playlist(video_id=video_id, grant=grant, quality=quality)
+    return Response(content=playlist, media_type=HLS_MIME_TYPE)
+
+
 @router.get("/{video_id}")
 async def get_video(
     video_id: uuid.UUID,
-    user: UserGet | None = Depends(get_current_optional_user),
+    user: UserPrincipal | None = Depends(get_current_optional_user),
     video_service: VideoService = Depends(get_video_service),
 ) -> VideoGet:
     return await video_service.get_video(video_id=video_id, user=user)
@@ -62,7 +85,7 @@ async def get_video(
 @router.get("/{video_id}/editor")
 async def get_video_editor(
     video_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     video_service: VideoService = Depends(get_video_service),
 ) -> VideoEditorGet:
     return await video_service.get_video_editor(video_id=video_id, user=user)
@@ -72,7 +95,7 @@ async def get_video_editor(
 async def update_video(
     video_id: uuid.UUID,
     data: VideoUpdate,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     video_service: VideoService = Depends(get_video_service),
 ) -> VideoGet:
     return await video_service.update_video(user=user, video_id=video_id, data=data)
@@ -81,7 +104,7 @@ async def update_video(
 @router.delete("/{video_id}")
 async def delete_video(
     video_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     video_service: VideoService = Depends(get_video_service),
 ) -> Status:
     await video_service.delete_video(user=user, video_id=video_id)
@@ -91,7 +114,7 @@ async def delete_video(
 @router.post("/{video_id}/like")
 async def like_video(
     video_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> VideoRating:
     rating = await content_service.set_reaction(
@@ -105,7 +128,7 @@ async def like_video(
 @router.delete("/{video_id}/like")
 async def unlike_video(
     video_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> VideoRating:
     rating = await content_service.remove_reaction(
@@ -119,7 +142,7 @@ async def unlike_video(
 @router.post("/{video_id}/dislike")
 async def dislike_video(
     video_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> VideoRating:
     rating = await content_service.set_reaction(
@@ -133,7 +156,7 @@ async def dislike_video(
 @router.delete("/{video_id}/dislike")
 async def undislike_video(
     video_id: uuid.UUID,
-    user: UserGet = Depends(get_current_user),
+    user: UserPrincipal = Depends(get_current_user),
     content_service: ContentService = Depends(get_content_service),
 ) -> VideoRating:
     rating = await content_service.remove_reaction(
@@ -108,6 +108,7 @@ class VideoCardGet(BaseSchema):
 class VideoGet(VideoCardGet):
     source_asset: VideoAssetGet | None = None
     playback_sources: list[VideoPlaybackSourceGet] = Field(default_factory=list)
+    streaming_sources: list[VideoPlaybackSourceGet] = Field(default_factory=list)
     chapters: list[VideoChapterGet] = Field(default_factory=list)
     publish_requested_at: datetime.datetime | None = None
     history_progress: dict | None = None
@@ -15,11 +15,12 @@ from src.assets.models import AssetModel
 from src.assets.repository import AssetRepository
 from src.assets.service import AssetService
 from src.assets.storage import AssetStorage, detect_extension
+from src.auth.schemas import PlaybackGrant
 from src.common.exceptions import PermissionDenied
 from src.content.access import can_view_content
 from src.content.enums import ContentStatusEnum, ContentVisibilityEnum, ReactionTypeEnum
 from src.tags.service import TagService
-from src.users.schemas import UserGet
+from src.users.schemas import UserPrincipal
 from src.videos.enums import (
     VideoOrder,
     VideoOrientationEnum,
@@ -29,7 +30,12 @@ from src.videos.enums import (
     VideoWriteVisibility,
 )
 from src.videos.exceptions import InvalidVideo, VideoNotFound
-from src.videos.presentation import build_video_card_get, build_video_editor_get, build_video_get
+from src.videos.presentation import (
+    build_hls_playlist,
+    build_video_card_get,
+    build_video_editor_get,
+    build_video_get,
+)
 from src.videos.repository import VideoRepository
 from src.videos.schemas import VideoCardGet, VideoCreate, VideoEditorGet, VideoGet, VideoRating, VideoUpdate
 
@@ -107,7 +113,7 @@ class VideoService:
     async def create_video(
         self,
         *,
-        user: UserGet,
+        user: UserPrincipal,
         data: VideoCreate,
     ) -> VideoGet:
         title = data.title.strip()
@@ -170,7 +176,7 @@ class VideoService:
         self,
         *,
         video_id: uuid.UUID,
-        user: UserGet | None,
+        user: UserPrincipal | None,
     ) -> VideoGet:
         viewer_id = user.user_id if user else None
         video = await self._repository.get_single(content_id=video_id, viewer_id=viewer_id)
@@ -178,11 +184,34 @@ class VideoService:
             raise VideoNotFound(f"Video with id {video_id!s} not found")
         return await self._build_video_get(video, viewer_id=viewer_id)
 
+    async def get_hls_playlist(
+        self,
+        *,
+        video_id: uuid.UUID,
+        grant: PlaybackGrant,
+        quality: str | None = None,
+    ) -> str:
+        if grant.content_id != video_id:
+            raise VideoNotFound(f"Video with id {video_id!s} not found")
+        viewer_id = grant.viewer_id
+        video = await self._repository.get_single(content_id=video_id, viewer_id=viewer_id)
+        if video is None or not self._can_view_video(video=video, viewer_id=viewer_id):
+            raise VideoNotFound(f"Video with id {video_id!s} not found")
+        playlist = await build_hls_playlist(
+            video,
+            quality=quality,
+            storage=self._asset_storage,
+            playback_token=grant.token,
+        )
+        if playlist is None:
+            raise VideoNotFound(f"Video with id {video_id!s} has no streaming playlist")
+        return playlist
+
     async def get_video_editor(
         self,
         *,
         video_id: uuid.UUID,
-        user: UserGet,
+        user: UserPrincipal,
     ) -> VideoEditorGet:
         video = await self._repository.get_single(content_id=video_id, viewer_id=user.user_id)
         if video is None or video.author_id != user.user_id or video.deleted_at is not None:
@@ -197,7 +226,7 @@ class VideoService:
         offset: int,
         limit: int,
         user_id: uuid.UUID | None,
-        user: UserGet | None,
+        user: UserPrincipal | None,
         profile_filter: VideoProfileFilter,
     ) -> list[VideoCardGet]:
         viewer_id = user.user_id if user else None
@@ -227,7 +256,7 @@ class VideoService:
     async def update_video(
         self,
         *,
-        user: UserGet,
+        user: UserPrincipal,
         video_id: uuid.UUID,
         data: VideoUpdate,
     ) -> VideoGet:
@@ -328,7 +357,7 @@ class VideoService:
             raise VideoNotFound(f"Video with id {video_id!s} not found")
         return await self._build_video_get(updated, viewer_id=user.user_id)
 
-    async def delete_video(self, *, user: UserGet, video_id: uuid.UUID) -> None:
+    async def delete_video(self, *, user: UserPrincipal, video_id: uuid.UUID) -> None:
         video = await self._repository.get_single(content_id=video_id, viewer_id=user.user_id)
         if video is None or video.author_id != user.user_id:
             raise PermissionDenied(f"User with id {user.user_id} can't delete video with id {video_id}")
@@ -0,0 +1,264 @@
+import datetime
+import hashlib
+from contextlib import asynccontextmanager
+from urllib.parse import parse_qs, urlsplit
+
+import botocore.auth
+import botocore.session
+import pytest
+from botocore.config import Config
+
+from src.assets.storage import AssetStorage, PresignedUrlCache, SigV4QuerySigner
+from src.config import StorageSettings
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeS3Client:
+    def __init__(self) -> None:
+        self.deleted: list[str] = []
+        self.parts: list[tuple[int, int]] = []
+        self.completed: list[dict] = []
+        self.aborted: list[str] = []
+        self.fail_on_part: int | None = None
+
+    async def delete_object(self, *, Bucket, Key):  # type: ignore[no-untyped-def]
+        self.deleted.append(Key)
+
+    async def create_multipart_upload(self, **params):  # type: ignore[no-untyped-def]
+        return {"UploadId": "upload-1"}
+
+    async def upload_part(self, *, Bucket, Key, UploadId, PartNumber, Body):  # type: ignore[no-untyped-def]
+        if PartNumber == self.fail_on_part:
+            raise OSError("connection reset")
+        self.parts.append((PartNumber, len(Body)))
+        return {"ETag": f'"etag-{PartNumber}"'}
+
+    async def complete_multipart_upload(self, *, Bucket, Key, UploadId, MultipartUpload):  # type: ignore[no-untyped-def]
+        self.completed.append(MultipartUpload)
+
+    async def abort_multipart_upload(self, *, Bucket, Key, UploadId):  # type: ignore[no-untyped-def]
+        self.aborted.append(UploadId)
+
+
+class CountingSigner:
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    def presign_get(self, *, bucket, key, expires_in, query=None):  # type: ignore[no-untyped-def]
+        self.calls.append({"bucket": bucket, "key": key, "expires_in": expires_in, "query": query})
+        return f"https://s3.test/{bucket}/{key}?sig={len(self.calls)}"
+
+
+class FakeSession:
+    def __init__(self, client: FakeS3Client) -> None:
+        self.client = client
+        self.created = 0
+        self.closed = 0
+
+    def create_client(self, service_name, **kwargs):  # type: ignore[no-untyped-def]
+        session = self
+
+        @asynccontextmanager
+        async def _client():  # type: ignore[no-untyped-def]
+            session.created += 1
+            try:
+                yield session.client
+            finally:
+                session.closed += 1
+
+        return _client()
+
+
+def _storage(**overrides) -> tuple[AssetStorage, FakeSession]:  # type: ignore[no-untyped-def]
+    values = {
+        "endpoint_url": "https://s3.test",
+        "region": "test",
+        "access_key": "key",
+        "secret_key": "secret",
+        "private_bucket": "private",
+    }
+    values.update(overrides)
+    storage = AssetStorage(StorageSettings(**values))
+    session = FakeSession(FakeS3Client())
+    storage._session = session
+    return storage, session
+
+
+def test_presigned_url_cache_expires_before_signature_ttl() -> None:
+    clock = FakeClock()
+    cache = PresignedUrlCache(ttl_seconds=900, margin_seconds=60, max_size=10, clock=clock)
+    key = ("bucket", "key", None, None)
+
+    cache.set(key, "https://signed")
+    clock.now = 839
+    assert cache.get(key) == "https://signed"
+    clock.now = 840
+    assert cache.get(key) is None
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_generate_presigned_get_reuses_signature_per_disposition_and_type() -> None:
+    storage, _ = _storage()
+    signer = CountingSigner()
+    storage._get_signer = signer  # type: ignore[assignment]
+
+    first = await storage.generate_presigned_get(bucket="private", key="a.png")
+    second = await storage.generate_presigned_get(bucket="private", key="a.png")
+    download = await storage.generate_presigned_get(
+        bucket="private",
+        key="a.png",
+        download_filename="a.png",
+        inline=False,
+        response_content_type="image/png",
+    )
+
+    assert first == second
+    assert download != first
+    assert len(signer.calls) == 2
+    assert storage.presigned_get_cache.hits == 1
+    assert storage.presigned_get_cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_presigned_get_with_explicit_ttl_skips_cache() -> None:
+    storage, _ = _storage()
+    signer = CountingSigner()
+    storage._get_signer = signer  # type: ignore[assignment]
+
+    await storage.generate_presigned_get(bucket="private", key="a.m4s")
+    first = await storage.generate_presigned_get(bucket="private", key="a.m4s", expires_in_seconds=3600)
+    second = await storage.generate_presigned_get(bucket="private", key="a.m4s", expires_in_seconds=3600)
+
+    assert first != second
+    assert [call["expires_in"] for call in signer.calls[1:]] == [3600, 3600]
+    assert storage.presigned_get_cache.hits == 0
+
+
+@pytest.mark.asyncio
+async def test_open_storage_reuses_one_client_until_closed() -> None:
+    storage, session = _storage()
+
+    await storage.open()
+    await storage.delete_object(bucket="private", key="a.png")
+    await storage.delete_object(bucket="private", key="b.png")
+    assert (session.created, session.closed) == (1, 0)
+
+    await storage.close()
+    assert session.closed == 1
+
+    await storage.delete_object(bucket="private", key="c.png")
+    assert (session.created, session.closed) == (2, 2)
+    assert session.client.deleted == ["a.png", "b.png", "c.png"]
+
+
+@pytest.mark.parametrize(
+    ("endpoint_url", "addressing_style"),
+    [
+        ("https://s3.storage.selcloud.ru", "virtual"),
+        ("http://localhost:9000", "path"),
+    ],
+)
+def test_sigv4_signer_matches_botocore_presigned_get(monkeypatch, endpoint_url, addressing_style) -> None:  # type: ignore[no-untyped-def]
+    now = datetime.datetime(2026, 5, 1, 12, 30, 15)
+
+    class FrozenDatetime(datetime.datetime):
+        @classmethod
+        def utcnow(cls):  # type: ignore[no-untyped-def]
+            return now
+
+    monkeypatch.setattr(botocore.auth.datetime, "datetime", FrozenDatetime)
+    client = botocore.session.get_session().create_client(
+        "s3",
+        aws_access_key_id="access",
+        aws_secret_access_key="secret",
+        endpoint_url=endpoint_url,
+        region_name="ru-1",
+        config=Config(signature_version="s3v4", s3={"addressing_style": addressing_style}),
+    )
+    disposition = "attachment; filename*=UTF-8''%D0%BE%D1%82%D1%87%D1%91%D1%82 1.pdf"
+    expected = client.generate_presigned_url(
+        "get_object",
+        Params={
+            "Bucket": "nerdex-private",
+            "Key": "v1/assets/ab/file name+1.pdf",
+            "ResponseContentDisposition": disposition,
+            "ResponseContentType": "application/pdf",
+        },
+        ExpiresIn=900,
+    )
+    signer = SigV4QuerySigner(
+        access_key="access",
+        secret_key="secret",
+        region="ru-1",
+        endpoint_url=endpoint_url,
+        addressing_style=addressing_style,
+    )
+
+    actual = signer.presign_get(
+        bucket="nerdex-private",
+        key="v1/assets/ab/file name+1.pdf",
+        expires_in=900,
+        query={
+            "response-content-disposition": disposition,
+            "response-content-type": "application/pdf",
+        },
+        now=now.replace(tzinfo=datetime.timezone.utc),
+    )
+
+    expected_parts, actual_parts = urlsplit(expected), urlsplit(actual)
+    assert actual_parts.netloc == expected_parts.netloc
+    assert actual_parts.path == expected_parts.path
+    assert parse_qs(actual_parts.query) == parse_qs(expected_parts.query)
+
+
+@pytest.mark.asyncio
+async def test_upload_file_multipart_streams_parts_and_hashes_whole_file(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    storage, session = _storage()
+    payload = bytes(range(256)) * (45 * 1024)
+    path = tmp_path / "video_720p.mp4"
+    path.write_bytes(payload)
+
+    stored = await storage.upload_file_multipart(
+        bucket="private",
+        key="video_720p.mp4",
+        path=path,
+        mime_type="video/mp4",
+        part_size_bytes=1,
+    )
+
+    part_size = 5 * 1024 * 1024
+    assert session.client.parts == [(1, part_size), (2, part_size), (3, len(payload) - 2 * part_size)]
+    assert session.client.completed == [
+        {"Parts": [{"ETag": f'"etag-{number}"', "PartNumber": number} for number in (1, 2, 3)]}
+    ]
+    assert stored.size_bytes == len(payload)
+    assert stored.checksum_sha256 == hashlib.sha256(payload).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_upload_file_multipart_aborts_upload_when_a_part_fails(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    storage, session = _storage()
+    session.client.fail_on_part = 2
+    path = tmp_path / "video_720p.mp4"
+    path.write_bytes(b"x" * (11 * 1024 * 1024))
+
+    with pytest.raises(OSError):
+        await storage.upload_file_multipart(
+            bucket="private",
+            key="video_720p.mp4",
+            path=path,
+            mime_type="video/mp4",
+            part_size_bytes=5 * 1024 * 1024,
+        )
+
+    assert session.client.aborted == ["upload-1"]
+    assert session.client.completed == []
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import configure_mappers
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 
 def test_asset_tasks_import_all_relationship_models() -> None:
@@ -8,11 +8,12 @@ def test_asset_tasks_import_all_relationship_models() -> None:
     configure_mappers()
 
 
-def test_asset_tasks_use_non_pooled_asyncpg_connections() -> None:
-    from src.assets.tasks import _build_task_session_maker
+def test_asset_tasks_use_pooled_asyncpg_connections() -> None:
+    from src.assets.worker_runtime import build_worker_session_maker
 
-    engine, _ = _build_task_session_maker()
+    engine, _ = build_worker_session_maker()
     try:
-        assert isinstance(engine.sync_engine.pool, NullPool)
+        assert isinstance(engine.sync_engine.pool, AsyncAdaptedQueuePool)
+        assert engine.sync_engine.pool.size() == 2
     finally:
         engine.sync_engine.dispose()
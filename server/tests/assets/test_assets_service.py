@@ -1,7 +1,9 @@
+import asyncio
 import datetime
 import io
 import uuid
 from dataclasses import dataclass, field
+from pathlib import Path
 
 import pytest
 from PIL import Image
@@ -9,9 +11,11 @@ from PIL import Image
 from src.assets.enums import AssetAccessTypeEnum, AssetStatusEnum, AssetTypeEnum, AssetVariantStatusEnum, AssetVariantTypeEnum
 from src.assets.exceptions import AssetNotFound, InvalidAsset
 from src.assets.service import AssetService, TaskDispatcher
+from src.assets.video_processing import RenderedVideoVariant, VideoMetadata
 from src.assets.storage import StoredObject, UploadInstruction, build_asset_storage_key
 from src.assets.schemas import AssetInitUploadRequest
 from src.config import AssetsSettings
+from src.videos.enums import VideoOrientationEnum
 
 
 @dataclass
@@ -181,6 +185,9 @@ class FakeAssetRepository:
         existing.is_primary = kwargs["is_primary"]
         existing.status = kwargs["status"]
 
+    async def update_asset_metadata(self, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        self.assets[kwargs["asset_id"]].asset_metadata = kwargs["asset_metadata"]
+
     async def mark_asset_deleted(self, **kwargs) -> None:  # type: ignore[no-untyped-def]
         asset = self.assets[kwargs["asset_id"]]
         asset.status = AssetStatusEnum.DELETED
@@ -232,6 +239,7 @@ class FakeStorage:
         self.object_payloads: dict[tuple[str, str], bytes] = {}
         self.uploaded_objects: dict[tuple[str, str], bytes] = {}
         self.deleted_objects: list[tuple[str, str]] = []
+        self.events: list[str] = []
 
     async def generate_presigned_put(self, *, bucket: str, key: str, mime_type: str | None) -> UploadInstruction:
         self.put_requests.append((bucket, key, mime_type))
@@ -273,6 +281,9 @@ class FakeStorage:
     async def get_object_bytes(self, *, bucket: str, key: str) -> bytes:
         return self.object_payloads[(bucket, key)]
 
+    async def download_to_file(self, *, bucket: str, key: str, path: Path) -> None:
+        path.write_bytes(self.object_payloads[(bucket, key)])
+
     async def upload_bytes(self, *, bucket: str, key: str, payload: bytes, mime_type: str) -> StoredObject:
         self.uploaded_objects[(bucket, key)] = payload
         return StoredObject(
@@ -281,6 +292,20 @@ class FakeStorage:
             mime_type=mime_type,
         )
 
+    async def upload_file_multipart(
+        self,
+        *,
+        bucket: str,
+        key: str,
+        path: Path,
+        mime_type: str,
+        part_size_bytes: int,
+    ) -> StoredObject:
+        payload = path.read_bytes()
+        self.uploaded_objects[(bucket, key)] = payload
+        self.events.append(f"uploaded {path.name}")
+        return StoredObject(size_bytes=len(payload), checksum_sha256="checksum", mime_type=mime_type)
+
     async def delete_object(self, *, bucket: str, key: str) -> None:
         self.deleted_objects.append((bucket, key))
 
@@ -466,6 +491,36 @@ async def test_process_image_asset_creates_expected_variants() -> None:
     assert repository.assets[asset.asset_id].status == AssetStatusEnum.READY
 
 
+@pytest.mark.anyio
+async def test_process_image_asset_renders_variants_from_large_jpeg() -> None:
+    service, repository, storage, _, _ = build_service()
+    init_response = await service.init_upload(
+        owner_id=uuid.uuid4(),
+        data=AssetInitUploadRequest(
+            filename="photo.jpg",
+            size_bytes=1024,
+            declared_mime_type="image/jpeg",
+            asset_type=AssetTypeEnum.IMAGE,
+            usage_context="avatar",
+        ),
+    )
+    asset = repository.assets[init_response.asset.asset_id]
+    original_variant = asset.variants[0]
+    buffer = io.BytesIO()
+    Image.new("RGB", (6000, 4000), color="red").save(buffer, format="JPEG")
+    storage.object_payloads[(original_variant.storage_bucket, original_variant.storage_key)] = buffer.getvalue()
+
+    await service.process_image_asset(asset_id=asset.asset_id)
+
+    medium = next(
+        variant
+        for variant in repository.assets[asset.asset_id].variants
+        if variant.asset_variant_type == AssetVariantTypeEnum.IMAGE_MEDIUM
+    )
+    assert (medium.width, medium.height) == (1280, 853)
+    assert repository.assets[asset.asset_id].detected_mime_type == "image/jpeg"
+
+
 @pytest.mark.anyio
 async def test_generate_avatar_variants_creates_expected_square_variants() -> None:
     service, repository, storage, _, _ = build_service()
@@ -612,6 +667,88 @@ async def test_generate_avatar_variants_rejects_tiny_crop() -> None:
         )
 
 
+class PipelinedVideoProcessor:
+    def __init__(self, events: list[str], **kwargs) -> None:  # type: ignore[no-untyped-def]
+        self.events = events
+
+    async def probe(self, input_path: Path) -> VideoMetadata:
+        return VideoMetadata(
+            duration_seconds=10,
+            width=854,
+            height=480,
+            bitrate=None,
+            orientation=VideoOrientationEnum.LANDSCAPE,
+            raw_probe={},
+        )
+
+    async def transcode_variants(self, *, input_path, output_dir, metadata, on_rendered=None):  # type: ignore[no-untyped-def]
+        rendered = []
+        for variant_type, label, width, height in (
+            (AssetVariantTypeEnum.VIDEO_480P, "480p", 854, 480),
+            (AssetVariantTypeEnum.VIDEO_360P, "360p", 640, 360),
+        ):
+            path = output_dir / f"{variant_type.value}.mp4"
+            path.write_bytes(label.encode())
+            self.events.append(f"encoded {path.name}")
+            variant = RenderedVideoVariant(
+                variant_type=variant_type,
+                label=label,
+                path=path,
+                width=width,
+                height=height,
+                bitrate=None,
+            )
+            rendered.append(variant)
+            await on_rendered(variant)
+            # Simulate the next ffmpeg run yielding to the event loop.
+            await asyncio.sleep(0)
+        return rendered
+
+
+@pytest.mark.anyio
+async def test_process_video_asset_uploads_renditions_while_later_ones_encode(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    repository = FakeAssetRepository()
+    storage = FakeStorage()
+    service = AssetService(
+        repository=repository,  # type: ignore[arg-type]
+        storage=storage,  # type: ignore[arg-type]
+        settings=AssetsSettings(video_hls_enabled=False),
+    )
+    monkeypatch.setattr(
+        "src.assets.service.VideoProcessor",
+        lambda **kwargs: PipelinedVideoProcessor(storage.events, **kwargs),
+    )
+    init_response = await service.init_upload(
+        owner_id=uuid.uuid4(),
+        data=AssetInitUploadRequest(
+            filename="clip.mp4",
+            size_bytes=1024,
+            declared_mime_type="video/mp4",
+            asset_type=AssetTypeEnum.VIDEO,
+            usage_context="video_source",
+        ),
+    )
+    asset = repository.assets[init_response.asset.asset_id]
+    original_variant = asset.variants[0]
+    storage.object_payloads[(original_variant.storage_bucket, original_variant.storage_key)] = b"source"
+
+    await service.process_video_asset(asset_id=asset.asset_id)
+
+    assert storage.events == [
+        "encoded video_480p.mp4",
+        "uploaded video_480p.mp4",
+        "encoded video_360p.mp4",
+        "uploaded video_360p.mp4",
+    ]
+    variant_types = [variant.asset_variant_type for variant in repository.assets[asset.asset_id].variants]
+    assert variant_types == [
+        AssetVariantTypeEnum.ORIGINAL,
+        AssetVariantTypeEnum.VIDEO_480P,
+        AssetVariantTypeEnum.VIDEO_360P,
+    ]
+    assert repository.assets[asset.asset_id].status == AssetStatusEnum.READY
+
+
 @pytest.mark.anyio
 async def test_failed_processing_marks_asset_failed() -> None:
     service, repository, storage, _, _ = build_service()
@@ -0,0 +1,87 @@
+import io
+
+import pytest
+from PIL import Image
+
+from src.assets.exceptions import InvalidAsset
+from src.assets.image_rendering import (
+    AvatarCropSpec,
+    ImageRenderExecutor,
+    load_image,
+    render_avatar_variants,
+    render_image_variants,
+)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _jpeg_bytes(size: tuple[int, int], *, orientation: int | None = None) -> bytes:
+    image = Image.new("RGB", size, color="red")
+    # Mark the top-left quadrant so crops can be checked after scaling.
+    image.paste((0, 0, 255), (0, 0, size[0] // 2, size[1] // 2))
+    exif = Image.Exif()
+    if orientation is not None:
+        exif[0x0112] = orientation
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+def test_load_image_decodes_jpeg_at_reduced_scale() -> None:
+    image = load_image(_jpeg_bytes((6000, 4000)), max_size=1280)
+
+    assert image.size == (3000, 2000)
+    assert image.format == "JPEG"
+
+
+def test_render_image_variants_derives_smaller_variants_progressively() -> None:
+    rendered = render_image_variants(
+        _jpeg_bytes((6000, 4000)),
+        {"image_small": (640, 640), "image_medium": (1280, 1280)},
+    )
+
+    assert rendered.format == "JPEG"
+    assert list(rendered.variants) == ["image_medium", "image_small"]
+    assert (rendered.variants["image_medium"].width, rendered.variants["image_medium"].height) == (1280, 853)
+    assert (rendered.variants["image_small"].width, rendered.variants["image_small"].height) == (640, 427)
+    assert Image.open(io.BytesIO(rendered.variants["image_small"].payload)).format == "WEBP"
+
+
+def test_render_avatar_variants_crops_in_full_resolution_coordinates() -> None:
+    rendered = render_avatar_variants(
+        _jpeg_bytes((4000, 3000)),
+        AvatarCropSpec(x=0.0, y=0.0, size=0.5),
+        {"avatar_medium": (256, 256), "avatar_small": (96, 96)},
+    )
+
+    medium = Image.open(io.BytesIO(rendered["avatar_medium"].payload)).convert("RGB")
+    assert medium.size == (256, 256)
+    red, green, blue = medium.getpixel((128, 128))
+    assert blue > 200 and red < 60
+
+
+def test_render_avatar_variants_validates_crop_against_rotated_frame() -> None:
+    # Orientation 6 turns a 3000x2000 landscape file into a 2000x3000 portrait frame.
+    source = _jpeg_bytes((3000, 2000), orientation=6)
+
+    with pytest.raises(InvalidAsset, match="within the source image bounds"):
+        render_avatar_variants(source, AvatarCropSpec(x=0.5, y=0.0, size=1.0), {"avatar_small": (96, 96)})
+    with pytest.raises(InvalidAsset, match="too small"):
+        render_avatar_variants(source, AvatarCropSpec(x=0.0, y=0.0, size=0.01), {"avatar_small": (96, 96)})
+
+    rendered = render_avatar_variants(source, AvatarCropSpec(x=0.0, y=0.3, size=1.0), {"avatar_small": (96, 96)})
+    assert (rendered["avatar_small"].width, rendered["avatar_small"].height) == (96, 96)
+
+
+@pytest.mark.anyio
+async def test_image_render_executor_runs_renders_in_worker_process() -> None:
+    executor = ImageRenderExecutor(max_workers=1)
+    try:
+        rendered = await executor.run(render_image_variants, _jpeg_bytes((800, 600)), {"image_small": (640, 640)})
+    finally:
+        executor.shutdown()
+
+    assert (rendered.variants["image_small"].width, rendered.variants["image_small"].height) == (640, 480)
@@ -4,7 +4,14 @@ from pathlib import Path
 
 import pytest
 
-from src.assets.video_processing import VideoProcessingError, VideoProcessor, build_quality_plans
+from src.assets.video_processing import (
+    RenderedVideoVariant,
+    VideoMetadata,
+    VideoProcessingError,
+    VideoProcessor,
+    build_quality_plans,
+    parse_hls_playlist,
+)
 from src.videos.enums import VideoOrientationEnum
 
 
@@ -101,3 +108,146 @@ async def test_probe_rejects_too_long_video(monkeypatch) -> None:
 
     with pytest.raises(VideoProcessingError, match="exceeds 30 minutes"):
         await processor.probe(Path("too-long.mp4"))
+
+
+@pytest.mark.anyio
+async def test_single_pass_transcode_decodes_once_and_maps_every_rendition(monkeypatch) -> None:
+    processor = VideoProcessor(single_pass=True, threads=4)
+    calls: list[tuple[str, ...]] = []
+
+    async def fake_run(*args):  # type: ignore[no-untyped-def]
+        calls.append(args)
+        return ""
+
+    monkeypatch.setattr(processor, "_run", fake_run)
+    metadata = VideoMetadata(
+        duration_seconds=10,
+        width=1280,
+        height=720,
+        bitrate=None,
+        orientation=VideoOrientationEnum.LANDSCAPE,
+        raw_probe={},
+    )
+
+    rendered = await processor.transcode_variants(
+        input_path=Path("source.mp4"),
+        output_dir=Path("/tmp/out"),
+        metadata=metadata,
+    )
+
+    assert len(calls) == 1
+    args = calls[0]
+    assert args.count("-i") == 1
+    filter_graph = args[args.index("-filter_complex") + 1]
+    assert filter_graph == (
+        "[0:v]split=3[v0][v1][v2];"
+        "[v0]scale=1280:720[out0];"
+        "[v1]scale=854:480[out1];"
+        "[v2]scale=640:360[out2]"
+    )
+    assert [args[index + 1] for index, arg in enumerate(args) if arg == "-map" and args[index + 1].startswith("[")] == [
+        "[out0]",
+        "[out1]",
+        "[out2]",
+    ]
+    assert args[args.index("-filter_complex_threads") + 1] == "4"
+    assert [variant.path.name for variant in rendered] == ["video_720p.mp4", "video_480p.mp4", "video_360p.mp4"]
+    assert len({variant.encode_run_seconds for variant in rendered}) == 1
+    assert [variant.encode_run_renditions for variant in rendered] == [3, 3, 3]
+
+
+@pytest.mark.anyio
+async def test_per_rendition_transcode_runs_ffmpeg_for_each_plan(monkeypatch) -> None:
+    processor = VideoProcessor(single_pass=False)
+    calls: list[tuple[str, ...]] = []
+
+    async def fake_run(*args):  # type: ignore[no-untyped-def]
+        calls.append(args)
+        return ""
+
+    monkeypatch.setattr(processor, "_run", fake_run)
+    metadata = VideoMetadata(
+        duration_seconds=10,
+        width=1280,
+        height=720,
+        bitrate=None,
+        orientation=VideoOrientationEnum.LANDSCAPE,
+        raw_probe={},
+    )
+
+    rendered = await processor.transcode_variants(
+        input_path=Path("source.mp4"),
+        output_dir=Path("/tmp/out"),
+        metadata=metadata,
+    )
+
+    assert len(calls) == 3
+    assert all("-threads" not in args for args in calls)
+    assert [variant.label for variant in rendered] == ["720p", "480p", "360p"]
+    assert [variant.encode_run_renditions for variant in rendered] == [1, 1, 1]
+
+
+HLS_PLAYLIST = """#EXTM3U
+#EXT-X-VERSION:7
+#EXT-X-TARGETDURATION:4
+#EXT-X-MEDIA-SEQUENCE:0
+#EXT-X-PLAYLIST-TYPE:VOD
+#EXT-X-MAP:URI="stream.m4s",BYTERANGE="812@0"
+#EXTINF:4.000000,
+#EXT-X-BYTERANGE:1000@812
+stream.m4s
+#EXTINF:1.500000,
+#EXT-X-BYTERANGE:400
+stream.m4s
+#EXT-X-ENDLIST
+"""
+
+
+def test_parse_hls_playlist_reads_init_section_and_byte_ranges() -> None:
+    playlist = parse_hls_playlist(HLS_PLAYLIST)
+
+    assert playlist.target_duration == 4
+    assert (playlist.map_uri, playlist.map_length, playlist.map_offset) == ("stream.m4s", 812, 0)
+    assert [(segment.duration, segment.length, segment.offset) for segment in playlist.segments] == [
+        (4.0, 1000, 812),
+        (1.5, 400, 1812),
+    ]
+
+
+def test_parse_hls_playlist_rejects_playlist_without_segments() -> None:
+    with pytest.raises(VideoProcessingError, match="incomplete HLS playlist"):
+        parse_hls_playlist("#EXTM3U\n#EXT-X-TARGETDURATION:4\n#EXT-X-ENDLIST\n")
+
+
+@pytest.mark.anyio
+async def test_package_hls_remuxes_each_rendition_into_single_file_fmp4(monkeypatch, tmp_path: Path) -> None:
+    processor = VideoProcessor()
+    calls: list[tuple[str, ...]] = []
+
+    async def fake_run(*args):  # type: ignore[no-untyped-def]
+        calls.append(args)
+        Path(args[-1]).write_text(HLS_PLAYLIST)
+        return ""
+
+    monkeypatch.setattr(processor, "_run", fake_run)
+    rendered = [
+        RenderedVideoVariant(
+            variant_type=AssetVariantTypeEnum.VIDEO_720P,
+            label="720p",
+            path=tmp_path / "video_720p.mp4",
+            width=1280,
+            height=720,
+            bitrate=None,
+        )
+    ]
+
+    packaged = await processor.package_hls(rendered=rendered, output_dir=tmp_path, segment_seconds=4)
+
+    assert len(calls) == 1
+    args = calls[0]
+    assert args[args.index("-c") + 1] == "copy"
+    assert args[args.index("-hls_segment_type") + 1] == "fmp4"
+    assert args[args.index("-hls_flags") + 1] == "single_file"
+    assert args[args.index("-hls_time") + 1] == "4"
+    assert packaged[0].directory == tmp_path / "hls_video_720p"
+    assert len(packaged[0].playlist.segments) == 2
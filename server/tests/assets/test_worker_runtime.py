@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from src.assets.worker_runtime import WorkerRuntime
+
+
+class FakeEngine:
+    def __init__(self) -> None:
+        self.disposed = 0
+
+    async def dispose(self) -> None:
+        self.disposed += 1
+
+
+class FakeStorage:
+    def __init__(self) -> None:
+        self.opened = 0
+        self.closed = 0
+
+    async def open(self) -> None:
+        self.opened += 1
+
+    async def close(self) -> None:
+        self.closed += 1
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 0.5
+        return self.now
+
+
+def _runtime() -> tuple[WorkerRuntime, list[FakeEngine], list[FakeStorage]]:
+    engines: list[FakeEngine] = []
+    storages: list[FakeStorage] = []
+
+    def session_maker_factory():  # type: ignore[no-untyped-def]
+        engines.append(FakeEngine())
+        return engines[-1], object()
+
+    def storage_factory():  # type: ignore[no-untyped-def]
+        storages.append(FakeStorage())
+        return storages[-1]
+
+    runtime = WorkerRuntime(
+        session_maker_factory=session_maker_factory,  # type: ignore[arg-type]
+        storage_factory=storage_factory,  # type: ignore[arg-type]
+        clock=FakeClock(),
+    )
+    return runtime, engines, storages
+
+
+def test_runtime_reuses_loop_engine_and_storage_across_tasks() -> None:
+    runtime, engines, storages = _runtime()
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    async def task() -> int:
+        loops.append(asyncio.get_running_loop())
+        return len(loops)
+
+    assert runtime.run("assets.process_image_asset", task) == 1
+    assert runtime.run("assets.process_image_asset", task) == 2
+
+    assert loops[0] is loops[1]
+    assert len(engines) == 1 and len(storages) == 1
+    assert storages[0].opened == 1
+    timing = runtime.timings["assets.process_image_asset"]
+    assert (timing.count, timing.failures, timing.total_seconds, timing.max_seconds) == (2, 0, 1.0, 0.5)
+
+    runtime.shutdown()
+    assert (engines[0].disposed, storages[0].closed) == (1, 1)
+    assert runtime.started is False
+
+
+def test_runtime_records_failed_tasks_and_keeps_serving() -> None:
+    runtime, engines, _ = _runtime()
+
+    async def failing() -> None:
+        raise ValueError("boom")
+
+    async def ok() -> str:
+        return "ok"
+
+    with pytest.raises(ValueError):
+        runtime.run("assets.process_video_asset", failing)
+    assert runtime.run("assets.process_video_asset", ok) == "ok"
+
+    timing = runtime.timings["assets.process_video_asset"]
+    assert (timing.count, timing.failures) == (2, 1)
+    assert len(engines) == 1
+    runtime.shutdown()
+
+
+def test_runtime_restarts_after_fork(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    runtime, engines, storages = _runtime()
+    runtime.start()
+    monkeypatch.setattr("src.assets.worker_runtime.os.getpid", lambda: -1)
+
+    assert runtime.started is False
+    runtime.start()
+
+    assert len(engines) == 2 and len(storages) == 2
+    assert engines[0].disposed == 0
+    runtime.shutdown()
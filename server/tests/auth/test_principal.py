@@ -0,0 +1,118 @@
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from src.auth import dependencies as auth_dependencies
+from src.auth.principal import PrincipalCache
+from src.auth.utils import ACCESS_TOKEN_TYPE, REFRESH_TOKEN_TYPE
+from src.users.exceptions import UserNotFound
+from src.users.schemas import UserPrincipal
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeUserService:
+    def __init__(self, principal: UserPrincipal | None) -> None:
+        self.principal = principal
+        self.calls = 0
+
+    async def get_user_principal(self, user_id: uuid.UUID) -> UserPrincipal:
+        self.calls += 1
+        if self.principal is None:
+            raise UserNotFound("not found")
+        return self.principal
+
+    async def get_user(self, **filters):  # type: ignore[no-untyped-def]
+        raise AssertionError("principal resolution must not load the full user profile")
+
+
+def _principal(**overrides) -> UserPrincipal:  # type: ignore[no-untyped-def]
+    values = {"user_id": uuid.uuid4(), "username": "alice", "is_admin": False}
+    values.update(overrides)
+    return UserPrincipal(**values)
+
+
+def test_principal_cache_expires_entries_after_ttl() -> None:
+    clock = FakeClock()
+    cache = PrincipalCache(ttl_seconds=30, max_size=10, clock=clock)
+    principal = _principal()
+
+    cache.set(principal)
+    clock.now = 29
+    assert cache.get(principal.user_id) == principal
+
+    clock.now = 30
+    assert cache.get(principal.user_id) is None
+
+
+def test_principal_cache_evicts_oldest_entry_when_full() -> None:
+    cache = PrincipalCache(ttl_seconds=30, max_size=2, clock=FakeClock())
+    first, second, third = _principal(), _principal(), _principal()
+
+    cache.set(first)
+    cache.set(second)
+    cache.set(third)
+
+    assert cache.get(first.user_id) is None
+    assert cache.get(second.user_id) == second
+    assert cache.get(third.user_id) == third
+
+
+def test_principal_cache_is_disabled_with_zero_ttl() -> None:
+    cache = PrincipalCache(ttl_seconds=0, max_size=10, clock=FakeClock())
+    principal = _principal()
+
+    cache.set(principal)
+
+    assert cache.get(principal.user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_current_user_resolves_principal_once_per_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    principal = _principal(is_admin=True)
+    service = FakeUserService(principal)
+    monkeypatch.setattr(
+        auth_dependencies,
+        "principal_cache",
+        PrincipalCache(ttl_seconds=30, max_size=10, clock=FakeClock()),
+    )
+    payload = {"type": ACCESS_TOKEN_TYPE, "sub": str(principal.user_id)}
+
+    first = await auth_dependencies.get_current_user(token_payload=payload, user_service=service)  # type: ignore[arg-type]
+    second = await auth_dependencies.get_current_optional_user(token_payload=payload, user_service=service)  # type: ignore[arg-type]
+
+    assert first == principal
+    assert second == principal
+    assert service.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_current_user_rejects_unknown_user_and_wrong_token_type(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        auth_dependencies,
+        "principal_cache",
+        PrincipalCache(ttl_seconds=30, max_size=10, clock=FakeClock()),
+    )
+    service = FakeUserService(None)
+    user_id = str(uuid.uuid4())
+
+    with pytest.raises(HTTPException) as missing:
+        await auth_dependencies.get_current_user(  # type: ignore[arg-type]
+            token_payload={"type": ACCESS_TOKEN_TYPE, "sub": user_id},
+            user_service=service,
+        )
+    with pytest.raises(HTTPException) as wrong_type:
+        await auth_dependencies.get_current_user(  # type: ignore[arg-type]
+            token_payload={"type": REFRESH_TOKEN_TYPE, "sub": user_id},
+            user_service=service,
+        )
+
+    assert missing.value.status_code == 401
+    assert wrong_type.value.status_code == 403
@@ -0,0 +1,224 @@
+import datetime
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.chats.models import ChatModel, MembershipModel
+from src.chats.repository import ChatRepository
+from src.chats.timeline import (
+    compute_unread_count,
+    create_event_timeline_item,
+    create_message_timeline_item,
+    exempt_deleted_message,
+)
+from src.common.model_registry import import_all_models
+
+import_all_models()
+
+
+class _Result:
+    def __init__(self, value):
+        self.value = value
+
+    def scalars(self):
+        return self
+
+    def unique(self):
+        return self
+
+    def all(self):
+        return self.value
+
+    def scalar_one(self):
+        return self.value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    @property
+    def rowcount(self):
+        return self.value
+
+
+class _Session:
+    def __init__(self, results) -> None:
+        self.results = list(results)
+        self.statements = []
+        self.committed = False
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result(self.results.pop(0) if self.results else None)
+
+    async def commit(self):
+        self.committed = True
+
+
+def _compile(stmt) -> str:  # type: ignore[no-untyped-def]
+    return " ".join(
+        str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})).split()
+    )
+
+
+@pytest.mark.asyncio
+async def test_message_timeline_item_updates_last_message_and_exempts_the_author() -> None:
+    chat_id = uuid.uuid4()
+    message_id = uuid.uuid4()
+    author_id = uuid.uuid4()
+    session = _Session([5])
+
+    chat_seq = await create_message_timeline_item(
+        session=session,  # type: ignore[arg-type]
+        chat_id=chat_id,
+        message_id=message_id,
+        author_id=author_id,
+        created_at=datetime.datetime(2026, 5, 18, tzinfo=datetime.timezone.utc),
+    )
+
+    chat_update, membership_update, timeline_insert = (_compile(stmt) for stmt in session.statements)
+    assert chat_seq == 5
+    assert "last_timeline_seq=(chats.last_timeline_seq + 1)" in chat_update
+    assert f"last_message_id='{message_id}'" in chat_update
+    assert "RETURNING chats.last_timeline_seq" in chat_update
+    assert "UPDATE chat_user SET last_message_at=" in membership_update
+    assert "unread_exempt_count=(chat_user.unread_exempt_count + CASE" in membership_update
+    assert f"CASE WHEN (chat_user.user_id = '{author_id}') THEN 1 ELSE 0 END" in membership_update
+    assert "INSERT INTO chat_timeline_items" in timeline_insert
+
+
+@pytest.mark.asyncio
+async def test_event_timeline_item_is_exempt_for_every_member() -> None:
+    session = _Session([6])
+
+    chat_seq = await create_event_timeline_item(
+        session=session,  # type: ignore[arg-type]
+        chat_id=uuid.uuid4(),
+        event_id=uuid.uuid4(),
+    )
+
+    assert chat_seq == 6
+    assert "SET unread_exempt_count=(chat_user.unread_exempt_count + 1)" in _compile(session.statements[1])
+
+
+@pytest.mark.asyncio
+async def test_deleted_message_is_exempt_only_for_members_who_had_not_read_it() -> None:
+    message_id = uuid.uuid4()
+    author_id = uuid.uuid4()
+    session = _Session([])
+
+    await exempt_deleted_message(
+        session=session,  # type: ignore[arg-type]
+        chat_id=uuid.uuid4(),
+        message_id=message_id,
+        author_id=author_id,
+    )
+
+    sql = _compile(session.statements[0])
+    assert "SET unread_exempt_count=(chat_user.unread_exempt_count + 1)" in sql
+    assert f"chat_user.user_id != '{author_id}'" in sql
+    assert "chat_user.last_read_seq < (SELECT chat_timeline_items.chat_seq" in sql
+    assert f"chat_timeline_items.message_id = '{message_id}'" in sql
+
+
+def test_unread_count_is_seq_distance_minus_exempt_items() -> None:
+    assert compute_unread_count(last_timeline_seq=40, last_read_seq=30, unread_exempt_count=4) == 6
+    assert compute_unread_count(last_timeline_seq=40, last_read_seq=40, unread_exempt_count=0) == 0
+    assert compute_unread_count(last_timeline_seq=40, last_read_seq=38, unread_exempt_count=3) == 0
+
+
+@pytest.mark.asyncio
+async def test_user_dialogs_are_read_from_memberships_in_activity_order() -> None:
+    user_id = uuid.uuid4()
+    last_message_id = uuid.uuid4()
+    chat = ChatModel(
+        chat_id=uuid.uuid4(),
+        title="chat",
+        last_message_id=last_message_id,
+        last_timeline_seq=12,
+    )
+    empty_chat = ChatModel(chat_id=uuid.uuid4(), title="empty", last_timeline_seq=2)
+    membership = MembershipModel(
+        chat_id=chat.chat_id,
+        user_id=user_id,
+        last_read_seq=7,
+        unread_exempt_count=2,
+    )
+    empty_membership = MembershipModel(
+        chat_id=empty_chat.chat_id,
+        user_id=user_id,
+        last_read_seq=0,
+        unread_exempt_count=2,
+    )
+
+    class _Message:
+        message_id = last_message_id
+
+    session = _Session([[(chat, membership), (empty_chat, empty_membership)], [_Message()]])
+    repository = ChatRepository(session)  # type: ignore[arg-type]
+
+    dialogs = await repository.get_user_dialogs(user_id=user_id, offset=0, limit=20)
+
+    dialogs_sql = _compile(session.statements[0])
+    assert "ORDER BY chat_user.last_message_at DESC NULLS LAST, chat_user.chat_id" in dialogs_sql
+    assert "max(" not in dialogs_sql
+    assert "row_number" not in _compile(session.statements[1])
+    assert f"messages.message_id IN ('{last_message_id}')" in _compile(session.statements[1])
+    assert [dialog.unread_count for dialog in dialogs] == [3, 0]
+    assert membership.last_read_seq == 7
+    assert dialogs[0].last_message.message_id == last_message_id
+    assert dialogs[1].last_message is None
+
+
+@pytest.mark.asyncio
+async def test_mark_read_uses_chat_last_message_and_resets_unread_count() -> None:
+    last_message_id = uuid.uuid4()
+    session = _Session([last_message_id])
+    repository = ChatRepository(session)  # type: ignore[arg-type]
+
+    result = await repository.mark_read(chat_id=uuid.uuid4(), user_id=uuid.uuid4())
+
+    sql = _compile(session.statements[0])
+    assert result == last_message_id
+    assert "last_read_seq=chats.last_timeline_seq" in sql
+    assert "last_read_message_id=chats.last_message_id" in sql
+    assert "unread_exempt_count=0" in sql
+    assert session.committed is True
+
+
+@pytest.mark.asyncio
+async def test_mark_read_up_to_advances_markers_in_one_transaction() -> None:
+    user_id = uuid.uuid4()
+    first_chat_id = uuid.uuid4()
+    second_chat_id = uuid.uuid4()
+    session = _Session([15, None])
+    repository = ChatRepository(session)  # type: ignore[arg-type]
+
+    result = await repository.mark_read_up_to(
+        user_id=user_id,
+        read_seqs={first_chat_id: 15, second_chat_id: 4},
+    )
+
+    sql = _compile(session.statements[0])
+    assert result == {first_chat_id: 15}
+    assert len(session.statements) == 2
+    assert session.committed is True
+    assert "least(15, (SELECT chats.last_timeline_seq" in sql
+    assert "chat_user.last_read_seq < least(15" in sql
+    assert "unread_exempt_count=greatest(chat_user.unread_exempt_count - (SELECT count(*)" in sql
+    assert "chat_timeline_items.chat_seq > chat_user.last_read_seq" in sql
+    assert f"messages.user_id = '{user_id}'" in sql
+    assert "RETURNING chat_user.last_read_seq" in sql
+
+
+@pytest.mark.asyncio
+async def test_added_members_start_caught_up_with_the_chat() -> None:
+    session = _Session([2])
+    repository = ChatRepository(session)  # type: ignore[arg-type]
+
+    await repository.add_members(chat_id=uuid.uuid4(), users_ids=[uuid.uuid4(), uuid.uuid4()])
+
+    sql = _compile(session.statements[0])
+    assert "INSERT INTO chat_user (chat_id, user_id, role, last_read_seq, last_read_message_id, last_message_at" in sql
+    assert "coalesce(anon_3.last_timeline_seq, 0)" in sql
+    assert "LEFT OUTER JOIN (SELECT chats.last_timeline_seq" in sql
@@ -0,0 +1,160 @@
+import uuid
+
+import pytest
+
+from src.chats.enums import ChatType
+from src.chats.membership_cache import ChatMembershipCache, SocketChatAuthorizations, build_chat_members_key
+from src.chats.service import ChatService
+from src.common.exceptions import PermissionDenied
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._calls: list[tuple] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:  # type: ignore[no-untyped-def]
+        return None
+
+    def sadd(self, key: str, *members: str) -> None:
+        self._calls.append(("sadd", key, members))
+
+    def expire(self, key: str, seconds: int, *, nx: bool = False) -> None:
+        self._calls.append(("expire", key, (seconds, nx)))
+
+    async def execute(self) -> None:
+        for name, key, value in self._calls:
+            if name == "sadd":
+                self._redis.sets.setdefault(key, set()).update(value)
+            else:
+                seconds, nx = value
+                if not nx or key not in self._redis.ttls:
+                    self._redis.ttls[key] = seconds
+                    self._redis.deadlines[key] = self._redis.now + seconds
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.sets: dict[str, set[str]] = {}
+        self.ttls: dict[str, int] = {}
+        self.deadlines: dict[str, float] = {}
+        self.now = 0.0
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+        for key, deadline in list(self.deadlines.items()):
+            if deadline <= self.now:
+                self.sets.pop(key, None)
+                self.ttls.pop(key, None)
+                del self.deadlines[key]
+
+    def pipeline(self, *, transaction: bool) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def sismember(self, key: str, member: str) -> bool:
+        return member in self.sets.get(key, set())
+
+    async def srem(self, key: str, *members: str) -> None:
+        self.sets.get(key, set()).difference_update(members)
+
+    async def delete(self, key: str) -> None:
+        self.sets.pop(key, None)
+        self.ttls.pop(key, None)
+        self.deadlines.pop(key, None)
+
+
+class FakeChatRepository:
+    def __init__(self, *, members: set[uuid.UUID], owner_id: uuid.UUID) -> None:
+        self.members = members
+        self.chat = type("Chat", (), {"owner_id": owner_id, "chat_type": ChatType.GROUP.value})()
+        self.is_member_calls = 0
+
+    async def is_member(self, *, chat_id: uuid.UUID, user_id: uuid.UUID) -> bool:
+        self.is_member_calls += 1
+        return user_id in self.members
+
+    async def get_single(self, **_filters):  # type: ignore[no-untyped-def]
+        return self.chat
+
+    async def is_owner_member(self, **_kwargs) -> bool:  # type: ignore[no-untyped-def]
+        return False
+
+    async def remove_members(self, *, chat_id: uuid.UUID, members_ids: list[uuid.UUID]) -> int:
+        self.members.difference_update(members_ids)
+        return len(members_ids)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_verified_membership_is_served_from_redis() -> None:
+    chat_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    redis = FakeRedis()
+    repository = FakeChatRepository(members={user_id}, owner_id=uuid.uuid4())
+    service = ChatService(repository, membership_cache=ChatMembershipCache(redis, ttl_seconds=60))  # type: ignore[arg-type]
+
+    await service.ensure_user_is_chat_member(chat_id=chat_id, user_id=user_id)
+    await service.ensure_user_is_chat_member(chat_id=chat_id, user_id=user_id)
+
+    assert repository.is_member_calls == 1
+    assert redis.sets[build_chat_members_key(chat_id)] == {str(user_id)}
+    assert redis.ttls[build_chat_members_key(chat_id)] == 60
+
+
+@pytest.mark.anyio
+async def test_removed_member_is_dropped_from_cache_and_rejected() -> None:
+    chat_id = uuid.uuid4()
+    owner_id = uuid.uuid4()
+    member_id = uuid.uuid4()
+    redis = FakeRedis()
+    repository = FakeChatRepository(members={owner_id, member_id}, owner_id=owner_id)
+    service = ChatService(repository, membership_cache=ChatMembershipCache(redis, ttl_seconds=60))  # type: ignore[arg-type]
+    await service.ensure_user_is_chat_member(chat_id=chat_id, user_id=member_id)
+
+    await service.remove_members_from_chat(chat_id=chat_id, user_id=owner_id, members_ids=[member_id])
+
+    assert str(member_id) not in redis.sets[build_chat_members_key(chat_id)]
+    with pytest.raises(PermissionDenied):
+        await service.ensure_user_is_chat_member(chat_id=chat_id, user_id=member_id)
+
+
+@pytest.mark.anyio
+async def test_stale_member_re_added_after_removal_still_expires() -> None:
+    chat_id = uuid.uuid4()
+    member_id = uuid.uuid4()
+    redis = FakeRedis()
+    cache = ChatMembershipCache(redis, ttl_seconds=60)  # type: ignore[arg-type]
+    await cache.add_members(chat_id=chat_id, user_ids=[member_id])
+    redis.advance(50)
+
+    await cache.remove_members(chat_id=chat_id, user_ids=[member_id])
+    # A verification that read Postgres before the removal lands afterwards.
+    await cache.add_members(chat_id=chat_id, user_ids=[member_id])
+    assert await cache.is_member(chat_id=chat_id, user_id=member_id)
+
+    redis.advance(11)
+    assert not await cache.is_member(chat_id=chat_id, user_id=member_id)
+
+
+def test_socket_authorizations_expire_and_are_dropped_with_the_sid() -> None:
+    now = [100.0]
+    chat_id = uuid.uuid4()
+    authorizations = SocketChatAuthorizations(ttl_seconds=30, clock=lambda: now[0])
+
+    authorizations.authorize("sid-1", chat_id)
+    assert authorizations.is_authorized("sid-1", chat_id)
+    assert not authorizations.is_authorized("sid-2", chat_id)
+
+    now[0] += 31
+    assert not authorizations.is_authorized("sid-1", chat_id)
+
+    authorizations.authorize("sid-1", chat_id)
+    authorizations.drop_sid("sid-1")
+    assert not authorizations.is_authorized("sid-1", chat_id)
@@ -17,6 +17,31 @@ def test_membership_last_read_message_index_is_registered() -> None:
     assert [column.name for column in index.columns] == ["last_read_message_id"]
 
 
+def test_membership_dialog_columns_and_activity_index_are_registered() -> None:
+    columns = MembershipModel.__table__.columns
+    indexes = {index.name: index for index in MembershipModel.__table__.indexes}
+
+    assert columns["last_message_at"].nullable is True
+    assert columns["last_read_seq"].nullable is False
+    assert columns["unread_exempt_count"].nullable is False
+    index = indexes["ix_chat_user_user_last_message_at"]
+    assert [str(expression) for expression in index.expressions] == [
+        "chat_user.user_id",
+        "last_message_at DESC NULLS LAST",
+        "chat_user.chat_id",
+    ]
+
+
+def test_chat_last_message_columns_are_registered() -> None:
+    columns = ChatModel.__table__.columns
+
+    assert columns["last_message_id"].nullable is True
+    assert columns["last_message_at"].nullable is True
+    foreign_key = next(iter(columns["last_message_id"].foreign_keys))
+    assert foreign_key.column.table.name == "messages"
+    assert foreign_key.ondelete == "SET NULL"
+
+
 def test_chat_timeline_seq_column_is_registered() -> None:
     columns = ChatModel.__table__.columns
 
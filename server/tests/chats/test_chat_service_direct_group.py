@@ -6,7 +6,7 @@ import pytest
 
 from src.chats.enums import ChatMemberRole, ChatType
 from src.chats.exceptions import CantAddMembers, InvalidChatHistoryCursor
-from src.chats.schemas import ChatCreate
+from src.chats.schemas import ChatCreate, ChatReadMarkerWS
 from src.chats.service import ChatService
 from src.common.model_registry import import_all_models
 from src.events.models import EventModel
@@ -105,12 +105,17 @@ class FakeChatRepository:
         self.marked_read = (chat_id, user_id)
         return uuid.uuid4()
 
-    async def history(self, *, chat_id, limit, before_seq=None, after_seq=None):
+    async def mark_read_up_to(self, *, user_id, read_seqs):
+        self.marked_read_up_to = (user_id, read_seqs)
+        return dict(read_seqs)
+
+    async def history(self, *, chat_id, limit, before_seq=None, after_seq=None, viewer_id=None):
         self.history_args = {
             "chat_id": chat_id,
             "limit": limit,
             "before_seq": before_seq,
             "after_seq": after_seq,
+            "viewer_id": viewer_id,
         }
         return self.history_items
 
@@ -235,6 +240,7 @@ async def test_user_dialogs_resolve_direct_display_title_and_unread_state() -> N
         SimpleNamespace(
             is_muted=True,
             last_read_message_id=read_message_id,
+            last_read_seq=9,
         ),
     )
     setattr(repository.dialogs[0], "unread_count", 3)
@@ -253,6 +259,7 @@ async def test_user_dialogs_resolve_direct_display_title_and_unread_state() -> N
     assert dialogs[0].unread_count == 3
     assert dialogs[0].is_muted is True
     assert dialogs[0].last_read_message_id == read_message_id
+    assert dialogs[0].last_read_seq == 9
 
 
 @pytest.mark.asyncio
@@ -295,6 +302,27 @@ async def test_mark_chat_read_updates_current_member() -> None:
     assert repository.marked_read == (chat_id, user_id)
 
 
+@pytest.mark.asyncio
+async def test_mark_chats_read_up_to_keeps_highest_seq_per_chat() -> None:
+    user_id = uuid.uuid4()
+    first_chat_id = uuid.uuid4()
+    second_chat_id = uuid.uuid4()
+    repository = FakeChatRepository()
+    service = ChatService(repository)  # type: ignore[arg-type]
+
+    result = await service.mark_chats_read_up_to(
+        user_id=user_id,
+        reads=[
+            ChatReadMarkerWS(chat_id=first_chat_id, seq=12),
+            ChatReadMarkerWS(chat_id=second_chat_id, seq=3),
+            ChatReadMarkerWS(chat_id=first_chat_id, seq=10),
+        ],
+    )
+
+    assert repository.marked_read_up_to == (user_id, {first_chat_id: 12, second_chat_id: 3})
+    assert result == {first_chat_id: 12, second_chat_id: 3}
+
+
 @pytest.mark.asyncio
 async def test_chat_history_rejects_conflicting_cursors() -> None:
     service = ChatService(FakeChatRepository())  # type: ignore[arg-type]
@@ -366,4 +394,5 @@ async def test_chat_history_passes_cursor_to_repository() -> None:
         "limit": 5,
         "before_seq": None,
         "after_seq": 42,
+        "viewer_id": None,
     }
@@ -0,0 +1,85 @@
+import json
+import uuid
+
+import pytest
+import socketio
+from socketio import async_pubsub_manager, packet
+
+from src.chats import sockets
+from src.chats.broadcast import (
+    CURRENT_SOCKET_PROTOCOL,
+    LEGACY_SOCKET_PROTOCOL,
+    BatchingAsyncRedisManager,
+    PacketJSON,
+    RawJSON,
+    RoomEmit,
+    build_message_created_emits,
+    legacy_chat_room,
+    parse_socket_protocol,
+)
+
+
+def test_packet_json_splices_raw_payloads_without_reencoding() -> None:
+    raw = RawJSON('{"content":"say \\"hi\\"","n":1}')
+
+    encoded = PacketJSON.dumps(["message:created", raw, {"ok": True, "data": raw}], separators=(",", ":"))
+
+    assert encoded == '["message:created",{"content":"say \\"hi\\"","n":1},{"ok":true,"data":{"content":"say \\"hi\\"","n":1}}]'
+    assert json.loads(encoded)[1] == {"content": 'say "hi"', "n": 1}
+
+
+def test_socket_server_encodes_event_packets_with_packet_json() -> None:
+    assert sockets.sio.packet_class.json is PacketJSON
+    pkt = sockets.sio.packet_class(packet.EVENT, data=["message:created", RawJSON('{"a":1}')])
+
+    assert pkt.encode() == '2["message:created",{"a":1}]'
+
+
+def test_socket_protocol_defaults_to_legacy() -> None:
+    assert parse_socket_protocol({"token": "t"}) == LEGACY_SOCKET_PROTOCOL
+    assert parse_socket_protocol({"token": "t", "protocol": "2"}) == LEGACY_SOCKET_PROTOCOL
+    assert parse_socket_protocol({"token": "t", "protocol": True}) == LEGACY_SOCKET_PROTOCOL
+    assert parse_socket_protocol({"token": "t", "protocol": 2}) == CURRENT_SOCKET_PROTOCOL
+    assert parse_socket_protocol(None) == LEGACY_SOCKET_PROTOCOL
+
+
+def test_legacy_message_event_only_targets_legacy_room() -> None:
+    chat_id = uuid.uuid4()
+    payload = RawJSON('{"a":1}')
+
+    created, legacy = build_message_created_emits(payload, chat_id=chat_id, skip_sid="sid-1")
+
+    assert (created.event, created.data, created.room, created.skip_sid) == ("message:created", payload, str(chat_id), None)
+    assert (legacy.event, legacy.data, legacy.room, legacy.skip_sid) == ("message", '{"a":1}', legacy_chat_room(chat_id), "sid-1")
+
+
+@pytest.mark.asyncio
+async def test_emit_batch_publishes_once_and_replays_every_emit(monkeypatch) -> None:
+    manager = BatchingAsyncRedisManager("redis://localhost:6379/2", write_only=True)
+    published = []
+    handled = []
+
+    async def publish(message):  # type: ignore[no-untyped-def]
+        published.append(message)
+
+    async def handle_emit(self, message):  # type: ignore[no-untyped-def]
+        handled.append((message["event"], message["room"], message["skip_sid"]))
+
+    monkeypatch.setattr(manager, "_publish", publish)
+    monkeypatch.setattr(async_pubsub_manager.AsyncPubSubManager, "_handle_emit", handle_emit)
+
+    await manager.emit_batch([RoomEmit("message:created", {"a": 1}, room="r1"), RoomEmit("message", "{}", room="r1:v1", skip_sid="s")])
+
+    assert len(published) == 1
+    assert [item["event"] for item in published[0]["batch"]] == ["message:created", "message"]
+    assert handled == [("message:created", "r1", None), ("message", "r1:v1", "s")]
+
+    # Other hosts receive the same message through the pub/sub listener.
+    handled.clear()
+    await manager._handle_emit(published[0])
+    assert handled == [("message:created", "r1", None), ("message", "r1:v1", "s")]
+
+
+def test_socket_server_uses_batching_manager() -> None:
+    assert isinstance(sockets.sio.manager, BatchingAsyncRedisManager)
+    assert isinstance(sockets.sio.manager, socketio.AsyncRedisManager)
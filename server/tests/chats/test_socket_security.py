@@ -107,3 +107,45 @@ def test_socket_message_create_does_not_accept_client_created_at() -> None:
     )
 
     assert not hasattr(result, "created_at")
+
+
+@pytest.mark.asyncio
+async def test_chats_read_only_moves_markers_of_the_authenticated_user(monkeypatch) -> None:
+    user_id = uuid.uuid4()
+    chat_id = uuid.uuid4()
+    calls = []
+
+    class _ChatService:
+        async def mark_chats_read_up_to(self, *, user_id, reads):
+            calls.append((user_id, [(read.chat_id, read.seq) for read in reads]))
+            return {chat_id: 8}
+
+    class _SessionManager:
+        async def __aenter__(self):
+            return object()
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+    async def get_socket_user_id(sid):
+        return user_id
+
+    monkeypatch.setattr(sockets, "_get_socket_user_id", get_socket_user_id)
+    monkeypatch.setattr(sockets, "async_session_maker", _SessionManager)
+    monkeypatch.setattr(sockets, "get_chat_service", lambda session: _ChatService())
+
+    result = await sockets.on_chats_read(
+        "sid-1",
+        {"reads": [{"chat_id": str(chat_id), "seq": 9}], "user_id": str(uuid.uuid4())},
+    )
+
+    assert calls == [(user_id, [(chat_id, 9)])]
+    assert result == {"ok": True, "data": {"reads": [{"chat_id": str(chat_id), "last_read_seq": 8}]}}
+
+
+@pytest.mark.asyncio
+async def test_chats_read_rejects_negative_seq() -> None:
+    result = await sockets.on_chats_read("sid-1", {"reads": [{"chat_id": str(uuid.uuid4()), "seq": -1}]})
+
+    assert result["ok"] is False
+    assert result["error"]["code"] == "bad_request"
@@ -0,0 +1,132 @@
+import asyncio
+import uuid
+
+import pytest
+
+from src.chats import typing_aggregator as aggregator_module
+from src.chats.typing_aggregator import TYPING_SNAPSHOT_REFRESH_SECONDS, TypingAggregator, build_typing_snapshot_digest
+from src.chats.typing_state import TypingUser
+
+
+class FakeTypingState:
+    def __init__(self) -> None:
+        self.users: dict[uuid.UUID, list[TypingUser]] = {}
+        self.snapshots: dict[uuid.UUID, str] = {}
+        self.reads = 0
+
+    async def get_chat_typing_users(self, *, chat_id: uuid.UUID) -> list[TypingUser]:
+        self.reads += 1
+        return list(self.users.get(chat_id, []))
+
+    async def swap_chat_typing_snapshot(self, *, chat_id: uuid.UUID, digest: str) -> str | None:
+        previous = self.snapshots.get(chat_id)
+        self.snapshots[chat_id] = digest
+        return previous
+
+
+@pytest.fixture
+def typing_state(monkeypatch) -> FakeTypingState:
+    state = FakeTypingState()
+    monkeypatch.setattr(aggregator_module.typing_state, "get_chat_typing_users", state.get_chat_typing_users)
+    monkeypatch.setattr(aggregator_module.typing_state, "swap_chat_typing_snapshot", state.swap_chat_typing_snapshot)
+    return state
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _aggregator(emitted: list, clock: FakeClock | None = None) -> TypingAggregator:
+    async def emit(chat_id, users):  # type: ignore[no-untyped-def]
+        emitted.append((chat_id, [user.username for user in users]))
+
+    return TypingAggregator(emit=emit, interval_seconds=0.01, clock=clock or FakeClock())
+
+
+@pytest.mark.asyncio
+async def test_bursts_of_typing_events_produce_one_snapshot(typing_state) -> None:
+    chat_id = uuid.uuid4()
+    emitted: list = []
+    aggregator = _aggregator(emitted)
+    typing_state.users[chat_id] = [TypingUser(uuid.uuid4(), "alice"), TypingUser(uuid.uuid4(), "bob")]
+
+    for _ in range(20):
+        aggregator.touch(chat_id)
+    await aggregator.flush()
+    await aggregator.flush()
+
+    assert emitted == [(chat_id, ["alice", "bob"])]
+    aggregator._task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_expired_statuses_produce_an_empty_snapshot_and_stop_the_loop(typing_state) -> None:
+    chat_id = uuid.uuid4()
+    emitted: list = []
+    aggregator = _aggregator(emitted)
+    typing_state.users[chat_id] = [TypingUser(uuid.uuid4(), "alice")]
+
+    aggregator.touch(chat_id)
+    await asyncio.sleep(0.03)
+    typing_state.users[chat_id] = []
+    await asyncio.sleep(0.05)
+
+    assert emitted == [(chat_id, ["alice"]), (chat_id, [])]
+    assert aggregator._task is not None and aggregator._task.done()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_already_sent_by_another_host_is_not_repeated(typing_state) -> None:
+    chat_id = uuid.uuid4()
+    user = TypingUser(uuid.uuid4(), "alice")
+    emitted: list = []
+    clock = FakeClock()
+    typing_state.users[chat_id] = [user]
+    typing_state.snapshots[chat_id] = build_typing_snapshot_digest([user], now=clock.now)
+    aggregator = _aggregator(emitted, clock)
+
+    aggregator.touch(chat_id)
+    await aggregator.flush()
+
+    assert emitted == []
+    aggregator._task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_unchanged_typing_set_is_resent_every_refresh_window(typing_state) -> None:
+    chat_id = uuid.uuid4()
+    emitted: list = []
+    clock = FakeClock()
+    aggregator = _aggregator(emitted, clock)
+    typing_state.users[chat_id] = [TypingUser(uuid.uuid4(), "alice")]
+
+    aggregator.touch(chat_id)
+    await aggregator.flush()
+    clock.now += TYPING_SNAPSHOT_REFRESH_SECONDS / 4
+    await aggregator.flush()
+    clock.now += TYPING_SNAPSHOT_REFRESH_SECONDS
+    await aggregator.flush()
+
+    assert emitted == [(chat_id, ["alice"]), (chat_id, ["alice"])]
+    aggregator._task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_empty_snapshot_is_sent_when_stored_digest_expired(typing_state) -> None:
+    chat_id = uuid.uuid4()
+    emitted: list = []
+    aggregator = _aggregator(emitted)
+    typing_state.users[chat_id] = [TypingUser(uuid.uuid4(), "alice")]
+
+    aggregator.touch(chat_id)
+    await aggregator.flush()
+    typing_state.snapshots.pop(chat_id)
+    typing_state.users[chat_id] = []
+    await aggregator.flush()
+
+    assert emitted == [(chat_id, ["alice"]), (chat_id, [])]
+    aggregator._task.cancel()
@@ -35,16 +35,19 @@ async def test_typing_start_marks_state_and_broadcasts_to_chat(monkeypatch) -> N
     user_id = uuid.uuid4()
     fake_service = FakeChatService()
     emit = AsyncMock()
-    mark_chat_typing = AsyncMock()
+    mark_chat_typing = AsyncMock(return_value=True)
+    touched = []
 
     monkeypatch.setattr(sockets, "_get_socket_user_context", AsyncMock(return_value=(user_id, "alice")))
     monkeypatch.setattr(sockets, "async_session_maker", lambda: DummySessionManager(object()))
     monkeypatch.setattr(sockets, "get_chat_service", lambda session: fake_service)
     monkeypatch.setattr(sockets.typing_state, "mark_chat_typing", mark_chat_typing)
+    monkeypatch.setattr(sockets.typing_aggregator, "touch", touched.append)
     monkeypatch.setattr(sockets.sio, "emit", emit)
 
     result = await sockets.on_typing_start("sid-1", {"chat_id": str(chat_id)})
 
+    assert touched == [chat_id]
     assert result == {"ok": True, "data": {"expires_in_seconds": sockets.typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS}}
     assert fake_service.calls == [(chat_id, user_id)]
     mark_chat_typing.assert_awaited_once_with(
@@ -62,24 +65,50 @@ async def test_typing_start_marks_state_and_broadcasts_to_chat(monkeypatch) -> N
             "expires_in_seconds": sockets.typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS,
         },
     )
+    # Per-user events only go to protocol 1 sockets; others get snapshots.
     assert emit.await_args.kwargs == {
-        "room": str(chat_id),
+        "room": f"{chat_id}:v1",
         "skip_sid": "sid-1",
     }
 
 
+@pytest.mark.asyncio
+async def test_typing_start_refreshes_legacy_clients_while_typing_continues(monkeypatch) -> None:
+    chat_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    emit = AsyncMock()
+    # Only the first start flips the user from idle to typing.
+    mark_chat_typing = AsyncMock(side_effect=[True, False])
+
+    monkeypatch.setattr(sockets, "_get_socket_user_context", AsyncMock(return_value=(user_id, "alice")))
+    monkeypatch.setattr(sockets, "async_session_maker", lambda: DummySessionManager(object()))
+    monkeypatch.setattr(sockets, "get_chat_service", lambda session: FakeChatService())
+    monkeypatch.setattr(sockets.typing_state, "mark_chat_typing", mark_chat_typing)
+    monkeypatch.setattr(sockets.typing_aggregator, "touch", lambda chat_id: None)
+    monkeypatch.setattr(sockets.sio, "emit", emit)
+
+    await sockets.on_typing_start("sid-1", {"chat_id": str(chat_id)})
+    await sockets.on_typing_start("sid-1", {"chat_id": str(chat_id)})
+
+    assert emit.await_count == 2
+    for call in emit.await_args_list:
+        assert call.args[0] == "typing:start"
+        assert call.kwargs == {"room": f"{chat_id}:v1", "skip_sid": "sid-1"}
+
+
 @pytest.mark.asyncio
 async def test_typing_stop_clears_state_and_broadcasts_stop(monkeypatch) -> None:
     chat_id = uuid.uuid4()
     user_id = uuid.uuid4()
     fake_service = FakeChatService()
     emit = AsyncMock()
-    clear_chat_typing = AsyncMock()
+    clear_chat_typing = AsyncMock(return_value=True)
 
     monkeypatch.setattr(sockets, "_get_socket_user_context", AsyncMock(return_value=(user_id, "alice")))
     monkeypatch.setattr(sockets, "async_session_maker", lambda: DummySessionManager(object()))
     monkeypatch.setattr(sockets, "get_chat_service", lambda session: fake_service)
     monkeypatch.setattr(sockets.typing_state, "clear_chat_typing", clear_chat_typing)
+    monkeypatch.setattr(sockets.typing_aggregator, "touch", lambda chat_id: None)
     monkeypatch.setattr(sockets.sio, "emit", emit)
 
     result = await sockets.on_typing_stop("sid-1", {"chat_id": str(chat_id)})
@@ -100,8 +129,9 @@ async def test_typing_stop_clears_state_and_broadcasts_stop(monkeypatch) -> None
             "expires_in_seconds": sockets.typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS,
         },
     )
+    # Per-user events only go to protocol 1 sockets; others get snapshots.
     assert emit.await_args.kwargs == {
-        "room": str(chat_id),
+        "room": f"{chat_id}:v1",
         "skip_sid": "sid-1",
     }
 
@@ -126,3 +156,51 @@ async def test_typing_start_rejects_non_member(monkeypatch) -> None:
     assert result["error"]["code"] == "forbidden"
     mark_chat_typing.assert_not_awaited()
     emit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_repeated_typing_events_reuse_socket_authorization(monkeypatch) -> None:
+    chat_id = uuid.uuid4()
+    user_id = uuid.uuid4()
+    fake_service = FakeChatService()
+
+    monkeypatch.setattr(sockets, "socket_chat_authorizations", sockets.SocketChatAuthorizations())
+    monkeypatch.setattr(sockets, "_get_socket_user_context", AsyncMock(return_value=(user_id, "alice")))
+    monkeypatch.setattr(sockets, "async_session_maker", lambda: DummySessionManager(object()))
+    monkeypatch.setattr(sockets, "get_chat_service", lambda session: fake_service)
+    monkeypatch.setattr(sockets.typing_state, "mark_chat_typing", AsyncMock(return_value=True))
+    monkeypatch.setattr(sockets.typing_state, "clear_chat_typing", AsyncMock(return_value=True))
+    monkeypatch.setattr(sockets.typing_aggregator, "touch", lambda chat_id: None)
+    monkeypatch.setattr(sockets.sio, "emit", AsyncMock())
+
+    await sockets.on_typing_start("sid-1", {"chat_id": str(chat_id)})
+    await sockets.on_typing_start("sid-1", {"chat_id": str(chat_id)})
+    await sockets.on_typing_stop("sid-1", {"chat_id": str(chat_id)})
+    await sockets.on_typing_start("sid-2", {"chat_id": str(chat_id)})
+
+    assert fake_service.calls == [(chat_id, user_id), (chat_id, user_id)]
+
+    sockets.socket_chat_authorizations.revoke("sid-1", chat_id)
+    await sockets.on_typing_stop("sid-1", {"chat_id": str(chat_id)})
+    assert len(fake_service.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_redundant_typing_stop_does_not_rebroadcast(monkeypatch) -> None:
+    chat_id = uuid.uuid4()
+    emit = AsyncMock()
+    touched = []
+
+    monkeypatch.setattr(sockets, "_get_socket_user_context", AsyncMock(return_value=(uuid.uuid4(), "alice")))
+    monkeypatch.setattr(sockets, "async_session_maker", lambda: DummySessionManager(object()))
+    monkeypatch.setattr(sockets, "get_chat_service", lambda session: FakeChatService())
+    monkeypatch.setattr(sockets.typing_state, "clear_chat_typing", AsyncMock(return_value=False))
+    monkeypatch.setattr(sockets.typing_aggregator, "touch", touched.append)
+    monkeypatch.setattr(sockets.sio, "emit", emit)
+
+    stop = await sockets.on_typing_stop("sid-1", {"chat_id": str(chat_id)})
+
+    assert stop == {"ok": True}
+    # A no-op stop changes nothing, so neither legacy clients nor the snapshot hear of it.
+    emit.assert_not_awaited()
+    assert touched == []
@@ -5,55 +5,126 @@ import pytest
 from src.chats import typing_state
 
 
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._calls: list[tuple[str, tuple]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:  # type: ignore[no-untyped-def]
+        return None
+
+    def __getattr__(self, name: str):  # type: ignore[no-untyped-def]
+        def queue(*args):  # type: ignore[no-untyped-def]
+            self._calls.append((name, args))
+
+        return queue
+
+    async def execute(self) -> list:
+        return [getattr(self._redis, name)(*args) for name, args in self._calls]
+
+
 class FakeRedis:
+    """Just enough of a sorted set, a hash and key TTLs for typing_state."""
+
     def __init__(self) -> None:
-        self.calls: list[tuple[str, tuple, dict]] = []
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+        self.values: dict[str, str] = {}
 
-    async def set(self, *args, **kwargs):
-        self.calls.append(("set", args, kwargs))
+    def pipeline(self, *, transaction: bool) -> FakePipeline:
+        return FakePipeline(self)
 
-    async def delete(self, *args, **kwargs):
-        self.calls.append(("delete", args, kwargs))
+    def zscore(self, key: str, member: str) -> float | None:
+        return self.zsets.get(key, {}).get(member)
 
+    def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
 
-@pytest.mark.asyncio
-async def test_mark_chat_typing_uses_ttl_and_key_format(monkeypatch) -> None:
-    fake_redis = FakeRedis()
-    monkeypatch.setattr(typing_state, "typing_redis", fake_redis)
+    def zrem(self, key: str, member: str) -> int:
+        return int(self.zsets.get(key, {}).pop(member, None) is not None)
+
+    def zrangebyscore(self, key: str, low: str, high: str) -> list[str]:
+        minimum = float(low.lstrip("("))
+        items = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+        return [member for member, score in items if score > minimum]
+
+    def zremrangebyscore(self, key: str, low: str, high: float) -> int:
+        expired = [member for member, score in self.zsets.get(key, {}).items() if score <= high]
+        for member in expired:
+            del self.zsets[key][member]
+        return len(expired)
+
+    def hset(self, key: str, field: str, value: str) -> int:
+        self.hashes.setdefault(key, {})[field] = value
+        return 1
+
+    def hdel(self, key: str, field: str) -> int:
+        return int(self.hashes.get(key, {}).pop(field, None) is not None)
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    def expire(self, key: str, seconds: int) -> bool:
+        self.ttls[key] = seconds
+        return True
 
+    async def set(self, key: str, value: str, *, ex: int, get: bool) -> str | None:
+        previous = self.values.get(key)
+        self.values[key] = value
+        self.ttls[key] = ex
+        return previous
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    redis = FakeRedis()
+    monkeypatch.setattr(typing_state, "typing_redis", redis)
+    return redis
+
+
+@pytest.mark.asyncio
+async def test_mark_chat_typing_scores_user_by_expiry_and_reports_new_typers(fake_redis) -> None:
     chat_id = uuid.uuid4()
     user_id = uuid.uuid4()
-    await typing_state.mark_chat_typing(
-        chat_id=chat_id,
-        user_id=user_id,
-        username="alice",
-    )
 
-    assert fake_redis.calls == [
-        (
-            "set",
-            (f"chats:typing:{chat_id}:{user_id}", "alice"),
-            {"ex": typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS},
-        ),
-    ]
+    started = await typing_state.mark_chat_typing(chat_id=chat_id, user_id=user_id, username="alice", now=100.0)
+    refreshed = await typing_state.mark_chat_typing(chat_id=chat_id, user_id=user_id, username="alice", now=102.0)
 
+    key = f"chats:typing:{chat_id}"
+    assert (started, refreshed) == (True, False)
+    assert fake_redis.zsets[key] == {str(user_id): 102.0 + typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS}
+    assert fake_redis.hashes[f"{key}:names"] == {str(user_id): "alice"}
+    assert fake_redis.ttls[key] == typing_state.TYPING_STATUS_EXPIRES_IN_SECONDS
 
-@pytest.mark.asyncio
-async def test_clear_chat_typing_deletes_key(monkeypatch) -> None:
-    fake_redis = FakeRedis()
-    monkeypatch.setattr(typing_state, "typing_redis", fake_redis)
+    # A status that already expired counts as a new start.
+    assert await typing_state.mark_chat_typing(chat_id=chat_id, user_id=user_id, username="alice", now=200.0) is True
 
+
+@pytest.mark.asyncio
+async def test_clear_chat_typing_reports_whether_user_was_typing(fake_redis) -> None:
     chat_id = uuid.uuid4()
     user_id = uuid.uuid4()
-    await typing_state.clear_chat_typing(
-        chat_id=chat_id,
-        user_id=user_id,
-    )
-
-    assert fake_redis.calls == [
-        (
-            "delete",
-            (f"chats:typing:{chat_id}:{user_id}",),
-            {},
-        ),
-    ]
+    await typing_state.mark_chat_typing(chat_id=chat_id, user_id=user_id, username="alice")
+
+    assert await typing_state.clear_chat_typing(chat_id=chat_id, user_id=user_id) is True
+    assert await typing_state.clear_chat_typing(chat_id=chat_id, user_id=user_id) is False
+    assert fake_redis.zsets[f"chats:typing:{chat_id}"] == {}
+
+
+@pytest.mark.asyncio
+async def test_get_chat_typing_users_prunes_expired_statuses(fake_redis) -> None:
+    chat_id = uuid.uuid4()
+    alice = uuid.uuid4()
+    bob = uuid.uuid4()
+    await typing_state.mark_chat_typing(chat_id=chat_id, user_id=alice, username="alice", now=100.0)
+    await typing_state.mark_chat_typing(chat_id=chat_id, user_id=bob, username="bob", now=103.0)
+
+    users = await typing_state.get_chat_typing_users(chat_id=chat_id, now=107.0)
+
+    assert users == [typing_state.TypingUser(user_id=bob, username="bob")]
+    assert list(fake_redis.zsets[f"chats:typing:{chat_id}"]) == [str(bob)]
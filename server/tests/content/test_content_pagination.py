@@ -0,0 +1,213 @@
+import datetime
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from fastapi import Response
+from sqlalchemy.dialects import postgresql
+
+from src.common.model_registry import import_all_models
+from src.content.enums import ContentProfileFilterEnum
+from src.content.enums_list import ContentOrder
+from src.content.exceptions import InvalidContentCursor
+from src.content.pagination import (
+    NEXT_CURSOR_HEADER,
+    VIDEO_SCORE_CURSOR_KEY,
+    ContentCursor,
+    build_next_content_cursor,
+    decode_content_cursor,
+    encode_content_cursor,
+    resolve_content_cursor,
+    set_next_cursor_header,
+)
+from src.content.repository import ContentRepository
+
+import_all_models()
+
+
+class FakeResult:
+    def scalars(self):  # type: ignore[no-untyped-def]
+        return self
+
+    def unique(self):  # type: ignore[no-untyped-def]
+        return self
+
+    def all(self):  # type: ignore[no-untyped-def]
+        return []
+
+
+class CapturingSession:
+    def __init__(self) -> None:
+        self.statements = []
+
+    async def execute(self, stmt):  # type: ignore[no-untyped-def]
+        self.statements.append(stmt)
+        return FakeResult()
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _compile_sql(stmt) -> str:  # type: ignore[no-untyped-def]
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def _item(**overrides):  # type: ignore[no-untyped-def]
+    now = datetime.datetime(2026, 5, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    values = {
+        "content_id": uuid.uuid4(),
+        "created_at": now,
+        "updated_at": now,
+        "published_at": now,
+        "views_count": 10,
+        "likes_count": 2,
+        "comments_count": 1,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_cursor_round_trips_sort_values_and_tiebreaker() -> None:
+    published_at = datetime.datetime(2026, 5, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    cursor = ContentCursor(
+        key=ContentOrder.PUBLISHED_AT.value,
+        order_desc=True,
+        values=(published_at,),
+        content_id=uuid.uuid4(),
+    )
+
+    decoded = decode_content_cursor(
+        encode_content_cursor(cursor),
+        key=ContentOrder.PUBLISHED_AT.value,
+        order_desc=True,
+    )
+
+    assert decoded == cursor
+
+
+def test_cursor_rejects_mismatched_ordering_and_garbage() -> None:
+    token = encode_content_cursor(
+        ContentCursor(
+            key=ContentOrder.CREATED_AT.value,
+            order_desc=True,
+            values=(datetime.datetime.now(datetime.timezone.utc),),
+            content_id=uuid.uuid4(),
+        )
+    )
+
+    with pytest.raises(InvalidContentCursor):
+        decode_content_cursor(token, key=ContentOrder.CREATED_AT.value, order_desc=False)
+    with pytest.raises(InvalidContentCursor):
+        decode_content_cursor(token, key=ContentOrder.UPDATED_AT.value, order_desc=True)
+    with pytest.raises(InvalidContentCursor):
+        decode_content_cursor("not-a-cursor", key=ContentOrder.CREATED_AT.value, order_desc=True)
+
+
+def test_cursor_cannot_be_combined_with_offset() -> None:
+    token = encode_content_cursor(
+        ContentCursor(key=ContentOrder.ID.value, order_desc=True, values=(), content_id=uuid.uuid4())
+    )
+
+    with pytest.raises(InvalidContentCursor):
+        resolve_content_cursor(token, key=ContentOrder.ID.value, order_desc=True, offset=20)
+    assert resolve_content_cursor(None, key=ContentOrder.ID.value, order_desc=True, offset=20) is None
+
+
+def test_next_cursor_is_built_from_last_item_of_full_page() -> None:
+    items = [_item(), _item()]
+
+    assert build_next_content_cursor(items, key=ContentOrder.CREATED_AT.value, order_desc=True, limit=3) is None
+
+    token = build_next_content_cursor(items, key=VIDEO_SCORE_CURSOR_KEY, order_desc=True, limit=2)
+    assert token is not None
+    cursor = decode_content_cursor(token, key=VIDEO_SCORE_CURSOR_KEY, order_desc=True)
+    assert cursor.content_id == items[-1].content_id
+    assert cursor.values == (10 * 2 + 2 * 4 + 1 * 3, items[-1].published_at, items[-1].created_at)
+
+
+def test_next_cursor_header_is_set_only_when_page_is_full() -> None:
+    response = Response()
+    set_next_cursor_header(response, [_item()], key=ContentOrder.ID.value, order_desc=True, limit=5)
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+    set_next_cursor_header(response, [_item()], key=ContentOrder.ID.value, order_desc=True, limit=1)
+    assert NEXT_CURSOR_HEADER in response.headers
+
+
+@pytest.mark.anyio
+async def test_feed_with_cursor_uses_keyset_predicate_instead_of_offset() -> None:
+    session = CapturingSession()
+    repository = ContentRepository(session)  # type: ignore[arg-type]
+    cursor_id = uuid.uuid4()
+
+    await repository.get_feed(
+        viewer_id=None,
+        order=ContentOrder.PUBLISHED_AT,
+        order_desc=True,
+        offset=0,
+        limit=20,
+        cursor=ContentCursor(
+            key=ContentOrder.PUBLISHED_AT.value,
+            order_desc=True,
+            values=(datetime.datetime(2026, 5, 1, tzinfo=datetime.timezone.utc),),
+            content_id=cursor_id,
+        ),
+    )
+
+    sql = _compile_sql(session.statements[0])
+    assert "(content.published_at, content.content_id) < ('2026-05-01 00:00:00+00:00'" in sql
+    assert f"'{cursor_id}'" in sql
+    assert "ORDER BY content.published_at DESC, content.content_id DESC" in sql
+    assert "OFFSET 0" in sql
+
+
+@pytest.mark.anyio
+async def test_publications_cursor_after_draft_continues_into_published_rows() -> None:
+    session = CapturingSession()
+    repository = ContentRepository(session)  # type: ignore[arg-type]
+    author_id = uuid.uuid4()
+
+    await repository.get_author_publications(
+        author_id=author_id,
+        viewer_id=None,
+        content_type=None,
+        profile_filter=ContentProfileFilterEnum.PUBLIC,
+        order=ContentOrder.PUBLISHED_AT,
+        order_desc=True,
+        offset=0,
+        limit=20,
+        cursor=ContentCursor(
+            key=ContentOrder.PUBLISHED_AT.value,
+            order_desc=True,
+            values=(None,),
+            content_id=uuid.uuid4(),
+        ),
+    )
+
+    sql = _compile_sql(session.statements[0])
+    assert "content.published_at IS NULL AND content.content_id <" in sql
+    assert "OR content.published_at IS NOT NULL" in sql
+
+
+@pytest.mark.anyio
+async def test_publications_filter_visibility_in_sql_for_other_viewers() -> None:
+    session = CapturingSession()
+    repository = ContentRepository(session)  # type: ignore[arg-type]
+
+    await repository.get_author_publications(
+        author_id=uuid.uuid4(),
+        viewer_id=uuid.uuid4(),
+        content_type=None,
+        profile_filter=ContentProfileFilterEnum.ALL,
+        order=ContentOrder.PUBLISHED_AT,
+        order_desc=True,
+        offset=0,
+        limit=20,
+    )
+
+    sql = _compile_sql(session.statements[0])
+    assert "content.status = 'published'" in sql
+    assert "content.visibility = 'public'" in sql
+    assert "LIMIT 20" in sql
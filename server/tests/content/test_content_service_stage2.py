@@ -806,7 +806,7 @@ async def test_gallery_returns_post_media_items(monkeypatch, service_bundle) ->
 
     monkeypatch.setattr("src.content.service.build_post_attachment_get", fake_build_attachment)
 
-    items = await service.get_gallery(
+    page = await service.get_gallery(
         author_id=author.user_id,
         viewer_id=viewer.user_id,
         profile_filter=ContentProfileFilterEnum.PUBLIC,
@@ -815,8 +815,60 @@ async def test_gallery_returns_post_media_items(monkeypatch, service_bundle) ->
         offset=0,
         limit=20,
     )
+    items = page.items
 
+    assert page.next_cursor is None
     assert len(items) == 1
     assert items[0].post_id == content.content_id
     assert items[0].position == 2
     assert items[0].attachment.preview_url == "https://cdn.test/preview.jpg"
+
+
+@pytest.mark.anyio
+async def test_gallery_cursor_counts_posts_not_attachments(monkeypatch, service_bundle) -> None:
+    service, repository, content, author, viewer = service_bundle
+    content.content_type = ContentTypeEnum.POST
+    content.status = ContentStatusEnum.PUBLISHED
+    content.visibility = ContentVisibilityEnum.PUBLIC
+    content.video_playback_details = None
+    content.post_details = FakePostDetails(body_text="gallery post")
+    content.asset_links = [FakeLink(position=0), FakeLink(position=1), FakeLink(position=2)]
+    repository.gallery_posts = [content]
+
+    async def fake_build_attachment(link, *, storage):  # type: ignore[no-untyped-def]
+        return PostAttachmentGet(
+            asset_id=link.asset.asset_id,
+            attachment_type=AttachmentTypeEnum.MEDIA,
+            position=link.position,
+            asset_type=AssetTypeEnum.IMAGE,
+            mime_type="image/jpeg",
+            file_kind="image",
+            preview_url="https://cdn.test/preview.jpg",
+            original_url="https://cdn.test/original.jpg",
+        )
+
+    monkeypatch.setattr("src.content.service.build_post_attachment_get", fake_build_attachment)
+
+    full_page = await service.get_gallery(
+        author_id=author.user_id,
+        viewer_id=viewer.user_id,
+        profile_filter=ContentProfileFilterEnum.PUBLIC,
+        order=ContentOrder.CREATED_AT,
+        desc=True,
+        offset=0,
+        limit=1,
+    )
+    short_page = await service.get_gallery(
+        author_id=author.user_id,
+        viewer_id=viewer.user_id,
+        profile_filter=ContentProfileFilterEnum.PUBLIC,
+        order=ContentOrder.CREATED_AT,
+        desc=True,
+        offset=0,
+        limit=2,
+    )
+
+    assert len(full_page.items) == 3
+    assert full_page.next_cursor is not None
+    assert len(short_page.items) == 3
+    assert short_page.next_cursor is None
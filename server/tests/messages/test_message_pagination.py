@@ -0,0 +1,36 @@
+import datetime
+import uuid
+
+import pytest
+
+from src.messages.exceptions import InvalidMessageSearchCursor
+from src.messages.pagination import (
+    MessageSearchCursor,
+    decode_message_search_cursor,
+    encode_message_search_cursor,
+    resolve_message_search_cursor,
+)
+
+
+def test_message_search_cursor_round_trips() -> None:
+    cursor = MessageSearchCursor(
+        created_at=datetime.datetime(2026, 5, 17, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+        message_id=uuid.uuid4(),
+    )
+
+    assert decode_message_search_cursor(encode_message_search_cursor(cursor)) == cursor
+
+
+def test_malformed_message_search_cursor_is_rejected() -> None:
+    with pytest.raises(InvalidMessageSearchCursor):
+        decode_message_search_cursor("not-a-cursor")
+
+
+def test_message_search_cursor_cannot_be_combined_with_offset() -> None:
+    token = encode_message_search_cursor(
+        MessageSearchCursor(created_at=datetime.datetime.now(datetime.timezone.utc), message_id=uuid.uuid4())
+    )
+
+    assert resolve_message_search_cursor(None, offset=3) is None
+    with pytest.raises(InvalidMessageSearchCursor):
+        resolve_message_search_cursor(token, offset=3)
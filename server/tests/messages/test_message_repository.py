@@ -6,8 +6,11 @@ import pytest
 from sqlalchemy.dialects import postgresql
 
 from src.common.model_registry import import_all_models
-from src.messages.models import MessageModel
+from src.content.models import ContentModel
+from src.messages.models import MessageModel, MessageSharedContentModel
+from src.messages.pagination import MessageSearchCursor
 from src.messages.repository import MessageRepository
+from src.users.models import UserModel
 
 import_all_models()
 
@@ -104,6 +107,50 @@ async def test_get_single_refreshes_loaded_relationships() -> None:
     assert session.statements[-1].get_execution_options()["populate_existing"] is True
 
 
+@pytest.mark.asyncio
+async def test_get_multi_marks_shared_content_author_subscription_for_viewer() -> None:
+    viewer_id = uuid.uuid4()
+    subscribed_author = UserModel(user_id=uuid.uuid4(), username="alice")
+    other_author = UserModel(user_id=uuid.uuid4(), username="bob")
+    messages = []
+    for author in (subscribed_author, other_author):
+        message = MessageModel(
+            message_id=uuid.uuid4(),
+            chat_id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            content="look",
+            created_at=datetime.datetime.now(datetime.timezone.utc),
+        )
+        content = ContentModel(content_id=uuid.uuid4(), author_id=author.user_id)
+        content.author = author
+        message.shared_content = MessageSharedContentModel(
+            message_id=message.message_id,
+            content_id=content.content_id,
+        )
+        message.shared_content.content = content
+        messages.append(message)
+    session = _Session([list(reversed(messages)), [subscribed_author.user_id]])
+    repository = MessageRepository(session)  # type: ignore[arg-type]
+
+    result = await repository.get_multi(
+        chat_id=uuid.uuid4(),
+        order="created_at",
+        order_desc=True,
+        offset=0,
+        limit=10,
+        viewer_id=viewer_id,
+    )
+
+    assert result == messages
+    assert subscribed_author.is_subscribed is True
+    assert other_author.is_subscribed is False
+    assert "subscriptions.subscriber_id" in _compile(session.statements[-1])
+
+
+def _compile(stmt) -> str:  # type: ignore[no-untyped-def]
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
 def test_search_uses_full_text_query_and_chat_scope() -> None:
     message = MessageModel(
         message_id=uuid.uuid4(),
@@ -112,38 +159,60 @@ def test_search_uses_full_text_query_and_chat_scope() -> None:
         content="hello world",
         created_at=datetime.datetime.now(datetime.timezone.utc),
     )
-    session = _Session([[message], 1])
+    session = _Session([[(message, "<mark>hello</mark> world")]])
     repository = MessageRepository(session)  # type: ignore[arg-type]
 
     result = asyncio.run(
         repository.search(
             query_text="hello",
-            order="created_at",
-            order_desc=True,
+            chat_id=message.chat_id,
             offset=5,
             limit=20,
-            chat_id=message.chat_id,
         )
     )
 
-    sql = str(
-        session.statements[-2].compile(
-            dialect=postgresql.dialect(),
-            compile_kwargs={"literal_binds": True},
-        )
-    )
-    count_sql = str(
-        session.statements[-1].compile(
-            dialect=postgresql.dialect(),
-            compile_kwargs={"literal_binds": True},
-        )
-    )
+    sql = _compile(session.statements[-1])
 
-    assert result == ([message], 1)
-    assert "websearch_to_tsquery('simple', 'hello')" in sql
-    assert "to_tsvector('simple', coalesce(messages.content, ''))" in sql
+    assert result == [message]
+    assert message.search_headline == "<mark>hello</mark> world"
+    assert len(session.statements) == 1
+    assert "messages.search_vector @@ websearch_to_tsquery('simple', 'hello')" in sql
+    assert "to_tsvector" not in sql
     assert "messages.deleted_at IS NULL" in sql
     assert "messages.chat_id = " in sql
     assert "ORDER BY messages.created_at DESC, messages.message_id DESC" in sql
-    assert "count(*)" in count_sql.lower()
-    assert "messages.deleted_at IS NULL" in count_sql
+    assert "LIMIT 20 OFFSET 5" in sql
+    # Snippets are built in the outer query, over the already limited page.
+    page_sql = sql[sql.index("JOIN (") :]
+    assert "ts_headline" in sql
+    assert "ts_headline" not in page_sql
+
+
+def test_search_after_cursor_uses_keyset_instead_of_offset() -> None:
+    chat_id = uuid.uuid4()
+    before = MessageSearchCursor(
+        created_at=datetime.datetime(2026, 5, 17, 12, tzinfo=datetime.timezone.utc),
+        message_id=uuid.uuid4(),
+    )
+    session = _Session([[]])
+    repository = MessageRepository(session)  # type: ignore[arg-type]
+
+    asyncio.run(repository.search(query_text="hello", chat_id=chat_id, limit=20, before=before))
+
+    sql = _compile(session.statements[-1])
+    assert "(messages.created_at, messages.message_id) < (" in sql
+    assert str(before.message_id) in sql
+    assert "OFFSET" not in sql
+
+
+def test_count_search_matches_stops_at_cap() -> None:
+    session = _Session([42])
+    repository = MessageRepository(session)  # type: ignore[arg-type]
+
+    total = asyncio.run(repository.count_search_matches(query_text="hello", chat_id=uuid.uuid4(), cap=1000))
+
+    sql = _compile(session.statements[-1])
+    assert total == 42
+    assert "count(*)" in sql.lower()
+    assert "LIMIT 1000" in sql
+    assert "messages.search_vector @@" in sql
@@ -122,7 +122,11 @@ class _Repository:
         if self.raises is not None:
             raise self.raises
         self.search_calls.append(kwargs)
-        return [self.message], 3
+        return [self.message]
+
+    async def count_search_matches(self, **kwargs):
+        self.search_calls.append(kwargs)
+        return 3
 
     async def set_reaction(self, **kwargs):
         if self.raises is not None:
@@ -690,8 +694,11 @@ def test_search_messages_trims_query_before_querying_repository() -> None:
         )
     )
 
-    assert result.total == 3
+    assert result.total == 1
     assert result.offset == 0
     assert result.limit == 20
+    assert result.has_more is False
+    assert result.next_cursor is None
     assert result.items[0].message_id == message.message_id
     assert repository.search_calls[0]["query_text"] == "hello world"
+    assert repository.search_calls[0]["limit"] == 21
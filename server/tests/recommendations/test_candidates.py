@@ -0,0 +1,102 @@
+import datetime
+import uuid
+
+import pytest
+
+from src.recommendations.candidates import (
+    RecommendationCandidate,
+    RecommendationCandidateStore,
+    build_recommendation_candidates_key,
+    rank_recommendation_candidates,
+)
+
+
+class FakePipeline:
+    def __init__(self, client: "FakeRedis") -> None:
+        self._client = client
+        self._commands: list[tuple] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:  # type: ignore[no-untyped-def]
+        return None
+
+    def delete(self, key: str) -> None:
+        self._commands.append(("delete", key))
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> None:
+        self._commands.append(("zadd", key, mapping))
+
+    def expire(self, key: str, seconds: int) -> None:
+        self._commands.append(("expire", key, seconds))
+
+    async def execute(self) -> None:
+        for command in self._commands:
+            if command[0] == "delete":
+                await self._client.delete(command[1])
+            elif command[0] == "zadd":
+                self._client.sorted_sets.setdefault(command[1], {}).update(command[2])
+            elif command[0] == "expire":
+                self._client.ttls[command[1]] = command[2]
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.sorted_sets: dict[str, dict[str, float]] = {}
+        self.ttls: dict[str, int] = {}
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    async def delete(self, key: str) -> None:
+        self.sorted_sets.pop(key, None)
+
+    async def zrevrange(self, key: str, start: int, end: int, withscores: bool = False):  # type: ignore[no-untyped-def]
+        members = sorted(self.sorted_sets.get(key, {}).items(), key=lambda item: item[1], reverse=True)
+        return members[start:] if end == -1 else members[start: end + 1]
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_store_round_trips_candidates_and_keeps_empty_lists_as_hits() -> None:
+    client = FakeRedis()
+    store = RecommendationCandidateStore(client, ttl_seconds=600)  # type: ignore[arg-type]
+    user_id = uuid.uuid4()
+    published_at = datetime.datetime(2026, 4, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    candidates = [
+        RecommendationCandidate(uuid.uuid4(), "video", 3.0, published_at),
+        RecommendationCandidate(uuid.uuid4(), "post", 1.5, None),
+    ]
+
+    assert await store.get(user_id) is None
+
+    await store.replace(user_id, candidates)
+    assert await store.get(user_id) == candidates
+    assert client.ttls[build_recommendation_candidates_key(user_id)] == 600
+
+    await store.replace(user_id, [])
+    assert await store.get(user_id) == []
+
+
+def test_rank_applies_freshness_and_filters() -> None:
+    now = datetime.datetime(2026, 4, 1, tzinfo=datetime.timezone.utc)
+    old_id, new_id, excluded_id, article_id = (uuid.uuid4() for _ in range(4))
+    ranked = rank_recommendation_candidates(
+        [
+            RecommendationCandidate(old_id, "post", 5.0, now - datetime.timedelta(days=365)),
+            RecommendationCandidate(new_id, "post", 1.0, now),
+            RecommendationCandidate(excluded_id, "post", 50.0, now),
+            RecommendationCandidate(article_id, "article", 50.0, now),
+        ],
+        now=now,
+        content_type="post",
+        excluded_content_ids={excluded_id},
+    )
+
+    assert [candidate.content_id for candidate in ranked] == [new_id, old_id]
+    assert ranked[0].score == pytest.approx(7.0)
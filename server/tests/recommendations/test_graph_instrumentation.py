@@ -0,0 +1,122 @@
+import itertools
+import uuid
+
+import pytest
+
+from src.recommendations.graph_instrumentation import GraphQueryRecorder, format_query_plan
+from src.recommendations.graph_repository import RecommendationGraphRepository
+
+
+PLAN = {
+    "operatorType": "ProduceResults@neo4j",
+    "rows": 1,
+    "dbHits": 0,
+    "children": [{"operatorType": "NodeIndexSeek@neo4j", "rows": 1, "dbHits": 2, "args": {"Details": "c:Content"}}],
+}
+
+
+class FakeSummary:
+    result_available_after = 30
+    result_consumed_after = 10
+    profile = PLAN
+    plan = PLAN
+
+
+class FakeResult:
+    def __init__(self, records: list[dict]) -> None:
+        self._records = records
+
+    async def data(self) -> list[dict]:
+        return self._records
+
+    async def consume(self) -> FakeSummary:
+        return FakeSummary()
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver") -> None:
+        self._driver = driver
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:  # type: ignore[no-untyped-def]
+        return None
+
+    async def run(self, query, parameters=None):  # type: ignore[no-untyped-def]
+        self._driver.queries.append(query)
+        return FakeResult(self._driver.records)
+
+    async def execute_read(self, work, *args):  # type: ignore[no-untyped-def]
+        return await work(self, *args)
+
+    async def execute_write(self, work, *args):  # type: ignore[no-untyped-def]
+        return await work(self, *args)
+
+
+class FakeDriver:
+    def __init__(self, records: list[dict]) -> None:
+        self.records = records
+        self.queries: list[str] = []
+
+    def session(self, *, database: str) -> FakeSession:
+        return FakeSession(self)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _repository(driver: FakeDriver, recorder: GraphQueryRecorder) -> RecommendationGraphRepository:
+    ticks = itertools.count(step=0.2)
+    return RecommendationGraphRepository(
+        driver=driver,
+        database="neo4j",
+        recorder=recorder,
+        clock=lambda: next(ticks),
+    )
+
+
+@pytest.mark.anyio
+async def test_queries_are_timed_and_sized_per_repository_method() -> None:
+    content_id = uuid.uuid4()
+    driver = FakeDriver([{"content_id": str(content_id), "score": 1.0, "reason": "shared_tags"}])
+    recorder = GraphQueryRecorder(slow_query_seconds=1.0, profile_slow_queries=True)
+    repository = _repository(driver, recorder)
+
+    await repository.get_similar_content(content_id=content_id, limit=5, content_type=None)
+    await repository.upsert_users([uuid.uuid4()])
+
+    stats = recorder.snapshot()
+    assert set(stats) == {"get_similar_content", "upsert_users"}
+    assert stats["get_similar_content"]["count"] == 1
+    assert stats["get_similar_content"]["rows"] == 1
+    assert stats["get_similar_content"]["server_seconds"] == pytest.approx(0.04)
+    assert stats["get_similar_content"]["duration_histogram"] == {"<=0.25": 1}
+    assert stats["get_similar_content"]["rows_histogram"] == {"<=1": 1}
+    # Fast queries are never profiled.
+    assert not any(query.startswith(("PROFILE", "EXPLAIN")) for query in driver.queries)
+
+
+@pytest.mark.anyio
+async def test_slow_reads_are_profiled_and_slow_writes_only_explained(caplog: pytest.LogCaptureFixture) -> None:
+    driver = FakeDriver([])
+    recorder = GraphQueryRecorder(slow_query_seconds=0.1, profile_slow_queries=True)
+    repository = _repository(driver, recorder)
+
+    await repository.get_recommended_authors(viewer_id=uuid.uuid4(), offset=0, limit=5)
+    await repository.upsert_users([uuid.uuid4()])
+
+    prefixes = [query.split(None, 1)[0] for query in driver.queries]
+    assert prefixes.count("PROFILE") == 1
+    assert prefixes.count("EXPLAIN") == 1
+    assert "Plan for slow Neo4j query get_recommended_authors" in caplog.text
+    assert "NodeIndexSeek@neo4j rows=1 dbHits=2 c:Content" in caplog.text
+
+
+def test_format_query_plan_indents_children() -> None:
+    assert format_query_plan(PLAN).splitlines() == [
+        "ProduceResults@neo4j rows=1 dbHits=0",
+        "  NodeIndexSeek@neo4j rows=1 dbHits=2 c:Content",
+    ]
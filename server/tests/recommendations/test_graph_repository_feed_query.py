@@ -112,3 +112,32 @@ async def test_recommended_authors_query_excludes_self_followed_and_requires_pub
     assert captured["parameters"]["viewer_id"] == str(viewer_id)
     assert captured["parameters"]["offset"] == 4
     assert captured["parameters"]["limit"] == 6
+
+
+@pytest.mark.anyio
+async def test_recompute_similar_to_generates_sparse_candidates_in_batches() -> None:
+    repository = RecommendationGraphRepository(driver=DummyDriver(), database="neo4j")
+    content_ids = [str(uuid.uuid4()) for _ in range(5)]
+    writes: list[tuple[str, dict]] = []
+
+    async def fake_read(query, parameters=None):  # type: ignore[no-untyped-def]
+        return [{"content_id": content_id} for content_id in content_ids]
+
+    async def fake_write(query, parameters=None):  # type: ignore[no-untyped-def]
+        writes.append((query, parameters or {}))
+
+    repository._read = fake_read  # type: ignore[method-assign]
+    repository._write = fake_write  # type: ignore[method-assign]
+
+    await repository.recompute_similar_to(batch_size=2, fanout_limit=50)
+
+    assert [parameters["content_ids"] for _, parameters in writes] == [
+        content_ids[:2],
+        content_ids[2:4],
+        content_ids[4:],
+    ]
+    assert all(parameters["fanout_limit"] == 50 for _, parameters in writes)
+    query = writes[0][0]
+    assert "MATCH (c2:Content)\n" not in query
+    assert "MATCH (tag)<-[:HAS_TAG]-(c2:Content)" in query
+    assert "LIMIT $engager_limit" in query
@@ -6,6 +6,7 @@ import pytest
 
 from src.content.enums import ContentStatusEnum, ContentTypeEnum, ContentVisibilityEnum
 from src.content.schemas import ContentListItemGet
+from src.recommendations.candidates import RecommendationCandidate
 from src.recommendations.graph_repository import (
     RecommendationAuthorGraphResult,
     RecommendationFeedGraphResult,
@@ -17,6 +18,8 @@ from src.recommendations.schemas import (
     RecommendedAuthorItemGet,
     SimilarContentListGet,
 )
+from src.recommendations.overfetch import AdaptiveOverfetch
+from src.recommendations.result_cache import RecommendationResultCache
 from src.recommendations.service import RecommendationService
 from src.users.schemas import UserGet
 
@@ -85,8 +88,18 @@ class FakePostgresRepository:
         self.users: dict[uuid.UUID, UserGet] = {}
         self.subscribed_user_ids: set[uuid.UUID] = set()
         self.visible_author_ids: set[uuid.UUID] = set()
+        self.hydration_calls: list[list[uuid.UUID]] = []
+
+    async def filter_visible_content_ids(self, *, content_ids, content_type=None):  # type: ignore[no-untyped-def]
+        return {
+            content_id
+            for content_id in content_ids
+            if content_id in self.hydrated
+            and (content_type is None or self.hydrated[content_id].content_type == content_type)
+        }
 
     async def get_visible_content_by_ids(self, *, content_ids, viewer_id):  # type: ignore[no-untyped-def]
+        self.hydration_calls.append(list(content_ids))
         return {
             content_id: self.hydrated[content_id]
             for content_id in content_ids
@@ -140,9 +153,19 @@ class FakeProjector:
 
 
 class FakeProjectorRegistry:
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+
     def get(self, content_type):  # type: ignore[no-untyped-def]
         return FakeProjector()
 
+    async def project_feed_items(self, items, *, viewer_id, storage):  # type: ignore[no-untyped-def]
+        self.batches.append(len(items))
+        return [
+            await FakeProjector().project_feed_item(item, viewer_id=viewer_id, storage=storage)
+            for item in items
+        ]
+
 
 async def _build_user(user_id: uuid.UUID, username: str, viewer_id: uuid.UUID | None = None) -> UserGet:
     return UserGet(
@@ -368,3 +391,275 @@ async def test_recommended_authors_returns_empty_when_graph_fails() -> None:
     )
 
     assert response == []
+
+
+class FakeCandidateStore:
+    def __init__(self, candidates: list[RecommendationCandidate] | None, should_fail: bool = False) -> None:
+        self.candidates = candidates
+        self.should_fail = should_fail
+
+    async def get(self, user_id):  # type: ignore[no-untyped-def]
+        if self.should_fail:
+            raise RuntimeError("redis unavailable")
+        return self.candidates
+
+
+class FakeExcludingPostgresRepository(FakePostgresRepository):
+    def __init__(self, hydrated: dict[uuid.UUID, FakeContent], excluded: set[uuid.UUID]) -> None:
+        super().__init__(hydrated=hydrated)
+        self.excluded = excluded
+
+    async def get_excluded_content_ids(self, *, viewer_id, content_ids):  # type: ignore[no-untyped-def]
+        return self.excluded & set(content_ids)
+
+
+@pytest.mark.anyio
+async def test_feed_pages_precomputed_candidates_without_graph_query() -> None:
+    now = datetime.datetime(2026, 5, 1, tzinfo=datetime.timezone.utc)
+    viewer_id = uuid.uuid4()
+    stale_id, fresh_id, seen_id, video_id = (uuid.uuid4() for _ in range(4))
+    candidates = [
+        RecommendationCandidate(stale_id, "post", 10.0, now - datetime.timedelta(days=70)),
+        RecommendationCandidate(fresh_id, "post", 9.0, now),
+        RecommendationCandidate(seen_id, "post", 20.0, now),
+        RecommendationCandidate(video_id, "video", 30.0, now),
+    ]
+    hydrated = {
+        content_id: FakeContent(content_id=content_id, content_type=ContentTypeEnum.POST, author_id=uuid.uuid4())
+        for content_id in (stale_id, fresh_id, seen_id)
+    }
+    graph = FakeGraphFeedRepository(rows=[])
+    service = RecommendationService(
+        graph_repository=graph,  # type: ignore[arg-type]
+        postgres_repository=FakeExcludingPostgresRepository(hydrated, excluded={seen_id}),  # type: ignore[arg-type]
+        projector_registry=FakeProjectorRegistry(),  # type: ignore[arg-type]
+        asset_storage=None,
+        candidate_store=FakeCandidateStore(candidates),  # type: ignore[arg-type]
+        clock=lambda: now,
+    )
+
+    items = await service.get_recommendations_feed(
+        viewer_id=viewer_id,
+        content_type=RecommendationFeedContentTypeEnum.POST,
+        sort=RecommendationFeedSortEnum.RELEVANCE,
+        offset=0,
+        limit=2,
+    )
+
+    # Freshness lifts the newer post above the higher base score of the 70-day-old one.
+    assert [item.content_id for item in items] == [fresh_id, stale_id]
+    assert graph.calls == []
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("store", [FakeCandidateStore(None), FakeCandidateStore([], should_fail=True)])
+async def test_feed_falls_back_to_graph_query_without_stored_candidates(store: FakeCandidateStore) -> None:
+    content_id = uuid.uuid4()
+    graph = FakeGraphFeedRepository(
+        rows=[RecommendationFeedGraphResult(content_id=content_id, score=1.0, reason="personalized_graph_feed")]
+    )
+    service = RecommendationService(
+        graph_repository=graph,  # type: ignore[arg-type]
+        postgres_repository=FakePostgresRepository(
+            hydrated={
+                content_id: FakeContent(
+                    content_id=content_id,
+                    content_type=ContentTypeEnum.POST,
+                    author_id=uuid.uuid4(),
+                )
+            }
+        ),  # type: ignore[arg-type]
+        projector_registry=FakeProjectorRegistry(),  # type: ignore[arg-type]
+        asset_storage=None,
+        candidate_store=store,  # type: ignore[arg-type]
+    )
+
+    items = await service.get_recommendations_feed(
+        viewer_id=uuid.uuid4(),
+        content_type=RecommendationFeedContentTypeEnum.ALL,
+        sort=RecommendationFeedSortEnum.RELEVANCE,
+        offset=0,
+        limit=1,
+    )
+
+    assert [item.content_id for item in items] == [content_id]
+    assert len(graph.calls) == 1
+
+
+class FakeRedis:
+    def __init__(self, should_fail: bool = False) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+        self.should_fail = should_fail
+
+    async def get(self, key):  # type: ignore[no-untyped-def]
+        if self.should_fail:
+            raise ConnectionError("redis unavailable")
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):  # type: ignore[no-untyped-def]
+        self.values[key] = value
+        self.ttls[key] = ex
+
+
+@pytest.mark.anyio
+async def test_similar_content_reuses_cached_graph_rows_until_sync_version_moves() -> None:
+    source_id, first_id, second_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    hydrated = {
+        content_id: FakeContent(content_id=content_id, content_type=ContentTypeEnum.VIDEO, author_id=uuid.uuid4())
+        for content_id in (first_id, second_id)
+    }
+    graph = FakeGraphRepository(rows=[SimilarContentGraphResult(content_id=first_id, score=2.0, reason="shared_tags")])
+    cache = RecommendationResultCache(FakeRedis(), ttl_seconds=300)  # type: ignore[arg-type]
+    await cache.set_version("v1")
+    service = RecommendationService(
+        graph_repository=graph,  # type: ignore[arg-type]
+        postgres_repository=FakePostgresRepository(hydrated=hydrated),  # type: ignore[arg-type]
+        projector_registry=FakeProjectorRegistry(),  # type: ignore[arg-type]
+        asset_storage=None,
+        result_cache=cache,
+    )
+
+    async def similar_ids() -> list[uuid.UUID]:
+        response = await service.get_similar_content(
+            content_id=source_id,
+            viewer_id=uuid.uuid4(),
+            limit=5,
+            content_type=ContentTypeEnum.VIDEO,
+        )
+        return [item.content_id for item in response.items]
+
+    assert await similar_ids() == [first_id]
+    graph.rows = [SimilarContentGraphResult(content_id=second_id, score=3.0, reason="shared_tags")]
+    assert await similar_ids() == [first_id]
+    assert len(graph.calls) == 1
+
+    await cache.set_version("v2")
+    assert await similar_ids() == [second_id]
+    assert len(graph.calls) == 2
+
+
+@pytest.mark.anyio
+async def test_similar_content_caches_largest_overfetch_and_slices_on_read() -> None:
+    row_ids = [uuid.uuid4() for _ in range(10)]
+    hydrated = {
+        content_id: FakeContent(content_id=content_id, content_type=ContentTypeEnum.POST, author_id=uuid.uuid4())
+        for content_id in row_ids[:5]
+    }
+    graph = FakeGraphRepository(
+        rows=[SimilarContentGraphResult(content_id=content_id, score=1.0, reason="shared_tags") for content_id in row_ids]
+    )
+    cache = RecommendationResultCache(FakeRedis(), ttl_seconds=300)  # type: ignore[arg-type]
+    await cache.set_version("v1")
+    overfetch = AdaptiveOverfetch(max_factor=4.0)
+    overfetch.observe("similar_content", fetched=10, kept=10)
+    postgres = FakePostgresRepository(hydrated=hydrated)
+    service = RecommendationService(
+        graph_repository=graph,  # type: ignore[arg-type]
+        postgres_repository=postgres,  # type: ignore[arg-type]
+        projector_registry=FakeProjectorRegistry(),  # type: ignore[arg-type]
+        asset_storage=None,
+        result_cache=cache,
+        overfetch=overfetch,
+    )
+
+    response = await service.get_similar_content(content_id=uuid.uuid4(), viewer_id=None, limit=2, content_type=None)
+
+    assert graph.calls[0]["limit"] == 8
+    assert [item.content_id for item in response.items] == row_ids[:2]
+    # Only the first graph_limit (3) cached rows were filtered, all of them visible.
+    assert overfetch.keep_rate("similar_content") == 1.0
+
+
+@pytest.mark.anyio
+async def test_recommended_authors_cache_keeps_viewer_filters_per_request() -> None:
+    viewer_id = uuid.uuid4()
+    author_id = uuid.uuid4()
+    graph = FakeGraphAuthorsRepository(
+        rows=[RecommendationAuthorGraphResult(user_id=author_id, score=4.0, reason="topic_author_affinity")]
+    )
+    postgres = FakePostgresRepository(hydrated={})
+    postgres.users = {author_id: await _build_user(author_id, "author")}
+    postgres.visible_author_ids = {author_id}
+    cache = RecommendationResultCache(FakeRedis(), ttl_seconds=300)  # type: ignore[arg-type]
+    await cache.set_version("v1")
+    service = RecommendationService(
+        graph_repository=graph,  # type: ignore[arg-type]
+        postgres_repository=postgres,  # type: ignore[arg-type]
+        projector_registry=FakeProjectorRegistry(),  # type: ignore[arg-type]
+        asset_storage=None,
+        result_cache=cache,
+    )
+
+    first = await service.get_recommended_authors(viewer_id=viewer_id, offset=0, limit=5)
+    postgres.subscribed_user_ids = {author_id}
+    second = await service.get_recommended_authors(viewer_id=viewer_id, offset=0, limit=5)
+
+    assert [item.user_id for item in first] == [author_id]
+    assert second == []
+    assert len(graph.calls) == 1
+
+
+@pytest.mark.anyio
+async def test_similar_content_queries_graph_when_result_cache_unavailable() -> None:
+    content_id = uuid.uuid4()
+    graph = FakeGraphRepository(rows=[SimilarContentGraphResult(content_id=content_id, score=1.0, reason="shared_tags")])
+    service = RecommendationService(
+        graph_repository=graph,  # type: ignore[arg-type]
+        postgres_repository=FakePostgresRepository(
+            hydrated={content_id: FakeContent(content_id=content_id, content_type=ContentTypeEnum.POST, author_id=uuid.uuid4())}
+        ),  # type: ignore[arg-type]
+        projector_registry=FakeProjectorRegistry(),  # type: ignore[arg-type]
+        asset_storage=None,
+        result_cache=RecommendationResultCache(FakeRedis(should_fail=True), ttl_seconds=300),  # type: ignore[arg-type]
+    )
+
+    response = await service.get_similar_content(content_id=uuid.uuid4(), viewer_id=None, limit=1, content_type=None)
+
+    assert [item.content_id for item in response.items] == [content_id]
+    assert len(graph.calls) == 1
+
+
+@pytest.mark.anyio
+async def test_feed_hydrates_only_the_visible_page_and_adapts_overfetch() -> None:
+    visible_ids = [uuid.uuid4() for _ in range(6)]
+    hidden_ids = [uuid.uuid4() for _ in range(2)]
+    graph = FakeGraphFeedRepository(
+        rows=[
+            RecommendationFeedGraphResult(content_id=content_id, score=1.0, reason="personalized_graph_feed")
+            for content_id in [hidden_ids[0], *visible_ids[:3], hidden_ids[1], *visible_ids[3:]]
+        ]
+    )
+    postgres = FakePostgresRepository(
+        hydrated={
+            content_id: FakeContent(content_id=content_id, content_type=ContentTypeEnum.POST, author_id=uuid.uuid4())
+            for content_id in visible_ids
+        }
+    )
+    registry = FakeProjectorRegistry()
+    service = RecommendationService(
+        graph_repository=graph,  # type: ignore[arg-type]
+        postgres_repository=postgres,  # type: ignore[arg-type]
+        projector_registry=registry,  # type: ignore[arg-type]
+        asset_storage=None,
+    )
+
+    async def feed() -> list[uuid.UUID]:
+        items = await service.get_recommendations_feed(
+            viewer_id=uuid.uuid4(),
+            content_type=RecommendationFeedContentTypeEnum.ALL,
+            sort=RecommendationFeedSortEnum.RELEVANCE,
+            offset=0,
+            limit=4,
+        )
+        return [item.content_id for item in items]
+
+    assert await feed() == visible_ids[:4]
+    # Only the page is eager-loaded and projected, in one batch.
+    assert postgres.hydration_calls == [visible_ids[:4]]
+    assert registry.batches == [4]
+    assert graph.calls[0]["limit"] == 16
+
+    # 6 of 8 rows survived, so the next page asks for ceil(1.25 / 0.75 * 2) / 2 = 2x.
+    await feed()
+    assert graph.calls[1]["limit"] == 8
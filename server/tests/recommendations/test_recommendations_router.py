@@ -3,15 +3,23 @@ import uuid
 import pytest
 
 from src.auth.dependencies import get_current_optional_user
+from src.common.exceptions import PermissionDenied
 from src.content.enums import ContentTypeEnum
-from src.recommendations.router import get_recommendations_feed, get_recommended_authors, get_similar_content, router
+from src.recommendations.graph_instrumentation import GraphQueryRecorder
+from src.recommendations.router import (
+    get_graph_query_stats,
+    get_recommendations_feed,
+    get_recommended_authors,
+    get_similar_content,
+    router,
+)
 from src.recommendations.schemas import (
     RecommendedAuthorItemGet,
     RecommendationFeedContentTypeEnum,
     RecommendationFeedSortEnum,
     SimilarContentListGet,
 )
-from src.users.schemas import UserGet
+from src.users.schemas import UserGet, UserPrincipal
 
 
 class FakeRecommendationService:
@@ -143,3 +151,18 @@ async def test_recommended_authors_endpoint_passes_params_to_service() -> None:
     assert call["viewer_id"] == viewer.user_id
     assert call["offset"] == 12
     assert call["limit"] == 9
+
+
+@pytest.mark.anyio
+async def test_graph_query_stats_endpoint_is_admin_only() -> None:
+    recorder = GraphQueryRecorder(slow_query_seconds=1.0, profile_slow_queries=False)
+    recorder.record("get_similar_content", 0.02, rows=8, server_seconds=0.01, failed=False)
+    admin = UserPrincipal(user_id=uuid.uuid4(), username="admin", is_admin=True)
+    viewer = UserPrincipal(user_id=uuid.uuid4(), username="viewer", is_admin=False)
+
+    response = await get_graph_query_stats(user=admin, recorder=recorder)
+
+    assert response == recorder.snapshot()
+    assert response["get_similar_content"]["count"] == 1
+    with pytest.raises(PermissionDenied):
+        await get_graph_query_stats(user=viewer, recorder=recorder)
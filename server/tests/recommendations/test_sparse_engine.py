@@ -0,0 +1,191 @@
+import datetime
+import math
+import uuid
+
+import pytest
+
+from src.content.enums import ContentStatusEnum, ContentTypeEnum, ContentVisibilityEnum, ReactionTypeEnum
+from src.recommendations.postgres_repository import (
+    ContentGraphRow,
+    ContentReactionGraphRow,
+    ContentTagGraphRow,
+    ContentViewedGraphRow,
+)
+from src.recommendations.sparse_engine import SparseRecommendationEngine, build_sparse_recommendation_index
+
+NOW = datetime.datetime(2026, 5, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _content(
+    content_id: uuid.UUID,
+    author_id: uuid.UUID,
+    *,
+    content_type: ContentTypeEnum = ContentTypeEnum.POST,
+    status: ContentStatusEnum = ContentStatusEnum.PUBLISHED,
+    age_days: int = 0,
+    likes_count: int = 0,
+) -> ContentGraphRow:
+    published_at = NOW - datetime.timedelta(days=age_days)
+    return ContentGraphRow(
+        content_id=content_id,
+        author_id=author_id,
+        content_type=content_type,
+        status=status,
+        visibility=ContentVisibilityEnum.PUBLIC,
+        created_at=published_at,
+        published_at=published_at,
+        likes_count=likes_count,
+        dislikes_count=0,
+        comments_count=0,
+        views_count=0,
+    )
+
+
+def _reaction(user_id: uuid.UUID, content_id: uuid.UUID, reaction_type: ReactionTypeEnum) -> ContentReactionGraphRow:
+    return ContentReactionGraphRow(user_id=user_id, content_id=content_id, reaction_type=reaction_type, created_at=NOW)
+
+
+class Graph:
+    def __init__(self) -> None:
+        self.viewer, self.peer, self.author_x, self.author_y, self.author_w = (uuid.uuid4() for _ in range(5))
+        self.a, self.b, self.c, self.d, self.e, self.f, self.g = (uuid.uuid4() for _ in range(7))
+        topic, other = uuid.uuid4(), uuid.uuid4()
+        self.index = build_sparse_recommendation_index(
+            user_ids=[self.viewer, self.peer, self.author_x, self.author_y, self.author_w],
+            subscriptions=[(self.viewer, self.author_y), (self.peer, self.author_w)],
+            content_rows=[
+                _content(self.a, self.author_x, age_days=1),
+                _content(self.b, self.author_x, likes_count=1),
+                _content(self.c, self.author_y, content_type=ContentTypeEnum.VIDEO),
+                _content(self.d, self.author_y),
+                _content(self.e, self.viewer),
+                _content(self.f, self.author_y, status=ContentStatusEnum.DRAFT),
+                _content(self.g, self.author_w),
+            ],
+            content_tags=[
+                ContentTagGraphRow(content_id=content_id, tag_id=topic, tag_slug="topic")
+                for content_id in (self.a, self.b, self.d, self.f)
+            ]
+            + [ContentTagGraphRow(content_id=self.g, tag_id=other, tag_slug="other")],
+            reactions=[
+                _reaction(self.viewer, self.a, ReactionTypeEnum.LIKE),
+                _reaction(self.peer, self.a, ReactionTypeEnum.LIKE),
+                _reaction(self.peer, self.b, ReactionTypeEnum.LIKE),
+            ],
+            views=[
+                ContentViewedGraphRow(
+                    user_id=self.viewer,
+                    content_id=self.d,
+                    views_count=1,
+                    progress_percent=95,
+                    last_seen_at=NOW,
+                )
+            ],
+            comments=[],
+        )
+
+    def engine(self) -> SparseRecommendationEngine:
+        async def load():  # type: ignore[no-untyped-def]
+            return self.index
+
+        return SparseRecommendationEngine(index_loader=load, ttl_seconds=60, clock=lambda: NOW)
+
+
+@pytest.mark.anyio
+async def test_feed_scores_match_graph_weights_and_exclusions() -> None:
+    graph = Graph()
+
+    rows = await graph.engine().get_recommendation_feed(
+        viewer_id=graph.viewer,
+        content_type=None,
+        sort="relevance",
+        offset=0,
+        limit=10,
+    )
+
+    # Own (e), watched-through (d) and draft (f) content is excluded.
+    assert [row.content_id for row in rows] == [graph.b, graph.a, graph.c, graph.g]
+    scores = {row.content_id: row.score for row in rows}
+    # tag 5 + author 5 + collaborative 3 + quality 0.8 + freshness 6
+    assert scores[graph.b] == pytest.approx(19.8)
+    # tag 5 + author 5 + collaborative 3 + freshness 6 / (1 + 1/7)
+    assert scores[graph.a] == pytest.approx(13.0 + 6.0 / (1.0 + 1.0 / 7.0))
+    # author affinity: one view of d + following y, plus freshness 6
+    assert scores[graph.c] == pytest.approx(13.0)
+
+    videos = await graph.engine().get_recommendation_feed(
+        viewer_id=graph.viewer,
+        content_type="video",
+        sort="relevance",
+        offset=0,
+        limit=10,
+    )
+    assert [row.content_id for row in videos] == [graph.c]
+
+
+@pytest.mark.anyio
+async def test_feed_for_anonymous_viewer_orders_by_quality_and_freshness() -> None:
+    graph = Graph()
+
+    rows = await graph.engine().get_recommendation_feed(
+        viewer_id=None,
+        content_type="post",
+        sort="oldest",
+        offset=0,
+        limit=2,
+    )
+
+    assert rows[0].content_id == graph.a
+    assert len(rows) == 2
+
+
+@pytest.mark.anyio
+async def test_similar_content_uses_shared_tags_audience_and_author() -> None:
+    graph = Graph()
+
+    rows = await graph.engine().get_similar_content(content_id=graph.a, limit=10, content_type=None)
+
+    assert rows[0].content_id == graph.b
+    assert rows[0].score == pytest.approx(2.5 + 3.0 + 3.0 + 0.6)
+    assert rows[0].reason == "same_author"
+    assert {row.content_id for row in rows[1:]} == {graph.d, graph.f}
+    assert all(row.reason == "shared_tags" for row in rows[1:])
+
+
+@pytest.mark.anyio
+async def test_recommended_authors_skip_followed_and_rank_topic_affinity_first() -> None:
+    graph = Graph()
+
+    rows = await graph.engine().get_recommended_authors(viewer_id=graph.viewer, offset=0, limit=10)
+
+    assert [row.user_id for row in rows] == [graph.author_x, graph.author_w]
+    assert rows[0].reason == "topic_author_affinity"
+    assert rows[0].score == pytest.approx(10.0 + math.log(5.0) * 2.0 + (1.0 / (1.0 + 1.0 / 30.0) + 1.0) * 1.2)
+    assert rows[1].reason == "similar_users_follow"
+    assert rows[1].score == pytest.approx(5.0 * 1.5 + 1.2)
+
+
+@pytest.mark.anyio
+async def test_engine_reloads_index_after_ttl() -> None:
+    graph = Graph()
+    loads = 0
+    now = [0.0]
+
+    async def load():  # type: ignore[no-untyped-def]
+        nonlocal loads
+        loads += 1
+        return graph.index
+
+    engine = SparseRecommendationEngine(index_loader=load, ttl_seconds=60, monotonic=lambda: now[0])
+    await engine.get_index()
+    now[0] = 30.0
+    await engine.get_index()
+    assert loads == 1
+    now[0] = 61.0
+    await engine.get_index()
+    assert loads == 2
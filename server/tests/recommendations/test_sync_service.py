@@ -1,9 +1,14 @@
+import asyncio
 import datetime
 import uuid
 
 import pytest
 
-from src.recommendations.postgres_repository import ActivityEventGraphRow
+from src.content.enums import ReactionTypeEnum
+from src.recommendations.candidates import RecommendationCandidate
+from src.recommendations.graph_repository import EngagementGraphState, RecommendationCandidateGraphResult
+from src.recommendations.postgres_repository import ActivityEventGraphRow, ContentReactionGraphRow
+from src.recommendations.result_cache import build_recommendation_result_version
 from src.recommendations.sync_service import RecommendationGraphSyncService
 
 
@@ -96,10 +101,36 @@ class FakeIncrementalPostgresRepository:
 
 
 class FakeIncrementalGraphRepository:
-    def __init__(self) -> None:
+    def __init__(self, follows: set[tuple[uuid.UUID, uuid.UUID]] | None = None) -> None:
         self.follow_rows: list[list[tuple[uuid.UUID, uuid.UUID]]] = []
         self.unfollow_rows: list[list[dict[str, str]]] = []
         self.recompute_affinity_calls: list[list[uuid.UUID]] = []
+        self.follows = set(follows or ())
+        self.engagement: dict[tuple[uuid.UUID, uuid.UUID], EngagementGraphState] = {}
+        self.interest_deltas: list[dict] = []
+        self.author_deltas: list[dict] = []
+
+    def _state(self, row):  # type: ignore[no-untyped-def]
+        key = (uuid.UUID(row["user_id"]), uuid.UUID(row["content_id"]))
+        return self.engagement.setdefault(key, EngagementGraphState())
+
+    async def get_engagement_states(self, pairs):  # type: ignore[no-untyped-def]
+        return {
+            pair: EngagementGraphState(**{
+                name: getattr(self.engagement.get(pair, EngagementGraphState()), name)
+                for name in ("liked", "disliked", "views_count", "comments_count")
+            })
+            for pair in pairs
+        }
+
+    async def get_follow_states(self, pairs):  # type: ignore[no-untyped-def]
+        return {pair: pair in self.follows for pair in pairs}
+
+    async def apply_interest_deltas(self, rows):  # type: ignore[no-untyped-def]
+        self.interest_deltas.extend(rows)
+
+    async def apply_author_affinity_deltas(self, rows):  # type: ignore[no-untyped-def]
+        self.author_deltas.extend(rows)
 
     async def ensure_schema(self) -> None:
         return None
@@ -109,27 +140,38 @@ class FakeIncrementalGraphRepository:
 
     async def upsert_subscriptions(self, rows):  # type: ignore[no-untyped-def]
         self.follow_rows.append(rows)
+        self.follows.update(rows)
 
     async def remove_follow_edges(self, rows):  # type: ignore[no-untyped-def]
         self.unfollow_rows.append(rows)
+        for row in rows:
+            self.follows.discard((uuid.UUID(row["user_id"]), uuid.UUID(row["target_user_id"])))
 
     async def set_liked_edges(self, rows):  # type: ignore[no-untyped-def]
-        return None
+        for row in rows:
+            state = self._state(row)
+            state.liked, state.disliked = True, False
 
     async def set_disliked_edges(self, rows):  # type: ignore[no-untyped-def]
-        return None
+        for row in rows:
+            state = self._state(row)
+            state.liked, state.disliked = False, True
 
     async def remove_liked_edges(self, rows):  # type: ignore[no-untyped-def]
-        return None
+        for row in rows:
+            self._state(row).liked = False
 
     async def remove_disliked_edges(self, rows):  # type: ignore[no-untyped-def]
-        return None
+        for row in rows:
+            self._state(row).disliked = False
 
     async def increment_viewed_edges(self, rows):  # type: ignore[no-untyped-def]
-        return None
+        for row in rows:
+            self._state(row).views_count += row["views_count"]
 
     async def increment_commented_edges(self, rows):  # type: ignore[no-untyped-def]
-        return None
+        for row in rows:
+            self._state(row).comments_count += row["comments_count"]
 
     async def upsert_users(self, user_ids):  # type: ignore[no-untyped-def]
         return None
@@ -157,7 +199,7 @@ class FakeIncrementalGraphRepository:
 
 
 @pytest.mark.anyio
-async def test_incremental_sync_updates_follow_edges_and_recomputes_affinity() -> None:
+async def test_incremental_sync_updates_follow_edges_and_applies_affinity_deltas() -> None:
     actor_id = uuid.uuid4()
     followed_id = uuid.uuid4()
     unfollowed_id = uuid.uuid4()
@@ -185,21 +227,339 @@ async def test_incremental_sync_updates_follow_edges_and_recomputes_affinity() -
     ]
 
     postgres_repository = FakeIncrementalPostgresRepository(events=events)
-    graph_repository = FakeIncrementalGraphRepository()
+    graph_repository = FakeIncrementalGraphRepository(follows={(actor_id, unfollowed_id)})
     service = RecommendationGraphSyncService(
         postgres_repository=postgres_repository,  # type: ignore[arg-type]
         graph_repository=graph_repository,  # type: ignore[arg-type]
     )
 
-    await service.incremental_sync()
+    report = await service.incremental_sync()
 
     assert graph_repository.follow_rows == [[(actor_id, followed_id)]]
     assert graph_repository.unfollow_rows == [[{
         "user_id": str(actor_id),
         "target_user_id": str(unfollowed_id),
     }]]
-    assert len(graph_repository.recompute_affinity_calls) == 1
-    recomputed_user_ids = set(graph_repository.recompute_affinity_calls[0])
-    assert actor_id in recomputed_user_ids
-    assert followed_id in recomputed_user_ids
-    assert unfollowed_id in recomputed_user_ids
+    # Only the changed pairs are touched; no per-user rebuild runs.
+    assert graph_repository.recompute_affinity_calls == []
+    assert graph_repository.interest_deltas == []
+    assert sorted(graph_repository.author_deltas, key=lambda row: row["delta"]) == [
+        {"user_id": str(actor_id), "content_id": None, "author_id": str(unfollowed_id), "delta": -6.0},
+        {"user_id": str(actor_id), "content_id": None, "author_id": str(followed_id), "delta": 6.0},
+    ]
+    assert report["affinity_deltas"] == 2
+
+
+class FakeResultCache:
+    def __init__(self) -> None:
+        self.versions: list[str] = []
+
+    async def set_version(self, version):  # type: ignore[no-untyped-def]
+        self.versions.append(version)
+
+
+@pytest.mark.anyio
+async def test_incremental_sync_publishes_result_cache_version_from_cursor() -> None:
+    event = _event(action_type="content_view", content_id=uuid.uuid4())
+    cache = FakeResultCache()
+    service = RecommendationGraphSyncService(
+        postgres_repository=FakeIncrementalPostgresRepository(events=[event]),  # type: ignore[arg-type]
+        graph_repository=FakeIncrementalGraphRepository(),  # type: ignore[arg-type]
+        result_cache=cache,  # type: ignore[arg-type]
+    )
+
+    await service.incremental_sync()
+
+    assert cache.versions == [
+        build_recommendation_result_version(
+            last_event_at=event.created_at,
+            last_event_id=event.activity_event_id,
+            last_full_rebuild_at=None,
+        )
+    ]
+
+
+@pytest.mark.anyio
+async def test_incremental_sync_applies_net_engagement_deltas_per_pair() -> None:
+    viewer_id = uuid.uuid4()
+    liked_id = uuid.uuid4()
+    switched_id = uuid.uuid4()
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    def event(action_type: str, content_id: uuid.UUID, seconds: int) -> ActivityEventGraphRow:
+        return ActivityEventGraphRow(
+            activity_event_id=uuid.uuid4(),
+            created_at=now + datetime.timedelta(seconds=seconds),
+            action_type=action_type,
+            user_id=viewer_id,
+            content_id=content_id,
+            target_user_id=None,
+            metadata={},
+        )
+
+    events = [
+        event("content_view", liked_id, 0),
+        event("content_view", liked_id, 1),
+        event("content_like", liked_id, 2),
+        # Already liked before this run: switching to a dislike is -8 for tags and -11 for the author.
+        event("content_dislike", switched_id, 3),
+    ]
+    graph_repository = FakeIncrementalGraphRepository()
+    graph_repository.engagement[(viewer_id, switched_id)] = EngagementGraphState(liked=True)
+    service = RecommendationGraphSyncService(
+        postgres_repository=FakeIncrementalPostgresRepository(events=events),  # type: ignore[arg-type]
+        graph_repository=graph_repository,  # type: ignore[arg-type]
+    )
+
+    await service.incremental_sync()
+
+    interest = {row["content_id"]: row["delta"] for row in graph_repository.interest_deltas}
+    author = {row["content_id"]: row["delta"] for row in graph_repository.author_deltas}
+    assert interest == {str(liked_id): 2.0 + 4.0, str(switched_id): -8.0}
+    assert author == {str(liked_id): 2.0 + 5.0, str(switched_id): -11.0}
+    assert all(row["user_id"] == str(viewer_id) for row in graph_repository.interest_deltas)
+
+
+@pytest.mark.anyio
+async def test_reconcile_affinities_recomputes_every_user_in_chunks() -> None:
+    graph_repository = FakeIncrementalGraphRepository()
+    service = RecommendationGraphSyncService(
+        postgres_repository=FakeStreamingPostgresRepository(users=5, reactions=0),  # type: ignore[arg-type]
+        graph_repository=graph_repository,  # type: ignore[arg-type]
+        rebuild_chunk_size=2,
+    )
+
+    report = await service.reconcile_affinities()
+
+    assert report == {"users": 5}
+    assert [len(user_ids) for user_ids in graph_repository.recompute_affinity_calls] == [2, 2, 1]
+
+
+class FakeCandidateGraphRepository(FakeIncrementalGraphRepository):
+    def __init__(self, failing_user_ids: set[uuid.UUID]) -> None:
+        super().__init__()
+        self.failing_user_ids = failing_user_ids
+        self.candidate_calls: list[dict] = []
+
+    async def get_recommendation_candidates(self, *, viewer_id, limit):  # type: ignore[no-untyped-def]
+        self.candidate_calls.append({"viewer_id": viewer_id, "limit": limit})
+        if viewer_id in self.failing_user_ids:
+            raise RuntimeError("neo4j unavailable")
+        return [
+            RecommendationCandidateGraphResult(
+                content_id=uuid.uuid4(),
+                content_type="post",
+                base_score=2.5,
+                published_at=None,
+            )
+        ]
+
+
+class FakeCandidateStore:
+    def __init__(self) -> None:
+        self.lists: dict[uuid.UUID, list[RecommendationCandidate]] = {}
+
+    async def replace(self, user_id, candidates):  # type: ignore[no-untyped-def]
+        self.lists[user_id] = candidates
+
+
+@pytest.mark.anyio
+async def test_incremental_sync_refreshes_candidates_for_touched_users() -> None:
+    actor_id = uuid.uuid4()
+    followed_id = uuid.uuid4()
+    events = [
+        ActivityEventGraphRow(
+            activity_event_id=uuid.uuid4(),
+            created_at=datetime.datetime.now(datetime.timezone.utc),
+            action_type="user_follow",
+            user_id=actor_id,
+            content_id=None,
+            target_user_id=followed_id,
+            metadata={},
+        ),
+    ]
+    graph_repository = FakeCandidateGraphRepository(failing_user_ids={followed_id})
+    store = FakeCandidateStore()
+    service = RecommendationGraphSyncService(
+        postgres_repository=FakeIncrementalPostgresRepository(events=events),  # type: ignore[arg-type]
+        graph_repository=graph_repository,  # type: ignore[arg-type]
+        candidate_store=store,  # type: ignore[arg-type]
+        candidate_list_size=50,
+    )
+
+    report = await service.incremental_sync()
+
+    assert report["candidate_users"] == 1
+    assert {call["viewer_id"] for call in graph_repository.candidate_calls} == {actor_id, followed_id}
+    assert all(call["limit"] == 50 for call in graph_repository.candidate_calls)
+    assert list(store.lists) == [actor_id]
+    assert store.lists[actor_id][0].base_score == 2.5
+
+
+@pytest.mark.anyio
+async def test_refresh_candidates_bounds_concurrent_feed_queries() -> None:
+    class SlowCandidateGraphRepository(FakeCandidateGraphRepository):
+        def __init__(self) -> None:
+            super().__init__(failing_user_ids=set())
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        async def get_recommendation_candidates(self, *, viewer_id, limit):  # type: ignore[no-untyped-def]
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            return await super().get_recommendation_candidates(viewer_id=viewer_id, limit=limit)
+
+    graph_repository = SlowCandidateGraphRepository()
+    store = FakeCandidateStore()
+    service = RecommendationGraphSyncService(
+        postgres_repository=FakeIncrementalPostgresRepository(events=[]),  # type: ignore[arg-type]
+        graph_repository=graph_repository,  # type: ignore[arg-type]
+        candidate_store=store,  # type: ignore[arg-type]
+        candidate_refresh_concurrency=3,
+    )
+    user_ids = [uuid.uuid4() for _ in range(10)]
+
+    refreshed = await service.refresh_candidates(user_ids)
+
+    assert refreshed == 10
+    assert set(store.lists) == set(user_ids)
+    assert graph_repository.max_in_flight == 3
+
+
+class FakeStreamingPostgresRepository:
+    def __init__(self, *, users: int, reactions: int) -> None:
+        self.user_ids = [uuid.uuid4() for _ in range(users)]
+        self.content_id = uuid.uuid4()
+        self.reactions = [
+            ContentReactionGraphRow(
+                user_id=self.user_ids[index % users],
+                content_id=self.content_id,
+                reaction_type=ReactionTypeEnum.LIKE if index % 2 else ReactionTypeEnum.DISLIKE,
+                created_at=datetime.datetime.now(datetime.timezone.utc),
+            )
+            for index in range(reactions)
+        ]
+        self.chunk_sizes: list[int] = []
+
+    @staticmethod
+    async def _chunks(rows: list, chunk_size: int):  # type: ignore[no-untyped-def]
+        for offset in range(0, len(rows), chunk_size):
+            yield rows[offset: offset + chunk_size]
+
+    def iter_all_user_ids(self, *, chunk_size: int):  # type: ignore[no-untyped-def]
+        self.chunk_sizes.append(chunk_size)
+        return self._chunks(self.user_ids, chunk_size)
+
+    def iter_all_subscriptions(self, *, chunk_size: int):  # type: ignore[no-untyped-def]
+        return self._chunks([], chunk_size)
+
+    def iter_all_content_nodes(self, *, chunk_size: int):  # type: ignore[no-untyped-def]
+        return self._chunks([], chunk_size)
+
+    def iter_all_content_tags(self, *, chunk_size: int):  # type: ignore[no-untyped-def]
+        return self._chunks([], chunk_size)
+
+    def iter_all_content_reactions(self, *, chunk_size: int):  # type: ignore[no-untyped-def]
+        return self._chunks(self.reactions, chunk_size)
+
+    def iter_all_content_views(self, *, chunk_size: int):  # type: ignore[no-untyped-def]
+        return self._chunks([], chunk_size)
+
+    def iter_all_content_comments(self, *, chunk_size: int):  # type: ignore[no-untyped-def]
+        return self._chunks([], chunk_size)
+
+    async def get_latest_activity_cursor(self):  # type: ignore[no-untyped-def]
+        return None
+
+
+class FakeConcurrentGraphRepository:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.users: list[uuid.UUID] = []
+        self.liked: list[dict] = []
+        self.disliked: list[dict] = []
+
+    async def _track(self) -> None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+
+    async def clear_graph(self) -> None:
+        return None
+
+    async def ensure_schema(self) -> None:
+        return None
+
+    async def upsert_users(self, user_ids):  # type: ignore[no-untyped-def]
+        await self._track()
+        self.users.extend(user_ids)
+
+    async def upsert_subscriptions(self, rows):  # type: ignore[no-untyped-def]
+        await self._track()
+
+    async def set_liked_edges(self, rows):  # type: ignore[no-untyped-def]
+        await self._track()
+        self.liked.extend(rows)
+
+    async def set_disliked_edges(self, rows):  # type: ignore[no-untyped-def]
+        await self._track()
+        self.disliked.extend(rows)
+
+    async def recompute_interested_in(self) -> None:
+        return None
+
+    async def recompute_affinity_to_author(self) -> None:
+        return None
+
+    async def recompute_similar_to(self) -> None:
+        return None
+
+    async def upsert_sync_state(self, **kwargs):  # type: ignore[no-untyped-def]
+        return None
+
+
+@pytest.mark.anyio
+async def test_full_rebuild_streams_chunks_with_bounded_concurrent_writes() -> None:
+    postgres_repository = FakeStreamingPostgresRepository(users=25, reactions=40)
+    graph_repository = FakeConcurrentGraphRepository()
+    service = RecommendationGraphSyncService(
+        postgres_repository=postgres_repository,  # type: ignore[arg-type]
+        graph_repository=graph_repository,  # type: ignore[arg-type]
+        rebuild_chunk_size=4,
+        rebuild_write_concurrency=2,
+    )
+
+    report = await service.full_rebuild()
+
+    assert postgres_repository.chunk_sizes == [4]
+    assert sorted(graph_repository.users) == sorted(postgres_repository.user_ids)
+    assert len(graph_repository.liked) == 20
+    assert len(graph_repository.disliked) == 20
+    assert 1 < graph_repository.max_in_flight <= 2
+    assert report["users"] == 25
+    assert report["reactions"] == 40
+    assert report["phases"]["users"]["rows"] == 25
+    assert report["phases"]["reactions"]["rows"] == 40
+    assert report["phases"]["reactions"]["rows_per_second"] > 0
+
+
+@pytest.mark.anyio
+async def test_full_rebuild_phase_cancels_pending_writes_on_failure() -> None:
+    class FailingGraphRepository(FakeConcurrentGraphRepository):
+        async def upsert_users(self, user_ids):  # type: ignore[no-untyped-def]
+            await self._track()
+            raise RuntimeError("neo4j unavailable")
+
+    service = RecommendationGraphSyncService(
+        postgres_repository=FakeStreamingPostgresRepository(users=10, reactions=0),  # type: ignore[arg-type]
+        graph_repository=FailingGraphRepository(),  # type: ignore[arg-type]
+        rebuild_chunk_size=2,
+        rebuild_write_concurrency=3,
+    )
+
+    with pytest.raises(RuntimeError):
+        await service.full_rebuild()
@@ -8,6 +8,7 @@ from sqlalchemy.dialects import postgresql
 from src.content.enums import ContentTypeEnum
 from src.search.enums import SearchPopularPeriodEnum, SearchSortEnum
 from src.search.repository import SearchRepository
+from src.users.models import UserModel
 
 
 class FakeResult:
@@ -134,11 +135,37 @@ async def test_search_authors_uses_user_search_vector_and_newest_sort() -> None:
     assert matches[0].author_id == author_id
 
     sql = _compile_sql(session.statements[0])
-    assert "to_tsvector('simple'" in sql
+    assert "users.search_vector @@ websearch_to_tsquery('simple', 'alex')" in sql
+    assert "to_tsvector" not in sql
     assert "users.created_at DESC" in sql
     assert "OFFSET 5" in sql
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize("method", ["search_authors", "search_all"])
+async def test_author_search_predicates_match_user_search_indexes(method: str) -> None:
+    session = CapturingSession([[]])
+    repository = SearchRepository(session)  # type: ignore[arg-type]
+
+    await getattr(repository, method)(query_text="alex", sort=SearchSortEnum.RELEVANCE, offset=0, limit=10)
+
+    sql = _compile_sql(session.statements[0])
+    where = sql[sql.rindex("FROM users"):]
+    # One predicate per GIN index on users, each on the indexed column itself;
+    # wrapping a column in coalesce() or to_tsvector() makes Postgres seq scan.
+    gin_columns = {
+        column.name
+        for index in UserModel.__table__.indexes
+        if index.dialect_options["postgresql"]["using"] == "gin"
+        for column in index.columns
+    }
+    assert gin_columns == {"username", "display_name", "search_vector"}
+    assert "users.search_vector @@ websearch_to_tsquery('simple', 'alex')" in where
+    assert "users.username %% 'alex'" in where
+    assert "users.display_name %% 'alex'" in where
+    assert "coalesce(users." not in where
+
+
 @pytest.mark.anyio
 @pytest.mark.parametrize(
     "period",
@@ -110,7 +110,7 @@ class FakeRepository:
         self.calls.append(("get_content_by_ids", {"content_ids": content_ids, "viewer_id": viewer_id}))
         return {content_id: self.content_map[content_id] for content_id in content_ids if content_id in self.content_map}
 
-    async def get_users_by_ids(self, *, user_ids):  # type: ignore[no-untyped-def]
+    async def get_users_by_ids(self, *, user_ids, viewer_id=None):  # type: ignore[no-untyped-def]
         self.calls.append(("get_users_by_ids", {"user_ids": user_ids}))
         return {user_id: self.user_map[user_id] for user_id in user_ids if user_id in self.user_map}
 
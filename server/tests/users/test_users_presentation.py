@@ -95,3 +95,36 @@ async def test_build_user_get_skips_unloaded_subscribers(monkeypatch) -> None:
     result = await build_user_get(user, viewer_id=uuid.uuid4())
 
     assert result.is_subscribed is False
+
+
+@pytest.mark.asyncio
+async def test_build_user_get_uses_batched_subscribed_ids(monkeypatch) -> None:
+    user = _UserWithLazySubscribers()
+
+    monkeypatch.setattr(
+        "src.users.presentation.sa_inspect",
+        lambda _instance: _InspectionState({"avatar_asset": _AttrState(NO_VALUE)}),
+    )
+
+    subscribed = await build_user_get(user, viewer_id=uuid.uuid4(), subscribed_ids={user.user_id})
+    not_subscribed = await build_user_get(user, viewer_id=uuid.uuid4(), subscribed_ids=set())
+    anonymous = await build_user_get(user, subscribed_ids={user.user_id})
+
+    assert subscribed.is_subscribed is True
+    assert not_subscribed.is_subscribed is False
+    assert anonymous.is_subscribed is False
+
+
+@pytest.mark.asyncio
+async def test_build_user_get_uses_repository_subscription_annotation(monkeypatch) -> None:
+    user = _UserWithLazySubscribers()
+    user.is_subscribed = True
+
+    monkeypatch.setattr(
+        "src.users.presentation.sa_inspect",
+        lambda _instance: _InspectionState({"avatar_asset": _AttrState(NO_VALUE)}),
+    )
+
+    result = await build_user_get(user, viewer_id=uuid.uuid4())
+
+    assert result.is_subscribed is True
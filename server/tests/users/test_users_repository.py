@@ -0,0 +1,83 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.common.model_registry import import_all_models
+from src.users.repository import populate_viewer_subscriptions
+
+import_all_models()
+
+
+class FakeScalars:
+    def __init__(self, values) -> None:  # type: ignore[no-untyped-def]
+        self._values = values
+
+    def all(self):  # type: ignore[no-untyped-def]
+        return self._values
+
+
+class FakeResult:
+    def __init__(self, values) -> None:  # type: ignore[no-untyped-def]
+        self._values = values
+
+    def scalars(self) -> FakeScalars:
+        return FakeScalars(self._values)
+
+
+class CapturingSession:
+    def __init__(self, subscribed_ids) -> None:  # type: ignore[no-untyped-def]
+        self.subscribed_ids = subscribed_ids
+        self.statements = []
+
+    async def execute(self, stmt):  # type: ignore[no-untyped-def]
+        self.statements.append(stmt)
+        return FakeResult(self.subscribed_ids)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_populate_viewer_subscriptions_uses_single_lookup_per_page() -> None:
+    followed = SimpleNamespace(user_id=uuid.uuid4())
+    other = SimpleNamespace(user_id=uuid.uuid4())
+    viewer_id = uuid.uuid4()
+    session = CapturingSession([followed.user_id])
+
+    await populate_viewer_subscriptions(
+        session,  # type: ignore[arg-type]
+        users=[followed, other, followed, None],
+        viewer_id=viewer_id,
+    )
+
+    assert len(session.statements) == 1
+    sql = str(
+        session.statements[0].compile(
+            dialect=postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+    assert "FROM subscriptions" in sql
+    assert f"subscriptions.subscriber_id = '{viewer_id}'" in sql
+    assert "subscriptions.subscribed_id IN" in sql
+    assert followed.is_subscribed is True
+    assert other.is_subscribed is False
+
+
+@pytest.mark.anyio
+async def test_populate_viewer_subscriptions_skips_query_for_anonymous_viewer() -> None:
+    author = SimpleNamespace(user_id=uuid.uuid4())
+    session = CapturingSession([author.user_id])
+
+    await populate_viewer_subscriptions(
+        session,  # type: ignore[arg-type]
+        users=[author],
+        viewer_id=None,
+    )
+
+    assert session.statements == []
+    assert author.is_subscribed is False
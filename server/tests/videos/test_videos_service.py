@@ -1,6 +1,7 @@
 import datetime
 import uuid
 from dataclasses import dataclass, field
+from urllib.parse import parse_qs
 
 import pytest
 
@@ -12,11 +13,13 @@ from src.assets.enums import (
     AssetVariantTypeEnum,
     AttachmentTypeEnum,
 )
+from src.auth.dependencies import get_playback_grant
 from src.content.enums import ContentStatusEnum, ContentVisibilityEnum
 from src.tags.service import TagService
 from src.users.schemas import UserGet
 from src.videos.enums import VideoOrientationEnum, VideoProcessingStatusEnum, VideoWriteStatus
-from src.videos.exceptions import InvalidVideo
+from src.videos.exceptions import InvalidVideo, VideoNotFound
+from src.videos.hls import HLS_URL_TTL_SLACK_SECONDS
 from src.videos.schemas import VideoCreate
 from src.videos.service import VideoAssetProcessingNotifier, VideoProcessingAssetUpdate, VideoService
 
@@ -34,6 +37,7 @@ class FakeVariant:
     bitrate: int | None = None
     status: AssetVariantStatusEnum = AssetVariantStatusEnum.READY
     checksum_sha256: str | None = None
+    variant_metadata: dict[str, object] = field(default_factory=dict)
     created_at: datetime.datetime = field(default_factory=lambda: datetime.datetime.now(datetime.timezone.utc))
 
 
@@ -250,7 +254,12 @@ class FakeAssetService:
 
 
 class FakeStorage:
+    def __init__(self) -> None:
+        self.presigned_ttls: list[int] = []
+
     async def generate_presigned_get(self, *, bucket: str, key: str, **kwargs) -> str:
+        if kwargs.get("expires_in_seconds") is not None:
+            self.presigned_ttls.append(kwargs["expires_in_seconds"])
         return f"https://cdn.example/{bucket}/{key}"
 
 
@@ -262,6 +271,7 @@ class Bundle:
     stranger: UserGet
     source_asset: FakeAsset
     cover_asset: FakeAsset
+    asset_storage: FakeStorage
 
 
 @pytest.fixture
@@ -343,14 +353,23 @@ def bundle() -> Bundle:
         cover_asset.asset_id: cover_asset,
     }
     repository = FakeVideoRepository(users={author.user_id: author, stranger.user_id: stranger}, assets=assets)
+    asset_storage = FakeStorage()
     service = VideoService(
         repository=repository,  # type: ignore[arg-type]
         tag_service=TagService(repository=FakeTagRepository()),  # type: ignore[arg-type]
         asset_repository=FakeAssetRepository(assets),  # type: ignore[arg-type]
         asset_service=FakeAssetService(),  # type: ignore[arg-type]
-        asset_storage=FakeStorage(),  # type: ignore[arg-type]
+        asset_storage=asset_storage,  # type: ignore[arg-type]
+    )
+    return Bundle(
+        service=service,
+        repository=repository,
+        author=author,
+        stranger=stranger,
+        source_asset=source_asset,
+        cover_asset=cover_asset,
+        asset_storage=asset_storage,
     )
-    return Bundle(service=service, repository=repository, author=author, stranger=stranger, source_asset=source_asset, cover_asset=cover_asset)
 
 
 @pytest.mark.anyio
@@ -516,6 +535,75 @@ async def test_ready_publish_returns_playback_sources(bundle: Bundle) -> None:
     assert [source.id for source in video.playback_sources] == ["720p", "original"]
 
 
+@pytest.mark.anyio
+async def test_ready_video_exposes_hls_streaming_source_and_playlists(bundle: Bundle) -> None:
+    bundle.source_asset.status = AssetStatusEnum.READY
+    bundle.source_asset.asset_metadata["video_processing_status"] = "ready"
+    hls_key = f"{bundle.source_asset.asset_id}/hls/video_720p.m4s"
+    bundle.source_asset.variants.append(
+        FakeVariant(
+            asset_variant_type=AssetVariantTypeEnum.VIDEO_720P,
+            storage_bucket="private",
+            storage_key=f"{bundle.source_asset.asset_id}/video_720p.mp4",
+            mime_type="video/mp4",
+            size_bytes=2048,
+            width=1280,
+            height=720,
+            duration_ms=6_000,
+            bitrate=1_500_000,
+            variant_metadata={
+                "quality": "720p",
+                "hls": {
+                    "key": hls_key,
+                    "target_duration": 4,
+                    "map": [800, 0],
+                    "segments": [[4.0, 1_000_000, 800], [2.0, 250_000, 1_000_800]],
+                },
+            },
+        )
+    )
+
+    video = await bundle.service.create_video(
+        user=bundle.author,
+        data=VideoCreate(
+            source_asset_id=bundle.source_asset.asset_id,
+            cover_asset_id=bundle.cover_asset.asset_id,
+            title="Streaming video",
+            visibility="public",
+            status="published",
+        ),
+    )
+
+    assert [source.id for source in video.playback_sources] == ["720p", "original"]
+    [streaming_source] = video.streaming_sources
+    assert (streaming_source.id, streaming_source.mimeType) == ("hls", "application/vnd.apple.mpegurl")
+    master_path, token_query = streaming_source.src.split("?")
+    assert master_path == f"/videos/{video.video_id}/playback/master.m3u8"
+    token = parse_qs(token_query)["token"][0]
+    grant = get_playback_grant(token=token)
+    assert (grant.content_id, grant.viewer_id) == (video.video_id, bundle.author.user_id)
+
+    master = await bundle.service.get_hls_playlist(video_id=video.video_id, grant=grant)
+    assert (
+        "#EXT-X-STREAM-INF:BANDWIDTH=2000000,AVERAGE-BANDWIDTH=1500000,RESOLUTION=1280x720\n"
+        f"720p.m3u8?{token_query}"
+    ) in master
+
+    media = await bundle.service.get_hls_playlist(video_id=video.video_id, grant=grant, quality="720p")
+    url = f"https://cdn.example/private/{hls_key}"
+    assert f'#EXT-X-MAP:URI="{url}",BYTERANGE="800@0"' in media
+    assert f"#EXTINF:2.000000,\n#EXT-X-BYTERANGE:250000@1000800\n{url}" in media
+    assert media.endswith("#EXT-X-ENDLIST\n")
+    assert bundle.asset_storage.presigned_ttls == [6 + HLS_URL_TTL_SLACK_SECONDS]
+
+    with pytest.raises(VideoNotFound):
+        await bundle.service.get_hls_playlist(video_id=video.video_id, grant=grant, quality="1080p")
+
+    other_grant = grant.model_copy(update={"content_id": uuid.uuid4()})
+    with pytest.raises(VideoNotFound):
+        await bundle.service.get_hls_playlist(video_id=video.video_id, grant=other_grant)
+
+
 @pytest.mark.anyio
 async def test_publish_accepts_processing_cover_with_ready_original(bundle: Bundle) -> None:
     bundle.source_asset.status = AssetStatusEnum.READY